@@ -0,0 +1 @@
+original_content
\ No newline at end of file
@@ -263,7 +263,7 @@ The agents will return structured results for synthesis.""",
             internal_states={},
             recent_errors=[],
         )
-        initial_context["precision_profile"] = precision_profile.model_dump()
+        initial_context["precision_profile"] = precision_profile.model_dump(mode="json")
 
         # Apply forecasted precisions to metaplasticity registry
         def _scale_precision(value: float) -> float:
@@ -37,7 +37,9 @@ class ConsciousnessMemoryCore:
             self._event_buffer.append(event)
             
             # 3. Check for boundary (TRIBUTARY)
-            should_segment = await self.river.check_boundary(self._event_buffer, resonance_signal=resonance_signal)
+            should_segment = await self.river.check_boundary(
+                self._event_buffer, resonance_signal=resonance_signal, stream_id=self.journey_id
+            )
             
             if should_segment or len(self._event_buffer) >= self._max_buffer_size:
                 logger.info(f"Boundary detected or buffer full. Segmenting {len(self._event_buffer)} events.")
@@ -52,28 +52,89 @@ class ConsolidatedMemoryStore:
         )
         RETURN e.id
         """
-        props = event.model_dump(exclude={"event_id", "timestamp", "journey_id", "device_id"})
-        props["timestamp"] = event.timestamp.isoformat()
-        
-        # Serialize nested objects
-        if event.active_inference_state:
-            props["active_inference_state"] = event.active_inference_state.model_dump_json()
-        
         try:
-            await self._driver.execute_query(cypher, {
-                "id": event.event_id,
-                "props": props,
-                "basin_id": event.linked_basin_id,
-                "basin_score": event.basin_r_score,
-                "blanket_id": event.markov_blanket_id,
-                "journey_id": event.journey_id,
-                "device_id": event.device_id
-            })
+            await self._driver.execute_query(cypher, self._event_params(event))
             return True
         except Exception as e:
             logger.error(f"Failed to store event {event.event_id}: {e}")
             return False
 
+    async def store_events(self, events: List[DevelopmentEvent]) -> int:
+        """
+        Persist a batch of raw development events (SOURCE) in one UNWIND write.
+
+        Neuronal packets carry their predecessor in metadata["parent_packet_id"];
+        the NEXT_PACKET chain is written in the same statement. Rows are applied
+        in order, so a parent earlier in the same batch is already merged.
+
+        Returns the number of events written (0 on failure).
+        """
+        if not events:
+            return 0
+
+        cypher = """
+        UNWIND $events AS row
+        MERGE (e:DevelopmentEvent {id: row.id})
+        SET e += row.props,
+            e.river_stage = 'source'
+        WITH e, row
+        FOREACH (_ IN CASE WHEN row.journey_id IS NOT NULL THEN [1] ELSE [] END |
+            MERGE (j:Journey {id: row.journey_id})
+            MERGE (e)-[:BELONGS_TO]->(j)
+        )
+        FOREACH (_ IN CASE WHEN row.journey_id IS NULL AND row.device_id IS NOT NULL THEN [1] ELSE [] END |
+            MERGE (j2:Journey {device_id: row.device_id})
+            MERGE (e)-[:BELONGS_TO]->(j2)
+        )
+        FOREACH (_ IN CASE WHEN row.basin_id IS NOT NULL THEN [1] ELSE [] END |
+            MERGE (b:AttractorBasin {id: row.basin_id})
+            MERGE (e)-[:ALIGNS_WITH {score: row.basin_score}]->(b)
+        )
+        FOREACH (_ IN CASE WHEN row.blanket_id IS NOT NULL THEN [1] ELSE [] END |
+            MERGE (mb:MarkovBlanket {id: row.blanket_id})
+            MERGE (e)-[:WITHIN_BLANKET]->(mb)
+        )
+        // Packet chain (Neuronal Packet Quantization)
+        FOREACH (_ IN CASE WHEN row.parent_packet_id IS NOT NULL THEN [1] ELSE [] END |
+            MERGE (p:DevelopmentEvent {id: row.parent_packet_id})
+            MERGE (p)-[:NEXT_PACKET]->(e)
+            SET e.parent_packet_id = row.parent_packet_id
+        )
+        RETURN count(e) AS stored
+        """
+        rows = []
+        for event in events:
+            row = self._event_params(event)
+            row["parent_packet_id"] = (event.metadata or {}).get("parent_packet_id")
+            rows.append(row)
+
+        try:
+            await self._driver.execute_query(cypher, {"events": rows})
+            return len(rows)
+        except Exception as e:
+            logger.error(f"Failed to store batch of {len(rows)} events: {e}")
+            return 0
+
+    @staticmethod
+    def _event_params(event: DevelopmentEvent) -> Dict[str, Any]:
+        """Build the Cypher parameters for a single development event."""
+        props = event.model_dump(exclude={"event_id", "timestamp", "journey_id", "device_id"})
+        props["timestamp"] = event.timestamp.isoformat()
+
+        # Serialize nested objects
+        if event.active_inference_state:
+            props["active_inference_state"] = event.active_inference_state.model_dump_json()
+
+        return {
+            "id": event.event_id,
+            "props": props,
+            "basin_id": event.linked_basin_id,
+            "basin_score": event.basin_r_score,
+            "blanket_id": event.markov_blanket_id,
+            "journey_id": event.journey_id,
+            "device_id": event.device_id,
+        }
+
     async def create_episode(self, episode: DevelopmentEpisode) -> bool:
         """Create a TRIBUTARY (Episode) and link its events/trajectories."""
         cypher = """
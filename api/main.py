@@ -24,12 +24,21 @@ from api.routers import ias, heartbeat, models, memory, skills, sync, session, m
 from api.models.network_state import get_network_state_config
 from api.services.journal_service import start_journal_scheduler
 from api.services.relatio_narrative_service import RelatioNarrativeService
+from api.services.metrics_registry import get_metrics_registry
 import asyncio
+import time
 
 # Rate limiter
 limiter = Limiter(key_func=get_remote_address)
 logger = logging.getLogger("dionysus.api")
 
+_HTTP_LATENCY = get_metrics_registry().histogram(
+    "dionysus_http_request_duration_ms", "HTTP request latency by route.", ("method", "route")
+)
+_HTTP_REQUESTS = get_metrics_registry().counter(
+    "dionysus_http_requests_total", "HTTP requests by route and status class.", ("method", "route", "status_class")
+)
+
 
 
 
@@ -55,6 +64,23 @@ async def lifespan(app: FastAPI):
         logger.info("Wake-Up Protocol: System broadcast presence initialized.")
     except Exception as exc:
         logger.warning(f"Startup initialization skipped/failed: {exc}")
+
+    # Compact execution trace segments left by the previous process, then
+    # keep sealing idle segments so traces reach the graph without new appends
+    try:
+        from api.services.execution_trace_service import get_execution_trace_service
+
+        get_execution_trace_service().start_compaction_loop()
+    except Exception as exc:
+        logger.warning(f"Execution trace compactor not started: {exc}")
+
+    # Ensure the advisor's idempotent index migration (IF NOT EXISTS)
+    try:
+        from api.services.schema_advisor import ensure_graph_schema
+
+        await ensure_graph_schema()
+    except Exception as exc:
+        logger.warning(f"Schema migration skipped/failed: {exc}")
     
     # Note: PostgreSQL removed. Using Graphiti/Neo4j for persistence.
     # Services requiring db_pool need migration to Graphiti.
@@ -66,6 +92,32 @@ async def lifespan(app: FastAPI):
     # Shutdown
     print("Shutting down Dionysus API server...")
 
+    # Flush buffered execution traces into the graph
+    try:
+        from api.services.execution_trace_service import get_execution_trace_service
+
+        trace_service = get_execution_trace_service()
+        await trace_service.stop_compaction_loop()
+        await trace_service.compact(seal_active=True)
+    except Exception as exc:
+        logger.warning(f"Execution trace compaction skipped/failed: {exc}")
+
+    # Write out agent state still pending in the write-behind buffer
+    try:
+        from api.services.biological_agency_service import flush_biological_agency_state
+
+        await flush_biological_agency_state()
+    except Exception as exc:
+        logger.warning(f"Biological agency state flush skipped/failed: {exc}")
+
+    # Persist the local memory ANN tier so recall starts warm
+    try:
+        from api.services.memory_ann_index import save_memory_ann_snapshot
+
+        save_memory_ann_snapshot()
+    except Exception as exc:
+        logger.warning(f"Memory ANN snapshot skipped/failed: {exc}")
+
 
 # Create FastAPI app
 app = FastAPI(
@@ -90,6 +142,26 @@ app.add_middleware(
 )
 
 
+# Request metrics: latency histogram and status counters per route template
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    started = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        route = request.scope.get("route")
+        path = getattr(route, "path", "unmatched")
+        _HTTP_LATENCY.labels(method=request.method, route=path).observe(
+            (time.perf_counter() - started) * 1000
+        )
+        _HTTP_REQUESTS.labels(
+            method=request.method, route=path, status_class=f"{status // 100}xx"
+        ).inc()
+
+
 # Health check
 @app.get("/health")
 async def health_check():
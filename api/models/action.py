@@ -357,6 +357,7 @@ class HeartbeatSummary:
     narrative: str = ""  # Self-generated description
     started_at: datetime = field(default_factory=datetime.utcnow)
     ended_at: datetime | None = None
+    phase_timings_ms: dict[str, float] = field(default_factory=dict)  # Per-phase wall time
 
     @property
     def energy_spent(self) -> float:
@@ -389,4 +390,5 @@ class HeartbeatSummary:
             "ended_at": self.ended_at.isoformat() if self.ended_at else None,
             "actions_completed": self.actions_completed,
             "actions_failed": self.actions_failed,
+            "phase_timings_ms": self.phase_timings_ms,
         }
@@ -200,3 +200,7 @@ class JourneyTimelineResponse(BaseModel):
     journey_id: UUID
     entries: list[TimelineEntry] = Field(default_factory=list)
     total_entries: int = 0
+    # Keyset pagination: entries are always oldest first
+    next_cursor: Optional[str] = Field(None, description="Cursor after the last entry (page forward)")
+    prev_cursor: Optional[str] = Field(None, description="Cursor before the first entry (page backward)")
+    has_more: bool = Field(False, description="More entries exist in the requested direction")
@@ -33,6 +33,10 @@ class ExtractionResult(BaseModel):
     provenance: Dict = Field(default_factory=dict)
     
     # Aggregate stats
+    write_counts: Dict[str, int] = Field(
+        default_factory=dict,
+        description="Graph writes issued per learning step (proposals, basins, strategies, coactivation)",
+    )
     run_id: str = Field(default_factory=lambda: "run-" + datetime.utcnow().strftime("%Y%m%d%H%M%S"))
     start_time: datetime = Field(default_factory=datetime.utcnow)
     end_time: Optional[datetime] = None
@@ -23,3 +23,15 @@ class PredictionAccuracy(BaseModel):
     sample_count: int
     window_start: datetime
     window_end: datetime
+    error_variance: float = 0.0
+    min_error: float = 0.0
+    max_error: float = 0.0
+    p50_error: float = 0.0
+    p90_error: float = 0.0
+    p99_error: float = 0.0
+
+class PredictionErrorTrendPoint(BaseModel):
+    bucket_start: datetime
+    sample_count: int
+    average_error: float
+    p90_error: float
@@ -22,6 +22,8 @@ class FileBackup(BaseModel):
     size_bytes: int
     backup_time: datetime
     checksum: str
+    # Content-addressed chunk digests; empty for legacy whole-file copies
+    chunks: List[str] = Field(default_factory=list)
 
 
 class RollbackCheckpoint(BaseModel):
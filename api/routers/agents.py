@@ -80,6 +80,16 @@ class TraceReplayResponse(BaseModel):
     summary: str
 
 
+class TraceCompactionResponse(BaseModel):
+    """Result of compacting trace segments into Neo4j."""
+
+    segments: int
+    traces: int
+    steps: int
+    basin_links: int
+    failed_segments: List[str]
+
+
 class TokenUsageResponse(BaseModel):
     """Token usage statistics."""
 
@@ -129,6 +139,18 @@ async def list_traces(
     return TraceListResponse(traces=summaries, count=len(summaries))
 
 
+@router.post("/traces/compact", response_model=TraceCompactionResponse)
+async def compact_traces():
+    """
+    Seal the active trace segment and compact all pending segments into Neo4j.
+
+    Returns:
+        Counts of segments, traces, steps and basin links written
+    """
+    service = get_execution_trace_service()
+    return TraceCompactionResponse(**await service.compact(seal_active=True))
+
+
 @router.get("/traces/{trace_id}", response_model=ExecutionTraceData)
 async def get_trace(trace_id: str = Path(..., description="Trace UUID")):
     """
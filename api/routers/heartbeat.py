@@ -29,6 +29,7 @@ class TriggerHeartbeatResponse(BaseModel):
     energy_end: float
     actions_completed: int
     narrative: str
+    phase_timings_ms: dict[str, float] = Field(default_factory=dict)
 
 
 class HeartbeatStatusResponse(BaseModel):
@@ -146,6 +147,7 @@ async def trigger_heartbeat():
             energy_end=summary.energy_end,
             actions_completed=summary.actions_completed,
             narrative=summary.narrative,
+            phase_timings_ms=summary.phase_timings_ms,
         )
     except HeartbeatPausedError as e:
         raise HTTPException(status_code=409, detail=f"Heartbeat paused: {e}")
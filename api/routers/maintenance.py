@@ -99,3 +99,23 @@ async def integrity_check():
         results["meta_tot_thresholds"] = {"error": str(exc)}
     
     return results
+
+@router.get("/schema-advice")
+async def get_schema_advice(limit: int = 50):
+    """
+    Analyze the recorded Cypher workload for label scans and propose indexes.
+    Uses EXPLAIN through the Graphiti gateway when SCHEMA_ADVISOR_EXPLAIN=true, static analysis otherwise.
+    """
+    from api.services.schema_advisor import get_schema_advisor
+
+    advice = await get_schema_advisor().advise(limit=limit)
+    return advice.to_dict()
+
+@router.post("/schema-migration")
+async def apply_schema_migration():
+    """
+    Re-apply the idempotent baseline index migration.
+    """
+    from api.services.schema_advisor import ensure_graph_schema
+
+    return await ensure_graph_schema()
@@ -3,7 +3,9 @@ Meta-ToT API Router
 Feature: 041-meta-tot-engine
 """
 
-from fastapi import APIRouter, HTTPException
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query
 
 from api.models.meta_tot import MetaToTRunRequest, MetaToTRunResponse, MetaToTResult
 from api.services.meta_tot_decision import get_meta_tot_decision_service
@@ -39,10 +41,31 @@ async def run_meta_tot(request: MetaToTRunRequest) -> MetaToTRunResponse:
     return MetaToTRunResponse(decision=decision, result=result, trace=trace)
 
 
+@router.get("/traces")
+async def list_meta_tot_traces(
+    session_id: Optional[str] = Query(None, description="Filter by session"),
+    limit: int = Query(50, ge=1, le=500),
+):
+    service = get_meta_tot_trace_service()
+    return await service.list_traces(session_id=session_id, limit=limit)
+
+
 @router.get("/traces/{trace_id}")
-async def get_meta_tot_trace(trace_id: str):
+async def get_meta_tot_trace(
+    trace_id: str,
+    include_branches: bool = Query(True, description="False returns root nodes only"),
+):
     service = get_meta_tot_trace_service()
-    trace = await service.get_trace(trace_id)
+    trace = await service.get_trace(trace_id, include_branches=include_branches)
     if trace is None:
         raise HTTPException(status_code=404, detail=f"Trace {trace_id} not found")
     return trace
+
+
+@router.get("/traces/{trace_id}/branches/{branch_id}")
+async def get_meta_tot_trace_branch(trace_id: str, branch_id: str):
+    service = get_meta_tot_trace_service()
+    nodes = await service.get_branch(trace_id, branch_id)
+    if nodes is None:
+        raise HTTPException(status_code=404, detail=f"Branch {branch_id} not found in trace {trace_id}")
+    return nodes
@@ -5,6 +5,7 @@ Feature: 023-migration-observability
 
 from typing import Dict, List, Optional
 from fastapi import APIRouter, Header, Depends
+from fastapi.responses import PlainTextResponse
 from api.services.monitoring_service import get_monitoring_service
 
 router = APIRouter(prefix="/api/monitoring", tags=["monitoring"])
@@ -34,6 +35,63 @@ async def get_alerts(service = Depends(get_monitoring_service_with_trace)):
     """Get active system alerts and warnings."""
     return await service.get_alerts()
 
+@router.get("/cypher", response_model=Dict)
+async def get_cypher_metrics(service = Depends(get_monitoring_service_with_trace)):
+    """Per-call-site latency, row and payload stats for the Cypher gateway."""
+    return await service.get_cypher_metrics()
+
+
+@router.get("/cypher/slow", response_model=List[Dict])
+async def get_slow_queries(limit: int = 50, service = Depends(get_monitoring_service_with_trace)):
+    """Ring-buffered slow-query log with redacted parameters."""
+    return await service.get_slow_queries(limit=limit)
+
+
+@router.get("/cypher/prometheus", response_class=PlainTextResponse)
+async def get_cypher_prometheus():
+    """Cypher gateway metrics in Prometheus text exposition format."""
+    from api.services.cypher_telemetry import get_cypher_telemetry
+    return PlainTextResponse(
+        get_cypher_telemetry().prometheus_text(),
+        media_type="text/plain; version=0.0.4",
+    )
+
+@router.get("/registry", response_model=Dict)
+async def get_registry_metrics(service = Depends(get_monitoring_service_with_trace)):
+    """Request, graph, LLM and embedding metrics with rolling-window rates and percentiles."""
+    return await service.get_registry_metrics()
+
+
+@router.get("/prometheus", response_class=PlainTextResponse)
+async def get_prometheus(service = Depends(get_monitoring_service_with_trace)):
+    """All in-process metrics in Prometheus text exposition format."""
+    return PlainTextResponse(service.prometheus_text(), media_type="text/plain; version=0.0.4")
+
+@router.get("/event-bus", response_model=List[Dict])
+async def get_event_bus_stats():
+    """Per-subscriber EventBus queue depth, lag, drop and failure counts."""
+    from api.utils.event_bus import get_event_bus
+    return get_event_bus().stats()
+
+@router.get("/llm-cache", response_model=Dict)
+async def get_llm_cache_stats():
+    """LLM response cache size and hit, miss and coalesced-request counters."""
+    from api.services.llm_response_cache import get_llm_response_cache
+    return get_llm_response_cache().stats()
+
+@router.get("/memory-ann", response_model=Dict)
+async def get_memory_ann_stats():
+    """Size, list count and insert/search/eviction counters of the local memory ANN tier."""
+    from api.services.memory_ann_index import get_memory_ann_index
+    index = get_memory_ann_index()
+    return index.stats() if index is not None else {"enabled": False}
+
+@router.get("/boundary-detection", response_model=Dict)
+async def get_boundary_detection_stats():
+    """Nemori boundary checks decided locally vs. escalated to the LLM, per kind."""
+    from api.services.nemori_river_flow import get_nemori_river_flow
+    return get_nemori_river_flow().get_boundary_stats()
+
 @router.get("/flow", response_model=Dict)
 async def get_river_flow(project_id: str = "default", service = Depends(get_monitoring_service_with_trace)):
     """T027: Get current 'River' status (Information flow quality)."""
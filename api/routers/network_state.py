@@ -22,7 +22,7 @@ from api.models.network_state import (
     SnapshotTrigger,
     get_network_state_config,
 )
-from api.models.prediction import PredictionRecord, PredictionAccuracy
+from api.models.prediction import PredictionRecord, PredictionAccuracy, PredictionErrorTrendPoint
 from api.services.network_state_service import NetworkStateService, get_network_state_service
 from api.services.self_modeling_service import SelfModelingService, get_self_modeling_service
 
@@ -309,3 +309,27 @@ async def get_accuracy_metrics(
         agent_id=agent_id,
         window_hours=window_hours,
     )
+
+
+@router.get(
+    "/self-modeling/{agent_id}/error-trend",
+    response_model=list[PredictionErrorTrendPoint],
+    responses={
+        503: {"model": ErrorResponse, "description": "Feature not enabled"},
+    },
+    summary="Get prediction error trend",
+    description="Returns per-step prediction error over a window, oldest first, for dashboards",
+)
+async def get_error_trend(
+    agent_id: str,
+    window_hours: int = Query(24, ge=1, le=168, description="Window size in hours (max 7 days)"),
+    step_hours: int = Query(1, ge=1, le=24, description="Hours per trend point"),
+    service: SelfModelingService = Depends(get_self_modeling),
+    _: None = Depends(check_self_modeling_enabled),
+) -> list[PredictionErrorTrendPoint]:
+    """Get the prediction error trend for an agent."""
+    return await service.get_error_trend(
+        agent_id=agent_id,
+        window_hours=window_hours,
+        step_hours=step_hours,
+    )
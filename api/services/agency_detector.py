@@ -75,32 +75,76 @@ class AgencyDetector:
             logger.warning("Insufficient samples for agency calculation, returning 0")
             return 0.0
         
-        # Ensure 2D arrays
-        mu = np.atleast_2d(internal_states)
-        a = np.atleast_2d(active_states)
-        
-        # If 1D arrays were passed, transpose to (N, 1)
-        if mu.shape[0] == 1 and len(internal_states.shape) == 1:
-            mu = mu.T
-        if a.shape[0] == 1 and len(active_states.shape) == 1:
-            a = a.T
-        
-        # Calculate mutual information as KL divergence between joint and product of marginals
-        # For each dimension pair, compute the KL divergence and sum
-        total_kl = 0.0
-        
-        for d_mu in range(mu.shape[1]):
-            for d_a in range(a.shape[1]):
-                kl = self._compute_2d_kl_divergence(mu[:, d_mu], a[:, d_a])
-                total_kl += kl
-        
-        # Normalize by number of dimension pairs for interpretability
-        num_pairs = mu.shape[1] * a.shape[1]
-        normalized_kl = total_kl / num_pairs if num_pairs > 0 else 0.0
-        
-        logger.debug(f"Agency score: {normalized_kl:.4f} (total KL: {total_kl:.4f}, pairs: {num_pairs})")
+        pairwise = self.pairwise_agency_scores(internal_states, active_states)
+        normalized_kl = float(pairwise.mean()) if pairwise.size else 0.0
+
+        logger.debug(f"Agency score: {normalized_kl:.4f} (total KL: {pairwise.sum():.4f}, pairs: {pairwise.size})")
         return normalized_kl
 
+    def pairwise_agency_scores(
+        self,
+        internal_states: np.ndarray,
+        active_states: np.ndarray
+    ) -> np.ndarray:
+        """
+        KL divergence for every (internal, active) dimension pair at once.
+
+        Each dimension is binned once over its own data range, and the joint
+        histograms for all pairs come from a single one-hot matrix product, so
+        the cost is one pass over the samples rather than one per pair. Results
+        match _compute_2d_kl_divergence pair by pair.
+
+        Returns:
+            (D_mu, D_a) array of per-pair agency scores
+        """
+        mu = _as_samples(internal_states)
+        a = _as_samples(active_states)
+        if len(mu) != len(a):
+            raise ValueError("Internal and active state arrays must have same length")
+
+        mu_bins = _bin_indices(mu, *_data_ranges(mu), self.num_bins)
+        a_bins = _bin_indices(a, *_data_ranges(a), self.num_bins)
+        mu_onehot = _one_hot(mu_bins, self.num_bins)
+        a_onehot = _one_hot(a_bins, self.num_bins)
+        return self._pairwise_kl_from_counts(
+            _joint_counts(mu_onehot, a_onehot, mu.shape[1], a.shape[1], self.num_bins),
+            mu_onehot.sum(axis=0).reshape(mu.shape[1], self.num_bins),
+            a_onehot.sum(axis=0).reshape(a.shape[1], self.num_bins),
+            len(mu),
+        )
+
+    def _pairwise_kl_from_counts(
+        self,
+        joint_counts: np.ndarray,
+        mu_counts: np.ndarray,
+        a_counts: np.ndarray,
+        num_samples: int,
+    ) -> np.ndarray:
+        """
+        Per-pair D_KL[p(μ,a) || p(μ)p(a)] from histogram counts.
+
+        Args:
+            joint_counts: (D_mu, D_a, B, B) joint histogram per dimension pair
+            mu_counts: (D_mu, B) marginal histogram per internal dimension
+            a_counts: (D_a, B) marginal histogram per active dimension
+            num_samples: Samples behind the histograms
+        """
+        eps = self._epsilon
+        joint_prob = joint_counts / (num_samples + eps) + eps
+        joint_prob = joint_prob / joint_prob.sum(axis=(2, 3), keepdims=True)
+
+        p_mu = (mu_counts + eps) / (num_samples + eps * self.num_bins)
+        p_a = (a_counts + eps) / (num_samples + eps * self.num_bins)
+        marginal_product = p_mu[:, None, :, None] * p_a[None, :, None, :]
+        marginal_product = marginal_product / marginal_product.sum(axis=(2, 3), keepdims=True)
+
+        kl_div = np.sum(joint_prob * np.log(joint_prob / (marginal_product + eps)), axis=(2, 3))
+        return np.maximum(kl_div, 0.0)
+
+    def sliding_window(self, window_size: int) -> "SlidingWindowAgency":
+        """Create a streaming estimator that scores the last `window_size` samples."""
+        return SlidingWindowAgency(self, window_size)
+
     def _compute_2d_kl_divergence(self, mu_dim: np.ndarray, a_dim: np.ndarray) -> float:
         """
         Compute KL divergence between joint distribution and product of marginals
@@ -371,6 +415,167 @@ class AgencyDetector:
         )
 
 
+def _as_samples(states: np.ndarray) -> np.ndarray:
+    """Shape samples as (N, D); a 1D array is N samples of one dimension."""
+    states = np.asarray(states, dtype=float)
+    if states.ndim == 1:
+        return states[:, None]
+    return np.atleast_2d(states)
+
+
+def _data_ranges(samples: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Per-dimension (min, max), widened by 0.5 each side for constant dimensions."""
+    lo = samples.min(axis=0)
+    hi = samples.max(axis=0)
+    constant = lo == hi
+    return np.where(constant, lo - 0.5, lo), np.where(constant, hi + 0.5, hi)
+
+
+def _bin_indices(samples: np.ndarray, lo: np.ndarray, hi: np.ndarray, num_bins: int) -> np.ndarray:
+    """
+    Histogram bin of every sample in every dimension, (N, D).
+
+    Uses the same edges as np.histogram2d: a value belongs to the last edge at
+    or below it, and the maximum falls into the last bin.
+    """
+    inner_edges = np.linspace(lo, hi, num_bins + 1, axis=1)[:, 1:-1]
+    return (samples[:, :, None] >= inner_edges[None, :, :]).sum(axis=2)
+
+
+def _one_hot(bins: np.ndarray, num_bins: int) -> np.ndarray:
+    """(N, D) bin indices as an (N, D * B) indicator matrix."""
+    n, dims = bins.shape
+    onehot = np.zeros((n, dims * num_bins))
+    onehot[np.arange(n)[:, None], np.arange(dims) * num_bins + bins] = 1.0
+    return onehot
+
+
+def _joint_counts(mu_onehot: np.ndarray, a_onehot: np.ndarray, mu_dims: int, a_dims: int, num_bins: int) -> np.ndarray:
+    """Joint histograms for all dimension pairs, (D_mu, D_a, B, B)."""
+    counts = mu_onehot.T @ a_onehot
+    return counts.reshape(mu_dims, num_bins, a_dims, num_bins).transpose(0, 2, 1, 3)
+
+
+class SlidingWindowAgency:
+    """
+    Agency score over a sliding window of (internal, active) samples.
+
+    Keeps the per-pair joint and marginal histograms of the window and updates
+    them as samples enter and leave, so a new sample costs O(D_mu * D_a) count
+    updates instead of re-binning the window. Bins follow each dimension's
+    range within the window, as in the batch estimator; a dimension whose range
+    changes is re-binned on its own. The score always equals
+    AgencyDetector.calculate_agency_score on the current window.
+    """
+
+    def __init__(self, detector: AgencyDetector, window_size: int):
+        if window_size < 2:
+            raise ValueError("window_size must be at least 2")
+        self.detector = detector
+        self.window_size = window_size
+        self._num_bins = detector.num_bins
+        self._count = 0
+        self._next = 0
+        self._scores: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _allocate(self, mu_dims: int, a_dims: int) -> None:
+        b = self._num_bins
+        self._mu = np.zeros((self.window_size, mu_dims))
+        self._a = np.zeros((self.window_size, a_dims))
+        self._mu_bins = np.zeros((self.window_size, mu_dims), dtype=int)
+        self._a_bins = np.zeros((self.window_size, a_dims), dtype=int)
+        self._mu_range = (np.full(mu_dims, np.nan), np.full(mu_dims, np.nan))
+        self._a_range = (np.full(a_dims, np.nan), np.full(a_dims, np.nan))
+        self._joint = np.zeros((mu_dims, a_dims, b, b))
+        self._mu_counts = np.zeros((mu_dims, b))
+        self._a_counts = np.zeros((a_dims, b))
+
+    def push(self, internal_state: np.ndarray, active_state: np.ndarray) -> None:
+        """Add one sample (a D_mu and a D_a vector), evicting the oldest when full."""
+        mu = np.atleast_1d(np.asarray(internal_state, dtype=float))
+        a = np.atleast_1d(np.asarray(active_state, dtype=float))
+        if self._count == 0 and self._next == 0:
+            self._allocate(len(mu), len(a))
+        if mu.shape != self._mu.shape[1:] or a.shape != self._a.shape[1:]:
+            raise ValueError("Sample dimensions must match the window's dimensions")
+
+        slot = self._next
+        mu_idx, a_idx = np.arange(len(mu)), np.arange(len(a))
+        if self._count == self.window_size:
+            old_mu, old_a = self._mu_bins[slot], self._a_bins[slot]
+            self._joint[mu_idx[:, None], a_idx[None, :], old_mu[:, None], old_a[None, :]] -= 1
+            self._mu_counts[mu_idx, old_mu] -= 1
+            self._a_counts[a_idx, old_a] -= 1
+        else:
+            self._count += 1
+        self._mu[slot], self._a[slot] = mu, a
+        self._next = (slot + 1) % self.window_size
+
+        n = self._count
+        mu_range, a_range = _data_ranges(self._mu[:n]), _data_ranges(self._a[:n])
+        stale_mu = (mu_range[0] != self._mu_range[0]) | (mu_range[1] != self._mu_range[1])
+        stale_a = (a_range[0] != self._a_range[0]) | (a_range[1] != self._a_range[1])
+        self._mu_range, self._a_range = mu_range, a_range
+
+        new_mu = _bin_indices(mu[None, :], *mu_range, self._num_bins)[0]
+        new_a = _bin_indices(a[None, :], *a_range, self._num_bins)[0]
+        self._mu_bins[slot], self._a_bins[slot] = new_mu, new_a
+        fresh_mu, fresh_a = mu_idx[~stale_mu], a_idx[~stale_a]
+        self._joint[fresh_mu[:, None], fresh_a[None, :], new_mu[fresh_mu][:, None], new_a[fresh_a][None, :]] += 1
+        self._mu_counts[fresh_mu, new_mu[fresh_mu]] += 1
+        self._a_counts[fresh_a, new_a[fresh_a]] += 1
+
+        if stale_mu.any() or stale_a.any():
+            self._rebin(np.flatnonzero(stale_mu), np.flatnonzero(stale_a))
+        self._scores = None
+
+    def _rebin(self, stale_mu: np.ndarray, stale_a: np.ndarray) -> None:
+        """Recompute bins and histograms for dimensions whose window range moved."""
+        n, b = self._count, self._num_bins
+        if len(stale_mu):
+            self._mu_bins[:n, stale_mu] = _bin_indices(
+                self._mu[:n, stale_mu], self._mu_range[0][stale_mu], self._mu_range[1][stale_mu], b
+            )
+        if len(stale_a):
+            self._a_bins[:n, stale_a] = _bin_indices(
+                self._a[:n, stale_a], self._a_range[0][stale_a], self._a_range[1][stale_a], b
+            )
+        mu_onehot = _one_hot(self._mu_bins[:n], b)
+        a_onehot = _one_hot(self._a_bins[:n], b)
+        mu_dims, a_dims = self._mu.shape[1], self._a.shape[1]
+        if len(stale_mu):
+            columns = (stale_mu[:, None] * b + np.arange(b)).ravel()
+            self._joint[stale_mu] = _joint_counts(mu_onehot[:, columns], a_onehot, len(stale_mu), a_dims, b)
+            self._mu_counts[stale_mu] = mu_onehot[:, columns].sum(axis=0).reshape(len(stale_mu), b)
+        if len(stale_a):
+            columns = (stale_a[:, None] * b + np.arange(b)).ravel()
+            self._joint[:, stale_a] = _joint_counts(mu_onehot, a_onehot[:, columns], mu_dims, len(stale_a), b)
+            self._a_counts[stale_a] = a_onehot[:, columns].sum(axis=0).reshape(len(stale_a), b)
+
+    def extend(self, internal_states: np.ndarray, active_states: np.ndarray) -> None:
+        """Push samples in order."""
+        for mu, a in zip(_as_samples(internal_states), _as_samples(active_states)):
+            self.push(mu, a)
+
+    def pairwise_scores(self) -> np.ndarray:
+        """(D_mu, D_a) per-pair agency scores over the current window."""
+        if self._count < 2:
+            return np.zeros(self._joint.shape[:2]) if self._count else np.zeros((0, 0))
+        if self._scores is None:
+            self._scores = self.detector._pairwise_kl_from_counts(
+                self._joint, self._mu_counts, self._a_counts, self._count
+            )
+        return self._scores
+
+    def score(self) -> float:
+        """Agency score over the current window (0 with fewer than 2 samples)."""
+        scores = self.pairwise_scores()
+        return float(scores.mean()) if scores.size else 0.0
+
+
 # Singleton factory
 _agency_detector: Optional[AgencyDetector] = None
 
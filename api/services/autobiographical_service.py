@@ -22,6 +22,7 @@ from api.models.autobiographical import (
     ExtendedMindState,
 )
 from api.services.webhook_neo4j_driver import get_neo4j_driver
+from api.services.system_metrics_service import count_created_memory
 from api.services.consciousness.active_inference_analyzer import ActiveInferenceAnalyzer
 from api.services.conversation_moment_service import (
     get_conversation_moment_service,
@@ -341,6 +342,7 @@ class AutobiographicalService:
             created_at: datetime()
         })
         SET m += $metadata
+        """ + count_created_memory("m") + """
         RETURN m.id as id
         """
         metadata = metadata or {}
@@ -14,6 +14,8 @@ from datetime import datetime, timedelta
 from enum import Enum
 from typing import Any
 
+from api.services.cypher_statements import register_statement
+
 logger = logging.getLogger("dionysus.background_worker")
 
 
@@ -70,12 +72,66 @@ class WorkerConfig:
     episode_stale_hours: float = 48.0
     max_items_per_cycle: int = 10
     health_check_interval_cycles: int = 10
+    metrics_reconcile_interval_cycles: int = 120
 
 
 # =============================================================================
 # T022: Neighborhood Recomputation
 # =============================================================================
 
+# Run for every stale memory on every cycle, so they are registered once
+_STALE_NEIGHBORHOODS = register_statement(
+    "background_worker.stale_neighborhoods",
+    """
+    MATCH (m:Memory)
+    WHERE m.neighborhood_computed_at IS NULL
+       OR m.neighborhood_computed_at < datetime($threshold)
+    RETURN m.id as id, m.content as content,
+           m.neighborhood_computed_at as last_computed
+    ORDER BY m.neighborhood_computed_at ASC NULLS FIRST
+    LIMIT $limit
+    """,
+)
+_GRAPH_NEIGHBORS = register_statement(
+    "background_worker.graph_neighbors",
+    """
+    MATCH (m:Memory {id: $memory_id})-[r]-(neighbor:Memory)
+    WHERE type(r) <> 'TEMPORAL_NEAR'
+    RETURN neighbor.id as id, type(r) as relationship
+    LIMIT 20
+    """,
+)
+_TEMPORAL_NEIGHBORS = register_statement(
+    "background_worker.temporal_neighbors",
+    """
+    MATCH (m:Memory {id: $memory_id})
+    MATCH (neighbor:Memory)
+    WHERE neighbor.id <> m.id
+      AND abs(duration.inSeconds(neighbor.created_at, m.created_at).seconds) < 3600
+    RETURN neighbor.id as id
+    LIMIT 10
+    """,
+)
+_SET_NEIGHBORHOOD_COUNTS = register_statement(
+    "background_worker.set_neighborhood_counts",
+    """
+    MATCH (m:Memory {id: $memory_id})
+    SET m.neighborhood_computed_at = datetime(),
+        m.graph_neighbor_count = $graph_count,
+        m.temporal_neighbor_count = $temporal_count
+    """,
+)
+_LINK_TEMPORAL_NEIGHBORS = register_statement(
+    "background_worker.link_temporal_neighbors",
+    """
+    MATCH (m:Memory {id: $memory_id})
+    UNWIND $neighbor_ids AS neighbor_id
+    MATCH (n:Memory {id: neighbor_id})
+    MERGE (m)-[r:TEMPORAL_NEAR]-(n)
+    ON CREATE SET r.created_at = datetime()
+    """,
+)
+
 
 class NeighborhoodRecomputeTask:
     """
@@ -109,16 +165,8 @@ class NeighborhoodRecomputeTask:
         stale_threshold = datetime.utcnow() - timedelta(hours=self._config.neighborhood_stale_hours)
 
         async with driver.session() as session:
-            result = await session.run(
-                """
-                MATCH (m:Memory)
-                WHERE m.neighborhood_computed_at IS NULL
-                   OR m.neighborhood_computed_at < datetime($threshold)
-                RETURN m.id as id, m.content as content,
-                       m.neighborhood_computed_at as last_computed
-                ORDER BY m.neighborhood_computed_at ASC NULLS FIRST
-                LIMIT $limit
-                """,
+            result = await session.run_statement(
+                _STALE_NEIGHBORHOODS.name,
                 threshold=stale_threshold.isoformat(),
                 limit=self._config.max_items_per_cycle,
             )
@@ -146,55 +194,27 @@ class NeighborhoodRecomputeTask:
         try:
             async with driver.session() as session:
                 # Find graph neighbors (memories connected via relationships)
-                graph_result = await session.run(
-                    """
-                    MATCH (m:Memory {id: $memory_id})-[r]-(neighbor:Memory)
-                    WHERE type(r) <> 'TEMPORAL_NEAR'
-                    RETURN neighbor.id as id, type(r) as relationship
-                    LIMIT 20
-                    """,
-                    memory_id=memory_id,
-                )
+                graph_result = await session.run_statement(_GRAPH_NEIGHBORS.name, memory_id=memory_id)
                 graph_neighbors = await graph_result.data()
 
                 # Find temporal neighbors (within 1 hour)
-                temporal_result = await session.run(
-                    """
-                    MATCH (m:Memory {id: $memory_id})
-                    MATCH (neighbor:Memory)
-                    WHERE neighbor.id <> m.id
-                      AND abs(duration.inSeconds(neighbor.created_at, m.created_at).seconds) < 3600
-                    RETURN neighbor.id as id
-                    LIMIT 10
-                    """,
-                    memory_id=memory_id,
-                )
+                temporal_result = await session.run_statement(_TEMPORAL_NEIGHBORS.name, memory_id=memory_id)
                 temporal_neighbors = await temporal_result.data()
 
                 # Update neighborhood metadata
-                await session.run(
-                    """
-                    MATCH (m:Memory {id: $memory_id})
-                    SET m.neighborhood_computed_at = datetime(),
-                        m.graph_neighbor_count = $graph_count,
-                        m.temporal_neighbor_count = $temporal_count
-                    """,
+                await session.run_statement(
+                    _SET_NEIGHBORHOOD_COUNTS.name,
                     memory_id=memory_id,
                     graph_count=len(graph_neighbors),
                     temporal_count=len(temporal_neighbors),
                 )
 
-                # Create/update temporal neighbor relationships
-                for neighbor in temporal_neighbors:
-                    await session.run(
-                        """
-                        MATCH (m:Memory {id: $memory_id})
-                        MATCH (n:Memory {id: $neighbor_id})
-                        MERGE (m)-[r:TEMPORAL_NEAR]-(n)
-                        ON CREATE SET r.created_at = datetime()
-                        """,
+                # Create/update temporal neighbor relationships in one round trip
+                if temporal_neighbors:
+                    await session.run_statement(
+                        _LINK_TEMPORAL_NEIGHBORS.name,
                         memory_id=memory_id,
-                        neighbor_id=neighbor["id"],
+                        neighbor_ids=[neighbor["id"] for neighbor in temporal_neighbors],
                     )
 
             logger.debug(f"Recomputed neighborhood for {memory_id}: {len(graph_neighbors)} graph, {len(temporal_neighbors)} temporal")
@@ -781,6 +801,15 @@ class BackgroundWorker:
                     except Exception as e:
                         logger.error(f"Failed to capture system moment: {e}")
 
+                    # Correct drift in the incrementally maintained system
+                    # moment metrics (~hourly)
+                    if cycle_count % self._config.metrics_reconcile_interval_cycles == 0:
+                        try:
+                            from api.services.system_metrics_service import get_system_metrics_service
+                            await get_system_metrics_service().reconcile()
+                        except Exception as e:
+                            logger.error(f"System metrics reconciliation failed: {e}")
+
                     # FEATURE 049: Meta-Evolutionary Cycle
                     # Run every 100 cycles (~50 minutes) or controlled by config
                     if cycle_count % 100 == 0:
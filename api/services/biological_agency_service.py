@@ -16,9 +16,13 @@ Reference:
     https://doi.org/10.1016/j.tics.2025.07.004
 """
 
+import asyncio
 import logging
 import json
-from typing import Any, Dict, List, Optional, Tuple
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from api.models.biological_agency import (
     AffordanceType,
@@ -40,10 +44,87 @@ from api.models.biological_agency import (
     ObjectAffordance,
     CompetitiveAffordance,
 )
+from api.services.cypher_statements import gate_blocked, register_statement
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class StatePersistencePolicy:
+    """
+    How agent state is written to the graph.
+
+    Each flush writes only the sub-states that changed since the last one (a
+    delta); every `keyframe_interval` deltas a full keyframe is written
+    instead. History is a ring of `retain_keyframes` keyframe spans: each
+    version overwrites the slot of the version one ring earlier, so it stays
+    bounded without deleting nodes (0 keeps everything).
+    Persists within `write_behind_delay` seconds are coalesced into one write.
+    """
+    keyframe_interval: int = 20
+    retain_keyframes: int = 5
+    write_behind_delay: float = 0.05
+
+    def history_slot(self, version: int) -> int:
+        """History slot a version is written to (versions start at 1)."""
+        if self.retain_keyframes <= 0:
+            return version
+        return (version - 1) % (self.retain_keyframes * (self.keyframe_interval + 1))
+
+    @classmethod
+    def from_env(cls) -> "StatePersistencePolicy":
+        return cls(
+            keyframe_interval=int(os.getenv("BIOLOGICAL_STATE_KEYFRAME_INTERVAL", "20")),
+            retain_keyframes=int(os.getenv("BIOLOGICAL_STATE_RETAIN_KEYFRAMES", "5")),
+            write_behind_delay=float(os.getenv("BIOLOGICAL_STATE_WRITE_DELAY", "0.05")),
+        )
+
+
+@dataclass
+class _PersistedState:
+    """What the graph already holds for one agent."""
+    version: int = 0
+    keyframe_version: int = 0
+    properties: Dict[str, Any] = field(default_factory=dict)
+    ledger_ids: Set[str] = field(default_factory=set)
+
+
+# Head node holding the latest full state; history nodes hold keyframes and
+# deltas in a fixed ring of slots (StatePersistencePolicy.history_slot).
+# schema: (:Agent)-[:LATEST_STATE]->(:BiologicalStateHead)
+# schema: (:Agent)-[:HAS_STATE]->(:BiologicalState {agent_id, slot, version, kind: 'keyframe'|'delta'})
+_STATE_WRITE = register_statement("biological_agency.state_write", """
+MERGE (a:Agent {id: $agent_id})
+MERGE (a)-[:LATEST_STATE]->(h:BiologicalStateHead {agent_id: $agent_id})
+SET h += $changed,
+    h.version = $version,
+    h.keyframe_version = $keyframe_version,
+    h.timestamp = $timestamp
+MERGE (s:BiologicalState {agent_id: $agent_id, slot: $slot})
+SET s = $record
+MERGE (a)-[:HAS_STATE]->(s)
+""")
+
+_LEDGER_APPEND = register_statement("biological_agency.ledger_append", """
+MATCH (a:Agent {id: $agent_id})
+UNWIND $events AS event_data
+MERGE (e:ReconciliationEvent {id: event_data.id})
+SET e = event_data
+MERGE (a)-[:HAS_RECONCILIATION]->(e)
+""")
+
+_STATE_HEAD = register_statement("biological_agency.state_head", """
+MATCH (a:Agent {id: $agent_id})
+OPTIONAL MATCH (a)-[:LATEST_STATE]->(h:BiologicalStateHead)
+OPTIONAL MATCH (a)-[:HAS_RECONCILIATION]->(e:ReconciliationEvent) WHERE h IS NOT NULL
+WITH a, h, e ORDER BY e.timestamp
+WITH a, h, collect(properties(e)) AS ledger
+OPTIONAL MATCH (a)-[:HAS_STATE]->(s:BiologicalState) WHERE h IS NULL
+WITH h, ledger, s ORDER BY s.timestamp DESC
+RETURN h, ledger, head(collect(s)) AS s
+""")
+
+
 class BiologicalAgencyService:
     """
     Orchestrates the three-tier biological agency architecture.
@@ -57,9 +138,13 @@ class BiologicalAgencyService:
     """
     
     
-    def __init__(self):
+    def __init__(self, persistence: Optional[StatePersistencePolicy] = None):
         """Initialize the biological agency service."""
         self._agents: Dict[str, BiologicalAgentState] = {}
+        self._persistence = persistence or StatePersistencePolicy.from_env()
+        self._persisted: Dict[str, _PersistedState] = {}
+        self._dirty: Set[str] = set()
+        self._flush_task: Optional[asyncio.Task] = None
         self._developmental_sequence = DevelopmentalStage.get_standard_sequence()
         self._collective_agencies: Dict[str, CollectiveAgency] = {}
         # Graphiti service is initialized lazily because it's async
@@ -110,7 +195,8 @@ class BiologicalAgencyService:
                 # Targeted Recognition: Find agent linked to this device's journey
                 recognition_query = """
                 MATCH (j:Journey {device_id: $device_id})-[:BELONGS_TO|HAS_PARTICIPANT]->(p)
-                MATCH (a:Agent {id: p.id})-[:HAS_STATE]->(s:BiologicalState)
+                MATCH (a:Agent {id: p.id})-[r:LATEST_STATE|HAS_STATE]->(s)
+                WHERE type(r) = 'LATEST_STATE' OR NOT (a)-[:LATEST_STATE]->()
                 RETURN a.id as agent_id
                 ORDER BY s.timestamp DESC
                 LIMIT 1
@@ -124,12 +210,14 @@ class BiologicalAgencyService:
                         logger.info(f"Wake-Up Recognition: Hydrated agent {agent_id} for device {device_id}")
 
             # Fallback/Broadcast hydration for system readiness (top active agents)
+            # Agents persisted before the head pointer existed fall back to their history
             broadcast_query = """
-            MATCH (a:Agent)-[:HAS_STATE]->(s:BiologicalState)
+            MATCH (a:Agent)-[r:LATEST_STATE|HAS_STATE]->(s)
             WHERE NOT a.id IN $already_hydrated
-            WITH a, s ORDER BY s.timestamp DESC
-            WITH a, head(collect(s)) as latest_state
+              AND (type(r) = 'LATEST_STATE' OR NOT (a)-[:LATEST_STATE]->())
+            WITH a, max(s.timestamp) as latest
             RETURN a.id as agent_id
+            ORDER BY latest DESC
             LIMIT $limit
             """
             limit = 5 - len(hydrated_ids)
@@ -191,115 +279,170 @@ class BiologicalAgencyService:
         )
         return agent
     
-    async def persist_agent_state(self, agent_id: str) -> None:
+    async def persist_agent_state(self, agent_id: str, wait: bool = True) -> None:
         """
-        Persist agent state to Graphiti (Neo4j).
-        
-        Creates/Updates the :Agent and :BiologicalState nodes.
-        schema: (:Agent {id: ...})-[:HAS_STATE]->(:BiologicalState {timestamp: ...})
+        Persist agent state to Graphiti (Neo4j), write-behind.
+
+        Marks the agent dirty and schedules a flush; persists arriving within
+        the policy's write_behind_delay share one write. With wait=False the
+        caller does not block on the graph (decision loops use this).
+
+        schema: (:Agent {id: ...})-[:LATEST_STATE]->(:BiologicalStateHead)
+        schema: (:Agent)-[:HAS_STATE]->(:BiologicalState {slot: ..., version: ..., kind: ...})
         schema: (:Agent)-[:HAS_RECONCILIATION]->(:ReconciliationEvent)
         """
+        if agent_id not in self._agents:
+            return
+
+        self._dirty.add(agent_id)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop(self._persistence.write_behind_delay))
+        if wait:
+            await asyncio.shield(self._flush_task)
+
+    async def flush(self) -> None:
+        """Write every pending agent state now (shutdown, tests)."""
+        if self._flush_task is not None and not self._flush_task.done():
+            await asyncio.shield(self._flush_task)
+        if self._dirty:
+            await self._flush_loop(0.0)
+
+    async def _flush_loop(self, delay: float) -> None:
+        if delay > 0:
+            await asyncio.sleep(delay)
+        # Agents whose write failed are re-marked dirty; leave them for the
+        # next persist or flush rather than retrying in a tight loop
+        failed: Set[str] = set()
+        while self._dirty - failed:
+            pending = self._dirty - failed
+            self._dirty -= pending
+            for agent_id in pending:
+                if await self._write_agent_state(agent_id) < 0:
+                    failed.add(agent_id)
+
+    async def _write_agent_state(self, agent_id: str) -> int:
+        """
+        Write one agent's changes: a delta (or periodic keyframe) into its
+        history slot, and new ledger events.
+
+        Returns:
+            Number of graph statements issued (0 when nothing changed, -1 when
+            the write failed and the agent was re-marked dirty)
+        """
         agent = self._agents.get(agent_id)
         if not agent:
-            return
+            return 0
 
+        persisted = self._persisted.get(agent_id) or _PersistedState()
         props = agent.to_graph_properties()
-        
-        # 1. Persist the State Node (The "Point-in-Time" Snapshot)
-        state_query = """
-        MERGE (a:Agent {id: $agent_id})
-        CREATE (s:BiologicalState)
-        SET s = $props
-        MERGE (a)-[:HAS_STATE]->(s)
-        """
-        
+        props.pop("timestamp", None)
+        # The ledger is stored as first-class nodes, appended below
+        props.pop("reconciliation_ledger", None)
+        new_events = [e for e in agent.reconciliation_ledger if e.id not in persisted.ledger_ids]
+
+        changed = {k: v for k, v in props.items() if k not in persisted.properties or persisted.properties[k] != v}
+        if not changed and not new_events and persisted.version:
+            return 0
+
+        policy = self._persistence
+        version = persisted.version + 1
+        is_keyframe = not persisted.version or version - persisted.keyframe_version > policy.keyframe_interval
+        keyframe_version = version if is_keyframe else persisted.keyframe_version
+        timestamp = datetime.utcnow().isoformat()
+        written = props if is_keyframe else changed
+        slot = policy.history_slot(version)
+        record = {
+            **{k: v for k, v in written.items() if v is not None},
+            "agent_id": agent_id,
+            "slot": slot,
+            "version": version,
+            "keyframe_version": keyframe_version,
+            "kind": "keyframe" if is_keyframe else "delta",
+            "changed": sorted(changed),
+            "timestamp": timestamp,
+        }
+
+        statements = 0
         try:
             graph = await self._get_graph_service()
-            await graph.execute_cypher(state_query, {"agent_id": agent_id, "props": props})
-            
-            # 2. Manifest Reconciliation Ledger (First-Class Nodes)
-            # We merge individual events to ensure history is traversable
-            if agent.reconciliation_ledger:
-                ledger_query = """
-                MATCH (a:Agent {id: $agent_id})
-                UNWIND $events AS event_data
-                MERGE (e:ReconciliationEvent {id: event_data.id})
-                SET e = event_data
-                MERGE (a)-[:HAS_RECONCILIATION]->(e)
-                """
-                # Prepare data (dumping pydantic to dict)
-                events = [e.model_dump(mode='json') for e in agent.reconciliation_ledger]
-                await graph.execute_cypher(ledger_query, {"agent_id": agent_id, "events": events})
-                logger.debug(f"Manifested {len(events)} reconciliation events in graph.")
+            rows = await graph.execute_statement(_STATE_WRITE.name, {
+                "agent_id": agent_id,
+                "changed": written,
+                "version": version,
+                "keyframe_version": keyframe_version,
+                "timestamp": timestamp,
+                "slot": slot,
+                "record": record,
+            })
+            if gate_blocked(rows):
+                raise RuntimeError("state write blocked by the Destruction Gate")
+            statements += 1
+            persisted = self._persisted[agent_id] = _PersistedState(
+                version=version,
+                keyframe_version=keyframe_version,
+                properties=props,
+                ledger_ids=persisted.ledger_ids,
+            )
 
-            logger.info(f"Persisted comprehensive state for agent {agent_id}")
+            # Manifest Reconciliation Ledger (First-Class Nodes), new events only
+            if new_events:
+                events = [e.model_dump(mode='json') for e in new_events]
+                rows = await graph.execute_statement(_LEDGER_APPEND.name, {"agent_id": agent_id, "events": events})
+                if gate_blocked(rows):
+                    raise RuntimeError("ledger append blocked by the Destruction Gate")
+                statements += 1
+                persisted.ledger_ids = persisted.ledger_ids | {e.id for e in new_events}
+                logger.debug(f"Appended {len(events)} reconciliation events for {agent_id}.")
+
+            logger.info(
+                f"Persisted {'keyframe' if is_keyframe else 'delta'} v{version} for agent {agent_id} "
+                f"({len(changed)} sub-states changed, {len(new_events)} ledger events)"
+            )
         except Exception as e:
+            # Unwritten changes stay unrecorded and the agent stays dirty, so
+            # the next persist or flush carries them
+            self._dirty.add(agent_id)
             logger.error(f"Failed to persist agent {agent_id}: {e}")
+            return -1
+        return statements
 
     async def _hydrate_agent(self, agent_id: str) -> Optional[BiologicalAgentState]:
         """
         Hydrate agent from Graphiti (The Lazarus Protocol).
         
-        Retrieves the most recent :BiologicalState for the agent.
-        """
-        query = """
-        MATCH (a:Agent {id: $agent_id})-[:HAS_STATE]->(s:BiologicalState)
-        RETURN s
-        ORDER BY s.timestamp DESC
-        LIMIT 1
+        Reads the agent's BiologicalStateHead through its LATEST_STATE pointer
+        (no history scan), plus its reconciliation events. Agents persisted
+        before the pointer existed fall back, in the same query, to their
+        latest full snapshot.
         """
-        
         try:
             graph = await self._get_graph_service()
-            results = await graph.execute_cypher(query, {"agent_id": agent_id})
-            if not results:
+            results = await graph.execute_statement(_STATE_HEAD.name, {"agent_id": agent_id})
+            row = results[0] if results else {}
+            if row.get('h'):
+                data = row['h']
+                ledger = [ReconciliationEvent.model_validate(item) for item in row.get('ledger') or [] if item]
+            elif row.get('s'):
+                data = row['s']
+                ledger = self._parse_legacy_ledger(agent_id, data.get('reconciliation_ledger'))
+            else:
                 return None
-            
-            data = results[0]['s']
-            
-            # Reconstruct Pydantic models from JSON strings
-            perception = PerceptionState.model_validate_json(data['perception_state'])
-            goals = GoalState.model_validate_json(data['goal_state'])
-            executive = ExecutiveState.model_validate_json(data['executive_state'])
-            metacog = MetacognitiveState.model_validate_json(data['metacognitive_state'])
-            
-            # Feature 070: Subcortical State hydration
-            subcortical_data = data.get('subcortical_state')
-            subcortical = SubcorticalState.model_validate_json(subcortical_data) if subcortical_data else SubcorticalState()
-            
-            # Handle optionals
-            last_decision = BehavioralDecision.model_validate_json(data['last_decision']) if data.get('last_decision') else None
-            joint_agency = JointAgency.model_validate_json(data['joint_agency']) if data.get('joint_agency') else None
-            collective_agency = CollectiveAgency.model_validate_json(data['collective_agency']) if data.get('collective_agency') else None
-            
-            # Feature 064: Hydrate Reconciliation Ledger
-            ledger_data = data.get('reconciliation_ledger')
-            reconciliation_ledger = []
-            if ledger_data:
-                try:
-                    # Handle both string and list (depending on Graphiti's underlying format)
-                    items = json.loads(ledger_data) if isinstance(ledger_data, str) else ledger_data
-                    reconciliation_ledger = [ReconciliationEvent.model_validate(item) for item in items]
-                except Exception as le:
-                    logger.warning(f"Could not parse reconciliation ledger for {agent_id}: {le}")
 
-            agent = BiologicalAgentState(
-                agent_id=agent_id,
-                current_tier=AgencyTier(data['current_tier']),
-                developmental_stage=int(data['developmental_stage']),
-                shared_agency_type=SharedAgencyType(data['shared_agency_type']),
-                perception=perception,
-                goals=goals,
-                executive=executive,
-                metacognitive=metacog,
-                subcortical=subcortical,
-                last_decision=last_decision,
-                joint_agency=joint_agency,
-                collective_agency=collective_agency,
-                reconciliation_ledger=reconciliation_ledger
-            )
-            
+            agent = self._agent_from_properties(agent_id, data, ledger)
             self._agents[agent_id] = agent
+            if data.get('version'):
+                props = agent.to_graph_properties()
+                props.pop("timestamp", None)
+                props.pop("reconciliation_ledger", None)
+                self._persisted[agent_id] = _PersistedState(
+                    version=int(data['version']),
+                    keyframe_version=int(data.get('keyframe_version') or data['version']),
+                    properties=props,
+                    ledger_ids={e.id for e in ledger},
+                )
+            else:
+                # Legacy ledgers were already merged as nodes; the next write is a keyframe
+                self._persisted[agent_id] = _PersistedState(ledger_ids={e.id for e in ledger})
             logger.info(f"Hydrated agent {agent_id} from Graph Memory.")
             return agent
             
@@ -307,6 +450,57 @@ class BiologicalAgencyService:
             logger.error(f"Failed to hydrate agent {agent_id}: {e}")
             return None
 
+    @staticmethod
+    def _parse_legacy_ledger(agent_id: str, ledger_data: Any) -> List[ReconciliationEvent]:
+        if not ledger_data:
+            return []
+        try:
+            # Handle both string and list (depending on Graphiti's underlying format)
+            items = json.loads(ledger_data) if isinstance(ledger_data, str) else ledger_data
+            return [ReconciliationEvent.model_validate(item) for item in items]
+        except Exception as le:
+            logger.warning(f"Could not parse reconciliation ledger for {agent_id}: {le}")
+            return []
+
+    @staticmethod
+    def _agent_from_properties(
+        agent_id: str,
+        data: Dict[str, Any],
+        reconciliation_ledger: List[ReconciliationEvent],
+    ) -> BiologicalAgentState:
+        """Rebuild an agent from stored properties (JSON strings per sub-state)."""
+        perception = PerceptionState.model_validate_json(data['perception_state'])
+        goals = GoalState.model_validate_json(data['goal_state'])
+        executive = ExecutiveState.model_validate_json(data['executive_state'])
+        metacog_data = data.get('metacognitive_state')
+        metacog = MetacognitiveState.model_validate_json(metacog_data) if metacog_data else MetacognitiveState()
+        
+        # Feature 070: Subcortical State hydration
+        subcortical_data = data.get('subcortical_state')
+        subcortical = SubcorticalState.model_validate_json(subcortical_data) if subcortical_data else SubcorticalState()
+        
+        # Handle optionals
+        last_decision = BehavioralDecision.model_validate_json(data['last_decision']) if data.get('last_decision') else None
+        joint_agency = JointAgency.model_validate_json(data['joint_agency']) if data.get('joint_agency') else None
+        collective_agency = CollectiveAgency.model_validate_json(data['collective_agency']) if data.get('collective_agency') else None
+
+        return BiologicalAgentState(
+            agent_id=agent_id,
+            current_tier=AgencyTier(data['current_tier']),
+            developmental_stage=int(data['developmental_stage']),
+            shared_agency_type=SharedAgencyType(data['shared_agency_type']),
+            perception=perception,
+            goals=goals,
+            executive=executive,
+            metacognitive=metacog,
+            subcortical=subcortical,
+            last_decision=last_decision,
+            joint_agency=joint_agency,
+            collective_agency=collective_agency,
+            reconciliation_ledger=reconciliation_ledger,
+            prior_hierarchy_json=data.get('prior_hierarchy_json'),
+        )
+
     async def get_agent(self, agent_id: str) -> Optional[BiologicalAgentState]:
         """
         Retrieve agent state by ID. 
@@ -379,7 +573,7 @@ class BiologicalAgencyService:
             )
         
         agent.last_decision = decision
-        await self.persist_agent_state(agent_id)
+        await self.persist_agent_state(agent_id, wait=False)
         return decision
     
     # =========================================================================
@@ -464,7 +658,7 @@ class BiologicalAgencyService:
         agent.executive = executive
         agent.last_decision = decision
         
-        await self.persist_agent_state(agent_id)
+        await self.persist_agent_state(agent_id, wait=False)
         
         return decision, executive
     
@@ -576,7 +770,7 @@ class BiologicalAgencyService:
                  )
                  
                  agent.last_decision = decision
-                 await self.persist_agent_state(agent_id)
+                 await self.persist_agent_state(agent_id, wait=False)
                  
                  # Feature 064: Trigger Forgiveness Protocol (Counterfactual Simulation)
                  # We must determine if this Refusal caused harm or prevented it.
@@ -622,7 +816,7 @@ class BiologicalAgencyService:
         agent.metacognitive = metacog
         agent.last_decision = decision
         
-        await self.persist_agent_state(agent_id)
+        await self.persist_agent_state(agent_id, wait=False)
         
         return decision, metacog
     
@@ -676,9 +870,9 @@ class BiologicalAgencyService:
             other_partners = [p for p in all_partners if p != pid]
             partner.enable_joint_agency(other_partners, joint_goal)
         
-        await self.persist_agent_state(initiator_id)
+        await self.persist_agent_state(initiator_id, wait=False)
         for pid in partner_ids:
-            await self.persist_agent_state(pid)
+            await self.persist_agent_state(pid, wait=False)
         
         logger.info(
             f"Formed joint agency: {initiator_id} + {partner_ids} "
@@ -752,7 +946,7 @@ class BiologicalAgencyService:
         agent.collective_agency = collective
         collective.institutional_roles[agent_id] = role
         
-        await self.persist_agent_state(agent_id)
+        await self.persist_agent_state(agent_id, wait=False)
         
         logger.info(
             f"Agent {agent_id} joined collective '{culture_id}' as '{role}'"
@@ -803,7 +997,7 @@ class BiologicalAgencyService:
         agent.developmental_stage = next_stage.stage_number
         agent.current_tier = next_stage.tier
         
-        await self.persist_agent_state(agent_id)
+        await self.persist_agent_state(agent_id, wait=False)
         
         logger.info(
             f"Agent {agent_id} advanced to stage {next_stage.stage_number}: "
@@ -1226,3 +1420,9 @@ def get_biological_agency_service() -> BiologicalAgencyService:
     if _service_instance is None:
         _service_instance = BiologicalAgencyService()
     return _service_instance
+
+
+async def flush_biological_agency_state() -> None:
+    """Write pending agent state if the service was ever created (shutdown)."""
+    if _service_instance is not None:
+        await _service_instance.flush()
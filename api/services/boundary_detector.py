@@ -0,0 +1,240 @@
+"""
+Embedding Boundary Detector.
+
+Local fast path for Nemori episode boundary detection (Event Segmentation Theory).
+Keeps a rolling window of event embeddings and flags a boundary when the new
+event drifts away from the window centroid, or when the drift is a change-point
+outlier against the window's own drift history. Only the ambiguous band between
+"clearly continuous" and "clearly a boundary" is escalated to the LLM.
+"""
+
+import logging
+from collections import deque
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Deque, Dict, Hashable, List, Optional, Sequence, Set
+
+import numpy as np
+
+logger = logging.getLogger("dionysus.boundary_detector")
+
+
+class BoundaryVerdict(str, Enum):
+    """Outcome of a local boundary check."""
+    BOUNDARY = "boundary"
+    CONTINUE = "continue"
+    AMBIGUOUS = "ambiguous"
+
+
+@dataclass
+class BoundaryDecision:
+    """Result of observing one event embedding."""
+    verdict: BoundaryVerdict
+    drift: float = 0.0
+    change_score: float = 0.0
+    window_size: int = 0
+
+
+@dataclass
+class BoundaryDetectorStats:
+    """Counters for how often the LLM had to be consulted."""
+    checks: int = 0
+    local_boundaries: int = 0
+    local_continues: int = 0
+    llm_consultations: int = 0
+    embedding_failures: int = 0
+
+    @property
+    def llm_rate(self) -> float:
+        return self.llm_consultations / self.checks if self.checks else 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "checks": self.checks,
+            "local_boundaries": self.local_boundaries,
+            "local_continues": self.local_continues,
+            "llm_consultations": self.llm_consultations,
+            "embedding_failures": self.embedding_failures,
+            "llm_rate": self.llm_rate,
+        }
+
+
+class EmbeddingBoundaryDetector:
+    """
+    Rolling-window centroid drift + change-point detector.
+
+    drift        = 1 - cos(new_embedding, centroid(window))
+    change_score = (drift - mean(past drifts)) / std(past drifts)
+
+    Drift at or above boundary_drift is a boundary; drift below continue_drift
+    is continuous. Inside that band the change-point score decides: an outlier
+    (>= boundary_z) is a boundary, a typical drift (< continue_z) continues.
+    Anything left over (or a window that is still warming up) is AMBIGUOUS
+    and should be escalated.
+    """
+
+    def __init__(
+        self,
+        window_size: int = 8,
+        min_window: int = 2,
+        boundary_drift: float = 0.45,
+        continue_drift: float = 0.25,
+        boundary_z: float = 3.0,
+        continue_z: float = 1.5,
+    ):
+        if not 0.0 <= continue_drift <= boundary_drift:
+            raise ValueError("Expected 0 <= continue_drift <= boundary_drift")
+        if continue_z > boundary_z:
+            raise ValueError("Expected continue_z <= boundary_z")
+        self.window_size = window_size
+        self.min_window = max(1, min_window)
+        self.boundary_drift = boundary_drift
+        self.continue_drift = continue_drift
+        self.boundary_z = boundary_z
+        self.continue_z = continue_z
+        self.stats = BoundaryDetectorStats()
+        self._keys: Deque[Hashable] = deque(maxlen=window_size)
+        self._vectors: Deque[np.ndarray] = deque(maxlen=window_size)
+        self._drifts: Deque[float] = deque(maxlen=window_size)
+
+    # ------------------------------------------------------------------
+    # Window management
+    # ------------------------------------------------------------------
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._keys
+
+    def __len__(self) -> int:
+        return len(self._vectors)
+
+    def seed(self, key: Hashable, embedding: Sequence[float]) -> None:
+        """Add an embedding to the window without scoring it."""
+        vector = self._normalize(embedding)
+        if vector is None:
+            return
+        if self._vectors:
+            self._drifts.append(self._drift(vector))
+        self._keys.append(key)
+        self._vectors.append(vector)
+
+    def reset(self, keep_last: bool = True) -> None:
+        """Start a new segment, optionally keeping the latest event as its seed."""
+        last = (self._keys[-1], self._vectors[-1]) if keep_last and self._vectors else None
+        self._keys.clear()
+        self._vectors.clear()
+        self._drifts.clear()
+        if last:
+            self._keys.append(last[0])
+            self._vectors.append(last[1])
+
+    # ------------------------------------------------------------------
+    # Scoring
+    # ------------------------------------------------------------------
+
+    def score(self, embedding: Sequence[float]) -> BoundaryDecision:
+        """Score an embedding against the current window without mutating it."""
+        vector = self._normalize(embedding)
+        size = len(self._vectors)
+        if vector is None or size < self.min_window:
+            return BoundaryDecision(BoundaryVerdict.AMBIGUOUS, window_size=size)
+
+        drift = self._drift(vector)
+        change_score = 0.0
+        has_history = len(self._drifts) >= 2
+        if has_history:
+            history = np.fromiter(self._drifts, dtype=float)
+            change_score = (drift - float(history.mean())) / max(float(history.std()), 1e-3)
+
+        if drift >= self.boundary_drift:
+            verdict = BoundaryVerdict.BOUNDARY
+        elif drift < self.continue_drift:
+            verdict = BoundaryVerdict.CONTINUE
+        elif has_history and change_score >= self.boundary_z:
+            verdict = BoundaryVerdict.BOUNDARY
+        elif has_history and change_score < self.continue_z:
+            verdict = BoundaryVerdict.CONTINUE
+        else:
+            verdict = BoundaryVerdict.AMBIGUOUS
+        return BoundaryDecision(verdict, drift=drift, change_score=change_score, window_size=size)
+
+    def observe(self, key: Hashable, embedding: Sequence[float]) -> BoundaryDecision:
+        """Score a new event, then append it to the window and update counters."""
+        decision = self.score(embedding)
+        self.seed(key, embedding)
+        self.stats.checks += 1
+        if decision.verdict == BoundaryVerdict.BOUNDARY:
+            self.stats.local_boundaries += 1
+        elif decision.verdict == BoundaryVerdict.CONTINUE:
+            self.stats.local_continues += 1
+        else:
+            self.stats.llm_consultations += 1
+        return decision
+
+    def _drift(self, vector: np.ndarray) -> float:
+        centroid = np.mean(np.stack(self._vectors), axis=0)
+        norm = float(np.linalg.norm(centroid))
+        if norm == 0.0:
+            return 1.0
+        return float(1.0 - np.dot(vector, centroid) / norm)
+
+    @staticmethod
+    def _normalize(embedding: Sequence[float]) -> Optional[np.ndarray]:
+        vector = np.asarray(embedding, dtype=float)
+        norm = float(np.linalg.norm(vector)) if vector.size else 0.0
+        if norm == 0.0:
+            return None
+        return vector / norm
+
+
+@dataclass
+class BoundaryReplayReport:
+    """Segmentation quality of the local detector against a reference log."""
+    precision: float
+    recall: float
+    f1: float
+    llm_rate: float
+    predicted: List[int] = field(default_factory=list)
+
+
+def replay_boundary_log(
+    embeddings: Sequence[Sequence[float]],
+    reference_boundaries: Set[int],
+    detector: Optional[EmbeddingBoundaryDetector] = None,
+    tolerance: int = 0,
+) -> BoundaryReplayReport:
+    """
+    Replay an event log through the local detector and score it.
+
+    `reference_boundaries` holds the indices (into `embeddings`) of events that
+    open a new episode, e.g. from past LLM decisions. Ambiguous events are
+    resolved with the reference label, which is what the LLM escalation would
+    provide, so the report measures the fast path and its escalation rate.
+    A predicted boundary within `tolerance` events of a reference one counts.
+    """
+    detector = detector or EmbeddingBoundaryDetector()
+    predicted: List[int] = []
+    for i, embedding in enumerate(embeddings):
+        decision = detector.observe(i, embedding)
+        if decision.verdict == BoundaryVerdict.AMBIGUOUS:
+            is_boundary = i in reference_boundaries
+        else:
+            is_boundary = decision.verdict == BoundaryVerdict.BOUNDARY
+        if is_boundary:
+            predicted.append(i)
+            detector.reset(keep_last=True)
+
+    def _matched(a: int, pool: Set[int]) -> bool:
+        return any(abs(a - b) <= tolerance for b in pool)
+
+    true_pos = sum(1 for p in predicted if _matched(p, reference_boundaries))
+    found = sum(1 for r in reference_boundaries if _matched(r, set(predicted)))
+    precision = true_pos / len(predicted) if predicted else 1.0
+    recall = found / len(reference_boundaries) if reference_boundaries else 1.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return BoundaryReplayReport(
+        precision=precision,
+        recall=recall,
+        f1=f1,
+        llm_rate=detector.stats.llm_rate,
+        predicted=predicted,
+    )
@@ -0,0 +1,213 @@
+"""
+Checkpoint Chunk Store
+Feature: 021-rollback-safety-net
+
+Content-addressed storage for rollback checkpoint files. Files are split with
+content-defined chunking (a gear rolling hash picks cut points), so an edit in
+the middle of a file only changes the chunks around it and repeated
+checkpoints of mostly unchanged files share storage. The cut test only looks
+at the low 13 bits of the hash, which depend on the last 13 bytes alone, so
+cut points are found with NumPy over a block at a time rather than byte by
+byte. Layout:
+
+    objects/ab/cdef...   zlib-compressed chunk, named by the sha256 of the
+                         uncompressed bytes
+
+put_file() reads the source once, producing the chunk list and the whole-file
+sha256 in the same pass. restore_file() verifies every chunk and the file
+checksum before the destination is replaced. gc() deletes chunks that no
+checkpoint references.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+import zlib
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator
+
+import numpy as np
+
+logger = logging.getLogger("dionysus.checkpoint_chunk_store")
+
+OBJECTS_DIR = "objects"
+
+MIN_CHUNK_BYTES = 2 * 1024
+MAX_CHUNK_BYTES = 64 * 1024
+# Cut when the low 13 bits of the rolling hash are zero: ~8 KiB past the minimum.
+_CUT_BITS = 13
+_CUT_MASK = (1 << _CUT_BITS) - 1
+_READ_BYTES = 1 << 20
+# Bytes hashed per vectorized step; about one expected chunk past the minimum
+_SCAN_BYTES = 8 * 1024
+
+# Deterministic gear table; changing it changes every chunk boundary.
+_GEAR = tuple(
+    int.from_bytes(hashlib.sha256(b"dionysus-gear-%d" % i).digest()[:8], "big")
+    for i in range(256)
+)
+# Only the bits the cut test reads; (g << k) mod 2**13 depends on g mod 2**13
+_GEAR_LOW = np.array([g & _CUT_MASK for g in _GEAR], dtype=np.uint32)
+
+
+class ChunkIntegrityError(ValueError):
+    """A stored chunk or a reassembled file does not match its checksum."""
+
+
+def _cut_point(data: bytes | bytearray, start: int, end: int) -> int:
+    """
+    Offset (exclusive) of the chunk that starts at `start` within data[:end].
+
+    The gear hash h = (h << 1) + gear[byte], restarted at the minimum chunk
+    size, is cut where its low bits are zero. Those bits are the sum of the
+    last _CUT_BITS gear values shifted by their distance, so each block is
+    hashed with _CUT_BITS shifted adds, reading up to _CUT_BITS - 1 bytes of
+    the previous block for context.
+    """
+    if end - start <= MIN_CHUNK_BYTES:
+        return end
+    stop = min(end, start + MAX_CHUNK_BYTES)
+    begin = start + MIN_CHUNK_BYTES
+    lo = begin
+    while lo < stop:
+        hi = min(stop, lo + _SCAN_BYTES)
+        context = min(_CUT_BITS - 1, lo - begin)
+        gear = _GEAR_LOW[np.frombuffer(data, dtype=np.uint8, count=hi - lo + context, offset=lo - context)]
+        h = gear.copy()
+        for shift in range(1, _CUT_BITS):
+            h[shift:] += gear[:-shift] << shift
+        hits = np.flatnonzero((h[context:] & _CUT_MASK) == 0)
+        if hits.size:
+            return lo + int(hits[0]) + 1
+        lo = hi
+    return stop
+
+
+def iter_chunks(f: BinaryIO) -> Iterator[bytes]:
+    """Split a binary stream into content-defined chunks."""
+    buf = bytearray()
+    pos = 0
+    eof = False
+    while True:
+        while not eof and len(buf) - pos < MAX_CHUNK_BYTES:
+            block = f.read(_READ_BYTES)
+            if not block:
+                eof = True
+            else:
+                if pos:
+                    del buf[:pos]
+                    pos = 0
+                buf += block
+        if pos >= len(buf):
+            return
+        cut = _cut_point(buf, pos, len(buf))
+        yield bytes(buf[pos:cut])
+        pos = cut
+
+
+class CheckpointChunkStore:
+    """Deduplicating, compressed chunk storage shared by all checkpoints."""
+
+    def __init__(self, directory: str | Path, compression_level: int = 6):
+        self.directory = Path(directory)
+        self.objects_dir = self.directory / OBJECTS_DIR
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self.compression_level = compression_level
+        self._lock = threading.Lock()
+        self._sizes: dict[str, int] = self._scan()
+
+    def _scan(self) -> dict[str, int]:
+        sizes = {}
+        for path in self.objects_dir.glob("*/*"):
+            if path.suffix == ".tmp":
+                path.unlink(missing_ok=True)
+                continue
+            sizes[path.parent.name + path.name] = path.stat().st_size
+        return sizes
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / digest[2:]
+
+    def put_chunk(self, data: bytes) -> str:
+        """Store one chunk, returning its sha256. Existing content is reused."""
+        digest = hashlib.sha256(data).hexdigest()
+        if digest in self._sizes:
+            return digest
+        compressed = zlib.compress(data, self.compression_level)
+        path = self._object_path(digest)
+        path.parent.mkdir(exist_ok=True)
+        tmp = path.with_name(f"{path.name}.tmp")
+        tmp.write_bytes(compressed)
+        tmp.replace(path)
+        with self._lock:
+            self._sizes[digest] = len(compressed)
+        return digest
+
+    def get_chunk(self, digest: str) -> bytes:
+        """Read and verify one chunk."""
+        try:
+            data = zlib.decompress(self._object_path(digest).read_bytes())
+        except FileNotFoundError:
+            raise ChunkIntegrityError(f"chunk_missing: {digest}") from None
+        except zlib.error as e:
+            raise ChunkIntegrityError(f"chunk_corrupt: {digest}: {e}") from e
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise ChunkIntegrityError(f"chunk_checksum_mismatch: {digest}")
+        return data
+
+    def has_chunk(self, digest: str) -> bool:
+        return digest in self._sizes
+
+    def put_file(self, path: str | Path) -> tuple[list[str], str, int]:
+        """Chunk a file in one read. Returns (chunk digests, file sha256, size)."""
+        file_hash = hashlib.sha256()
+        digests: list[str] = []
+        size = 0
+        with open(path, "rb") as f:
+            for chunk in iter_chunks(f):
+                file_hash.update(chunk)
+                size += len(chunk)
+                digests.append(self.put_chunk(chunk))
+        return digests, file_hash.hexdigest(), size
+
+    def restore_file(self, digests: Iterable[str], checksum: str, dest: str | Path) -> Path:
+        """
+        Reassemble a file into a temporary sibling of `dest` and verify it.
+
+        Returns the verified temporary path; the caller moves it into place.
+        The temporary file is removed if verification fails.
+        """
+        dest = Path(dest)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        tmp = dest.with_name(f".{dest.name}.restore-{os.getpid()}")
+        file_hash = hashlib.sha256()
+        try:
+            with open(tmp, "wb") as out:
+                for digest in digests:
+                    data = self.get_chunk(digest)
+                    file_hash.update(data)
+                    out.write(data)
+            if file_hash.hexdigest() != checksum:
+                raise ChunkIntegrityError(f"file_checksum_mismatch: {dest}")
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        return tmp
+
+    def gc(self, referenced: set[str]) -> int:
+        """Delete every chunk not in `referenced`. Returns the number removed."""
+        with self._lock:
+            unreferenced = [d for d in self._sizes if d not in referenced]
+            for digest in unreferenced:
+                self._object_path(digest).unlink(missing_ok=True)
+                del self._sizes[digest]
+        if unreferenced:
+            logger.info(f"checkpoint_chunks_collected: count={len(unreferenced)}")
+        return len(unreferenced)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"chunks": len(self._sizes), "stored_bytes": sum(self._sizes.values())}
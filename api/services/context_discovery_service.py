@@ -16,6 +16,7 @@ from cgr3.neo4j_provider import GraphitiContextGraph
 from cgr3.utils.llm_util import LLMInterface
 
 from api.services.webhook_neo4j_driver import get_neo4j_driver
+from api.services.system_metrics_service import count_recorded_episode
 
 logger = logging.getLogger("dionysus.context_reasoning")
 
@@ -90,7 +91,7 @@ class ContextDiscoveryService:
             e.surprise_score = $surprise,
             e.has_answer = $has_answer,
             e.context_id = $context_id
-        """
+        """ + count_recorded_episode("e")
         params = {
             "id": episode_id,
             "timestamp": datetime.utcnow().isoformat(),
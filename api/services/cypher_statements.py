@@ -0,0 +1,148 @@
+"""
+Cypher Statement Registry
+
+Services declare named, parameterized Cypher statements once, at import time,
+instead of building statement strings per call. Classification happens at
+registration:
+- destructive: DELETE / DETACH / DROP / REMOVE (still subject to the
+  Destruction Gate in GraphitiService)
+- read_only: no write clause at all; routed to read transactions
+
+The gate does not raise: a blocked statement returns a single row whose
+"error" is DESTRUCTION_GATE_ERROR. Callers that need the write to happen
+check their rows with gate_blocked().
+
+GraphitiService.execute_statement resolves a name with one dict lookup and
+sends the identical statement text every time, so Neo4j can reuse the cached
+query plan. Ad-hoc statements passed to execute_cypher are classified through
+the same code path and memoized by text.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from dataclasses import dataclass
+from typing import Any, Optional
+
+DESTRUCTIVE_RE = re.compile(r"\b(DELETE|DETACH|DROP|REMOVE)\b", re.IGNORECASE)
+# Any clause that can mutate the graph or schema. Procedure calls are treated
+# as writes because procedures (apoc.*, db.create.*) may mutate; read-only
+# procedures simply run in a write transaction as before. CALL { ... }
+# subqueries are judged by the clauses inside them.
+WRITE_RE = re.compile(
+    r"\b(CREATE|MERGE|SET|DELETE|DETACH|DROP|REMOVE|FOREACH|LOAD\s+CSV)\b|\bCALL\s+(?![{(])",
+    re.IGNORECASE,
+)
+_PARAM_RE = re.compile(r"\$(\w+)")
+
+DESTRUCTION_GATE_ERROR = "DESTRUCTION_GATE_TRIGGERED"
+
+# Bound on memoized ad-hoc classifications (statement text -> flags).
+DEFAULT_MAX_ADHOC = 2048
+
+
+@dataclass(frozen=True)
+class CypherStatement:
+    """A named statement with its classification computed once."""
+    name: str
+    text: str
+    destructive: bool
+    read_only: bool
+    parameters: frozenset[str]
+
+
+def classify_statement(text: str) -> tuple[bool, bool]:
+    """
+    Return (destructive, read_only) for a statement.
+
+    Matches the raw text, literals and comments included, so a keyword inside a
+    string errs towards "destructive"/"write" rather than slipping past the gate.
+    """
+    destructive = DESTRUCTIVE_RE.search(text) is not None
+    read_only = not destructive and WRITE_RE.search(text) is None
+    return destructive, read_only
+
+
+def gate_blocked(rows: Any) -> bool:
+    """True when `rows` is the Destruction Gate's refusal rather than a result."""
+    return any(
+        isinstance(row, dict) and row.get("error") == DESTRUCTION_GATE_ERROR
+        for row in rows or ()
+    )
+
+
+class StatementRegistry:
+    """Thread-safe name -> CypherStatement map plus a bounded ad-hoc cache."""
+
+    def __init__(self, max_adhoc: int = DEFAULT_MAX_ADHOC):
+        self.max_adhoc = max_adhoc
+        self._statements: dict[str, CypherStatement] = {}
+        self._adhoc: dict[str, CypherStatement] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, text: str) -> CypherStatement:
+        """
+        Declare a statement. Re-registering the same name with the same text is
+        a no-op (modules may be reloaded); a different text is an error.
+        """
+        existing = self._statements.get(name)
+        if existing is not None:
+            if existing.text != text:
+                raise ValueError(f"Cypher statement '{name}' already registered with different text")
+            return existing
+        destructive, read_only = classify_statement(text)
+        statement = CypherStatement(
+            name=name,
+            text=text,
+            destructive=destructive,
+            read_only=read_only,
+            parameters=frozenset(_PARAM_RE.findall(text)),
+        )
+        with self._lock:
+            return self._statements.setdefault(name, statement)
+
+    def get(self, name: str) -> CypherStatement:
+        try:
+            return self._statements[name]
+        except KeyError:
+            raise KeyError(f"Unknown Cypher statement: {name}") from None
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._statements
+
+    def names(self) -> list[str]:
+        return sorted(self._statements)
+
+    def classify(self, text: str) -> CypherStatement:
+        """Classification for an ad-hoc statement, memoized by text."""
+        cached = self._adhoc.get(text)
+        if cached is not None:
+            return cached
+        destructive, read_only = classify_statement(text)
+        statement = CypherStatement(
+            name="",
+            text=text,
+            destructive=destructive,
+            read_only=read_only,
+            parameters=frozenset(),
+        )
+        if len(self._adhoc) < self.max_adhoc:
+            self._adhoc[text] = statement
+        return statement
+
+
+_registry: Optional[StatementRegistry] = None
+
+
+def get_statement_registry() -> StatementRegistry:
+    """Process-wide registry shared by every GraphitiService instance."""
+    global _registry
+    if _registry is None:
+        _registry = StatementRegistry()
+    return _registry
+
+
+def register_statement(name: str, text: str) -> CypherStatement:
+    """Register a statement in the process-wide registry."""
+    return get_statement_registry().register(name, text)
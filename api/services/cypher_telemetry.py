@@ -0,0 +1,367 @@
+"""
+Cypher Gateway Telemetry
+
+Always-on instrumentation for GraphitiService.execute_cypher, the single choke
+point for graph traffic. Records, per call site (calling module + function):
+- a bucketed latency histogram
+- row counts and approximate parameter payload size
+- error counts
+
+Statements slower than CYPHER_SLOW_QUERY_MS land in a bounded ring buffer with
+redacted parameters. Everything is O(1) per call: fixed buckets, no sorting,
+no serialization of parameters.
+
+The gateway does not aggregate inline. record_call resolves the call site,
+logs slow statements immediately and appends a GatewayCall to a pending
+batch; the batch is folded into the histograms, and handed to the registered
+sinks (workload recorder, metrics registry), every CYPHER_TELEMETRY_BATCH
+calls, after CYPHER_TELEMETRY_FLUSH_SECONDS, and before any read.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, NamedTuple, Optional
+
+# Upper bounds in milliseconds; the final bucket is +Inf.
+LATENCY_BUCKETS_MS: tuple[float, ...] = (
+    1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000,
+)
+
+# Frames from these modules are the gateway itself, not the caller.
+_GATEWAY_MODULES = (
+    "api.services.graphiti_service",
+    "api.services.memevolve_adapter",
+    "api.services.webhook_neo4j_driver",
+    "api.services.cypher_telemetry",
+    "asyncio",
+)
+DEFAULT_BATCH_SIZE = int(os.getenv("CYPHER_TELEMETRY_BATCH", "256"))
+DEFAULT_FLUSH_SECONDS = float(os.getenv("CYPHER_TELEMETRY_FLUSH_SECONDS", "1.0"))
+
+logger = logging.getLogger("dionysus.cypher_telemetry")
+
+_SENSITIVE_KEY_RE = re.compile(r"pass|secret|token|key|auth|credential", re.IGNORECASE)
+_MAX_STATEMENT_CHARS = 2000
+
+
+def resolve_call_site(max_depth: int = 24) -> str:
+    """Return 'module:function' of the first frame outside the Cypher gateway."""
+    frame = sys._getframe(1)
+    depth = 0
+    while frame is not None and depth < max_depth:
+        module = frame.f_globals.get("__name__", "")
+        if not module.startswith(_GATEWAY_MODULES):
+            return f"{module}:{frame.f_code.co_name}"
+        frame = frame.f_back
+        depth += 1
+    return "unknown"
+
+
+def redact_params(params: Optional[dict[str, Any]]) -> dict[str, Any]:
+    """Keep parameter shape, drop values: strings/collections are summarized."""
+    redacted: dict[str, Any] = {}
+    for key, value in (params or {}).items():
+        if _SENSITIVE_KEY_RE.search(key):
+            redacted[key] = "<redacted>"
+        elif value is None or isinstance(value, (bool, int, float)):
+            redacted[key] = value
+        elif isinstance(value, str):
+            redacted[key] = f"<str len={len(value)}>"
+        elif isinstance(value, (list, tuple)):
+            redacted[key] = f"<list len={len(value)}>"
+        elif isinstance(value, dict):
+            redacted[key] = f"<map keys={len(value)}>"
+        else:
+            redacted[key] = f"<{type(value).__name__}>"
+    return redacted
+
+
+def approximate_payload_bytes(params: Optional[dict[str, Any]]) -> int:
+    """Cheap, non-serializing estimate of the parameter payload size."""
+    return sum(len(k) + _approx_size(v, 2) for k, v in (params or {}).items())
+
+
+def _approx_size(value: Any, depth: int) -> int:
+    if value is None or isinstance(value, bool):
+        return 1
+    if isinstance(value, (int, float)):
+        return 8
+    if isinstance(value, (str, bytes)):
+        return len(value)
+    if isinstance(value, (list, tuple)):
+        if not value:
+            return 2
+        first = value[0]
+        if isinstance(first, (int, float)) or depth <= 0:
+            return 8 * len(value)
+        return sum(_approx_size(v, depth - 1) for v in value)
+    if isinstance(value, dict):
+        if depth <= 0:
+            return 16 * len(value)
+        return sum(len(str(k)) + _approx_size(v, depth - 1) for k, v in value.items())
+    return 16
+
+
+class GatewayCall(NamedTuple):
+    """One gateway execution, buffered until the next flush."""
+    call_site: str
+    statement: str
+    params: Optional[dict[str, Any]]
+    duration_ms: float
+    rows: int
+    error: bool
+    read_only: bool
+
+
+@dataclass
+class CallSiteStats:
+    """Histogram and counters for one call site."""
+    call_site: str
+    count: int = 0
+    errors: int = 0
+    sum_ms: float = 0.0
+    max_ms: float = 0.0
+    rows: int = 0
+    payload_bytes: int = 0
+    buckets: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+
+    def observe_batch(self, calls: list[GatewayCall]) -> None:
+        buckets = self.buckets
+        for call in calls:
+            duration_ms = call.duration_ms
+            self.sum_ms += duration_ms
+            if duration_ms > self.max_ms:
+                self.max_ms = duration_ms
+            self.rows += call.rows
+            self.payload_bytes += approximate_payload_bytes(call.params)
+            if call.error:
+                self.errors += 1
+            buckets[bisect_left(LATENCY_BUCKETS_MS, duration_ms)] += 1
+        self.count += len(calls)
+
+    def quantile(self, q: float) -> float:
+        """Upper bucket bound containing the q-quantile (max_ms for the +Inf bucket)."""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= target:
+                return LATENCY_BUCKETS_MS[i] if i < len(LATENCY_BUCKETS_MS) else self.max_ms
+        return self.max_ms
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "call_site": self.call_site,
+            "count": self.count,
+            "errors": self.errors,
+            "mean_ms": round(self.sum_ms / self.count, 3) if self.count else 0.0,
+            "p50_ms": self.quantile(0.5),
+            "p95_ms": self.quantile(0.95),
+            "p99_ms": self.quantile(0.99),
+            "max_ms": round(self.max_ms, 3),
+            "rows": self.rows,
+            "payload_bytes": self.payload_bytes,
+        }
+
+
+@dataclass
+class SlowQuery:
+    """One slow-query log entry (parameters redacted)."""
+    timestamp: float
+    call_site: str
+    duration_ms: float
+    rows: int
+    error: bool
+    statement: str
+    params: dict[str, Any]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "timestamp": self.timestamp,
+            "call_site": self.call_site,
+            "duration_ms": round(self.duration_ms, 3),
+            "rows": self.rows,
+            "error": self.error,
+            "statement": self.statement,
+            "params": self.params,
+        }
+
+
+class CypherTelemetry:
+    """Per-call-site histograms plus a ring-buffered slow-query log."""
+
+    def __init__(
+        self,
+        slow_query_ms: Optional[float] = None,
+        slow_log_size: int = 200,
+        enabled: bool = True,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_seconds: float = DEFAULT_FLUSH_SECONDS,
+    ):
+        self.slow_query_ms = (
+            slow_query_ms
+            if slow_query_ms is not None
+            else float(os.getenv("CYPHER_SLOW_QUERY_MS", "500"))
+        )
+        self.enabled = enabled
+        self.batch_size = max(1, batch_size)
+        self.flush_seconds = flush_seconds
+        self._sites: dict[str, CallSiteStats] = {}
+        self._slow: deque[SlowQuery] = deque(maxlen=slow_log_size)
+        self._lock = threading.Lock()
+        self._pending: list[GatewayCall] = []
+        self._pending_since = time.monotonic()
+        self._sinks: dict[str, Callable[[list[GatewayCall]], None]] = {}
+        self._flush_lock = threading.Lock()
+
+    def add_sink(self, name: str, sink: Callable[[list[GatewayCall]], None]) -> None:
+        """Register (or replace) a consumer of flushed gateway batches."""
+        self._sinks[name] = sink
+
+    def record_call(
+        self,
+        statement: str,
+        params: Optional[dict[str, Any]],
+        duration_ms: float,
+        rows: int = 0,
+        error: bool = False,
+        read_only: bool = False,
+    ) -> None:
+        """Gateway hot path: buffer one call; aggregation happens on flush."""
+        site = resolve_call_site() if self.enabled else ""
+        if self.enabled and duration_ms >= self.slow_query_ms:
+            self._log_slow(site, statement, params, duration_ms, rows, error)
+        pending = self._pending
+        if not pending:
+            self._pending_since = time.monotonic()
+        pending.append(GatewayCall(site, statement, params, duration_ms, rows, error, read_only))
+        if len(pending) >= self.batch_size or time.monotonic() - self._pending_since >= self.flush_seconds:
+            self.flush()
+
+    def flush(self) -> int:
+        """Fold pending calls into the histograms and hand them to every sink."""
+        with self._flush_lock:
+            batch, self._pending = self._pending, []
+            if not batch:
+                return 0
+            if self.enabled:
+                by_site: dict[str, list[GatewayCall]] = {}
+                for call in batch:
+                    calls = by_site.get(call.call_site)
+                    if calls is None:
+                        by_site[call.call_site] = [call]
+                    else:
+                        calls.append(call)
+                with self._lock:
+                    for site, calls in by_site.items():
+                        stats = self._sites.get(site)
+                        if stats is None:
+                            stats = self._sites[site] = CallSiteStats(site)
+                        stats.observe_batch(calls)
+            for name, sink in list(self._sinks.items()):
+                try:
+                    sink(batch)
+                except Exception as exc:  # a broken sink must not drop the others
+                    logger.warning(f"Cypher telemetry sink {name} failed: {exc}")
+            return len(batch)
+
+    def _log_slow(
+        self,
+        site: str,
+        statement: str,
+        params: Optional[dict[str, Any]],
+        duration_ms: float,
+        rows: int,
+        error: bool,
+    ) -> None:
+        self._slow.append(SlowQuery(
+            timestamp=time.time(),
+            call_site=site,
+            duration_ms=duration_ms,
+            rows=rows,
+            error=error,
+            statement=statement[:_MAX_STATEMENT_CHARS],
+            params=redact_params(params),
+        ))
+
+    def call_sites(self) -> list[CallSiteStats]:
+        self.flush()
+        with self._lock:
+            return sorted(self._sites.values(), key=lambda s: s.sum_ms, reverse=True)
+
+    def slow_queries(self, limit: Optional[int] = None) -> list[SlowQuery]:
+        entries = list(self._slow)[::-1]
+        return entries[:limit] if limit else entries
+
+    def snapshot(self) -> dict[str, Any]:
+        sites = self.call_sites()
+        return {
+            "total_calls": sum(s.count for s in sites),
+            "total_errors": sum(s.errors for s in sites),
+            "slow_query_ms": self.slow_query_ms,
+            "slow_queries_logged": len(self._slow),
+            "call_sites": [s.to_dict() for s in sites],
+        }
+
+    def prometheus_text(self) -> str:
+        """Render metrics in the Prometheus text exposition format."""
+        lines = [
+            "# HELP dionysus_cypher_latency_ms Cypher gateway latency by call site.",
+            "# TYPE dionysus_cypher_latency_ms histogram",
+        ]
+        sites = self.call_sites()
+        for s in sites:
+            label = _escape_label(s.call_site)
+            cumulative = 0
+            for bound, n in zip(list(LATENCY_BUCKETS_MS) + ["+Inf"], s.buckets):
+                cumulative += n
+                lines.append(
+                    f'dionysus_cypher_latency_ms_bucket{{call_site="{label}",le="{bound}"}} {cumulative}'
+                )
+            lines.append(f'dionysus_cypher_latency_ms_sum{{call_site="{label}"}} {s.sum_ms:.3f}')
+            lines.append(f'dionysus_cypher_latency_ms_count{{call_site="{label}"}} {s.count}')
+        for metric, attr, help_text in (
+            ("dionysus_cypher_errors_total", "errors", "Failed Cypher calls by call site."),
+            ("dionysus_cypher_rows_total", "rows", "Rows returned by call site."),
+            ("dionysus_cypher_payload_bytes_total", "payload_bytes", "Approximate parameter bytes sent by call site."),
+        ):
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} counter")
+            for s in sites:
+                lines.append(f'{metric}{{call_site="{_escape_label(s.call_site)}"}} {getattr(s, attr)}')
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        with self._flush_lock:
+            self._pending = []
+        with self._lock:
+            self._sites.clear()
+        self._slow.clear()
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+_telemetry: Optional[CypherTelemetry] = None
+
+
+def get_cypher_telemetry() -> CypherTelemetry:
+    """Process-wide telemetry shared by every GraphitiService instance."""
+    global _telemetry
+    if _telemetry is None:
+        _telemetry = CypherTelemetry(
+            enabled=os.getenv("CYPHER_TELEMETRY", "true").lower() == "true",
+        )
+    return _telemetry
@@ -1,9 +1,13 @@
 import numpy as np
-from typing import List
+from typing import Any, Dict, List
+
+from api.services.treur_network import TreurNetwork
 
 class DynamicsService:
     """
     Implements the mathematical primitives for Jan Treur's Self-Modeling Networks (SMN).
+    For whole networks use DynamicsService.network(), which advances every state
+    and adaptive weight per vectorized step instead of one call per state.
     
     References:
     - Treur (2022): Mental Models and Their Dynamics, Adaptation, and Control.
@@ -33,6 +37,18 @@ class DynamicsService:
         
         return (base_logistic - shift) * scale
 
+    @staticmethod
+    def alogistic_batch(sigm: float, tau: float, impacts: np.ndarray) -> np.ndarray:
+        """
+        Vectorized alogistic over precomputed aggregated impacts.
+        Element i equals alogistic(sigm, tau, inputs_i, weights_i) where impacts[i] = inputs_i · weights_i.
+        """
+        impacts = np.asarray(impacts, dtype=float)
+        base_logistic = 1.0 / (1.0 + np.exp(-sigm * (impacts - tau)))
+        shift = 1.0 / (1.0 + np.exp(sigm * tau))
+        scale = 1.0 / (1.0 - shift)
+        return (base_logistic - shift) * scale
+
     @staticmethod
     def hebbian(mu: float, x: float, y: float, w: float) -> float:
         """
@@ -54,3 +70,8 @@ class DynamicsService:
         Maps to the passive membrane equation or integrate-and-fire decay dynamics.
         """
         return current_val + speed_factor * (impact - current_val) * delta_t
+
+    @staticmethod
+    def network(states: List[Dict[str, Any]], connections: List[Dict[str, Any]]) -> TreurNetwork:
+        """Build a vectorized network simulator (see TreurNetwork.from_spec)."""
+        return TreurNetwork.from_spec(states, connections)
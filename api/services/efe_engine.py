@@ -1,6 +1,8 @@
 import numpy as np
+from scipy.special import entr
 from scipy.stats import entropy
 from scipy.spatial.distance import cosine
+from dataclasses import dataclass
 from typing import List, Dict, Any, Optional
 import logging
 from api.models.cognitive import EFEResult, EFEResponse
@@ -32,6 +34,36 @@ def set_agent_precision(agent_name: str, precision: float) -> None:
     logger.info(f"Agent '{agent_name}' precision set to {clamped:.4f}")
 
 
+# Modality -> (uncertainty weight numerator, divergence weight multiplier).
+# EFE = (u / precision) * uncertainty + (d * precision) * divergence
+MODALITY_EFE_WEIGHTS: Dict[str, tuple[float, float]] = {
+    "neurotypical": (1.0, 1.0),
+    # Montgomery (2024): ADHD has higher precision on prediction error, so
+    # the uncertainty penalty is scaled down to encourage exploration.
+    "adhd_exploratory": (0.5, 1.5),
+    # The Triple-Bind: everything feels high error.
+    "siege_locked": (2.0, 2.0),
+}
+
+
+@dataclass
+class CandidateScores:
+    """Per-candidate EFE components from one vectorized pass (row i = candidate i)."""
+    seed_ids: List[str]
+    uncertainty: np.ndarray
+    goal_divergence: np.ndarray
+    efe: np.ndarray
+
+    def to_results(self, efe: Optional[np.ndarray] = None) -> Dict[str, EFEResult]:
+        efe = self.efe if efe is None else efe
+        results: Dict[str, EFEResult] = {}
+        for seed_id, score, u, d in zip(
+            self.seed_ids, efe.tolist(), self.uncertainty.tolist(), self.goal_divergence.tolist()
+        ):
+            results[seed_id] = EFEResult(seed_id=seed_id, efe_score=score, uncertainty=u, goal_divergence=d)
+        return results
+
+
 def adjust_agent_precision(agent_name: str, delta: float) -> float:
     """Adjust precision by delta. Returns new precision."""
     current = get_agent_precision(agent_name)
@@ -98,25 +130,91 @@ class EFEEngine:
         divergence = self.calculate_goal_divergence(thought_vector, goal_vector)
 
         # Modality logic: Apply behavioral bias
-        if modality == "adhd_exploratory":
-            # Montgomery (2024): ADHD has higher precision on prediction error.
-            # Effectively, this means uncertainty is more 'attractive' or more processed.
-            # We scale down the 'penalty' of uncertainty to encourage exploration.
-            uncertainty_weight = 0.5 / max(0.01, precision)
-            divergence_weight = precision * 1.5
-        elif modality == "siege_locked":
-            # The Triple-Bind: Everything feels high error.
-            uncertainty_weight = 2.0 / max(0.01, precision)
-            divergence_weight = precision * 2.0
-        else:
-            uncertainty_weight = 1.0 / max(0.01, precision)
-            divergence_weight = precision
+        u_weight, d_weight = MODALITY_EFE_WEIGHTS.get(modality, MODALITY_EFE_WEIGHTS["neurotypical"])
+        uncertainty_weight = u_weight / max(0.01, precision)
+        divergence_weight = precision * d_weight
 
         efe = (uncertainty_weight * uncertainty) + (divergence_weight * divergence)
 
         logger.debug(f"EFE Calculation (Modality={modality}, Prec={precision:.2f}): U={uncertainty:.4f}, D={divergence:.4f}, Total={efe:.4f}")
         return efe
 
+    # =========================================================================
+    # Batch (matrix-form) scoring
+    # =========================================================================
+
+    def calculate_entropy_batch(self, probabilities: List[Optional[List[float]]]) -> np.ndarray:
+        """
+        Row-wise calculate_entropy for a list of distributions of any length.
+        Shorter rows are zero-padded (0 * log 0 = 0); empty rows score 1.0.
+        """
+        lengths = np.fromiter((len(p) if p is not None else 0 for p in probabilities), dtype=int, count=len(probabilities))
+        width = int(lengths.max()) if len(lengths) else 0
+        if width == 0:
+            return np.ones(len(probabilities))
+        if (lengths == width).all():
+            matrix = np.asarray(probabilities, dtype=float)
+        else:
+            matrix = np.zeros((len(probabilities), width))
+            for i, p in enumerate(probabilities):
+                if lengths[i]:
+                    matrix[i, :lengths[i]] = p
+        with np.errstate(divide="ignore", invalid="ignore"):
+            matrix = matrix / matrix.sum(axis=1, keepdims=True)
+            result = entr(matrix).sum(axis=1) / np.log(2)
+        result[lengths == 0] = 1.0
+        return result
+
+    def calculate_goal_divergence_batch(self, thought_matrix: np.ndarray, goal_vector: np.ndarray | List[float]) -> np.ndarray:
+        """Row-wise cosine distance to the goal; zero vectors score 1.0."""
+        goal = np.asarray(goal_vector, dtype=float)
+        thought_matrix = np.asarray(thought_matrix, dtype=float)
+        if thought_matrix.ndim != 2 or thought_matrix.shape[1] != goal.shape[0]:
+            raise ValueError(
+                f"Thought vectors of shape {thought_matrix.shape} do not match goal dimension {goal.shape[0]}"
+            )
+        thought_norms = np.linalg.norm(thought_matrix, axis=1)
+        goal_norm = np.linalg.norm(goal)
+        if goal_norm == 0:
+            return np.ones(len(thought_matrix))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            divergence = np.clip(1.0 - (thought_matrix @ goal) / (thought_norms * goal_norm), 0.0, 2.0)
+        divergence[thought_norms == 0] = 1.0
+        return divergence
+
+    def score_candidates_batch(
+        self,
+        candidates: List[Dict[str, Any]],
+        goal_vector: List[float] | np.ndarray,
+        precision: float | np.ndarray = 1.0,
+        modality: str = "neurotypical",
+    ) -> CandidateScores:
+        """
+        Score a whole candidate pool in one NumPy pass.
+
+        Equivalent to calling calculate_entropy, calculate_goal_divergence and
+        calculate_efe per candidate (within floating-point tolerance).
+        `precision` may be a scalar or one value per candidate.
+        """
+        goal_vec = np.asarray(goal_vector, dtype=float)
+        seed_ids = [str(c.get("id", f"seed_{i}")) for i, c in enumerate(candidates)]
+        probabilities = [c.get("probabilities", [0.5, 0.5]) for c in candidates]
+
+        thought_matrix = np.zeros((len(candidates), goal_vec.shape[0]))
+        for i, candidate in enumerate(candidates):
+            vector = candidate.get("vector")
+            if vector is not None:
+                thought_matrix[i] = vector
+
+        uncertainty = self.calculate_entropy_batch(probabilities)
+        divergence = self.calculate_goal_divergence_batch(thought_matrix, goal_vec)
+
+        u_weight, d_weight = MODALITY_EFE_WEIGHTS.get(modality, MODALITY_EFE_WEIGHTS["neurotypical"])
+        precision = np.asarray(precision, dtype=float)
+        efe = (u_weight / np.maximum(0.01, precision)) * uncertainty + (precision * d_weight) * divergence
+
+        return CandidateScores(seed_ids=seed_ids, uncertainty=uncertainty, goal_divergence=divergence, efe=efe)
+
     def detect_triple_bind(self, efe_scores: List[float], threshold: float = 1.5) -> bool:
         """
         Detects 'The Triple-Bind Siege'.
@@ -164,23 +262,22 @@ class EFEEngine:
             
         # Extract EFE scores as inputs (inverted, since lower EFE is better)
         # efe_inverted = 1.0 - normalized_efe
-        efe_scores = [c.get("efe_score", 1.0) for c in candidates]
-        max_efe = max(efe_scores) if efe_scores else 1.0
-        min_efe = min(efe_scores) if efe_scores else 0.0
-        
+        efe_scores = np.fromiter((c.get("efe_score", 1.0) for c in candidates), dtype=float, count=len(candidates))
+        max_efe = efe_scores.max()
+        min_efe = efe_scores.min()
+
         range_efe = max_efe - min_efe
-        inputs = [1.0 - ((e - min_efe) / range_efe if range_efe > 0 else 0.5) for e in efe_scores]
+        normalized = (efe_scores - min_efe) / range_efe if range_efe > 0 else np.full(len(efe_scores), 0.5)
+        inputs = 1.0 - normalized
         
         # In a real SMN, weights would come from connectivity (W-states)
-        # For now, we assume uniform weights for selection
-        weights = [1.0] * len(inputs)
-        
-        # Calculate alogistic activation for each candidate (as if they were independent nodes)
-        for i, candidate in enumerate(candidates):
-            # Sigm and Tau control the 'steepness' and 'threshold' of activation
-            activation = DynamicsService.alogistic(sigm, tau, [inputs[i]], [1.0])
+        # For now, we assume uniform weights, so each impact is the input itself.
+        # Calculate alogistic activation for every candidate (as independent nodes) at once;
+        # sigm and tau control the 'steepness' and 'threshold' of activation.
+        activations = DynamicsService.alogistic_batch(sigm, tau, inputs)
+        for candidate, activation in zip(candidates, activations.tolist()):
             candidate["activation"] = activation
-            
+
         # Filter candidates above a threshold or keep ordered by activation
         return sorted(candidates, key=lambda x: x.get("activation", 0.0), reverse=True)
 
@@ -196,22 +293,7 @@ class EFEEngine:
         if not candidates:
             return EFEResponse(dominant_seed_id="none", scores={})
 
-        results: dict[str, EFEResult] = {}
-        goal_vec = np.array(goal_vector)
-
-        for i, candidate in enumerate(candidates):
-            seed_id = str(candidate.get("id", f"seed_{i}"))
-            probs = candidate.get("probabilities", [0.5, 0.5])
-            thought_vec = np.array(candidate.get("vector", [0.0]*len(goal_vector)))
-
-            efe = self.calculate_efe(probs, thought_vec, goal_vec, precision)
-
-            results[seed_id] = EFEResult(
-                seed_id=seed_id,
-                efe_score=efe,
-                uncertainty=self.calculate_entropy(probs),
-                goal_divergence=self.calculate_goal_divergence(thought_vec, goal_vec)
-            )
+        results = self.score_candidates_batch(candidates, goal_vector, precision).to_results()
 
         # Select dominant seed (minimum EFE)
         dominant_seed_id = min(results, key=lambda k: results[k].efe_score)
@@ -318,30 +400,12 @@ class EFEEngine:
         detector = get_agency_detector()
         agency_score = detector.calculate_agency_score(internal_states, active_states)
         
-        results: dict[str, EFEResult] = {}
-        goal_vec = np.array(goal_vector)
-
-        for i, candidate in enumerate(candidates):
-            seed_id = str(candidate.get("id", f"seed_{i}"))
-            probs = candidate.get("probabilities", [0.5, 0.5])
-            thought_vec = np.array(candidate.get("vector", [0.0] * len(goal_vector)))
+        # Agency-weighted EFE (same modifier as agency_weighted_efe) for ranking,
+        # base uncertainty and divergence kept for transparency
+        scores = self.score_candidates_batch(candidates, goal_vector)
+        agency_modifier = 1.0 - (agency_weight * float(np.tanh(agency_score)))
+        results = scores.to_results(efe=scores.efe * agency_modifier)
 
-            # Calculate agency-weighted EFE
-            weighted_efe = self.agency_weighted_efe(
-                probs, thought_vec, goal_vec, agency_score, agency_weight
-            )
-
-            # Store with base metrics for transparency
-            uncertainty = self.calculate_entropy(probs)
-            divergence = self.calculate_goal_divergence(thought_vec, goal_vec)
-
-            results[seed_id] = EFEResult(
-                seed_id=seed_id,
-                efe_score=weighted_efe,  # Use weighted score for ranking
-                uncertainty=uncertainty,
-                goal_divergence=divergence
-            )
-        
         # Select dominant seed (minimum weighted EFE)
         dominant_seed_id = min(results, key=lambda k: results[k].efe_score)
         
@@ -406,26 +470,13 @@ class EFEEngine:
                     scores={}
                 )
 
-        results: dict[str, EFEResult] = {}
-        goal_vec = np.array(goal_vector)
-
-        for i, candidate in enumerate(filtered_candidates):
-            seed_id = str(candidate.get("id", f"seed_{i}"))
-            probs = candidate.get("probabilities", [0.5, 0.5])
-            thought_vec = np.array(candidate.get("vector", [0.0] * len(goal_vector)))
-
-            # Get prior-adjusted precision if available
-            candidate_precision = candidate.get("prior_precision", precision)
-
-            # Calculate EFE with adjusted precision
-            efe = self.calculate_efe(probs, thought_vec, goal_vec, candidate_precision)
-
-            results[seed_id] = EFEResult(
-                seed_id=seed_id,
-                efe_score=efe,
-                uncertainty=self.calculate_entropy(probs),
-                goal_divergence=self.calculate_goal_divergence(thought_vec, goal_vec)
-            )
+        # Calculate EFE with prior-adjusted precision where available
+        precisions = np.fromiter(
+            (c.get("prior_precision", precision) for c in filtered_candidates),
+            dtype=float,
+            count=len(filtered_candidates),
+        )
+        results = self.score_candidates_batch(filtered_candidates, goal_vector, precisions).to_results()
 
         # Guard: Check if any valid results were produced
         if not results:
@@ -14,8 +14,17 @@ from typing import Optional
 
 import httpx
 
+from api.services.metrics_registry import get_metrics_registry
+
 logger = logging.getLogger("dionysus.embedding")
 
+_EMBEDDING_LATENCY = get_metrics_registry().histogram(
+    "dionysus_embedding_request_duration_ms", "Embedding request latency by provider and call type.", ("provider", "op")
+)
+_EMBEDDING_REQUESTS = get_metrics_registry().counter(
+    "dionysus_embedding_requests_total", "Embedding requests by provider, call type and outcome.", ("provider", "op", "outcome")
+)
+
 
 # =============================================================================
 # Configuration
@@ -116,6 +125,7 @@ class EmbeddingService:
             raise EmbeddingError("Cannot generate embedding for empty text")
 
         start_time = time.time()
+        outcome = "error"
 
         try:
             if self.provider == "openai":
@@ -168,6 +178,7 @@ class EmbeddingService:
                 }
             )
 
+            outcome = "ok"
             return embedding
 
         except httpx.HTTPStatusError as e:
@@ -176,6 +187,10 @@ class EmbeddingService:
             raise EmbeddingError(f"Ollama connection error: {e}") from e
         except Exception as e:
             raise EmbeddingError(f"Embedding generation failed: {e}") from e
+        finally:
+            elapsed_ms = (time.time() - start_time) * 1000
+            _EMBEDDING_LATENCY.labels(provider=self.provider, op="single").observe(elapsed_ms)
+            _EMBEDDING_REQUESTS.labels(provider=self.provider, op="single", outcome=outcome).inc()
 
     async def generate_embeddings_batch(
         self,
@@ -195,6 +210,7 @@ class EmbeddingService:
             return []
 
         start_time = time.time()
+        outcome = "error"
 
         try:
             if self.provider == "openai":
@@ -237,12 +253,17 @@ class EmbeddingService:
                 }
             )
 
+            outcome = "ok"
             return embeddings
 
         except httpx.HTTPStatusError as e:
             raise EmbeddingError(f"Ollama API error: {e.response.status_code}") from e
         except httpx.RequestError as e:
             raise EmbeddingError(f"Ollama connection error: {e}") from e
+        finally:
+            elapsed_ms = (time.time() - start_time) * 1000
+            _EMBEDDING_LATENCY.labels(provider=self.provider, op="batch").observe(elapsed_ms)
+            _EMBEDDING_REQUESTS.labels(provider=self.provider, op="batch", outcome=outcome).inc()
 
     async def check_model_available(self) -> bool:
         """
@@ -9,10 +9,19 @@ This service persists smolagents execution history to Neo4j for:
 - Performance analysis
 - Learning from past runs
 - Linking to activated attractor basins
+
+Completed traces are appended to a local segment store (TraceSegmentStore)
+and compacted into Neo4j in bulk UNWIND batches once a segment is sealed, so a
+trace costs one local append instead of one graph write per step. Reads by id
+are served from the segment store and fall back to Neo4j. Segment file I/O
+runs in worker threads; start_compaction_loop compacts leftovers at startup
+and periodically seals idle segments so quiet periods still reach the graph.
 """
 
+import asyncio
 import json
 import logging
+import os
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -20,8 +29,51 @@ from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
+from api.services.trace_segment_store import TraceSegmentStore
+
 logger = logging.getLogger(__name__)
 
+# Maximum trace steps written per compaction statement
+DEFAULT_COMPACTION_BATCH_STEPS = 500
+# How often the background compactor seals idle segments and compacts
+DEFAULT_COMPACTION_INTERVAL_SECONDS = float(os.getenv("EXECUTION_TRACE_COMPACT_INTERVAL_SECONDS", "60"))
+
+COMPACT_TRACES_CYPHER = """
+UNWIND $traces AS tr
+MERGE (t:AgentExecutionTrace {id: tr.id})
+SET t.agent_name = tr.agent_name,
+    t.run_id = tr.run_id,
+    t.started_at = datetime(tr.started_at),
+    t.completed_at = datetime(tr.completed_at),
+    t.step_count = tr.step_count,
+    t.planning_count = tr.planning_count,
+    t.success = tr.success,
+    t.error_message = tr.error_message,
+    t.token_usage = tr.token_usage
+WITH t, tr
+UNWIND tr.steps AS st
+MERGE (s:AgentExecutionStep {id: st.id})
+SET s.trace_id = tr.id,
+    s.step_number = st.step_number,
+    s.step_type = st.step_type,
+    s.timestamp = datetime(st.timestamp),
+    s.tool_name = st.tool_name,
+    s.tool_arguments = st.tool_arguments,
+    s.observation_summary = st.observation_summary,
+    s.plan = st.plan,
+    s.error = st.error
+MERGE (t)-[r:HAS_STEP]->(s)
+SET r.order = st.order
+"""
+
+COMPACT_BASIN_LINKS_CYPHER = """
+UNWIND $links AS link
+MATCH (t:AgentExecutionTrace {id: link.trace_id})
+MATCH (b:MemoryCluster {id: link.basin_id})
+MERGE (t)-[r:ACTIVATED_BASIN]->(b)
+SET r.strength = link.strength, r.at_step = link.at_step
+"""
+
 
 # =============================================================================
 # Data Models
@@ -102,8 +154,22 @@ class ExecutionTraceService:
         trace = await service.get_trace(trace_id)
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        store: Optional[TraceSegmentStore] = None,
+        compaction_batch_steps: int = DEFAULT_COMPACTION_BATCH_STEPS,
+    ):
         self._buffers: Dict[str, TraceBuffer] = {}
+        self._store = store
+        self._compaction_batch_steps = compaction_batch_steps
+        self._compaction_lock = asyncio.Lock()
+        self._compaction_task: Optional[asyncio.Task] = None
+        self._compaction_loop: Optional[asyncio.Task] = None
+
+    def _get_store(self) -> TraceSegmentStore:
+        if self._store is None:
+            self._store = TraceSegmentStore.from_env()
+        return self._store
 
     async def create_trace(self, agent_name: str, run_id: str) -> str:
         """
@@ -198,7 +264,7 @@ class ExecutionTraceService:
         token_usage: Optional[Dict[str, Any]] = None,
     ) -> bool:
         """
-        Mark trace as complete and persist to Neo4j.
+        Mark trace as complete and append it to the segment store.
 
         Args:
             trace_id: The trace to complete
@@ -217,7 +283,7 @@ class ExecutionTraceService:
         buffer.success = success
         buffer.error_message = error_message
 
-        # Persist to Neo4j
+        # Persist to the segment store (compacted into Neo4j later)
         persisted = await self._persist_trace(buffer, token_usage)
 
         # Clean up buffer
@@ -229,123 +295,192 @@ class ExecutionTraceService:
     async def _persist_trace(
         self, buffer: TraceBuffer, token_usage: Optional[Dict[str, Any]] = None
     ) -> bool:
-        """Persist trace and steps to Neo4j."""
+        """Append the trace to the local segment store as a single record."""
         try:
-            from api.services.remote_sync import get_neo4j_driver
-
-            driver = get_neo4j_driver()
-
-            # Count step types
-            action_count = sum(
-                1 for s in buffer.steps if s.get("step_type") == "ActionStep"
-            )
             planning_count = sum(
                 1 for s in buffer.steps if s.get("step_type") == "PlanningStep"
             )
+            record = {
+                "id": buffer.trace_id,
+                "agent_name": buffer.agent_name,
+                "run_id": buffer.run_id,
+                "started_at": buffer.started_at.isoformat(),
+                "completed_at": datetime.utcnow().isoformat(),
+                "step_count": len(buffer.steps),
+                "planning_count": planning_count,
+                "success": buffer.success,
+                "error_message": buffer.error_message,
+                "token_usage": token_usage,
+                "steps": buffer.steps,
+                "basin_links": buffer.basin_links,
+            }
+            store = await asyncio.to_thread(self._get_store)
+            if await asyncio.to_thread(store.append, record):
+                self._schedule_compaction()
 
-            # Create trace node
-            trace_cypher = """
-            CREATE (t:AgentExecutionTrace {
-                id: $id,
-                agent_name: $agent_name,
-                run_id: $run_id,
-                started_at: datetime($started_at),
-                completed_at: datetime($completed_at),
-                step_count: $step_count,
-                planning_count: $planning_count,
-                success: $success,
-                error_message: $error_message,
-                token_usage: $token_usage
-            })
-            RETURN t.id as trace_id
-            """
+            logger.debug(
+                f"Appended execution trace {buffer.trace_id}: "
+                f"{len(buffer.steps)} steps, {len(buffer.basin_links)} basins"
+            )
+            return True
 
-            await driver.execute_query(
-                trace_cypher,
-                {
-                    "id": buffer.trace_id,
-                    "agent_name": buffer.agent_name,
-                    "run_id": buffer.run_id,
-                    "started_at": buffer.started_at.isoformat(),
-                    "completed_at": datetime.utcnow().isoformat(),
-                    "step_count": len(buffer.steps),
-                    "planning_count": planning_count,
-                    "success": buffer.success,
-                    "error_message": buffer.error_message,
-                    "token_usage": json.dumps(token_usage) if token_usage else None,
-                },
+        except Exception as e:
+            logger.error(f"Failed to persist execution trace: {e}")
+            return False
+
+    def _schedule_compaction(self) -> None:
+        """Compact sealed segments in the background (at most one run at a time)."""
+        if self._compaction_task is not None and not self._compaction_task.done():
+            return
+        try:
+            self._compaction_task = asyncio.get_running_loop().create_task(self.compact())
+        except RuntimeError:
+            logger.debug("No running loop; trace compaction deferred")
+
+    def start_compaction_loop(self, interval_seconds: Optional[float] = None) -> asyncio.Task:
+        """Start the background compactor (idempotent); see _run_compaction_loop."""
+        if self._compaction_loop is None or self._compaction_loop.done():
+            self._compaction_loop = asyncio.get_running_loop().create_task(
+                self._run_compaction_loop(interval_seconds or DEFAULT_COMPACTION_INTERVAL_SECONDS)
             )
+        return self._compaction_loop
+
+    async def stop_compaction_loop(self) -> None:
+        """Cancel the background compactor and wait for it to exit."""
+        task, self._compaction_loop = self._compaction_loop, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
 
-            # Create step nodes and link to trace
-            for idx, step in enumerate(buffer.steps):
-                step_cypher = """
-                MATCH (t:AgentExecutionTrace {id: $trace_id})
-                CREATE (s:AgentExecutionStep {
-                    id: $step_id,
-                    trace_id: $trace_id,
-                    step_number: $step_number,
-                    step_type: $step_type,
-                    timestamp: datetime($timestamp),
-                    tool_name: $tool_name,
-                    tool_arguments: $tool_arguments,
-                    observation_summary: $observation_summary,
-                    plan: $plan,
-                    error: $error
-                })
-                CREATE (t)-[:HAS_STEP {order: $order}]->(s)
-                """
-
-                await driver.execute_query(
-                    step_cypher,
-                    {
-                        "trace_id": buffer.trace_id,
-                        "step_id": step.get("id"),
-                        "step_number": step.get("step_number", idx),
-                        "step_type": step.get("step_type", "Unknown"),
-                        "timestamp": step.get("timestamp", datetime.utcnow().isoformat()),
-                        "tool_name": step.get("tool_name"),
-                        "tool_arguments": str(step.get("tool_arguments"))
-                        if step.get("tool_arguments")
-                        else None,
-                        "observation_summary": step.get("observation_summary"),
-                        "plan": step.get("plan"),
-                        "error": step.get("error"),
-                        "order": idx + 1,
-                    },
-                )
+    async def _run_compaction_loop(self, interval_seconds: float) -> None:
+        """
+        Compact segments left sealed by a previous process, then every
+        interval seal the active segment if it outlived its age limit and
+        compact whatever is pending, so traces reach Neo4j without new appends.
+        """
+        while True:
+            try:
+                store = await asyncio.to_thread(self._get_store)
+                await asyncio.to_thread(store.seal_if_expired)
+                if store.pending_segments():
+                    await self.compact()
+            except Exception as e:
+                logger.error(f"Background trace compaction failed: {e}")
+            await asyncio.sleep(interval_seconds)
+
+    async def compact(self, seal_active: bool = False) -> Dict[str, Any]:
+        """
+        Write sealed segments into Neo4j in bulk batches.
 
-            # Link activated basins
-            for link in buffer.basin_links:
-                basin_cypher = """
-                MATCH (t:AgentExecutionTrace {id: $trace_id})
-                MATCH (b:MemoryCluster {id: $basin_id})
-                MERGE (t)-[r:ACTIVATED_BASIN]->(b)
-                SET r.strength = $strength, r.at_step = $at_step
-                """
-
-                await driver.execute_query(
-                    basin_cypher,
-                    {
-                        "trace_id": buffer.trace_id,
-                        "basin_id": link["basin_id"],
-                        "strength": link["strength"],
-                        "at_step": link["at_step"],
-                    },
-                )
+        Writes are MERGEs, so re-compacting a segment after a crash is safe.
+        A segment is only marked compacted once all of its batches succeeded.
+
+        Args:
+            seal_active: Also seal (and compact) the segment currently being appended to
+
+        Returns:
+            Counts of segments, traces, steps and basin links written
+        """
+        store = await asyncio.to_thread(self._get_store)
+        if seal_active:
+            await asyncio.to_thread(store.seal)
+
+        totals = {"segments": 0, "traces": 0, "steps": 0, "basin_links": 0, "failed_segments": []}
+        async with self._compaction_lock:
+            from api.services.remote_sync import get_neo4j_driver
 
+            driver = get_neo4j_driver()
+            for segment in store.pending_segments():
+                try:
+                    records = await asyncio.to_thread(lambda: list(store.read_segment(segment)))
+                    counts = await self._compact_records(driver, records)
+                except Exception as e:
+                    logger.error(f"Failed to compact trace segment {segment}: {e}")
+                    totals["failed_segments"].append(segment)
+                    continue
+                await asyncio.to_thread(store.mark_compacted, segment)
+                totals["segments"] += 1
+                for key, value in counts.items():
+                    totals[key] += value
+
+        if totals["segments"]:
             logger.info(
-                f"Persisted execution trace {buffer.trace_id}: "
-                f"{len(buffer.steps)} steps, {len(buffer.basin_links)} basins"
+                f"Compacted {totals['segments']} trace segments: {totals['traces']} traces, "
+                f"{totals['steps']} steps, {totals['basin_links']} basin links"
+            )
+        return totals
+
+    async def _compact_records(self, driver, records: List[Dict[str, Any]]) -> Dict[str, int]:
+        batch: List[Dict[str, Any]] = []
+        batch_steps = 0
+        links: List[Dict[str, Any]] = []
+        steps_written = 0
+
+        for record in records:
+            trace = self._graph_trace_row(record)
+            if batch and batch_steps + len(trace["steps"]) > self._compaction_batch_steps:
+                await driver.execute_query(COMPACT_TRACES_CYPHER, {"traces": batch})
+                batch, batch_steps = [], 0
+            batch.append(trace)
+            batch_steps += len(trace["steps"])
+            steps_written += len(trace["steps"])
+            links.extend(
+                {"trace_id": record["id"], **link} for link in record.get("basin_links", [])
             )
-            return True
 
-        except Exception as e:
-            logger.error(f"Failed to persist execution trace: {e}")
-            return False
+        if batch:
+            await driver.execute_query(COMPACT_TRACES_CYPHER, {"traces": batch})
+        for i in range(0, len(links), self._compaction_batch_steps):
+            await driver.execute_query(
+                COMPACT_BASIN_LINKS_CYPHER,
+                {"links": links[i:i + self._compaction_batch_steps]},
+            )
+        return {"traces": len(records), "steps": steps_written, "basin_links": len(links)}
+
+    @staticmethod
+    def _graph_trace_row(record: Dict[str, Any]) -> Dict[str, Any]:
+        """Shape a stored trace record into compaction statement parameters."""
+        token_usage = record.get("token_usage")
+        return {
+            "id": record["id"],
+            "agent_name": record.get("agent_name"),
+            "run_id": record.get("run_id"),
+            "started_at": record.get("started_at"),
+            "completed_at": record.get("completed_at"),
+            "step_count": record.get("step_count", 0),
+            "planning_count": record.get("planning_count", 0),
+            "success": record.get("success"),
+            "error_message": record.get("error_message"),
+            "token_usage": json.dumps(token_usage) if token_usage else None,
+            "steps": [
+                {
+                    "id": step.get("id"),
+                    "step_number": step.get("step_number", idx),
+                    "step_type": step.get("step_type", "Unknown"),
+                    "timestamp": step.get("timestamp") or record.get("completed_at"),
+                    "tool_name": step.get("tool_name"),
+                    "tool_arguments": str(step.get("tool_arguments"))
+                    if step.get("tool_arguments")
+                    else None,
+                    "observation_summary": step.get("observation_summary"),
+                    "plan": step.get("plan"),
+                    "error": step.get("error"),
+                    "order": idx + 1,
+                }
+                for idx, step in enumerate(record.get("steps", []))
+            ],
+        }
 
     async def get_trace(self, trace_id: str) -> Optional[ExecutionTraceData]:
         """
-        Retrieve a full execution trace from Neo4j.
+        Retrieve a full execution trace.
+
+        Served from the local segment store when the trace is held there
+        (recent or not yet compacted); otherwise read from Neo4j.
 
         Args:
             trace_id: The trace to retrieve
@@ -353,6 +488,11 @@ class ExecutionTraceService:
         Returns:
             ExecutionTraceData with steps and basin links, or None
         """
+        store = await asyncio.to_thread(self._get_store)
+        record = await asyncio.to_thread(store.get, trace_id)
+        if record is not None:
+            return self._trace_from_record(record)
+
         try:
             from api.services.remote_sync import get_neo4j_driver
 
@@ -440,6 +580,39 @@ class ExecutionTraceService:
             logger.error(f"Failed to retrieve execution trace {trace_id}: {e}")
             return None
 
+    @staticmethod
+    def _trace_from_record(record: Dict[str, Any]) -> ExecutionTraceData:
+        """Build ExecutionTraceData from a segment store record."""
+        return ExecutionTraceData(
+            id=record["id"],
+            agent_name=record.get("agent_name") or "unknown",
+            run_id=record.get("run_id") or "unknown",
+            started_at=record.get("started_at") or "",
+            completed_at=record.get("completed_at"),
+            step_count=record.get("step_count", 0),
+            planning_count=record.get("planning_count", 0),
+            success=record.get("success"),
+            error_message=record.get("error_message"),
+            token_usage=record.get("token_usage"),
+            steps=[
+                ExecutionStepData(
+                    step_number=s.get("step_number", idx),
+                    step_type=s.get("step_type", "Unknown"),
+                    timestamp=s.get("timestamp", ""),
+                    tool_name=s.get("tool_name"),
+                    tool_arguments=s.get("tool_arguments"),
+                    observation_summary=s.get("observation_summary"),
+                    plan=s.get("plan"),
+                    error=s.get("error"),
+                )
+                for idx, s in enumerate(record.get("steps", []))
+            ],
+            activated_basins=[
+                {"basin_id": b.get("basin_id"), "strength": b.get("strength"), "at_step": b.get("at_step")}
+                for b in record.get("basin_links", [])
+            ],
+        )
+
     async def list_traces(
         self,
         agent_name: Optional[str] = None,
@@ -457,6 +630,13 @@ class ExecutionTraceService:
         Returns:
             List of trace summaries
         """
+        store = await asyncio.to_thread(self._get_store)
+        traces = store.summaries(
+            agent_name=agent_name, success_only=success_only, limit=limit
+        )
+        if len(traces) >= limit:
+            return traces
+
         try:
             from api.services.remote_sync import get_neo4j_driver
 
@@ -489,11 +669,17 @@ class ExecutionTraceService:
             """
 
             result = await driver.execute_query(cypher, params)
-            return [row.get("trace", {}) for row in result]
+            seen = {t["id"] for t in traces}
+            for row in result:
+                trace = row.get("trace", {})
+                if trace.get("id") not in seen:
+                    traces.append(trace)
+            traces.sort(key=lambda t: t.get("started_at") or "", reverse=True)
+            return traces[:limit]
 
         except Exception as e:
             logger.error(f"Failed to list execution traces: {e}")
-            return []
+            return traces
 
 
 # =============================================================================
@@ -25,6 +25,7 @@ from api.models.goal import (
     GoalSource,
     GoalUpdate,
 )
+from api.services.system_metrics_service import SystemMetricsService
 
 logger = logging.getLogger("dionysus.goal_service")
 
@@ -69,6 +70,10 @@ class GoalService:
 
         return get_neo4j_driver()
 
+    async def _track_goal(self, goal_id: UUID) -> None:
+        """Keep the precomputed focus goal current after a goal write."""
+        await SystemMetricsService(self._get_driver()).record_goal_touched(str(goal_id))
+
     # =========================================================================
     # T005: CRUD Operations
     # =========================================================================
@@ -133,6 +138,7 @@ class GoalService:
             )
 
         logger.info(f"Created goal: {goal.title} ({goal.id})")
+        await self._track_goal(goal.id)
         return goal
 
     async def get_goal(self, goal_id: UUID) -> Optional[Goal]:
@@ -204,6 +210,7 @@ class GoalService:
             return None
 
         logger.info(f"Updated goal: {goal_id}")
+        await self._track_goal(goal_id)
         return self._record_to_goal(record["g"])
 
     async def delete_goal(self, goal_id: UUID) -> bool:
@@ -231,6 +238,7 @@ class GoalService:
         deleted = record["deleted"] > 0
         if deleted:
             logger.info(f"Deleted goal: {goal_id}")
+            await self._track_goal(goal_id)
         return deleted
 
     async def list_goals(
@@ -376,6 +384,7 @@ class GoalService:
             return None
 
         logger.info(f"Completed goal: {goal_id}")
+        await self._track_goal(goal_id)
         return self._record_to_goal(record["g"])
 
     async def get_goal_statistics(self) -> dict:
@@ -429,6 +438,7 @@ class GoalService:
             return None
 
         logger.info(f"Abandoned goal: {goal_id} - {reason}")
+        await self._track_goal(goal_id)
         return self._record_to_goal(record["g"])
 
     async def add_progress(
@@ -470,6 +480,7 @@ class GoalService:
             return None
 
         logger.info(f"Added progress to goal: {goal_id}")
+        await self._track_goal(goal_id)
         return self._record_to_goal(record["g"])
 
     async def set_blocked(self, goal_id: UUID, blocker: GoalBlocker) -> Optional[Goal]:
@@ -502,6 +513,7 @@ class GoalService:
             return None
 
         logger.info(f"Marked goal as blocked: {goal_id}")
+        await self._track_goal(goal_id)
         return self._record_to_goal(record["g"])
 
     async def clear_blocked(self, goal_id: UUID) -> Optional[Goal]:
@@ -532,6 +544,7 @@ class GoalService:
             return None
 
         logger.info(f"Cleared blocker from goal: {goal_id}")
+        await self._track_goal(goal_id)
         return self._record_to_goal(record["g"])
 
     # =========================================================================
@@ -785,6 +798,7 @@ class GoalService:
             return None
 
         logger.info(f"Changed goal {goal_id} priority to {new_priority.value}")
+        await self._track_goal(goal_id)
         return self._record_to_goal(record["g"])
 
     async def _count_goals_by_priority(self, priority: GoalPriority) -> int:
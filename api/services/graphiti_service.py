@@ -9,6 +9,7 @@ from __future__ import annotations
 import os
 import json
 import logging
+import time
 from datetime import datetime
 from typing import Optional, Any
 from uuid import uuid4
@@ -16,9 +17,41 @@ from uuid import uuid4
 from typing import TYPE_CHECKING
 # Note: search_config_recipes not available in graphiti-core 0.24.3
 from api.models.memevolve import TrajectoryData, TrajectoryStep
+from api.services.cypher_statements import DESTRUCTION_GATE_ERROR, CypherStatement, get_statement_registry
+from api.services.cypher_telemetry import GatewayCall, get_cypher_telemetry
+from api.services.metrics_registry import get_metrics_registry
+from api.services.schema_advisor.workload import get_workload_recorder
 
 logger = logging.getLogger(__name__)
 
+_GRAPH_LATENCY = get_metrics_registry().histogram(
+    "dionysus_graph_query_duration_ms", "Cypher gateway latency by transaction mode.", ("mode",)
+)
+_GRAPH_QUERIES = get_metrics_registry().counter(
+    "dionysus_graph_queries_total", "Cypher gateway calls by transaction mode and outcome.", ("mode", "outcome")
+)
+
+
+def _record_gateway_batch(calls: list[GatewayCall]) -> None:
+    """Telemetry sink: workload shapes and registry metrics, one update per key."""
+    get_workload_recorder().record_batch((c.statement, c.duration_ms, c.error) for c in calls)
+    latencies: dict[str, list[float]] = {"read": [], "write": []}
+    outcomes: dict[tuple[str, str], int] = {}
+    for call in calls:
+        mode = "read" if call.read_only else "write"
+        latencies[mode].append(call.duration_ms)
+        key = (mode, "error" if call.error else "ok")
+        outcomes[key] = outcomes.get(key, 0) + 1
+    for mode, values in latencies.items():
+        if values:
+            _GRAPH_LATENCY.labels(mode=mode).observe_many(values)
+    for (mode, outcome), count in outcomes.items():
+        _GRAPH_QUERIES.labels(mode=mode, outcome=outcome).inc(count)
+
+
+get_cypher_telemetry().add_sink("graph_gateway", _record_gateway_batch)
+get_metrics_registry().register_collector("cypher_gateway", lambda: get_cypher_telemetry().flush())
+
 if TYPE_CHECKING:  # pragma: no cover - typing only
     from graphiti_core import Graphiti
 
@@ -140,6 +173,46 @@ import threading
 _global_graphiti: Optional["Graphiti"] = None
 _global_graphiti_lock = threading.Lock() # Use threading lock for initialization
 
+_INGEST_RELATIONSHIPS_CYPHER = """
+MATCH (source:__SOURCE_LABEL__ {id: $source_id})
+UNWIND $rows AS row
+MERGE (s:Entity {name: row.source_name})
+ON CREATE SET s.id = randomUUID(), s.created_at = datetime()
+
+MERGE (t:Entity {name: row.target_name})
+ON CREATE SET t.id = randomUUID(), t.created_at = datetime()
+
+MERGE (s)-[r:__REL_TYPE__]->(t)
+SET r.evidence = row.evidence, r.updated_at = datetime()
+
+MERGE (s)-[:MENTIONED_IN]->(source)
+MERGE (t)-[:MENTIONED_IN]->(source)
+"""
+
+
+def _sanitize_rel_type(relation_type: str) -> str:
+    rel_type = relation_type.upper().replace(" ", "_")
+    if not rel_type.replace("_", "").isalnum():
+        return "RELATED_TO"
+    return rel_type
+
+
+def _ingest_relationships_statement(rel_type: str, source_label: str = "Trajectory") -> str:
+    """Register (once) and return the batch-ingest statement name for a relationship type."""
+    if not source_label.replace("_", "").isalnum():
+        raise ValueError(f"Invalid source label: {source_label!r}")
+    name = f"graphiti.ingest_relationships.{source_label}.{rel_type}"
+    registry = get_statement_registry()
+    if name not in registry:
+        registry.register(
+            name,
+            _INGEST_RELATIONSHIPS_CYPHER
+            .replace("__REL_TYPE__", rel_type)
+            .replace("__SOURCE_LABEL__", source_label),
+        )
+    return name
+
+
 class GraphitiService:
     """
     Service wrapper for Graphiti knowledge graph operations.
@@ -251,6 +324,16 @@ class GraphitiService:
             f"{len(result.edges)} relationships"
         )
 
+        # Edges this episode invalidated must stop being served by the local recall tier
+        invalidated = [
+            str(e.uuid) for e in result.edges
+            if getattr(e, "invalid_at", None) or getattr(e, "expired_at", None)
+        ]
+        if invalidated:
+            from api.services.memory_ann_index import forget_memories
+
+            forget_memories(invalidated)
+
         return {
             "episode_uuid": str(result.episode.uuid) if result.episode else None,
             "nodes": [
@@ -591,6 +674,7 @@ IMPORTANT:
         source_id: str,
         group_id: Optional[str] = None,
         valid_at: Optional[datetime] = None,
+        source_label: str = "Trajectory",
     ) -> dict[str, Any]:
         """
         Ingest pre-extracted relationships using direct Cypher.
@@ -600,6 +684,7 @@ IMPORTANT:
             relationships: List of relationship dicts (source, target, relation_type, evidence, status)
             source_id: ID of the source node (e.g., Trajectory UUID)
             group_id: Optional group context
+            source_label: Label of the source node, so the lookup uses its id index
             
         Returns:
             Dict with ingestion stats
@@ -612,77 +697,31 @@ IMPORTANT:
         if not to_ingest:
             return {"ingested": 0, "skipped": len(relationships), "errors": []}
 
-        # Handle provenance ID (strip prefix if present, though cleaner to fix in caller)
-        # We perform a generic link: (Entity)-[:MENTIONED_IN]->(Source)
-        # where Source is looked up by ID.
-        
-        cypher = """
-        UNWIND $batch as row
-        
-        // 1. Merge Entities
-        MERGE (s:Entity {name: row.source})
-        ON CREATE SET s.id = randomUUID(), s.created_at = datetime()
-        
-        MERGE (t:Entity {name: row.target})
-        ON CREATE SET t.id = randomUUID(), t.created_at = datetime()
-        
-        // 2. Merge Relationship
-        // Note: Dynamic relationship types require APOC or careful handling. 
-        // For standard Cypher without APOC, we might default to RELATES_TO and set a type property,
-        // or use a safe interpolation if types are controlled.
-        // Here we use a standard relationship with type property for safety:
-        MERGE (s)-[r:RELATED_TO {type: row.relation_type}]->(t)
-        SET r.evidence = row.evidence,
-            r.updated_at = datetime()
-            
-        // 3. Link Evidence to Source (Trajectory/Episode)
-        WITH s, t, row
-        MATCH (source {id: $source_id}) 
-        MERGE (s)-[:MENTIONED_IN]->(source)
-        MERGE (t)-[:MENTIONED_IN]->(source)
-        """
-
-        # Note: Cypher doesn't support dynamic relationship types cleanly in MERGE without APOC.
-        # If we need dynamic types (e.g. [:LIKES]), we can use apoc.merge.relationship
-        # checking if APOC is available is expensive.
-        # For now, we will stick to a generic :RELATED_TO relationship with a type property
-        # OR we can iterate (slower but strictly correct for types).
-        # Given "Protocol 060" emphasizes speed and correctness, let's use a loop for now 
-        # to support real relationship types if possible, or fallback to APOC if we trust the env.
-        # Use Python loop for dynamic edge types (safer than string injection)
-        
+        # Cypher doesn't support dynamic relationship types in MERGE without APOC,
+        # so each sanitized type gets its own registered statement and the
+        # relationships of that type are written in one UNWIND batch.
+        by_type: dict[str, list[dict[str, Any]]] = {}
         for rel in to_ingest:
+            by_type.setdefault(_sanitize_rel_type(rel.get("relation_type", "")), []).append(rel)
+
+        source_key = source_id.split(":")[-1]  # Handle 'memevolve:uuid'
+        for rel_type, rels in by_type.items():
             try:
-                rel_type = rel['relation_type'].upper().replace(" ", "_")
-                # Basic sanitization
-                if not rel_type.replace("_","").isalnum():
-                    rel_type = "RELATED_TO"
-                
-                query = f"""
-                MATCH (source {{id: $source_id}})
-                MERGE (s:Entity {{name: $source_name}})
-                ON CREATE SET s.id = randomUUID(), s.created_at = datetime()
-                
-                MERGE (t:Entity {{name: $target_name}})
-                ON CREATE SET t.id = randomUUID(), t.created_at = datetime()
-                
-                MERGE (s)-[r:{rel_type}]->(t)
-                SET r.evidence = $evidence, r.updated_at = datetime()
-                
-                MERGE (s)-[:MENTIONED_IN]->(source)
-                MERGE (t)-[:MENTIONED_IN]->(source)
-                """
-                
-                await self.execute_cypher(query, {
-                    "source_id": source_id.split(":")[-1], # Handle 'memevolve:uuid'
-                    "source_name": rel['source'],
-                    "target_name": rel['target'],
-                    "evidence": rel.get('evidence', ''),
+                await self.execute_statement(_ingest_relationships_statement(rel_type, source_label), {
+                    "source_id": source_key,
+                    "rows": [
+                        {
+                            "source_name": rel["source"],
+                            "target_name": rel["target"],
+                            "evidence": rel.get("evidence", ""),
+                        }
+                        for rel in rels
+                    ],
                 })
-                ingested += 1
+                ingested += len(rels)
             except Exception as e:
-                errors.append({"relationship": rel, "error": str(e)})
-                logger.error(f"Failed to ingest relation: {e}")
+                errors.extend({"relationship": rel, "error": str(e)} for rel in rels)
+                logger.error(f"Failed to ingest {len(rels)} {rel_type} relations: {e}")
 
         return {
             "ingested": ingested,
@@ -885,48 +924,94 @@ IMPORTANT:
         """
         Sole authorized gateway for direct Cypher execution.
         Proxies through Graphiti's internal driver with a Destruction Gate.
+
+        Ad-hoc statements are classified once per distinct text; prefer
+        execute_statement for anything on a hot path.
         """
-        import re
-        params = params or {}
-        
-        # 1. Destruction Gate: Scan for destructive keywords
-        destructive_pattern = re.compile(r"\b(DELETE|DETACH|DROP|REMOVE)\b", re.IGNORECASE)
-        is_destructive = destructive_pattern.search(statement)
-        
-        if is_destructive:
-            # Check for two-step authorization flags
-            authorized = params.get("fingerprint_authorized", False)
-            confirmed = params.get("user_confirmed", False)
-            
-            if not (authorized and confirmed):
-                logger.warning(f"BLOCKING destructive Cypher: {statement}")
-                return [{
-                    "error": "DESTRUCTION_GATE_TRIGGERED",
-                    "requires": ["fingerprint", "confirmation"],
-                    "statement": statement,
-                    "reason": "Destructive operations require biometric (fingerprint) and manual confirmation."
-                }]
-
-        # 2. Proxy to internal driver
+        return await self._run_statement(
+            get_statement_registry().classify(statement), params or {}
+        )
+
+    async def execute_statement(
+        self,
+        name: str,
+        params: Optional[dict[str, Any]] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Execute a statement declared via cypher_statements.register_statement.
+
+        Classification was done at registration, so the per-call cost is a
+        registry lookup. Read-only statements are routed to read transactions.
+        """
+        return await self._run_statement(get_statement_registry().get(name), params or {})
+
+    async def _run_statement(
+        self,
+        stmt: CypherStatement,
+        params: dict[str, Any],
+    ) -> list[dict[str, Any]]:
+        statement = stmt.text
+
+        # 1. Destruction Gate: destructive keywords require two-step authorization
+        if stmt.destructive and not (
+            params.get("fingerprint_authorized", False) and params.get("user_confirmed", False)
+        ):
+            logger.warning(f"BLOCKING destructive Cypher: {statement}")
+            return [{
+                "error": DESTRUCTION_GATE_ERROR,
+                "requires": ["fingerprint", "confirmation"],
+                "statement": statement,
+                "reason": "Destructive operations require biometric (fingerprint) and manual confirmation."
+            }]
+
+        # 2. Proxy to internal driver (read-only statements go to read transactions)
         graphiti = self._get_graphiti()
+        started = time.perf_counter()
+        failed = False
+        rows: list[dict[str, Any]] = []
         try:
-            result = await asyncio.wait_for(
-                graphiti.driver.execute_query(statement, params=params),
-                timeout=self.config.cypher_timeout_seconds,
-            )
-            
+            # asyncio.timeout runs the query inline; wait_for would wrap it in a Task
+            async with asyncio.timeout(self.config.cypher_timeout_seconds):
+                if stmt.read_only:
+                    result = await graphiti.driver.execute_query(statement, params=params, routing_="r")
+                else:
+                    result = await graphiti.driver.execute_query(statement, params=params)
+
             records = getattr(result, "records", None)
             if records is None:
                 raw = result if isinstance(result, list) else []
-                return [_normalize_neo4j_value(row) for row in raw]
-            return [_normalize_neo4j_value(record.data()) for record in records]
-            
+                rows = [_normalize_neo4j_value(row) for row in raw]
+            else:
+                rows = [_normalize_neo4j_value(record.data()) for record in records]
+            return rows
+
         except asyncio.TimeoutError:
+            failed = True
             logger.warning("Graphiti Cypher execution timed out.")
             raise
         except Exception as e:
+            failed = True
             logger.error(f"Cypher execution via Graphiti failed: {e}")
             raise
+        finally:
+            # 3. Gateway telemetry + workload recording for the schema advisor,
+            # buffered and aggregated per batch by _record_gateway_batch
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            get_cypher_telemetry().record_call(
+                statement, params, elapsed_ms, rows=len(rows), error=failed, read_only=stmt.read_only
+            )
+
+    async def explain_plan(self, statement: str) -> Optional[dict[str, Any]]:
+        """
+        Query plan for a statement, via EXPLAIN (the statement is not executed).
+
+        Used by the schema advisor; returns None when the driver exposes no plan.
+        """
+        graphiti = self._get_graphiti()
+        async with asyncio.timeout(self.config.cypher_timeout_seconds):
+            result = await graphiti.driver.execute_query(f"EXPLAIN {statement}", params={}, routing_="r")
+        summary = getattr(result, "summary", None)
+        return getattr(summary, "plan", None)
 
     async def get_entity(self, name: str, group_id: Optional[str] = None) -> Optional[dict[str, Any]]:
         """Get entity by name."""
@@ -7,9 +7,12 @@ Main heartbeat orchestration service implementing the OODA loop:
 Initialize → Observe → Orient → Decide → Act → Record
 """
 
+import asyncio
 import json
 import logging
 import os
+import time
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, Optional
@@ -27,6 +30,7 @@ from api.models.exoskeleton import RecoveryPathway, SurrogateFilter
 from api.models.goal import GoalAssessment
 from api.services.action_executor import ActionExecutor, get_action_executor
 from api.services.energy_service import ActionType, EnergyService, get_energy_service
+from api.services.system_metrics_service import SystemMetricsService, count_created_memory
 
 logger = logging.getLogger("dionysus.heartbeat_service")
 
@@ -127,6 +131,58 @@ HEARTBEAT_USER_PROMPT = """## Current Environment
 What will you do this heartbeat?"""
 
 
+# One read of everything the heartbeat needs from the graph. Each CALL subquery
+# aggregates to exactly one row, so the statement always returns one row and
+# all four views come from the same transaction.
+WORLD_SNAPSHOT_CYPHER = """
+CALL {
+    MATCH (m:Memory)
+    WHERE m.created_at > datetime() - duration('PT24H')
+    WITH m ORDER BY m.created_at DESC LIMIT 10
+    RETURN collect({id: m.id, content: m.content, type: m.memory_type,
+                    created_at: m.created_at}) AS recent_memories
+}
+CALL {
+    MATCH (t:Trajectory)
+    WHERE t.processed_at IS NULL
+    WITH t ORDER BY t.created_at DESC LIMIT 5
+    RETURN collect({id: t.id, summary: t.summary, metadata: t.metadata}) AS recent_trajectories
+}
+CALL {
+    MATCH (m:Memory)
+    WHERE m.memory_type = 'identity' OR m.memory_type = 'core_value'
+    WITH m ORDER BY m.importance DESC LIMIT 5
+    RETURN collect(m.content) AS identity
+}
+CALL {
+    OPTIONAL MATCH (l:HeartbeatLog)
+    WITH l ORDER BY l.heartbeat_number DESC LIMIT 1
+    RETURN l.narrative AS last_narrative
+}
+RETURN recent_memories, recent_trajectories, identity, last_narrative
+"""
+
+
+class _PhaseTimer:
+    """Wall-clock milliseconds per heartbeat phase (repeated phases accumulate)."""
+
+    def __init__(self):
+        self.timings: dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - started) * 1000
+            self.timings[name] = round(self.timings.get(name, 0.0) + elapsed, 3)
+
+    async def track(self, name: str, awaitable):
+        with self.phase(name):
+            return await awaitable
+
+
 # =============================================================================
 # T016: Context Builder
 # =============================================================================
@@ -167,9 +223,9 @@ class ContextBuilder:
         """Get Neo4j driver."""
         if self._driver:
             return self._driver
-        from api.services.remote_sync import get_graphiti_driver
+        from api.services.remote_sync import get_neo4j_driver
 
-        return get_graphiti_driver()
+        return get_neo4j_driver()
 
     async def build_context(
         self,
@@ -188,8 +244,6 @@ class ContextBuilder:
         Returns:
             HeartbeatContext with all necessary information
         """
-        driver = self._get_driver()
-
         # Build goals snapshot
         goals = GoalsSnapshot(
             active=[g.id for g in goal_assessment.active_goals],
@@ -198,76 +252,31 @@ class ContextBuilder:
             stale=[g.id for g in goal_assessment.stale_goals],
         )
 
-        # ULTRATHINK: Subconscious Fetch
+        # ULTRATHINK: Subconscious state, boardroom aspects (Source of Truth) and
+        # the graph snapshot are independent reads, so fetch them together.
+        from api.services.aspect_service import get_aspect_service
         from api.services.hexis_service import get_hexis_service
-        hexis = get_hexis_service()
-        subconscious = await hexis.get_subconscious_state(agent_id)
-
-        # Get recent memories and trajectories
-        async with driver.session() as session:
-            memory_result = await session.run(
-                """
-                MATCH (m:Memory)
-                WHERE m.created_at > datetime() - duration('PT24H')
-                RETURN m.id as id, m.content as content, m.memory_type as type,
-                       m.created_at as created_at
-                ORDER BY m.created_at DESC
-                LIMIT 10
-                """
-            )
-            recent_memories = await memory_result.data()
-
-            # T018: Fetch recent MemEvolve trajectories (MemEvolve Phase 4)
-            trajectory_result = await session.run(
-                """
-                MATCH (t:Trajectory)
-                WHERE t.processed_at IS NULL
-                RETURN t.id as id, t.summary as summary, t.metadata as metadata
-                ORDER BY t.created_at DESC
-                LIMIT 5
-                """
-            )
-            recent_trajectories = await trajectory_result.data()
-
-            # Get identity context (core beliefs, values)
-            identity_result = await session.run(
-                """
-                MATCH (m:Memory)
-                WHERE m.memory_type = 'identity' OR m.memory_type = 'core_value'
-                RETURN m.content as content
-                ORDER BY m.importance DESC
-                LIMIT 5
-                """
-            )
-            identity_data = await identity_result.data()
-            identity_context = "\n".join(r["content"] for r in identity_data) if identity_data else "I am developing my sense of self."
 
-            # Get last heartbeat summary
-            last_result = await session.run(
-                """
-                MATCH (l:HeartbeatLog)
-                RETURN l.narrative as narrative, l.heartbeat_number as num
-                ORDER BY l.heartbeat_number DESC
-                LIMIT 1
-                """
-            )
-            last_record = await last_result.single()
-            last_summary = last_record["narrative"] if last_record else "This is my first heartbeat."
+        subconscious, boardroom_aspects, snapshot = await asyncio.gather(
+            get_hexis_service().get_subconscious_state(agent_id),
+            # For heartbeat, we use a default user_id or system identifier
+            get_aspect_service().get_all_aspects(user_id="dionysus_system"),
+            self.fetch_world_snapshot(),
+        )
 
-        # Fetch boardroom aspects (Source of Truth)
-        from api.services.aspect_service import get_aspect_service
-        aspect_service = get_aspect_service()
-        # For heartbeat, we use a default user_id or system identifier
-        boardroom_aspects = await aspect_service.get_all_aspects(user_id="dionysus_system")
+        identity_data = snapshot.get("identity") or []
+        identity_context = "\n".join(identity_data) if identity_data else "I am developing my sense of self."
+        last_summary = snapshot.get("last_narrative") or "This is my first heartbeat."
 
         context = HeartbeatContext(
             environment=environment,
             goals=goals,
             goal_assessment=goal_assessment,
-            recent_memories=recent_memories,
-            recent_trajectories=recent_trajectories,
+            recent_memories=snapshot.get("recent_memories") or [],
+            recent_trajectories=snapshot.get("recent_trajectories") or [],
             identity_context=identity_context,
             boardroom_aspects=boardroom_aspects,
+            last_heartbeat_summary=last_summary,
             modality=subconscious.modality,
             active_loops=[loop.model_dump() if hasattr(loop, 'model_dump') else loop for loop in subconscious.active_loops],
             is_finality_predicted=getattr(subconscious, 'is_finality_predicted', False)
@@ -286,6 +295,16 @@ class ContextBuilder:
             
         return context
 
+    async def fetch_world_snapshot(self) -> dict[str, Any]:
+        """
+        Read recent memories, unprocessed trajectories, identity and the last
+        heartbeat narrative in a single round-trip (WORLD_SNAPSHOT_CYPHER).
+        """
+        driver = self._get_driver()
+        async with driver.session() as session:
+            result = await session.run(WORLD_SNAPSHOT_CYPHER)
+            rows = await result.data()
+        return rows[0] if rows else {}
 
     def format_prompt(
         self,
@@ -450,9 +469,9 @@ class HeartbeatService:
         """Get Neo4j driver."""
         if self._driver:
             return self._driver
-        from api.services.remote_sync import get_graphiti_driver
+        from api.services.remote_sync import get_neo4j_driver
 
-        return get_graphiti_driver()
+        return get_neo4j_driver()
 
     async def heartbeat(self) -> HeartbeatSummary:
         """
@@ -462,79 +481,54 @@ class HeartbeatService:
             HeartbeatSummary with all results
         """
         started_at = datetime.utcnow()
+        tick_started = time.perf_counter()
+        timer = _PhaseTimer()
         logger.info("=== HEARTBEAT START ===")
 
         # =====================================================================
         # Phase 1: Initialize
         # =====================================================================
         logger.info("Phase 1: Initialize")
-
-        # Check if paused
-        state = await self._energy_service.get_state()
-        if state.paused:
-            logger.warning(f"Heartbeat paused: {state.pause_reason}")
-            raise HeartbeatPausedError(state.pause_reason or "System paused")
-
-        # Regenerate energy
-        state = await self._energy_service.regenerate_energy()
-        energy_start = state.current_energy
-
-        # Increment heartbeat count
-        heartbeat_number = await self._energy_service.increment_heartbeat_count()
-
+        energy_start, heartbeat_number = await timer.track("initialize", self._initialize())
         logger.info(f"Heartbeat #{heartbeat_number}, energy: {energy_start}")
 
         # =====================================================================
-        # Phase 2: Observe
+        # Phase 2+3: Observe / Orient
+        # Observation, goal review and the pending-prediction fetch do not
+        # depend on each other, so they run concurrently. Prediction generation,
+        # prediction resolution and context building need the environment and
+        # goal assessment, and run concurrently in a second wave.
         # =====================================================================
-        logger.info("Phase 2: Observe")
+        logger.info("Phase 2: Observe / Phase 3: Orient")
 
-        observe_result = await self._action_executor.execute(
-            ActionRequest(action_type=ActionType.OBSERVE)
-        )
-        environment = EnvironmentSnapshot(
-            **observe_result.data.get("snapshot", {})
-        ) if observe_result.success else EnvironmentSnapshot(
-            heartbeat_number=heartbeat_number,
-            current_energy=energy_start,
+        environment, goal_assessment, unresolved = await asyncio.gather(
+            timer.track("observe", self._observe(heartbeat_number, energy_start)),
+            timer.track("goal_review", self._review_goals()),
+            timer.track("prediction_fetch", self._fetch_unresolved_predictions()),
         )
-        environment.heartbeat_number = heartbeat_number
-        environment.current_energy = energy_start
-
-        # Generate predictions from mental models (T033)
-        predictions = await self._generate_model_predictions({
-            "heartbeat_number": heartbeat_number,
-            "user_present": environment.user_present,
-            "time_since_user": environment.time_since_user_hours,
-        })
-
-        # =====================================================================
-        # Phase 3: Orient (Review Goals + Resolve Predictions)
-        # =====================================================================
-        logger.info("Phase 3: Orient")
 
-        review_result = await self._action_executor.execute(
-            ActionRequest(action_type=ActionType.REVIEW_GOALS)
-        )
-
-        from api.services.goal_service import get_goal_service
-        goal_service = get_goal_service()
-        goal_assessment = await goal_service.review_goals()
-
-        # Resolve any pending predictions from last heartbeat (T041)
-        resolved_predictions = await self._resolve_pending_predictions({
-            "goal_assessment": goal_assessment,
-            "environment": environment,
-        })
-
-        # Build full context
-        context = await self._context_builder.build_context(
-            environment=environment,
-            goal_assessment=goal_assessment,
+        # Generate predictions from mental models (T033), resolve the ones
+        # pending from previous heartbeats (T041) and build the full context
+        predictions, resolved_predictions, context = await asyncio.gather(
+            timer.track("prediction_generate", self._generate_model_predictions({
+                "heartbeat_number": heartbeat_number,
+                "user_present": environment.user_present,
+                "time_since_user": environment.time_since_user_hours,
+            })),
+            timer.track("prediction_review", self._resolve_pending_predictions({
+                "goal_assessment": goal_assessment,
+                "environment": environment,
+            }, unresolved=unresolved)),
+            timer.track("context", self._context_builder.build_context(
+                environment=environment,
+                goal_assessment=goal_assessment,
+            )),
         )
 
         # T019: Detect patterns in agent trajectories (Phase 4)
-        trajectory_insights = await self._detect_trajectory_patterns(context.recent_trajectories)
+        trajectory_insights = await timer.track(
+            "trajectory_patterns", self._detect_trajectory_patterns(context.recent_trajectories)
+        )
         if trajectory_insights:
             logger.info(f"Detected {len(trajectory_insights)} trajectory insights")
             # We could add these to the context or goals
@@ -544,7 +538,7 @@ class HeartbeatService:
         # =====================================================================
         logger.info("Phase 4: Decide")
 
-        decision = await self._make_decision(context)
+        decision = await timer.track("decide", self._make_decision(context))
 
         logger.info(
             f"Decision: {len(decision.action_plan.actions)} actions, "
@@ -580,7 +574,9 @@ class HeartbeatService:
                 f"Please specificy a cheaper plan OR set 'force_execution' to true if this is an emergency."
             )
             
-            current_decision = await self._make_decision(context, feedback=feedback)
+            current_decision = await timer.track(
+                "decide", self._make_decision(context, feedback=feedback)
+            )
             
         # Update main decision object for recording
         decision = current_decision
@@ -593,48 +589,35 @@ class HeartbeatService:
         else:
             trimmed_plan = decision.action_plan # Allow overdraft
         
-        # T020: Check for strategic memory generation (Phase 4)
-        # In a real implementation, the LLM would explicitly choose this action.
-        # For now, we'll simulate it if there are insights.
-        if trajectory_insights:
-            await self._generate_strategic_memory(trajectory_insights)
-
-        results = await self._action_executor.execute_plan(
-            [ActionRequest(action_type=ActionType(a.action_type), params=a.params)
-             for a in trimmed_plan.actions]
-        )
-
-        # T018: Mark trajectories as consumed (Phase 4)
-        await self._consume_trajectories(context.recent_trajectories)
+        with timer.phase("act"):
+            # T020: Check for strategic memory generation (Phase 4)
+            # In a real implementation, the LLM would explicitly choose this action.
+            # For now, we'll simulate it if there are insights.
+            if trajectory_insights:
+                await self._generate_strategic_memory(trajectory_insights)
+
+            results = await self._action_executor.execute_plan(
+                [ActionRequest(action_type=ActionType(a.action_type), params=a.params)
+                 for a in trimmed_plan.actions]
+            )
 
+        # T018: Mark trajectories as consumed (Phase 4), read the final energy
+        # and ground the intention-execution gap in Hexis - all independent.
+        gap_magnitude = 0.0
+        if results:
+            success_count = sum(1 for r in results if r.status == "completed")
+            gap_magnitude = 1.0 - (success_count / len(results))
 
-        # Get final energy
-        final_state = await self._energy_service.get_state()
+        final_state, _, _ = await timer.track("settle", asyncio.gather(
+            self._energy_service.get_state(),
+            self._consume_trajectories(context.recent_trajectories),
+            self._record_execution_gap(gap_magnitude),
+        ))
         energy_end = final_state.current_energy
 
         logger.info(f"Actions completed: {sum(1 for r in results if r.success)}/{len(results)}")
         logger.info(f"Energy: {energy_start} → {energy_end}")
 
-        # ULTRATHINK: Calculate Intention-Execution Gap
-        gap_magnitude = 0.0
-        if results:
-            success_count = sum(1 for r in results if r.status == "completed")
-            gap_magnitude = 1.0 - (success_count / len(results))
-        
-        # Grounding: Record gap in Hexis
-        from api.services.hexis_service import get_hexis_service
-        hexis = get_hexis_service()
-        subconscious = await hexis.get_subconscious_state("dionysus_core")
-        subconscious.intention_execution_gap = gap_magnitude
-        
-        # If gap is high, shift towards RECOVERY proactivity for next turn
-        if gap_magnitude > 0.5:
-            from api.models.hexis_ontology import ExoskeletonMode
-            subconscious.exoskeleton_mode = ExoskeletonMode.RECOVERY
-            logger.warning(f"Intention-Execution Gap detected ({gap_magnitude}). Shifting to RECOVERY mode.")
-        
-        await hexis.update_subconscious_state("dionysus_core", subconscious)
-
         # =====================================================================
         # Phase 6: Record
         # =====================================================================
@@ -651,30 +634,92 @@ class HeartbeatService:
             energy_end=energy_end,
             started_at=started_at,
             ended_at=datetime.utcnow(),
+            phase_timings_ms=timer.timings,
         )
 
         # Generate narrative
-        summary.narrative = await self._generate_narrative(summary)
-
-        # Store as episodic memory and heartbeat log
-        await self._record_heartbeat(summary)
+        summary.narrative = await timer.track("narrative", self._generate_narrative(summary))
 
-        # Track 099: Ingest heartbeat narrative + reasoning through memory gateway
-        await self._route_heartbeat_memory(summary)
+        # Store as episodic memory and heartbeat log; Track 099: ingest heartbeat
+        # narrative + reasoning through memory gateway
+        await timer.track("record", asyncio.gather(
+            self._record_heartbeat(summary),
+            self._route_heartbeat_memory(summary),
+        ))
 
         # FEATURE 044: Multi-Tier Memory Lifecycle Management
         # Perform background consolidation and compression
-        try:
-            from api.services.multi_tier_lifecycle_service import get_multi_tier_lifecycle_service
-            multi_tier_svc = get_multi_tier_lifecycle_service()
-            lifecycle_result = await multi_tier_svc.run_lifecycle_management()
-            logger.info(f"Multi-tier memory lifecycle completed: {lifecycle_result}")
-        except Exception as e:
-            logger.error(f"Multi-tier memory lifecycle failed: {e}")
-
-        logger.info(f"=== HEARTBEAT #{heartbeat_number} COMPLETE ===")
+        with timer.phase("lifecycle"):
+            try:
+                from api.services.multi_tier_lifecycle_service import get_multi_tier_lifecycle_service
+                multi_tier_svc = get_multi_tier_lifecycle_service()
+                lifecycle_result = await multi_tier_svc.run_lifecycle_management()
+                logger.info(f"Multi-tier memory lifecycle completed: {lifecycle_result}")
+            except Exception as e:
+                logger.error(f"Multi-tier memory lifecycle failed: {e}")
+
+        # Concurrent phases overlap, so "total" is the tick's wall time, not a sum
+        summary.phase_timings_ms["total"] = round((time.perf_counter() - tick_started) * 1000, 3)
+        logger.info(
+            f"=== HEARTBEAT #{heartbeat_number} COMPLETE === "
+            f"phases(ms): {summary.phase_timings_ms}"
+        )
         return summary
 
+    async def _initialize(self) -> tuple[float, int]:
+        """Phase 1: pause check, energy regeneration and heartbeat count."""
+        # Check if paused
+        state = await self._energy_service.get_state()
+        if state.paused:
+            logger.warning(f"Heartbeat paused: {state.pause_reason}")
+            raise HeartbeatPausedError(state.pause_reason or "System paused")
+
+        # Regenerate energy
+        state = await self._energy_service.regenerate_energy()
+
+        # Increment heartbeat count
+        heartbeat_number = await self._energy_service.increment_heartbeat_count()
+        return state.current_energy, heartbeat_number
+
+    async def _observe(self, heartbeat_number: int, energy_start: float) -> EnvironmentSnapshot:
+        """Phase 2: environment snapshot via the OBSERVE action."""
+        observe_result = await self._action_executor.execute(
+            ActionRequest(action_type=ActionType.OBSERVE)
+        )
+        environment = EnvironmentSnapshot(
+            **observe_result.data.get("snapshot", {})
+        ) if observe_result.success else EnvironmentSnapshot(
+            heartbeat_number=heartbeat_number,
+            current_energy=energy_start,
+        )
+        environment.heartbeat_number = heartbeat_number
+        environment.current_energy = energy_start
+        return environment
+
+    async def _review_goals(self) -> GoalAssessment:
+        """Phase 3: REVIEW_GOALS action followed by the goal assessment."""
+        await self._action_executor.execute(
+            ActionRequest(action_type=ActionType.REVIEW_GOALS)
+        )
+
+        from api.services.goal_service import get_goal_service
+        return await get_goal_service().review_goals()
+
+    async def _record_execution_gap(self, gap_magnitude: float) -> None:
+        """ULTRATHINK: Record the intention-execution gap in Hexis."""
+        from api.services.hexis_service import get_hexis_service
+        hexis = get_hexis_service()
+        subconscious = await hexis.get_subconscious_state("dionysus_core")
+        subconscious.intention_execution_gap = gap_magnitude
+
+        # If gap is high, shift towards RECOVERY proactivity for next turn
+        if gap_magnitude > 0.5:
+            from api.models.hexis_ontology import ExoskeletonMode
+            subconscious.exoskeleton_mode = ExoskeletonMode.RECOVERY
+            logger.warning(f"Intention-Execution Gap detected ({gap_magnitude}). Shifting to RECOVERY mode.")
+
+        await hexis.update_subconscious_state("dionysus_core", subconscious)
+
     async def _make_decision(self, context: HeartbeatContext, feedback: str | None = None) -> HeartbeatDecision:
         """
         Make the heartbeat decision using ConsciousnessManager and SchemaContext.
@@ -814,9 +859,29 @@ class HeartbeatService:
         # Legacy method kept for interface but logic moved to _make_decision
         return await self._make_decision(context)
 
+    async def _fetch_unresolved_predictions(self) -> list:
+        """
+        Fetch predictions still pending from previous heartbeats.
+
+        Runs alongside observation so the predictions generated this heartbeat
+        are never resolved against the observation that produced them.
+        """
+        try:
+            from api.services.model_service import get_model_service
+
+            # Get unresolved predictions (limit to recent ones from last 24 hours)
+            return await get_model_service().get_unresolved_predictions(limit=10)
+        except ImportError:
+            logger.debug("Model service not available")
+            return []
+        except Exception as e:
+            logger.error(f"Error fetching unresolved predictions: {e}")
+            return []
+
     async def _resolve_pending_predictions(
         self,
         observation_context: dict,
+        unresolved: Optional[list] = None,
     ) -> list[dict]:
         """
         Resolve pending predictions from previous heartbeats.
@@ -825,6 +890,7 @@ class HeartbeatService:
 
         Args:
             observation_context: Current observation data to compare against predictions
+            unresolved: Predictions already fetched via _fetch_unresolved_predictions
 
         Returns:
             List of resolved prediction dicts
@@ -834,8 +900,8 @@ class HeartbeatService:
 
             model_service = get_model_service()
 
-            # Get unresolved predictions (limit to recent ones from last 24 hours)
-            unresolved = await model_service.get_unresolved_predictions(limit=10)
+            if unresolved is None:
+                unresolved = await self._fetch_unresolved_predictions()
 
             if not unresolved:
                 logger.debug("No unresolved predictions to resolve")
@@ -1090,7 +1156,7 @@ class HeartbeatService:
                         tags: $tags,
                         created_at: datetime()
                     })
-                    """,
+                    """ + count_created_memory("m"),
                     id=memory_id,
                     content=lesson,
                     importance=importance,
@@ -1113,7 +1179,7 @@ class HeartbeatService:
                         importance: 0.5,
                         created_at: datetime()
                     })
-                    """,
+                    """ + count_created_memory("m"),
                     id=memory_id,
                     content=f"Strategic Insights: {'; '.join(insights)}"
                 )
@@ -1222,7 +1288,8 @@ class HeartbeatService:
         memory_id = str(uuid4())
 
         async with driver.session() as session:
-            # Create HeartbeatLog
+            # HeartbeatLog, episodic memory, their link and the focused goal
+            # touch in one round-trip
             await session.run(
                 """
                 CREATE (l:HeartbeatLog {
@@ -1238,9 +1305,26 @@ class HeartbeatService:
                     actions_taken: $actions,
                     narrative: $narrative,
                     emotional_valence: $emotional_valence,
+                    phase_timings: $phase_timings,
                     memory_id: $memory_id
                 })
-                """,
+                CREATE (m:Memory {
+                    id: $memory_id,
+                    content: $narrative,
+                    memory_type: 'episodic',
+                    source: 'heartbeat',
+                    heartbeat_number: $heartbeat_number,
+                    emotional_valence: $emotional_valence,
+                    created_at: datetime()
+                })
+                CREATE (l)-[:CREATED_MEMORY]->(m)
+                WITH l
+                OPTIONAL MATCH (g:Goal {id: $goal_id})
+                FOREACH (_ IN CASE WHEN g IS NULL THEN [] ELSE [1] END |
+                    CREATE (l)-[:TOUCHED_GOAL {action: 'focused'}]->(g)
+                    SET g.last_touched = datetime()
+                )
+                """ + count_created_memory("l"),
                 log_id=log_id,
                 heartbeat_number=summary.heartbeat_number,
                 started_at=summary.started_at.isoformat(),
@@ -1253,52 +1337,14 @@ class HeartbeatService:
                 actions=json.dumps([r.to_dict() for r in summary.results]),
                 narrative=summary.narrative,
                 emotional_valence=summary.decision.emotional_state,
+                phase_timings=json.dumps(summary.phase_timings_ms),
                 memory_id=memory_id,
+                goal_id=str(summary.decision.focus_goal_id) if summary.decision.focus_goal_id else None,
             )
 
-            # Create episodic memory
-            await session.run(
-                """
-                CREATE (m:Memory {
-                    id: $memory_id,
-                    content: $narrative,
-                    memory_type: 'episodic',
-                    source: 'heartbeat',
-                    heartbeat_number: $heartbeat_number,
-                    emotional_valence: $emotional_valence,
-                    created_at: datetime()
-                })
-                """,
-                memory_id=memory_id,
-                narrative=summary.narrative,
-                heartbeat_number=summary.heartbeat_number,
-                emotional_valence=summary.decision.emotional_state,
-            )
-
-            # Link heartbeat to memory
-            await session.run(
-                """
-                MATCH (l:HeartbeatLog {id: $log_id})
-                MATCH (m:Memory {id: $memory_id})
-                CREATE (l)-[:CREATED_MEMORY]->(m)
-                """,
-                log_id=log_id,
-                memory_id=memory_id,
-            )
-
-            if summary.decision.focus_goal_id:
-                await session.run(
-                    """
-                    MATCH (l:HeartbeatLog {id: $log_id})
-                    MATCH (g:Goal {id: $goal_id})
-                    CREATE (l)-[:TOUCHED_GOAL {action: 'focused'}]->(g)
-                    SET g.last_touched = datetime()
-                    """,
-                    log_id=log_id,
-                    goal_id=str(summary.decision.focus_goal_id),
-                )
-
         logger.info(f"Recorded heartbeat log {log_id} and memory {memory_id}")
+        if summary.decision.focus_goal_id:
+            await SystemMetricsService(driver).record_goal_touched(str(summary.decision.focus_goal_id))
 
         # Feature 046: Working Memory Cache Update
         try:
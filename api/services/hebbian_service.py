@@ -3,6 +3,8 @@ Hebbian Service - Manages co-activation learning for knowledge relationships.
 """
 
 import logging
+from typing import Dict, List, Tuple
+
 from api.models.hebbian import HebbianConnection
 from api.services.webhook_neo4j_driver import get_neo4j_driver
 
@@ -14,34 +16,66 @@ class HebbianService:
 
     async def record_coactivation(self, source_id: str, target_id: str, v1: float = 1.0, v2: float = 1.0):
         """Record a co-activation event between two nodes (T045)."""
-        # 1. Fetch current weight from Neo4j
-        cypher = """
-        MATCH (n {uuid: $src})-[r:RELATES_TO]->(m {uuid: $tgt})
-        RETURN r.weight as weight
+        await self.record_coactivations([(source_id, target_id, v1, v2)])
+
+    async def record_coactivations(self, events: List[Tuple[str, str, float, float]]) -> int:
+        """
+        Record many co-activation events with one fetch and one update.
+
+        Events are (source_id, target_id, v1, v2). Repeated pairs are applied
+        in order, as if recorded one at a time.
+
+        Returns:
+            Number of connections whose weight was written
         """
+        if not events:
+            return 0
+
+        # 1. Fetch current weights from Neo4j
+        fetch_cypher = """
+        UNWIND $pairs AS pair
+        MATCH (n {uuid: pair.src})-[r:RELATES_TO]->(m {uuid: pair.tgt})
+        RETURN pair.src as source, pair.tgt as target, r.weight as weight
+        """
+        pairs = list({(src, tgt): {"src": src, "tgt": tgt} for src, tgt, _, _ in events}.values())
         async with self.driver.session() as session:
-            res = await session.run(cypher, {"src": source_id, "tgt": target_id})
-            record = await res.single()
-            current_weight = record["weight"] if record and record["weight"] is not None else 0.5
-            
-            # 2. Apply Hebbian update
-            conn = HebbianConnection(source_id=source_id, target_id=target_id, weight=current_weight)
-            conn.apply_hebbian_update(v1, v2)
-            
+            res = await session.run(fetch_cypher, {"pairs": pairs})
+            records = await res.data()
+            current = {
+                (r["source"], r["target"]): r["weight"] for r in records if r.get("weight") is not None
+            }
+
+            # 2. Apply Hebbian updates
+            connections: Dict[Tuple[str, str], HebbianConnection] = {}
+            for source_id, target_id, v1, v2 in events:
+                key = (source_id, target_id)
+                if key not in connections:
+                    connections[key] = HebbianConnection(
+                        source_id=source_id, target_id=target_id, weight=current.get(key, 0.5)
+                    )
+                connections[key].apply_hebbian_update(v1, v2)
+
             # 3. Persist back to Neo4j (T047)
             update_cypher = """
-            MATCH (n {uuid: $src})-[r:RELATES_TO]->(m {uuid: $tgt})
-            SET r.weight = $weight,
-                r.last_activated = $now
+            UNWIND $updates AS u
+            MATCH (n {uuid: u.src})-[r:RELATES_TO]->(m {uuid: u.tgt})
+            SET r.weight = u.weight,
+                r.last_activated = u.now
             """
             await session.run(update_cypher, {
-                "src": source_id,
-                "tgt": target_id,
-                "weight": conn.weight,
-                "now": conn.last_activated.isoformat()
+                "updates": [
+                    {
+                        "src": conn.source_id,
+                        "tgt": conn.target_id,
+                        "weight": conn.weight,
+                        "now": conn.last_activated.isoformat(),
+                    }
+                    for conn in connections.values()
+                ]
             })
-            
-            logger.info(f"Updated Hebbian weight for {source_id}->{target_id}: {conn.weight:.4f}")
+
+        logger.info(f"Updated Hebbian weights for {len(connections)} connections")
+        return len(connections)
 
     async def apply_decay_batch(self, decay_rate: float = 0.01, min_days_inactive: int = 1) -> int:
         """
@@ -9,6 +9,7 @@ cognition-base strategy boosting.
 import json
 import logging
 import warnings
+from collections import Counter
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 from uuid import uuid4
@@ -59,14 +60,14 @@ class KGLearningService:
             )
             relationships.append(rel)
             
-            # Persist the proposal for tracking/review (T007)
-            await self._persist_proposal(rel)
         
         result = ExtractionResult(
             run_id=run_id,
             entities=extraction.get("entities", []),
             relationships=relationships,
         )
+        # Persist the proposals for tracking/review (T007)
+        result.write_counts["proposals"] = await self._persist_proposals(relationships)
         
         # 4. Ingest approved relationships via MemEvolve adapter
         approved_rels = [r for r in extraction.get("relationships", []) if r["status"] == "approved"]
@@ -82,13 +83,13 @@ class KGLearningService:
             logger.info(f"{pending_count} low-confidence extractions queued for review")
 
         # 5. Update basins and learn
-        await self._strengthen_basins(result.entities)
+        result.write_counts["basins"] = await self._strengthen_basins(result.entities)
         
         # T010: Automatic Feedback Loop
         evaluation = await self.evaluate_extraction(result, content)
         
         if evaluation.get("precision_score", 0.0) > 0.8:
-            await self._record_learning(result.relationships)
+            result.write_counts.update(await self._record_learning(result.relationships))
             logger.info(f"Automatic Strategy Boost applied for run {run_id}")
 
         result.end_time = datetime.utcnow()
@@ -160,14 +161,14 @@ class KGLearningService:
             )
             relationships.append(rel)
             
-            # Persist the proposal for tracking/review
-            await self._persist_proposal(rel)
         
         result = ExtractionResult(
             run_id=run_id,
             entities=extraction.get("entities", []),
             relationships=relationships,
         )
+        # Persist the proposals for tracking/review
+        result.write_counts["proposals"] = await self._persist_proposals(relationships)
         
         # 6. Ingest approved relationships via MemEvolve adapter
         approved_rels = [r for r in extraction.get("relationships", []) if r["status"] == "approved"]
@@ -183,14 +184,14 @@ class KGLearningService:
             logger.info(f"{pending_count} low-confidence extractions queued for review")
 
         # 7. Update basins and learn - strengthen the memory-type-specific basin
-        await self._strengthen_basins(result.entities)
+        result.write_counts["basins"] = await self._strengthen_basins(result.entities)
         await router._record_basin_memory(basin_name, memory_type, extraction)
         
         # T010: Automatic Feedback Loop
         evaluation = await self.evaluate_extraction(result, content)
         
         if evaluation.get("precision_score", 0.0) > 0.8:
-            await self._record_learning(result.relationships)
+            result.write_counts.update(await self._record_learning(result.relationships))
             logger.info(f"Automatic Strategy Boost applied for typed run {run_id}")
 
         result.end_time = datetime.utcnow()
@@ -275,80 +276,105 @@ class KGLearningService:
 
     async def _persist_proposal(self, rel: RelationshipProposal):
         """Store a relationship proposal in Neo4j for audit/review."""
+        await self._persist_proposals([rel])
+
+    async def _persist_proposals(self, relationships: List[RelationshipProposal]) -> int:
+        """Store a run's relationship proposals in one write. Returns the writes issued."""
+        if not relationships:
+            return 0
+
         cypher = """
-        CREATE (r:RelationshipProposal {{
-            source: $source,
-            target: $target,
-            relation_type: $type,
-            confidence: $confidence,
-            evidence: $evidence,
-            run_id: $run_id,
-            model_id: $model_id,
-            status: $status,
+        UNWIND $proposals AS p
+        CREATE (r:RelationshipProposal {
+            source: p.source,
+            target: p.target,
+            relation_type: p.type,
+            confidence: p.confidence,
+            evidence: p.evidence,
+            run_id: p.run_id,
+            model_id: p.model_id,
+            status: p.status,
             created_at: datetime()
-        }})
+        })
         """
-        params = rel.model_dump(by_alias=True)
-        await self._adapter.execute_cypher(cypher, params)
+        proposals = [rel.model_dump(by_alias=True) for rel in relationships]
+        await self._adapter.execute_cypher(cypher, {"proposals": proposals})
+        return 1
 
-    async def _strengthen_basins(self, entities: List[str]):
-        """Update/Create basins based on extracted entities."""
-        if not entities: return
+    async def _strengthen_basins(self, entities: List[str]) -> int:
+        """Update/Create basins based on extracted entities. Returns the writes issued."""
+        if not entities:
+            return 0
         
         cypher = """
-        MERGE (b:AttractorBasin {{name: $main}})
+        MERGE (b:AttractorBasin {name: $main})
         SET b.strength = coalesce(b.strength, 1.0) + 0.1,
             b.concepts = apoc.coll.toSet(coalesce(b.concepts, []) + $all),
             b.last_strengthened = datetime()
         """
         params = {"main": entities[0], "all": entities}
         await self._adapter.execute_cypher(cypher, params)
+        return 1
 
-    async def _record_learning(self, relationships: List[RelationshipProposal]):
-        """Update strategy priorities based on successful extractions."""
-        for rel in relationships:
-            if rel.confidence > 0.7:
-                cypher = """
-                MERGE (s:CognitionStrategy {category: 'relationship_types', name: $name})
-                SET s.success_count = coalesce(s.success_count, 0) + 1,
-                    s.priority_boost = coalesce(s.priority_boost, 0.0) + 0.05,
-                    s.last_used = datetime()
-                """
-                await self._adapter.execute_cypher(cypher, {"name": rel.relation_type})
+    async def _record_learning(self, relationships: List[RelationshipProposal]) -> Dict[str, int]:
+        """
+        Update strategy priorities based on successful extractions.
+
+        Boosts are aggregated per relation type and applied in one write, so a
+        type seen n times gains n successes and n * 0.05 priority.
+
+        Returns:
+            Writes issued per learning step
+        """
+        writes = {"strategies": 0, "coactivation": 0}
+        boosts = Counter(rel.relation_type for rel in relationships if rel.confidence > 0.7)
+        if boosts:
+            cypher = """
+            UNWIND $boosts AS boost
+            MERGE (s:CognitionStrategy {category: 'relationship_types', name: boost.name})
+            SET s.success_count = coalesce(s.success_count, 0) + boost.count,
+                s.priority_boost = coalesce(s.priority_boost, 0.0) + 0.05 * boost.count,
+                s.last_used = datetime()
+            """
+            await self._adapter.execute_cypher(
+                cypher, {"boosts": [{"name": name, "count": count} for name, count in boosts.items()]}
+            )
+            writes["strategies"] = 1
 
         # T048: Hebbian co-activation learning (conditional on feature flag)
         config = get_network_state_config()
         if config.hebbian_learning_enabled:
-            await self._apply_hebbian_coactivation(relationships)
+            writes["coactivation"] = await self._apply_hebbian_coactivation(relationships)
+        return writes
 
-    async def _apply_hebbian_coactivation(self, relationships: List[RelationshipProposal]):
+    async def _apply_hebbian_coactivation(self, relationships: List[RelationshipProposal]) -> int:
         """
         Apply Hebbian learning to relationship connections (T048).
 
         When entities co-activate through successful extraction, strengthen
-        their connection weights using the Hebbian learning formula.
+        their connection weights using the Hebbian learning formula. All pairs
+        are updated together; returns the writes issued.
         """
         from api.services.hebbian_service import get_hebbian_service
 
-        hebbian_svc = get_hebbian_service()
-
-        for rel in relationships:
-            if rel.confidence < 0.6:
-                continue
-
-            # Record co-activation between source and target entities
-            # Activation values scaled by confidence
-            try:
-                await hebbian_svc.record_coactivation(
-                    source_id=rel.source,
-                    target_id=rel.target,
-                    v1=rel.confidence,
-                    v2=rel.confidence
-                )
-                logger.debug(f"Hebbian co-activation recorded: {rel.source} -> {rel.target}")
-            except Exception as e:
-                # Don't fail extraction on Hebbian errors - just log
-                logger.warning(f"Hebbian co-activation failed for {rel.source}->{rel.target}: {e}")
+        # Record co-activation between source and target entities
+        # Activation values scaled by confidence
+        events = [
+            (rel.source, rel.target, rel.confidence, rel.confidence)
+            for rel in relationships
+            if rel.confidence >= 0.6
+        ]
+        if not events:
+            return 0
+
+        try:
+            await get_hebbian_service().record_coactivations(events)
+            logger.debug(f"Hebbian co-activation recorded for {len(events)} relationships")
+            return 1
+        except Exception as e:
+            # Don't fail extraction on Hebbian errors - just log
+            logger.warning(f"Hebbian co-activation failed for {len(events)} relationships: {e}")
+            return 0
 
     async def evaluate_extraction(self, extraction: ExtractionResult, ground_truth: str) -> Dict[str, Any]:
         """
@@ -401,6 +427,26 @@ class KGLearningService:
             logger.error(f"evaluation_failed: {e}")
             return {"error": "Evaluation parsing failed", "precision_score": 0.0}
 
+    async def _record_evaluation_metric(self, run_id: str, eval_data: Dict[str, Any]) -> None:
+        """Store an extraction evaluation as a LearningMetric node (T014)."""
+        cypher = """
+        CREATE (m:LearningMetric {
+            run_id: $run_id,
+            precision_score: $precision_score,
+            recall_proxy: $recall_proxy,
+            hallucination_count: $hallucination_count,
+            learning_signal: $learning_signal,
+            created_at: datetime()
+        })
+        """
+        await self._adapter.execute_cypher(cypher, {
+            "run_id": run_id,
+            "precision_score": float(eval_data.get("precision_score", 0.0)),
+            "recall_proxy": float(eval_data.get("recall_proxy", 0.0)),
+            "hallucination_count": len(eval_data.get("hallucinations", [])),
+            "learning_signal": eval_data.get("learning_signal", ""),
+        })
+
     async def ingest_unified(
         self,
         content: str,
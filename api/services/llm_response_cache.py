@@ -0,0 +1,173 @@
+"""
+LLM Response Cache
+
+Local cache in front of llm_service.chat_completion. Entries are keyed by the
+sha256 of (model, normalized messages, sampling parameters) and expire after a
+TTL; the oldest entries are evicted past max_entries.
+
+Single-flight: while a request for a key is in flight, identical requests
+await the same future instead of issuing their own upstream call.
+
+Config:
+    LLM_CACHE_ENABLED          default true
+    LLM_CACHE_TTL_SECONDS      default 300
+    LLM_CACHE_MAX_ENTRIES      default 1024
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional
+
+logger = logging.getLogger("dionysus.llm_response_cache")
+
+
+def normalize_messages(messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Drop empty fields and surrounding whitespace so trivially different prompts share a key."""
+    normalized = []
+    for message in messages:
+        entry = {}
+        for field, value in message.items():
+            if value is None:
+                continue
+            entry[field] = value.strip() if isinstance(value, str) else value
+        normalized.append(entry)
+    return normalized
+
+
+def make_cache_key(model: str, messages: list[dict[str, Any]], **params: Any) -> str:
+    payload = {
+        "model": model,
+        "messages": normalize_messages(messages),
+        "params": {k: v for k, v in params.items() if v is not None},
+    }
+    raw = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+class LLMResponseCache:
+    """TTL + LRU response cache with single-flight deduplication."""
+
+    def __init__(self, ttl_seconds: float = 300.0, max_entries: int = 1024, enabled: bool = True):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._counters = {"hits": 0, "misses": 0, "coalesced": 0, "bypassed": 0, "evictions": 0}
+
+    @classmethod
+    def from_env(cls) -> "LLMResponseCache":
+        return cls(
+            ttl_seconds=float(os.getenv("LLM_CACHE_TTL_SECONDS", "300")),
+            max_entries=int(os.getenv("LLM_CACHE_MAX_ENTRIES", "1024")),
+            enabled=os.getenv("LLM_CACHE_ENABLED", "true").lower() not in ("0", "false", "no"),
+        )
+
+    def get(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl_seconds if ttl is None else ttl
+        if ttl <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._counters["evictions"] += 1
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[str]],
+        ttl: Optional[float] = None,
+        use_cache: bool = True,
+    ) -> str:
+        """
+        Return a cached response, join an identical in-flight request, or
+        run `compute`. Empty responses (upstream errors) are shared with
+        waiters but not stored.
+        """
+        if not (self.enabled and use_cache):
+            self._counters["bypassed"] += 1
+            return await compute()
+
+        cached = self.get(key)
+        if cached is not None:
+            self._counters["hits"] += 1
+            return cached
+
+        loop = asyncio.get_running_loop()
+        pending = self._inflight.get(key)
+        if pending is not None and pending.get_loop() is loop:
+            self._counters["coalesced"] += 1
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                # The leading request was cancelled, not this one: go upstream ourselves
+                return await self.get_or_compute(key, compute, ttl, use_cache)
+
+        self._counters["misses"] += 1
+        future = loop.create_future()
+        self._inflight[key] = future
+        try:
+            value = await compute()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Retrieve it so a future nobody joined doesn't log a warning
+            future.exception()
+            raise
+        else:
+            if value:
+                self.set(key, value, ttl)
+            future.set_result(value)
+            return value
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self._counters["hits"] + self._counters["misses"] + self._counters["coalesced"]
+        served = self._counters["hits"] + self._counters["coalesced"]
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "inflight": len(self._inflight),
+            "ttl_seconds": self.ttl_seconds,
+            "max_entries": self.max_entries,
+            **self._counters,
+            "hit_rate": served / lookups if lookups else 0.0,
+        }
+
+
+_cache: Optional[LLMResponseCache] = None
+
+
+def get_llm_response_cache() -> LLMResponseCache:
+    global _cache
+    if _cache is None:
+        _cache = LLMResponseCache.from_env()
+    return _cache
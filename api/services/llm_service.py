@@ -9,14 +9,25 @@ from __future__ import annotations
 import os
 import json
 import logging
+import time
 from typing import AsyncGenerator, Optional, TYPE_CHECKING
 from litellm import acompletion
 
+from api.services.llm_response_cache import get_llm_response_cache, make_cache_key
+from api.services.metrics_registry import get_metrics_registry
+
 if TYPE_CHECKING:
     from smolagents import LiteLLMRouterModel
 
 logger = logging.getLogger(__name__)
 
+_LLM_LATENCY = get_metrics_registry().histogram(
+    "dionysus_llm_request_duration_ms", "Upstream LLM completion latency by model.", ("model",)
+)
+_LLM_REQUESTS = get_metrics_registry().counter(
+    "dionysus_llm_requests_total", "Upstream LLM completions by model and outcome.", ("model", "outcome")
+)
+
 # Provider config
 LLM_PROVIDER = os.getenv("LLM_PROVIDER", "openai")
 OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL", "http://host.docker.internal:11434")
@@ -72,10 +83,18 @@ async def chat_completion(
     messages: list[dict],
     system_prompt: str,
     model: str = GPT5_NANO,
-    max_tokens: int = 1024
+    max_tokens: int = 1024,
+    use_cache: bool = True,
+    cache_ttl: Optional[float] = None,
 ) -> str:
     """
     Non-streaming chat completion via LiteLLM.
+
+    Responses are served from the local LLM response cache when an identical
+    request (model, messages, sampling parameters) completed within the TTL,
+    and concurrent identical requests share one upstream call. Pass
+    use_cache=False for calls that must reach the model, or cache_ttl to
+    override the default TTL.
     """
     # If model is an ollama model, force provider
     if model.startswith("ollama/"):
@@ -83,28 +102,41 @@ async def chat_completion(
     else:
         llm_model = model if model.startswith("openai/") else f"openai/{model}"
 
-    try:
-        kwargs = {
-            "model": llm_model,
-            "messages": [{"role": "system", "content": system_prompt}] + messages,
-            "api_key": os.getenv("OPENAI_API_KEY"),
-            "timeout": 60,
-            "drop_params": True
-        }
-        
-        # Ollama support
-        if "ollama" in llm_model:
-            kwargs["api_base"] = OLLAMA_BASE_URL
-            
-        if "gpt-5" not in llm_model:
-            kwargs["max_tokens"] = max_tokens
-            
-        response = await acompletion(**kwargs)
-        content = response.choices[0].message.content
-        return content if content is not None else ""
-    except Exception as e:
-        logger.error(f"LiteLLM error ({llm_model}): {e}")
-        return ""
+    full_messages = [{"role": "system", "content": system_prompt}] + messages
+
+    async def _complete() -> str:
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            kwargs = {
+                "model": llm_model,
+                "messages": full_messages,
+                "api_key": os.getenv("OPENAI_API_KEY"),
+                "timeout": 60,
+                "drop_params": True
+            }
+
+            # Ollama support
+            if "ollama" in llm_model:
+                kwargs["api_base"] = OLLAMA_BASE_URL
+
+            if "gpt-5" not in llm_model:
+                kwargs["max_tokens"] = max_tokens
+
+            response = await acompletion(**kwargs)
+            content = response.choices[0].message.content
+            outcome = "ok"
+            return content if content is not None else ""
+        except Exception as e:
+            logger.error(f"LiteLLM error ({llm_model}): {e}")
+            return ""
+        finally:
+            _LLM_LATENCY.labels(model=llm_model).observe((time.perf_counter() - started) * 1000)
+            _LLM_REQUESTS.labels(model=llm_model, outcome=outcome).inc()
+
+    cache = get_llm_response_cache()
+    key = make_cache_key(llm_model, full_messages, max_tokens=max_tokens)
+    return await cache.get_or_compute(key, _complete, ttl=cache_ttl, use_cache=use_cache)
 
 
 async def chat_stream(
@@ -8,6 +8,7 @@ Phase: 2 - Retrieval
 Handles communication between Dionysus and MemEvolve systems via n8n webhooks.
 """
 
+import asyncio
 import time
 import logging
 import os
@@ -16,6 +17,7 @@ from typing import Optional, Dict, Any, List
 from datetime import datetime
 from uuid import uuid4
 
+from api.services.memory_ann_index import get_memory_ann_index
 from api.services.remote_sync import RemoteSyncService
 from api.models.memevolve import (
     MemoryRecallRequest,
@@ -29,6 +31,10 @@ from api.models.memevolve import (
 logger = logging.getLogger(__name__)
 
 
+def _ann_ttl_seconds() -> float:
+    return float(os.getenv("MEMORY_ANN_TTL_SECONDS", "900"))
+
+
 class MemEvolveAdapter:
     """
     Adapter service for MemEvolve integration.
@@ -46,6 +52,7 @@ class MemEvolveAdapter:
         """
         self._initialized_at = datetime.utcnow()
         self._sync_service = sync_service or RemoteSyncService()
+        self._background_tasks: set[asyncio.Task] = set()
     
     async def health_check(self) -> Dict[str, Any]:
         """
@@ -355,7 +362,13 @@ class MemEvolveAdapter:
             expanded_query = f"{request.query} {' '.join(expanded_concepts)}"
             logger.info(f"Active Inquiry: '{request.query}' -> '{expanded_query}' (Strategy: {strategy.strategy_name})")
             
-            # 3. Execute Search
+            # 3. Execute Search: local ANN tier first, then the backend
+            ann_result = await self._recall_from_ann(
+                request, start_time, expanded_query, strategy, expanded_concepts
+            )
+            if ann_result is not None:
+                return ann_result
+
             backend = os.getenv("MEMEVOLVE_RECALL_BACKEND", "graphiti").lower()
 
             if backend == "graphiti":
@@ -407,6 +420,7 @@ class MemEvolveAdapter:
             
             # Transform to MemEvolve format
             memories: List[Dict[str, Any]] = []
+            invalidated: set[str] = set()
             for item in items:
                 if not isinstance(item, dict):
                     continue
@@ -431,9 +445,12 @@ class MemEvolveAdapter:
                 if request.include_temporal_metadata:
                     memory["valid_at"] = item.get("valid_at")
                     memory["invalid_at"] = item.get("invalid_at")
+                if item.get("invalid_at"):
+                    invalidated.add(memory["id"])
                 
                 memories.append(memory)
             
+            self._schedule_ann_insert(memories, invalidated)
             search_time_ms = (time.time() - start_time) * 1000
             
             return {
@@ -484,6 +501,7 @@ class MemEvolveAdapter:
         )
         edges = results.get("edges", [])
         memories: List[Dict[str, Any]] = []
+        invalidated: set[str] = set()
         for edge in edges:
             content = edge.get("fact") or edge.get("name") or ""
             memory = {
@@ -499,7 +517,10 @@ class MemEvolveAdapter:
             if request.include_temporal_metadata:
                 memory["valid_at"] = edge.get("valid_at")
                 memory["invalid_at"] = edge.get("invalid_at")
+            if edge.get("invalid_at"):
+                invalidated.add(memory["id"])
             memories.append(memory)
+        self._schedule_ann_insert(memories, invalidated)
 
         search_time_ms = (time.time() - start_time) * 1000
         response = {
@@ -515,6 +536,137 @@ class MemEvolveAdapter:
             response["error"] = error
         return response
 
+    async def _recall_from_ann(
+        self,
+        request: MemoryRecallRequest,
+        start_time: float,
+        expanded_query: str,
+        strategy: Any,
+        expansion_concepts: List[str],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Answer from the in-process ANN index when it holds a full page of
+        confident, recently confirmed hits for this query and filter; None
+        means go to the backend.
+
+        Entries older than MEMORY_ANN_TTL_SECONDS are not served: the backend
+        answers instead and its results re-confirm (re-insert) them. The
+        query is only embedded when enough candidates pass the filters, so a
+        miss that is certain does not pay for an extra embedding call.
+        """
+        index = get_memory_ann_index()
+        if index is None or not len(index):
+            return None
+
+        context_filters = request.context if isinstance(request.context, dict) else {}
+
+        def _matches(metadata: Dict[str, Any]) -> bool:
+            # Mirrors the filters the n8n backend applies
+            if request.project_id and metadata.get("project_id") != request.project_id:
+                return False
+            if request.session_id and metadata.get("session_id") != request.session_id:
+                return False
+            if request.memory_types and metadata.get("type") not in request.memory_types:
+                return False
+            for key, value in context_filters.items():
+                if metadata.get(key) != value:
+                    return False
+            return True
+
+        limit = strategy.top_k
+        ttl = _ann_ttl_seconds()
+        if not index.has_candidates(limit, where=_matches, max_age_seconds=ttl):
+            return None
+        try:
+            from api.services.embedding import get_embedding_service
+
+            query_vector = await get_embedding_service().generate_embedding(expanded_query)
+        except Exception as e:
+            logger.debug(f"ANN tier skipped, query embedding failed: {e}")
+            return None
+
+        hits = index.search(
+            query_vector,
+            k=limit,
+            min_similarity=float(os.getenv("MEMORY_ANN_MIN_SIMILARITY", "0.75")),
+            where=_matches,
+            max_age_seconds=ttl,
+        )
+        if len(hits) < limit:
+            return None
+
+        memories = []
+        for hit in hits:
+            memory = {key: value for key, value in hit.metadata.items() if key not in ("valid_at", "invalid_at")}
+            memory["id"] = hit.id
+            memory["similarity"] = round(hit.score, 4)
+            if request.include_temporal_metadata:
+                memory["valid_at"] = hit.metadata.get("valid_at")
+                memory["invalid_at"] = hit.metadata.get("invalid_at")
+            memories.append(memory)
+
+        return {
+            "memories": memories,
+            "query": request.query,
+            "expanded_query": expanded_query,
+            "expansion_concepts": expansion_concepts,
+            "strategy": strategy.strategy_name,
+            "result_count": len(memories),
+            "search_time_ms": round((time.time() - start_time) * 1000, 2),
+            "tier": "ann",
+        }
+
+    def _schedule_ann_insert(
+        self,
+        memories: List[Dict[str, Any]],
+        invalidated: Optional[set[str]] = None,
+    ) -> None:
+        """
+        Embed backend recall results into the ANN index off the request path.
+
+        Ids in `invalidated` (results the backend reported with invalid_at,
+        whether or not the caller asked for temporal metadata) are removed
+        instead; entries past the TTL are re-embedded, which re-confirms them.
+        """
+        index = get_memory_ann_index()
+        if index is None or not memories:
+            return
+
+        ttl = _ann_ttl_seconds()
+        fresh = []
+        for memory in memories:
+            memory_id = memory.get("id")
+            if not memory_id or not memory.get("content"):
+                continue
+            if (invalidated and memory_id in invalidated) or memory.get("invalid_at"):
+                # Invalidated facts must not be served from the local tier
+                index.remove(memory_id)
+                continue
+            age = index.age_seconds(memory_id)
+            if age is None or age >= ttl:
+                fresh.append(memory)
+        if not fresh:
+            return
+
+        async def _insert() -> None:
+            try:
+                from api.services.embedding import get_embedding_service
+
+                vectors = await get_embedding_service().generate_embeddings_batch(
+                    [m["content"] for m in fresh]
+                )
+                index.add_batch(
+                    (m["id"], vector, {k: v for k, v in m.items() if k not in ("id", "similarity")})
+                    for m, vector in zip(fresh, vectors)
+                    if vector
+                )
+            except Exception as e:
+                logger.debug(f"ANN insert of {len(fresh)} recalled memories failed: {e}")
+
+        task = asyncio.create_task(_insert())
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
     async def execute_cypher(
         self,
         statement: str,
@@ -522,9 +674,21 @@ class MemEvolveAdapter:
         **kwargs: Any,
     ) -> List[Dict[str, Any]]:
         graphiti = await self._get_graphiti_service()
-        combined_params = (parameters or {}).copy()
-        combined_params.update(kwargs)
-        return await graphiti.execute_cypher(statement, combined_params)
+        if kwargs:
+            parameters = {**(parameters or {}), **kwargs}
+        return await graphiti.execute_cypher(statement, parameters)
+
+    async def execute_statement(
+        self,
+        name: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> List[Dict[str, Any]]:
+        """Execute a statement registered via cypher_statements.register_statement."""
+        graphiti = await self._get_graphiti_service()
+        if kwargs:
+            parameters = {**(parameters or {}), **kwargs}
+        return await graphiti.execute_statement(name, parameters)
 
     async def extract_with_context(
         self,
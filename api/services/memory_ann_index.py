@@ -0,0 +1,452 @@
+"""
+In-Process ANN Index over Memory Embeddings
+
+First-tier semantic recall for the hot working set. MemEvolveAdapter answers a
+recall from here when the index holds enough confident hits, and falls back to
+the Graphiti/Neo4j vector index otherwise; memories returned by the graph are
+embedded and inserted afterwards.
+
+Structure: IVF-flat on NumPy. Vectors are L2-normalized so the inner product
+is cosine similarity. Below `train_min` live vectors every search is exact;
+after that the vectors are clustered with k-means into ~sqrt(n) inverted lists
+and a search scans only the `n_probe` lists whose centroids are closest to the
+query. Inserts are assigned to their nearest centroid; the lists are retrained
+when the index has grown 4x since the last training.
+
+Deletions free the row for reuse. Past `capacity` the least recently used
+vector (by insert or search hit) is evicted. Every vector carries its insert
+time; searches can ignore vectors older than a TTL, so the local tier never
+keeps answering from entries the graph has not re-confirmed. Snapshots are a
+single .npz.
+
+Config:
+    MEMORY_ANN_ENABLED         default true
+    MEMORY_ANN_CAPACITY        default 20000
+    MEMORY_ANN_NPROBE          default 8
+    MEMORY_ANN_MIN_SIMILARITY  default 0.75 (hits below this don't count)
+    MEMORY_ANN_TTL_SECONDS     default 900 (older entries are revalidated
+                               against the graph before being served again)
+    MEMORY_ANN_SNAPSHOT        default data/memory_ann/index.npz
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+
+import numpy as np
+
+logger = logging.getLogger("dionysus.memory_ann_index")
+
+
+@dataclass
+class ANNHit:
+    id: str
+    score: float
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.where(norms == 0, 1.0, norms)
+
+
+def _kmeans(data: np.ndarray, k: int, iterations: int, seed: int) -> np.ndarray:
+    """Spherical k-means; returns normalized centroids."""
+    rng = np.random.default_rng(seed)
+    centroids = data[rng.choice(len(data), size=k, replace=False)].copy()
+    for _ in range(iterations):
+        assign = np.argmax(data @ centroids.T, axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assign, data)
+        counts = np.bincount(assign, minlength=k)
+        empty = counts == 0
+        # Reseed empty clusters from random points instead of letting them die
+        sums[empty] = data[rng.choice(len(data), size=int(empty.sum()))]
+        centroids = _normalize(sums)
+    return centroids
+
+
+class MemoryANNIndex:
+    """IVF-flat cosine index with incremental inserts, deletes and LRU eviction."""
+
+    def __init__(
+        self,
+        dim: Optional[int] = None,
+        capacity: int = 20000,
+        n_probe: int = 8,
+        n_lists: Optional[int] = None,
+        train_min: int = 256,
+        kmeans_iterations: int = 10,
+        seed: int = 0,
+    ):
+        self.dim = dim
+        self.capacity = capacity
+        self.n_probe = n_probe
+        self.n_lists = n_lists
+        self.train_min = train_min
+        self.kmeans_iterations = kmeans_iterations
+        self.seed = seed
+
+        self._lock = threading.Lock()
+        self._vectors = np.zeros((0, dim or 0), dtype=np.float32)
+        self._assign = np.zeros(0, dtype=np.int32)  # list per row; -1 = free row
+        self._last_used = np.zeros(0, dtype=np.int64)
+        self._added_at = np.zeros(0, dtype=np.float64)  # wall-clock insert time
+        self._ids: list[Optional[str]] = []
+        self._rows: dict[str, int] = {}
+        self._metadata: dict[str, dict[str, Any]] = {}
+        self._free: list[int] = []
+        self._centroids: Optional[np.ndarray] = None
+        self._trained_size = 0
+        self._clock = 0
+        self._counters = {"searches": 0, "inserts": 0, "deletes": 0, "evictions": 0}
+
+    @classmethod
+    def from_env(cls) -> "MemoryANNIndex":
+        index = cls(
+            capacity=int(os.getenv("MEMORY_ANN_CAPACITY", "20000")),
+            n_probe=int(os.getenv("MEMORY_ANN_NPROBE", "8")),
+        )
+        snapshot = Path(os.getenv("MEMORY_ANN_SNAPSHOT", "data/memory_ann/index.npz"))
+        if snapshot.exists():
+            try:
+                index = cls.load(snapshot, capacity=index.capacity, n_probe=index.n_probe)
+            except (OSError, ValueError, KeyError) as e:
+                logger.error(f"Unreadable memory ANN snapshot, starting empty: {e}")
+        return index
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, memory_id: str) -> bool:
+        return memory_id in self._rows
+
+    # -------------------------------------------------------------------------
+    # Writes
+    # -------------------------------------------------------------------------
+
+    def add(self, memory_id: str, vector: Iterable[float], metadata: Optional[dict[str, Any]] = None) -> None:
+        self.add_batch([(memory_id, vector, metadata)])
+
+    def add_batch(self, items: Iterable[tuple[str, Iterable[float], Optional[dict[str, Any]]]]) -> int:
+        """Insert or replace vectors. Returns the number written."""
+        items = list(items)
+        if not items:
+            return 0
+        vectors = _normalize(np.asarray([v for _, v, _ in items], dtype=np.float32))
+        with self._lock:
+            if self.dim is None:
+                self.dim = vectors.shape[1]
+                self._vectors = np.zeros((0, self.dim), dtype=np.float32)
+            if vectors.shape[1] != self.dim:
+                raise ValueError(f"Expected {self.dim}-dimensional vectors, got {vectors.shape[1]}")
+
+            rows = [self._claim_row_locked(memory_id) for memory_id, _, _ in items]
+            self._vectors[rows] = vectors
+            self._added_at[rows] = time.time()
+            self._assign[rows] = self._nearest_list(vectors)
+            for row, (memory_id, _, metadata) in zip(rows, items):
+                self._metadata[memory_id] = dict(metadata or {})
+                self._last_used[row] = self._tick()
+            self._counters["inserts"] += len(items)
+
+            while len(self._rows) > self.capacity:
+                self._evict_lru_locked()
+            if self._needs_training_locked():
+                self._train_locked()
+        return len(items)
+
+    def age_seconds(self, memory_id: str) -> Optional[float]:
+        """Seconds since the vector was (re)inserted, or None if it is not held."""
+        row = self._rows.get(memory_id)
+        if row is None:
+            return None
+        return time.time() - float(self._added_at[row])
+
+    def remove(self, memory_id: str) -> bool:
+        with self._lock:
+            row = self._rows.pop(memory_id, None)
+            if row is None:
+                return False
+            self._release_row_locked(row)
+            self._counters["deletes"] += 1
+            return True
+
+    def _claim_row_locked(self, memory_id: str) -> int:
+        row = self._rows.get(memory_id)
+        if row is not None:
+            return row
+        if self._free:
+            row = self._free.pop()
+        else:
+            row = len(self._ids)
+            if row >= len(self._vectors):
+                self._grow_locked(max(64, 2 * len(self._vectors)))
+            self._ids.append(None)
+        self._ids[row] = memory_id
+        self._rows[memory_id] = row
+        return row
+
+    def _release_row_locked(self, row: int) -> None:
+        memory_id = self._ids[row]
+        self._ids[row] = None
+        self._assign[row] = -1
+        self._metadata.pop(memory_id, None)
+        self._free.append(row)
+
+    def _grow_locked(self, size: int) -> None:
+        grown = np.zeros((size, self.dim), dtype=np.float32)
+        grown[: len(self._vectors)] = self._vectors
+        self._vectors = grown
+        self._assign = np.concatenate([self._assign, np.full(size - len(self._assign), -1, dtype=np.int32)])
+        self._last_used = np.concatenate([self._last_used, np.zeros(size - len(self._last_used), dtype=np.int64)])
+        self._added_at = np.concatenate([self._added_at, np.zeros(size - len(self._added_at), dtype=np.float64)])
+
+    def _evict_lru_locked(self) -> None:
+        live = np.flatnonzero(self._assign[: len(self._ids)] >= 0)
+        row = int(live[np.argmin(self._last_used[live])])
+        del self._rows[self._ids[row]]
+        self._release_row_locked(row)
+        self._counters["evictions"] += 1
+
+    def _tick(self) -> int:
+        self._clock += 1
+        return self._clock
+
+    # -------------------------------------------------------------------------
+    # Inverted lists
+    # -------------------------------------------------------------------------
+
+    def _nearest_list(self, vectors: np.ndarray) -> np.ndarray:
+        if self._centroids is None:
+            return np.zeros(len(vectors), dtype=np.int32)
+        return np.argmax(vectors @ self._centroids.T, axis=1).astype(np.int32)
+
+    def _needs_training_locked(self) -> bool:
+        size = len(self._rows)
+        if self._centroids is None:
+            return size >= self.train_min
+        return size >= 4 * self._trained_size
+
+    def _train_locked(self) -> None:
+        live = np.flatnonzero(self._assign[: len(self._ids)] >= 0)
+        data = self._vectors[live]
+        k = min(len(data), self.n_lists or max(1, int(np.sqrt(len(data)))))
+        self._centroids = _kmeans(data, k, self.kmeans_iterations, self.seed)
+        self._assign[live] = self._nearest_list(data)
+        self._trained_size = len(live)
+        logger.debug(f"Memory ANN index trained: {len(live)} vectors in {k} lists")
+
+    def train(self) -> None:
+        """(Re)build the inverted lists from the current vectors."""
+        with self._lock:
+            if self._rows:
+                self._train_locked()
+
+    # -------------------------------------------------------------------------
+    # Search
+    # -------------------------------------------------------------------------
+
+    def search(
+        self,
+        query: Iterable[float],
+        k: int = 10,
+        min_similarity: Optional[float] = None,
+        where: Optional[Callable[[dict[str, Any]], bool]] = None,
+        exact: bool = False,
+        touch: bool = True,
+        max_age_seconds: Optional[float] = None,
+    ) -> list[ANNHit]:
+        """
+        Top-k memories by cosine similarity, best first.
+
+        `where` filters on metadata; `exact` scans every vector; vectors
+        inserted more than `max_age_seconds` ago are skipped. Hits count as
+        uses for LRU eviction unless touch=False.
+        """
+        if not self._rows:
+            return []
+        q = _normalize(np.asarray(query, dtype=np.float32))
+        with self._lock:
+            n = len(self._ids)
+            live = self._assign[:n] >= 0
+            if max_age_seconds is not None:
+                live &= self._added_at[:n] >= time.time() - max_age_seconds
+            if exact or self._centroids is None:
+                rows = np.flatnonzero(live)
+            else:
+                probes = np.argsort(-(self._centroids @ q))[: self.n_probe]
+                rows = np.flatnonzero(live & np.isin(self._assign[:n], probes))
+            scores = self._vectors[rows] @ q
+
+            hits: list[ANNHit] = []
+            for i in np.argsort(-scores):
+                score = float(scores[i])
+                if min_similarity is not None and score < min_similarity:
+                    break
+                memory_id = self._ids[rows[i]]
+                metadata = self._metadata.get(memory_id, {})
+                if where is not None and not where(metadata):
+                    continue
+                hits.append(ANNHit(memory_id, score, dict(metadata)))
+                if touch:
+                    self._last_used[rows[i]] = self._tick()
+                if len(hits) >= k:
+                    break
+            self._counters["searches"] += 1
+        return hits
+
+    def has_candidates(
+        self,
+        k: int,
+        where: Optional[Callable[[dict[str, Any]], bool]] = None,
+        max_age_seconds: Optional[float] = None,
+    ) -> bool:
+        """
+        Whether at least k vectors pass the filter and age limit. Cheap enough
+        to run before embedding a query, so hopeless searches are skipped.
+        """
+        if len(self._rows) < k:
+            return False
+        oldest = None if max_age_seconds is None else time.time() - max_age_seconds
+        found = 0
+        with self._lock:
+            for memory_id, row in self._rows.items():
+                if oldest is not None and self._added_at[row] < oldest:
+                    continue
+                if where is not None and not where(self._metadata.get(memory_id, {})):
+                    continue
+                found += 1
+                if found >= k:
+                    return True
+        return False
+
+    def evaluate_recall(self, queries: np.ndarray, k: int = 10) -> dict[str, float]:
+        """
+        Recall@k of the approximate search against an exact scan, with mean
+        per-query latency of both. Does not affect LRU order.
+        """
+        queries = np.atleast_2d(np.asarray(queries, dtype=np.float32))
+        found = 0
+        expected = 0
+        ann_seconds = 0.0
+        exact_seconds = 0.0
+        for q in queries:
+            started = time.perf_counter()
+            approx = self.search(q, k=k, touch=False)
+            ann_seconds += time.perf_counter() - started
+            started = time.perf_counter()
+            truth = self.search(q, k=k, exact=True, touch=False)
+            exact_seconds += time.perf_counter() - started
+            found += len({h.id for h in approx} & {h.id for h in truth})
+            expected += len(truth)
+        count = max(1, len(queries))
+        return {
+            "queries": len(queries),
+            "k": k,
+            "recall_at_k": found / expected if expected else 1.0,
+            "ann_ms_per_query": ann_seconds / count * 1000,
+            "exact_ms_per_query": exact_seconds / count * 1000,
+        }
+
+    # -------------------------------------------------------------------------
+    # Snapshots
+    # -------------------------------------------------------------------------
+
+    def save(self, path: str | Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            live = np.flatnonzero(self._assign[: len(self._ids)] >= 0)
+            order = live[np.argsort(self._last_used[live])]
+            ids = [self._ids[row] for row in order]
+            arrays: dict[str, Any] = {
+                "vectors": self._vectors[order],
+                "assign": self._assign[order],
+                "ids": np.array(ids, dtype=str),
+                "metadata": np.array(json.dumps([self._metadata.get(i, {}) for i in ids], default=str)),
+                "added_at": self._added_at[order],
+                "trained_size": np.array(self._trained_size),
+            }
+            if self._centroids is not None:
+                arrays["centroids"] = self._centroids
+        tmp = path.with_name(f"{path.name}.tmp")
+        with open(tmp, "wb") as f:
+            np.savez_compressed(f, **arrays)
+        tmp.replace(path)
+        return path
+
+    @classmethod
+    def load(cls, path: str | Path, **kwargs: Any) -> "MemoryANNIndex":
+        with np.load(path) as data:
+            vectors = data["vectors"]
+            index = cls(dim=vectors.shape[1] if vectors.ndim == 2 and len(vectors) else None, **kwargs)
+            ids = [str(i) for i in data["ids"]]
+            if not ids:
+                return index
+            metadata = json.loads(str(data["metadata"]))
+            index._vectors = vectors.astype(np.float32)
+            index._ids = list(ids)
+            index._rows = {memory_id: row for row, memory_id in enumerate(ids)}
+            index._metadata = dict(zip(ids, metadata))
+            # Snapshot rows are stored least recently used first
+            index._last_used = np.arange(1, len(ids) + 1, dtype=np.int64)
+            # Snapshots without insert times are treated as expired (revalidated on use)
+            index._added_at = (
+                data["added_at"].astype(np.float64) if "added_at" in data else np.zeros(len(ids), dtype=np.float64)
+            )
+            index._clock = len(ids)
+            if "centroids" in data:
+                index._centroids = data["centroids"]
+                index._assign = data["assign"].astype(np.int32)
+                index._trained_size = int(data["trained_size"])
+            else:
+                index._assign = np.zeros(len(ids), dtype=np.int32)
+        with index._lock:
+            while len(index._rows) > index.capacity:
+                index._evict_lru_locked()
+        return index
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "vectors": len(self._rows),
+            "capacity": self.capacity,
+            "dim": self.dim,
+            "lists": 0 if self._centroids is None else len(self._centroids),
+            "n_probe": self.n_probe,
+            **self._counters,
+        }
+
+
+_index: Optional[MemoryANNIndex] = None
+
+
+def get_memory_ann_index() -> Optional[MemoryANNIndex]:
+    """Process-wide index, or None when MEMORY_ANN_ENABLED is off."""
+    global _index
+    if os.getenv("MEMORY_ANN_ENABLED", "true").lower() in ("0", "false", "no"):
+        return None
+    if _index is None:
+        _index = MemoryANNIndex.from_env()
+    return _index
+
+
+def forget_memories(memory_ids: Iterable[str]) -> int:
+    """Drop deleted or invalidated memories from the local tier; returns how many were held."""
+    index = get_memory_ann_index()
+    if index is None:
+        return 0
+    return sum(index.remove(memory_id) for memory_id in memory_ids)
+
+
+def save_memory_ann_snapshot() -> Optional[Path]:
+    if _index is None or not len(_index):
+        return None
+    return _index.save(os.getenv("MEMORY_ANN_SNAPSHOT", "data/memory_ann/index.npz"))
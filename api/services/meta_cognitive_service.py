@@ -13,6 +13,7 @@ from datetime import datetime
 from api.models.meta_cognition import CognitiveEpisode
 from api.services.remote_sync import get_neo4j_driver
 from api.services.llm_service import chat_completion
+from api.services.system_metrics_service import count_recorded_episode
 
 logger = logging.getLogger(__name__)
 
@@ -92,8 +93,10 @@ class MetaCognitiveLearner:
         """
         driver = get_neo4j_driver()
         
+        # Re-recording an episode updates it without counting it twice
         query = """
         MERGE (c:CognitiveEpisode {id: $id})
+        WITH c, c.timestamp IS NULL AS is_new
         SET c.timestamp = $timestamp,
             c.task_query = $task_query,
             c.task_context = $task_context,
@@ -103,7 +106,9 @@ class MetaCognitiveLearner:
             c.outcome_summary = $outcome_summary,
             c.surprise_score = $surprise_score,
             c.lessons_learned = $lessons_learned
-        """
+        WITH c, is_new
+        WHERE is_new
+        """ + count_recorded_episode("c")
         
         params = {
             "id": episode.id,
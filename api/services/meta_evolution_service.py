@@ -14,7 +14,7 @@ from api.models.evolution import SystemMoment, EvolutionUpdate
 from api.services.webhook_neo4j_driver import get_neo4j_driver
 from api.services.llm_service import chat_completion
 from api.services.consciousness_integration_pipeline import get_consciousness_pipeline
-from api.services.memory_basin_router import get_memory_basin_router
+from api.services.system_metrics_service import SystemMetricsService
 
 logger = logging.getLogger("dionysus.meta_evolution")
 
@@ -119,66 +119,41 @@ class MetaEvolutionService:
         Feature 057: Replaced placeholder values with real basin-based computation.
         - energy_level: Sum of active basin strengths (strength > 0.3)
         - active_basins_count: Count of basins above activation threshold
+
+        Aggregates come precomputed from SystemMetricsService, so a capture
+        costs the same regardless of graph size.
         """
         driver = get_neo4j_driver()
 
-        # Gather memory count
-        memory_rows = await driver.execute_query(
-            "MATCH (m:Memory) RETURN count(m) as count"
-        )
-        total_memories = memory_rows[0]["count"] if memory_rows else 0
-
-        # Query attractor basins for real metrics (FR-001, FR-002)
-        basin_router = get_memory_basin_router()
-        basin_stats = await basin_router.get_basin_stats()
-        basins = basin_stats.get("basins", [])
+        # Memory count, 24h episode window and focus goal are maintained
+        # incrementally by their writers; basin strengths come back alongside
+        metrics = await SystemMetricsService(driver).read()
+        total_memories = metrics["memory_count"]
 
-        # Filter active basins (strength > 0.3 threshold)
+        # Filter active basins (strength > 0.3 threshold, FR-001, FR-002)
         ACTIVE_THRESHOLD = 0.3
-        active_basins = [b for b in basins if b.get("strength", 0.0) > ACTIVE_THRESHOLD]
+        active_strengths = [s for s in metrics["basin_strengths"] if s > ACTIVE_THRESHOLD]
 
         # Compute real metrics
-        active_basins_count = len(active_basins)
-        energy_level = sum(b.get("strength", 0.0) for b in active_basins)
+        active_basins_count = len(active_strengths)
+        energy_level = sum(active_strengths)
 
         # Validate energy_level in expected range [0, 10] (FR-011)
         if energy_level < 0.0 or energy_level > 10.0:
             logger.warning(
                 f"Energy level {energy_level:.2f} out of expected range [0, 10]. "
-                f"Active basins: {active_basins_count}, Basin strengths: {[b.get('strength') for b in active_basins]}"
+                f"Active basins: {active_basins_count}, Basin strengths: {active_strengths}"
             )
             # Clamp to valid range
             energy_level = max(0.0, min(10.0, energy_level))
 
         # Cognitive episode metrics (last 24h)
-        cutoff = (datetime.utcnow() - timedelta(hours=24)).isoformat()
-        episode_rows = await driver.execute_query(
-            """
-            MATCH (e:CognitiveEpisode)
-            WHERE datetime(e.timestamp) > datetime($cutoff)
-            RETURN
-                avg(coalesce(e.surprise_score, 0.0)) as avg_surprise,
-                avg(CASE WHEN e.success THEN 1.0 ELSE 0.0 END) as avg_success,
-                count(e) as episode_count
-            """,
-            {"cutoff": cutoff},
-        )
-        episode_row = episode_rows[0] if episode_rows else {}
-        avg_surprise = float(episode_row.get("avg_surprise") or 0.0)
+        avg_surprise = float(metrics["avg_surprise"])
         # Use success rate as a proxy for confidence until explicit confidence is tracked.
-        avg_confidence = float(episode_row.get("avg_success") or 0.0)
+        avg_confidence = float(metrics["avg_success"])
 
         # Current focus: most recently touched active goal, fallback to queued.
-        focus_rows = await driver.execute_query(
-            """
-            MATCH (g:Goal)
-            WHERE g.priority IN ['active', 'queued']
-            RETURN g.title as title, g.priority as priority, g.last_touched as last_touched
-            ORDER BY CASE g.priority WHEN 'active' THEN 0 ELSE 1 END, g.last_touched DESC
-            LIMIT 1
-            """
-        )
-        current_focus = focus_rows[0]["title"] if focus_rows else None
+        current_focus = metrics["current_focus"]
 
         # Recent errors from latest heartbeat logs.
         recent_errors = []
@@ -5,13 +5,25 @@ Feature: D2 Migration - Meta-Learning Document Enhancer
 Service for extracting meta-learning patterns and algorithms
 from documents, with consciousness enhancement detection.
 
+Every keyword the extractors look for is matched in a single pass over the
+document (KeywordScanner); the extractors then read counts and positions from
+the resulting KeywordHits. process_documents() spreads large corpora over
+worker processes and merges the learned patterns in the calling process.
+
 Migrated from D2 meta_learning_document_enhancer.py
 """
 
+import asyncio
 import logging
+import math
+import multiprocessing
+import os
 import re
+import threading
 import time
-from typing import Any, Dict, List, Optional, Set, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
 
 from api.models.meta_learning import (
     ConsciousnessEnhancementSignal,
@@ -26,6 +38,102 @@ from api.models.meta_learning import (
 
 logger = logging.getLogger(__name__)
 
+# Batches smaller than this are analyzed inline; process start-up costs more.
+BATCH_PROCESS_MIN_DOCUMENTS = 16
+# Aim for this many chunks per worker so uneven documents balance out.
+BATCH_CHUNKS_PER_WORKER = 4
+
+
+def _trie_pattern(node: Dict[str, Any]) -> str:
+    """Regex for a keyword trie; greedy, so it prefers the longest keyword."""
+    branches = [
+        re.escape(char) + _trie_pattern(child)
+        for char, child in sorted(node.items())
+        if char
+    ]
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    # "" marks the end of a keyword: the rest of the branch becomes optional.
+    return f"(?:{body})?" if "" in node else body
+
+
+class KeywordHits:
+    """Per-keyword occurrence counts and first positions from one scan."""
+
+    __slots__ = ("counts", "first")
+
+    def __init__(self) -> None:
+        self.counts: Dict[str, int] = {}
+        self.first: Dict[str, int] = {}
+
+    def __contains__(self, keyword: str) -> bool:
+        return keyword in self.first
+
+    def count(self, keyword: str) -> int:
+        """Non-overlapping occurrences, as str.count would report."""
+        return self.counts.get(keyword, 0)
+
+    def index(self, keyword: str) -> int:
+        """Position of the first occurrence, as str.index would report."""
+        return self.first[keyword]
+
+
+class KeywordScanner:
+    """
+    Single-pass, case-insensitive substring matcher for a fixed keyword set.
+
+    The keywords are compiled into one trie-shaped regular expression, so the
+    C regex engine walks the text once and reports the longest keyword
+    starting at each position. Shorter keywords that are prefixes of it start
+    there too and are credited from a precomputed table, so overlapping hits
+    ("active inference" / "inference") are all reported.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords = sorted({kw.lower() for kw in keywords if kw})
+        trie: Dict[str, Any] = {}
+        for keyword in self.keywords:
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[""] = {}
+        self._regex = re.compile(_trie_pattern(trie)) if self.keywords else None
+        # keyword -> every keyword it starts with (itself included)
+        self._prefixes: Dict[str, Tuple[str, ...]] = {
+            keyword: tuple(kw for kw in self.keywords if keyword.startswith(kw))
+            for keyword in self.keywords
+        }
+
+    def finditer(self, text_lower: str) -> Iterator[Tuple[int, str]]:
+        """Yield (position, keyword) for every occurrence in lowercased text."""
+        if self._regex is None:
+            return
+        search = self._regex.search
+        prefixes = self._prefixes
+        match = search(text_lower)
+        while match is not None:
+            position = match.start()
+            for keyword in prefixes[match.group()]:
+                yield position, keyword
+            match = search(text_lower, position + 1)
+
+    def scan(self, text: str) -> KeywordHits:
+        """Count every keyword in one traversal of text."""
+        hits = KeywordHits()
+        counts = hits.counts
+        first = hits.first
+        next_free: Dict[str, int] = {}
+        for position, keyword in self.finditer(text.lower()):
+            # str.count semantics: occurrences of one keyword never overlap
+            if position < next_free.get(keyword, 0):
+                continue
+            next_free[keyword] = position + len(keyword)
+            if keyword not in first:
+                first[keyword] = position
+            counts[keyword] = counts.get(keyword, 0) + 1
+        return hits
+
 
 class MetaLearningEnhancer:
     """
@@ -168,6 +276,30 @@ class MetaLearningEnhancer:
         "optimization": 0.3,
     }
 
+    # Structural pattern indicators
+    STRUCTURE_KEYWORDS: List[str] = ["method", "result"]
+    STEP_INDICATORS: List[str] = ["first", "then", "next", "finally", "step"]
+    COMPARISON_INDICATORS: List[str] = [
+        "compared to", "versus", "outperforms", "baseline"
+    ]
+
+    # Meta-learning concepts reported as key concepts
+    META_CONCEPTS: List[str] = [
+        "meta-learning", "transfer", "few-shot", "zero-shot",
+        "attention", "transformer", "embedding", "representation",
+        "optimization", "gradient", "loss function", "architecture"
+    ]
+
+    # Domain tag keywords
+    DOMAIN_KEYWORDS: Dict[str, List[str]] = {
+        "nlp": ["language", "text", "nlp", "bert", "gpt", "translation"],
+        "computer_vision": ["image", "vision", "cnn", "convolution", "visual"],
+        "reinforcement_learning": ["reinforcement", "reward", "policy", "agent"],
+        "robotics": ["robot", "manipulation", "control", "motor"],
+        "healthcare": ["medical", "clinical", "diagnosis", "patient"],
+        "neuroscience": ["neural", "brain", "cognitive", "neuron"],
+    }
+
     def __init__(self, config: Optional[MetaLearningConfig] = None):
         """Initialize the meta-learning enhancer.
 
@@ -176,19 +308,24 @@ class MetaLearningEnhancer:
         """
         self.config = config or MetaLearningConfig()
         self.pattern_library = PatternLibrary()
-        self._compiled_patterns: Dict[str, re.Pattern] = {}
-        self._compile_patterns()
+        self._library_lock = threading.Lock()
+        self._scanner = KeywordScanner(self._scanned_keywords())
         logger.info("MetaLearningEnhancer initialized")
 
-    def _compile_patterns(self) -> None:
-        """Pre-compile regex patterns for efficiency."""
-        for algo_name, algo_info in self.ALGORITHM_PATTERNS.items():
-            pattern_str = "|".join(
-                re.escape(kw) for kw in algo_info["keywords"]
-            )
-            self._compiled_patterns[algo_name] = re.compile(
-                pattern_str, re.IGNORECASE
-            )
+    def _scanned_keywords(self) -> Set[str]:
+        """Every keyword any extractor reads from the scan."""
+        keywords: Set[str] = set(self.CONSCIOUSNESS_KEYWORDS)
+        for type_keywords in self.PAPER_TYPE_KEYWORDS.values():
+            keywords.update(type_keywords)
+        for algo_info in self.ALGORITHM_PATTERNS.values():
+            keywords.update(algo_info["keywords"])
+        for domain_keywords in self.DOMAIN_KEYWORDS.values():
+            keywords.update(domain_keywords)
+        keywords.update(self.STRUCTURE_KEYWORDS)
+        keywords.update(self.STEP_INDICATORS)
+        keywords.update(self.COMPARISON_INDICATORS)
+        keywords.update(self.META_CONCEPTS)
+        return {kw.lower() for kw in keywords}
 
     async def process_document(
         self,
@@ -209,27 +346,129 @@ class MetaLearningEnhancer:
         Returns:
             MetaLearningProcessingResult with extraction and recommendations
         """
+        result = self._analyze_document(document_id, content, title)
+        if result.success:
+            self._learn_patterns(result)
+        return result
+
+    async def process_documents(
+        self,
+        documents: Sequence[Dict[str, Any]],
+        max_workers: Optional[int] = None,
+        min_documents_for_processes: int = BATCH_PROCESS_MIN_DOCUMENTS
+    ) -> List[MetaLearningProcessingResult]:
+        """
+        Process a batch of documents, in parallel worker processes when large.
+
+        Extraction is CPU-bound, so batches of at least
+        min_documents_for_processes documents are analyzed in a process pool.
+        Workers never touch the pattern library: their results are merged
+        here, in input order, so the library ends up exactly as if the
+        documents had been processed one by one.
+
+        Args:
+            documents: Dicts with document_id, content and optional title
+                and metadata (the process_document arguments)
+            max_workers: Worker process limit. Defaults to the CPU count;
+                1 forces inline processing.
+            min_documents_for_processes: Smaller batches run inline
+
+        Returns:
+            One MetaLearningProcessingResult per document, in input order
+        """
+        docs = [
+            (doc["document_id"], doc.get("content") or "", doc.get("title"))
+            for doc in documents
+        ]
+        if not docs:
+            return []
+
+        workers = min(max_workers or os.cpu_count() or 1, len(docs))
+        results: Optional[List[MetaLearningProcessingResult]] = None
+        if workers > 1 and len(docs) >= min_documents_for_processes:
+            try:
+                results = await self._analyze_in_processes(docs, workers)
+            except (BrokenProcessPool, OSError) as e:
+                logger.warning(f"Process pool unavailable, analyzing inline: {e}")
+        if results is None:
+            results = [self._analyze_document(*doc) for doc in docs]
+
+        for result in results:
+            if result.success:
+                self._learn_patterns(result)
+        return results
+
+    async def _analyze_in_processes(
+        self,
+        docs: List[Tuple[str, str, Optional[str]]],
+        workers: int
+    ) -> List[MetaLearningProcessingResult]:
+        """Analyze documents in a process pool, preserving input order."""
+        chunk_size = math.ceil(len(docs) / (workers * BATCH_CHUNKS_PER_WORKER))
+        chunks = [
+            docs[i:i + chunk_size]
+            for i in range(0, len(docs), chunk_size)
+        ]
+        config_data = self.config.model_dump()
+        loop = asyncio.get_running_loop()
+        # Spawn, not fork: the server process has live threads and driver
+        # connections that a forked child would inherit half-copied
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        try:
+            chunk_results = await asyncio.gather(*(
+                loop.run_in_executor(pool, _analyze_batch, config_data, chunk)
+                for chunk in chunks
+            ))
+        finally:
+            # Never join workers on the loop; on cancellation drop queued chunks
+            pool.shutdown(wait=False, cancel_futures=True)
+        return [result for chunk in chunk_results for result in chunk]
+
+    def _learn_patterns(self, result: MetaLearningProcessingResult) -> None:
+        """Merge a result's patterns into the library and record the counts."""
+        patterns_learned = 0
+        patterns_reinforced = 0
+        with self._library_lock:
+            for pattern in result.extraction.patterns:
+                if pattern.pattern_id in self.pattern_library.patterns:
+                    patterns_reinforced += 1
+                else:
+                    patterns_learned += 1
+                self.pattern_library.add_pattern(pattern)
+        result.patterns_learned = patterns_learned
+        result.patterns_reinforced = patterns_reinforced
+
+    def _analyze_document(
+        self,
+        document_id: str,
+        content: str,
+        title: Optional[str] = None
+    ) -> MetaLearningProcessingResult:
+        """Run extraction and recommendations without touching the library."""
         start_time = time.time()
 
         try:
-            # 1. Classify paper type
-            paper_type, type_confidence = self._classify_paper_type(content)
+            # 1. Match every keyword in one pass
+            hits = self._scanner.scan(content)
 
-            # 2. Extract algorithms
-            algorithms = self._extract_algorithms(content)
+            # 2. Classify paper type and extract algorithms
+            paper_type, type_confidence = self._classify_paper_type(hits)
+            algorithms = self._extract_algorithms(hits)
 
             # 3. Extract patterns (if enabled)
             patterns = []
             if self.config.enable_pattern_learning:
-                patterns = self._extract_patterns(content, document_id)
+                patterns = self._extract_patterns(hits, document_id)
 
             # 4. Detect consciousness signals (if enabled)
             consciousness_signals = []
             if self.config.enable_consciousness_enhancement:
-                consciousness_signals = self._detect_consciousness_signals(content)
+                consciousness_signals = self._detect_consciousness_signals(
+                    hits, content
+                )
 
             # 5. Extract key concepts
-            key_concepts = self._extract_key_concepts(content)
+            key_concepts = self._extract_key_concepts(hits)
 
             # 6. Calculate quality metrics
             extraction_quality = self._calculate_extraction_quality(
@@ -250,7 +489,7 @@ class MetaLearningEnhancer:
                 patterns=patterns,
                 consciousness_signals=consciousness_signals,
                 key_concepts=key_concepts,
-                domain_tags=self._infer_domain_tags(content, paper_type),
+                domain_tags=self._infer_domain_tags(hits, paper_type),
                 extraction_quality=extraction_quality,
                 consciousness_enhancement_potential=consciousness_potential,
                 processing_time_ms=processing_time_ms
@@ -261,17 +500,7 @@ class MetaLearningEnhancer:
             related_basins = self._suggest_related_basins(extraction)
             suggested_thoughtseeds = self._suggest_thoughtseeds(extraction)
 
-            # 9. Learn patterns for future use
-            patterns_learned = 0
-            patterns_reinforced = 0
-            for pattern in patterns:
-                if pattern.pattern_id in self.pattern_library.patterns:
-                    patterns_reinforced += 1
-                else:
-                    patterns_learned += 1
-                self.pattern_library.add_pattern(pattern)
-
-            # 10. Suggest Graphiti entities
+            # 9. Suggest Graphiti entities (pattern learning happens in the caller)
             graphiti_entities = self._suggest_graphiti_entities(extraction)
 
             return MetaLearningProcessingResult(
@@ -280,8 +509,6 @@ class MetaLearningEnhancer:
                 enhancement_recommendations=recommendations,
                 related_basins=related_basins,
                 suggested_thoughtseeds=suggested_thoughtseeds,
-                patterns_learned=patterns_learned,
-                patterns_reinforced=patterns_reinforced,
                 graphiti_entities_suggested=graphiti_entities
             )
 
@@ -301,16 +528,15 @@ class MetaLearningEnhancer:
 
     def _classify_paper_type(
         self,
-        content: str
+        hits: KeywordHits
     ) -> Tuple[MetaLearningPaperType, float]:
         """Classify document by meta-learning paper type."""
-        content_lower = content.lower()
         scores: Dict[MetaLearningPaperType, float] = {}
 
         for paper_type, keywords in self.PAPER_TYPE_KEYWORDS.items():
             score = 0.0
             for keyword in keywords:
-                count = content_lower.count(keyword.lower())
+                count = hits.count(keyword.lower())
                 if count > 0:
                     # Diminishing returns for repeated keywords
                     score += min(count * 0.1, 0.5)
@@ -330,13 +556,12 @@ class MetaLearningEnhancer:
 
         return best_type, confidence
 
-    def _extract_algorithms(self, content: str) -> List[MetaLearningAlgorithm]:
+    def _extract_algorithms(self, hits: KeywordHits) -> List[MetaLearningAlgorithm]:
         """Extract meta-learning algorithms from content."""
         algorithms = []
 
-        for algo_name, pattern in self._compiled_patterns.items():
-            if pattern.search(content):
-                algo_info = self.ALGORITHM_PATTERNS[algo_name]
+        for algo_name, algo_info in self.ALGORITHM_PATTERNS.items():
+            if any(kw.lower() in hits for kw in algo_info["keywords"]):
                 algorithms.append(MetaLearningAlgorithm(
                     name=algo_name,
                     description=f"Detected {algo_name} algorithm",
@@ -348,15 +573,14 @@ class MetaLearningEnhancer:
 
     def _extract_patterns(
         self,
-        content: str,
+        hits: KeywordHits,
         document_id: str
     ) -> List[MetaLearningPattern]:
         """Extract learnable patterns from content."""
         patterns = []
-        content_lower = content.lower()
 
         # Pattern: Methodology sections
-        if "method" in content_lower and "result" in content_lower:
+        if all(kw in hits for kw in self.STRUCTURE_KEYWORDS):
             patterns.append(MetaLearningPattern(
                 pattern_type="structural",
                 pattern_content="Standard methodology-results structure",
@@ -367,8 +591,7 @@ class MetaLearningEnhancer:
             ))
 
         # Pattern: Multi-step reasoning
-        step_indicators = ["first", "then", "next", "finally", "step"]
-        step_count = sum(content_lower.count(ind) for ind in step_indicators)
+        step_count = sum(hits.count(ind) for ind in self.STEP_INDICATORS)
         if step_count > 5:
             patterns.append(MetaLearningPattern(
                 pattern_type="conceptual",
@@ -380,8 +603,7 @@ class MetaLearningEnhancer:
             ))
 
         # Pattern: Comparative analysis
-        comparison_indicators = ["compared to", "versus", "outperforms", "baseline"]
-        if any(ind in content_lower for ind in comparison_indicators):
+        if any(ind in hits for ind in self.COMPARISON_INDICATORS):
             patterns.append(MetaLearningPattern(
                 pattern_type="analytical",
                 pattern_content="Comparative analysis pattern",
@@ -396,16 +618,16 @@ class MetaLearningEnhancer:
 
     def _detect_consciousness_signals(
         self,
+        hits: KeywordHits,
         content: str
     ) -> List[ConsciousnessEnhancementSignal]:
         """Detect consciousness-relevant signals in content."""
         signals = []
-        content_lower = content.lower()
 
         for keyword, base_strength in self.CONSCIOUSNESS_KEYWORDS.items():
-            if keyword in content_lower:
+            if keyword in hits:
                 # Find context around keyword
-                idx = content_lower.index(keyword)
+                idx = hits.index(keyword)
                 start = max(0, idx - 50)
                 end = min(len(content), idx + len(keyword) + 50)
                 source_span = content[start:end]
@@ -452,50 +674,32 @@ class MetaLearningEnhancer:
 
         return unique_signals
 
-    def _extract_key_concepts(self, content: str) -> List[str]:
+    def _extract_key_concepts(self, hits: KeywordHits) -> List[str]:
         """Extract key concepts from content."""
         concepts = []
-        content_lower = content.lower()
 
         # Check for meta-learning concepts
-        meta_concepts = [
-            "meta-learning", "transfer", "few-shot", "zero-shot",
-            "attention", "transformer", "embedding", "representation",
-            "optimization", "gradient", "loss function", "architecture"
-        ]
-
-        for concept in meta_concepts:
-            if concept in content_lower:
+        for concept in self.META_CONCEPTS:
+            if concept in hits:
                 concepts.append(concept)
 
         # Check for consciousness concepts
         for keyword in self.CONSCIOUSNESS_KEYWORDS:
-            if keyword in content_lower and keyword not in concepts:
+            if keyword in hits and keyword not in concepts:
                 concepts.append(keyword)
 
         return concepts[:20]  # Limit to top 20
 
     def _infer_domain_tags(
         self,
-        content: str,
+        hits: KeywordHits,
         paper_type: MetaLearningPaperType
     ) -> List[str]:
         """Infer domain tags from content and paper type."""
         tags = [paper_type.value]
 
-        content_lower = content.lower()
-
-        domain_keywords = {
-            "nlp": ["language", "text", "nlp", "bert", "gpt", "translation"],
-            "computer_vision": ["image", "vision", "cnn", "convolution", "visual"],
-            "reinforcement_learning": ["reinforcement", "reward", "policy", "agent"],
-            "robotics": ["robot", "manipulation", "control", "motor"],
-            "healthcare": ["medical", "clinical", "diagnosis", "patient"],
-            "neuroscience": ["neural", "brain", "cognitive", "neuron"],
-        }
-
-        for domain, keywords in domain_keywords.items():
-            if any(kw in content_lower for kw in keywords):
+        for domain, keywords in self.DOMAIN_KEYWORDS.items():
+            if any(kw in hits for kw in keywords):
                 tags.append(domain)
 
         return tags
@@ -697,6 +901,23 @@ class MetaLearningEnhancer:
         return [p for p, _ in scored[:limit]]
 
 
+# Per-process enhancers used by process_documents() workers, keyed by config
+_worker_enhancers: Dict[str, MetaLearningEnhancer] = {}
+
+
+def _analyze_batch(
+    config_data: Dict[str, Any],
+    docs: List[Tuple[str, str, Optional[str]]]
+) -> List[MetaLearningProcessingResult]:
+    """Process-pool entry point: analyze a chunk of documents."""
+    config = MetaLearningConfig(**config_data)
+    key = config.model_dump_json()
+    enhancer = _worker_enhancers.get(key)
+    if enhancer is None:
+        enhancer = _worker_enhancers[key] = MetaLearningEnhancer(config)
+    return [enhancer._analyze_document(*doc) for doc in docs]
+
+
 # Singleton instance
 _enhancer_instance: Optional[MetaLearningEnhancer] = None
 
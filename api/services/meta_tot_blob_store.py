@@ -0,0 +1,333 @@
+"""
+Meta-ToT Trace Blob Store
+Feature: 041-meta-tot-engine
+
+Full Meta-ToT trace payloads live in a local content-addressed store instead
+of a JSON property on the graph node. Layout under META_TOT_BLOB_DIR
+(default data/meta_tot_blobs):
+
+    objects/ab/cdef...   zlib-compressed canonical JSON, named by the
+                         sha256 of the uncompressed bytes
+    refs.journal         append-only JSON lines: {"op": "put", "ref": ...}
+                         or {"op": "drop", "trace_id": ...}; replayed on
+                         startup and rewritten once it carries more than
+                         REFS_JOURNAL_COMPACT_SLACK dead records
+
+A trace is split into one manifest blob (header fields, root nodes, node order
+and a branch_id -> hash map) and one blob per branch, where a branch is the
+subtree under a child of a root node. Identical branches are stored once, and
+a single branch can be loaded without decompressing the rest of the tree.
+
+Retention: gc() drops refs older than retention_days or beyond max_traces
+(oldest first), then deletes objects no remaining manifest references. It
+returns the expired trace ids so callers can clear graph pointers to them.
+A refs.json written by earlier versions is imported into the journal once.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import zlib
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger("dionysus.meta_tot_blob_store")
+
+REFS_JOURNAL_FILE = "refs.journal"
+LEGACY_REFS_FILE = "refs.json"
+OBJECTS_DIR = "objects"
+
+# Rewrite the journal once it holds this many more records than live refs
+REFS_JOURNAL_COMPACT_SLACK = 1024
+
+# Header fields copied into the manifest (everything except the node list)
+MANIFEST_FIELDS = (
+    "trace_id", "session_id", "created_at", "decision",
+    "best_path", "selected_action", "confidence", "metrics",
+)
+
+
+def _canonical(obj: Any) -> bytes:
+    return json.dumps(obj, sort_keys=True, separators=(",", ":"), default=str).encode()
+
+
+def _split_branches(nodes: list[dict[str, Any]]) -> tuple[list[dict], dict[str, list[dict]]]:
+    """Split a node list into root nodes and subtrees keyed by branch root id."""
+    by_id = {n["node_id"]: n for n in nodes}
+    roots = [n for n in nodes if n.get("parent_id") not in by_id]
+    root_ids = {n["node_id"] for n in roots}
+
+    branch_of: dict[str, str] = {}
+
+    def _branch(node_id: str) -> Optional[str]:
+        # Walk up to the child-of-root ancestor, memoizing along the way
+        path = []
+        current = node_id
+        while current not in branch_of:
+            parent = by_id[current].get("parent_id")
+            if parent in root_ids:
+                branch_of[current] = current
+                break
+            if parent not in by_id or current in path:
+                return None
+            path.append(current)
+            current = parent
+        for visited in path:
+            branch_of[visited] = branch_of[current]
+        return branch_of[current]
+
+    branches: dict[str, list[dict]] = {}
+    for node in nodes:
+        if node["node_id"] in root_ids:
+            continue
+        branch_id = _branch(node["node_id"])
+        if branch_id is None:
+            # Cycle guard: keep unreachable nodes with the roots
+            roots.append(node)
+            continue
+        branches.setdefault(branch_id, []).append(node)
+    return roots, branches
+
+
+class MetaToTBlobStore:
+    """Compressed, content-addressed storage for Meta-ToT trace payloads."""
+
+    def __init__(
+        self,
+        directory: str | Path,
+        retention_days: float = 30.0,
+        max_traces: int = 5000,
+        compression_level: int = 6,
+    ):
+        self.directory = Path(directory)
+        self.objects_dir = self.directory / OBJECTS_DIR
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self.retention_days = retention_days
+        self.max_traces = max_traces
+        self.compression_level = compression_level
+        self._lock = threading.Lock()
+        self._journal_path = self.directory / REFS_JOURNAL_FILE
+        self._journal_records = 0
+        self._refs: dict[str, dict[str, Any]] = {}
+        self._load_refs()
+
+    @classmethod
+    def from_env(cls) -> "MetaToTBlobStore":
+        return cls(
+            directory=os.getenv("META_TOT_BLOB_DIR", "data/meta_tot_blobs"),
+            retention_days=float(os.getenv("META_TOT_TRACE_RETENTION_DAYS", "30")),
+            max_traces=int(os.getenv("META_TOT_TRACE_MAX_TRACES", "5000")),
+        )
+
+    # -------------------------------------------------------------------------
+    # Objects
+    # -------------------------------------------------------------------------
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / digest[2:]
+
+    def put_object(self, obj: Any) -> tuple[str, int]:
+        """Store an object, returning (hash, compressed size). Existing content is reused."""
+        raw = _canonical(obj)
+        digest = hashlib.sha256(raw).hexdigest()
+        path = self._object_path(digest)
+        if path.exists():
+            return digest, path.stat().st_size
+        data = zlib.compress(raw, self.compression_level)
+        path.parent.mkdir(exist_ok=True)
+        tmp = path.with_name(f"{path.name}.tmp")
+        tmp.write_bytes(data)
+        tmp.replace(path)
+        return digest, len(data)
+
+    def get_object(self, digest: str) -> Optional[Any]:
+        try:
+            return json.loads(zlib.decompress(self._object_path(digest).read_bytes()))
+        except FileNotFoundError:
+            return None
+        except (OSError, zlib.error, ValueError) as e:
+            logger.error(f"Corrupt Meta-ToT blob {digest}: {e}")
+            return None
+
+    # -------------------------------------------------------------------------
+    # Traces
+    # -------------------------------------------------------------------------
+
+    def put_trace(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """
+        Store a trace payload (MetaToTTracePayload.model_dump()).
+
+        Returns the ref: manifest hash, stored size, node/branch counts and
+        listing fields.
+        """
+        nodes = payload.get("nodes") or []
+        roots, branches = _split_branches(nodes)
+
+        branch_hashes: dict[str, str] = {}
+        stored_bytes = 0
+        for branch_id, branch_nodes in branches.items():
+            branch_hashes[branch_id], size = self.put_object(branch_nodes)
+            stored_bytes += size
+
+        manifest = {field: payload.get(field) for field in MANIFEST_FIELDS}
+        manifest["roots"] = roots
+        manifest["branches"] = branch_hashes
+        manifest["node_order"] = [n["node_id"] for n in nodes]
+        manifest_hash, size = self.put_object(manifest)
+        stored_bytes += size
+
+        ref = {
+            "trace_id": payload["trace_id"],
+            "session_id": payload.get("session_id"),
+            "created_at": payload.get("created_at"),
+            "confidence": payload.get("confidence"),
+            "selected_action": payload.get("selected_action"),
+            "hash": manifest_hash,
+            "stored_bytes": stored_bytes,
+            "node_count": len(nodes),
+            "branch_count": len(branch_hashes),
+        }
+        with self._lock:
+            self._refs[ref["trace_id"]] = ref
+            self._append_journal_locked({"op": "put", "ref": ref})
+        return ref
+
+    def get_ref(self, trace_id: str) -> Optional[dict[str, Any]]:
+        ref = self._refs.get(trace_id)
+        return dict(ref) if ref else None
+
+    def get_manifest(self, trace_id: str) -> Optional[dict[str, Any]]:
+        """Manifest for a trace: header, root nodes and branch map."""
+        ref = self._refs.get(trace_id)
+        if ref is None:
+            return None
+        return self.get_object(ref["hash"])
+
+    def get_branch(self, manifest: dict[str, Any], branch_id: str) -> Optional[list[dict[str, Any]]]:
+        """Nodes of one branch (subtree under a child of a root node)."""
+        digest = manifest.get("branches", {}).get(branch_id)
+        if digest is None:
+            return None
+        return self.get_object(digest)
+
+    def assemble(self, manifest: dict[str, Any]) -> Optional[dict[str, Any]]:
+        """Rebuild the full payload from a manifest, loading every branch."""
+        nodes = list(manifest.get("roots", []))
+        for branch_id in manifest.get("branches", {}):
+            branch = self.get_branch(manifest, branch_id)
+            if branch is None:
+                logger.error(f"Missing branch {branch_id} for Meta-ToT trace {manifest.get('trace_id')}")
+                return None
+            nodes.extend(branch)
+        order = {node_id: i for i, node_id in enumerate(manifest.get("node_order", []))}
+        nodes.sort(key=lambda n: order.get(n["node_id"], len(order)))
+
+        payload = {field: manifest.get(field) for field in MANIFEST_FIELDS}
+        payload["nodes"] = nodes
+        return payload
+
+    def list_traces(self, session_id: Optional[str] = None, limit: int = 50) -> list[dict[str, Any]]:
+        """Refs newest first."""
+        with self._lock:
+            refs = [r for r in self._refs.values() if session_id is None or r.get("session_id") == session_id]
+        refs.sort(key=lambda r: r.get("created_at") or "", reverse=True)
+        return [dict(r) for r in refs[:limit]]
+
+    # -------------------------------------------------------------------------
+    # Retention
+    # -------------------------------------------------------------------------
+
+    def gc(self, now: Optional[datetime] = None) -> dict[str, Any]:
+        """Expire refs by age and count, then sweep unreferenced objects."""
+        now = now or datetime.utcnow()
+        cutoff = (now - timedelta(days=self.retention_days)).isoformat()
+        with self._lock:
+            newest_first = sorted(self._refs.values(), key=lambda r: r.get("created_at") or "", reverse=True)
+            keep = [r for r in newest_first[: self.max_traces] if (r.get("created_at") or "") >= cutoff]
+            kept_ids = {r["trace_id"] for r in keep}
+            expired_ids = sorted(tid for tid in self._refs if tid not in kept_ids)
+            self._refs = {r["trace_id"]: r for r in keep}
+            if expired_ids:
+                self._append_journal_locked(*({"op": "drop", "trace_id": tid} for tid in expired_ids))
+
+            live: set[str] = set()
+            for ref in keep:
+                live.add(ref["hash"])
+                manifest = self.get_object(ref["hash"])
+                if manifest:
+                    live.update(manifest.get("branches", {}).values())
+
+            deleted = 0
+            for path in self.objects_dir.glob("*/*"):
+                digest = path.parent.name + path.name
+                if path.name.endswith(".tmp") or digest not in live:
+                    path.unlink(missing_ok=True)
+                    deleted += 1
+
+        expired = len(expired_ids)
+        if expired or deleted:
+            logger.info(f"meta_tot_blob_gc: expired {expired} traces, deleted {deleted} objects")
+        return {
+            "expired_traces": expired,
+            "deleted_objects": deleted,
+            "traces": len(keep),
+            "expired_trace_ids": expired_ids,
+        }
+
+    # -------------------------------------------------------------------------
+    # Refs journal
+    # -------------------------------------------------------------------------
+
+    def _load_refs(self) -> None:
+        """Replay the refs journal, importing a legacy refs.json first."""
+        legacy = self.directory / LEGACY_REFS_FILE
+        if legacy.exists() and not self._journal_path.exists():
+            try:
+                self._refs = json.loads(legacy.read_text())
+                self._compact_journal_locked()
+                legacy.rename(legacy.with_suffix(".json.imported"))
+            except (OSError, ValueError) as e:
+                logger.error(f"Unreadable Meta-ToT refs file, starting empty: {e}")
+                self._refs = {}
+            return
+
+        if not self._journal_path.exists():
+            return
+        with open(self._journal_path, "rb") as f:
+            for line_no, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                    if entry["op"] == "put":
+                        self._refs[entry["ref"]["trace_id"]] = entry["ref"]
+                    elif entry["op"] == "drop":
+                        self._refs.pop(entry["trace_id"], None)
+                    else:
+                        raise ValueError(f"unknown op {entry['op']}")
+                    self._journal_records += 1
+                except (ValueError, KeyError, TypeError) as e:
+                    # A torn final write is expected after a crash
+                    logger.error(f"Skipping Meta-ToT refs journal line {line_no}: {e}")
+
+    def _append_journal_locked(self, *entries: dict[str, Any]) -> None:
+        with open(self._journal_path, "ab") as f:
+            for entry in entries:
+                f.write(json.dumps(entry, separators=(",", ":"), default=str).encode() + b"\n")
+        self._journal_records += len(entries)
+        if self._journal_records > len(self._refs) + REFS_JOURNAL_COMPACT_SLACK:
+            self._compact_journal_locked()
+
+    def _compact_journal_locked(self) -> None:
+        """Rewrite the journal as one put record per live ref."""
+        tmp = self._journal_path.with_name(f"{REFS_JOURNAL_FILE}.tmp")
+        with open(tmp, "wb") as f:
+            for ref in self._refs.values():
+                f.write(json.dumps({"op": "put", "ref": ref}, separators=(",", ":"), default=str).encode() + b"\n")
+        tmp.replace(self._journal_path)
+        self._journal_records = len(self._refs)
@@ -1,64 +1,185 @@
 """
 Meta-ToT Trace Persistence Service (Graphiti-backed)
 Feature: 041-meta-tot-engine
+
+Full trace payloads are kept in the local MetaToTBlobStore; the graph node
+holds only a summary and the manifest hash. Traces written before the blob
+store (JSON `payload` property) are still readable. When blob retention
+expires a trace, its node keeps the summary but loses blob_hash and gains
+blob_expired_at, so nothing points at deleted blobs. Blob store I/O
+(compression, object files, the refs journal, retention sweeps) runs in
+worker threads via asyncio.to_thread.
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
-from typing import Optional
+from datetime import datetime
+from typing import Any, Dict, List, Optional
 
-from api.models.meta_tot import MetaToTTracePayload
+from api.models.meta_tot import MetaToTNodeTrace, MetaToTTracePayload
 from api.services.graphiti_service import get_graphiti_service, GraphitiService
+from api.services.meta_tot_blob_store import MetaToTBlobStore
 
 logger = logging.getLogger("dionysus.meta_tot_trace")
 
+# Run blob retention every N stored traces
+DEFAULT_GC_EVERY = 100
+
+_TOMBSTONE_EXPIRED_CYPHER = """
+UNWIND $ids AS trace_id
+MATCH (t:MetaToTTrace {id: trace_id})
+SET t.blob_hash = null,
+    t.blob_expired_at = $expired_at
+"""
+
 
 class MetaToTTraceService:
-    def __init__(self, graphiti_service: Optional[GraphitiService] = None):
+    def __init__(
+        self,
+        graphiti_service: Optional[GraphitiService] = None,
+        blob_store: Optional[MetaToTBlobStore] = None,
+        gc_every: int = DEFAULT_GC_EVERY,
+    ):
         self._graphiti_service = graphiti_service
+        self._blob_store = blob_store
+        self._gc_every = gc_every
+        self._stored_since_gc = 0
+        # Retention sweeps every object not yet referenced; it must not run
+        # while a put is between writing a trace's objects and recording its ref
+        self._put_lock = asyncio.Lock()
 
     async def _get_graphiti(self) -> GraphitiService:
         if self._graphiti_service is None:
             self._graphiti_service = await get_graphiti_service()
         return self._graphiti_service
 
+    def _get_blob_store(self) -> MetaToTBlobStore:
+        if self._blob_store is None:
+            self._blob_store = MetaToTBlobStore.from_env()
+        return self._blob_store
+
     async def store_trace(self, payload: MetaToTTracePayload) -> str:
         trace_id = payload.trace_id
+        store = self._get_blob_store()
+        async with self._put_lock:
+            ref = await asyncio.to_thread(store.put_trace, payload.model_dump())
+
         cypher = """
         MERGE (t:MetaToTTrace {id: $id})
         SET t.session_id = $session_id,
             t.created_at = $created_at,
-            t.payload = $payload
+            t.confidence = $confidence,
+            t.selected_action = $selected_action,
+            t.best_path = $best_path,
+            t.node_count = $node_count,
+            t.branch_count = $branch_count,
+            t.blob_hash = $blob_hash,
+            t.stored_bytes = $stored_bytes,
+            t.payload = null
         RETURN t.id as id
         """
         params = {
             "id": trace_id,
             "session_id": payload.session_id,
             "created_at": payload.created_at,
-            "payload": json.dumps(payload.model_dump()),
+            "confidence": payload.confidence,
+            "selected_action": payload.selected_action,
+            "best_path": payload.best_path,
+            "node_count": ref["node_count"],
+            "branch_count": ref["branch_count"],
+            "blob_hash": ref["hash"],
+            "stored_bytes": ref["stored_bytes"],
         }
         graphiti = await self._get_graphiti()
         await graphiti.execute_cypher(cypher, params)
-        logger.info(f"meta_tot_trace_stored: {trace_id}")
+        logger.info(f"meta_tot_trace_stored: {trace_id} ({ref['stored_bytes']} bytes)")
+
+        self._stored_since_gc += 1
+        if self._stored_since_gc >= self._gc_every:
+            self._stored_since_gc = 0
+            try:
+                await self.gc()
+            except Exception as e:
+                logger.error(f"meta_tot_blob_gc_failed: {e}")
         return trace_id
 
-    async def get_trace(self, trace_id: str) -> Optional[MetaToTTracePayload]:
+    async def _get_manifest(self, trace_id: str) -> Optional[Dict[str, Any]]:
+        """Manifest from the local refs, else via the graph pointer (or a legacy payload)."""
+        store = self._get_blob_store()
+        manifest = await asyncio.to_thread(store.get_manifest, trace_id)
+        if manifest is not None:
+            return manifest
+
         cypher = """
         MATCH (t:MetaToTTrace {id: $id})
-        RETURN t.payload as payload
+        RETURN t.blob_hash as blob_hash, t.payload as payload
         """
         graphiti = await self._get_graphiti()
         rows = await graphiti.execute_cypher(cypher, {"id": trace_id})
         if not rows:
             return None
-        payload_raw = rows[0].get("payload")
+        row = rows[0]
+        if row.get("blob_hash"):
+            return await asyncio.to_thread(store.get_object, row["blob_hash"])
+        payload_raw = row.get("payload")
         if not payload_raw:
             return None
-        payload = json.loads(payload_raw)
+        legacy = json.loads(payload_raw)
+        legacy["roots"], legacy["branches"] = legacy.pop("nodes", []), {}
+        return legacy
+
+    async def get_trace(
+        self, trace_id: str, include_branches: bool = True
+    ) -> Optional[MetaToTTracePayload]:
+        """
+        Load a trace. With include_branches=False only the root nodes are
+        returned; use get_branch() with a root's children_ids to expand.
+        """
+        manifest = await self._get_manifest(trace_id)
+        if manifest is None:
+            return None
+        store = self._get_blob_store()
+        if include_branches:
+            payload = await asyncio.to_thread(store.assemble, manifest)
+            if payload is None:
+                return None
+        else:
+            payload = {k: v for k, v in manifest.items() if k not in ("roots", "branches", "node_order")}
+            payload["nodes"] = manifest.get("roots", [])
         return MetaToTTracePayload(**payload)
 
+    async def get_branch(self, trace_id: str, branch_id: str) -> Optional[List[MetaToTNodeTrace]]:
+        """Nodes of the subtree under `branch_id` (a child of a root node)."""
+        manifest = await self._get_manifest(trace_id)
+        if manifest is None:
+            return None
+        nodes = await asyncio.to_thread(self._get_blob_store().get_branch, manifest, branch_id)
+        if nodes is None:
+            return None
+        return [MetaToTNodeTrace(**node) for node in nodes]
+
+    async def list_traces(
+        self, session_id: Optional[str] = None, limit: int = 50
+    ) -> List[Dict[str, Any]]:
+        """Summaries of locally stored traces, newest first."""
+        return self._get_blob_store().list_traces(session_id=session_id, limit=limit)
+
+    async def gc(self) -> Dict[str, Any]:
+        """Apply blob retention now and clear graph pointers to the expired blobs."""
+        async with self._put_lock:
+            result = await asyncio.to_thread(self._get_blob_store().gc)
+        expired_ids = result["expired_trace_ids"]
+        if expired_ids:
+            graphiti = await self._get_graphiti()
+            await graphiti.execute_cypher(
+                _TOMBSTONE_EXPIRED_CYPHER,
+                {"ids": expired_ids, "expired_at": datetime.utcnow().isoformat()},
+            )
+        return result
+
 
 _meta_tot_trace_service: Optional[MetaToTTraceService] = None
 
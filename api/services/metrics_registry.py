@@ -0,0 +1,528 @@
+"""
+In-process Metrics Registry
+
+Counters, gauges and bucketed histograms with optional labels, kept in process
+memory and rendered in the Prometheus text exposition format. Besides lifetime
+totals, every counter and histogram series keeps a rolling window: a ring of
+fixed-width time slots, so rates and windowed percentiles cost one pass over
+the ring and recording stays O(1).
+
+Gauges that mirror other services' state are refreshed by collectors, which
+run before exposition and alert evaluation. AlertRule declares a threshold on
+a metric's current value, rate, windowed increase or windowed quantile;
+evaluate_alert_rules turns the rules that hold into alert dictionaries.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import os
+import threading
+import time
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Iterable, Optional
+
+DEFAULT_WINDOW_SECONDS = float(os.getenv("METRICS_WINDOW_SECONDS", "300"))
+DEFAULT_SLOT_SECONDS = float(os.getenv("METRICS_SLOT_SECONDS", "10"))
+
+# Upper bounds in milliseconds; the final bucket is +Inf.
+DEFAULT_LATENCY_BUCKETS_MS: tuple[float, ...] = (
+    5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000,
+)
+
+logger = logging.getLogger(__name__)
+
+_OPERATORS: dict[str, Callable[[float, float], bool]] = {
+    ">": lambda a, b: a > b,
+    ">=": lambda a, b: a >= b,
+    "<": lambda a, b: a < b,
+    "<=": lambda a, b: a <= b,
+    "==": lambda a, b: a == b,
+    "!=": lambda a, b: a != b,
+}
+
+
+class RollingWindow:
+    """Ring of fixed-width time slots; each slot holds `width` running sums."""
+
+    def __init__(self, width: int, window_seconds: float, slot_seconds: float):
+        self.width = width
+        self.slot_seconds = slot_seconds
+        self.n_slots = max(1, math.ceil(window_seconds / slot_seconds))
+        self._epochs = [-1] * self.n_slots
+        self._slots = [[0.0] * width for _ in range(self.n_slots)]
+
+    def add(self, now: float, index: int, amount: float) -> None:
+        epoch = int(now // self.slot_seconds)
+        i = epoch % self.n_slots
+        if self._epochs[i] != epoch:
+            self._epochs[i] = epoch
+            self._slots[i] = [0.0] * self.width
+        self._slots[i][index] += amount
+
+    def totals(self, now: float, seconds: Optional[float] = None) -> list[float]:
+        """Sum each column over the slots that fall inside the last `seconds`."""
+        span = self.n_slots if seconds is None else max(1, min(self.n_slots, math.ceil(seconds / self.slot_seconds)))
+        oldest = int(now // self.slot_seconds) - span + 1
+        out = [0.0] * self.width
+        for epoch, slot in zip(self._epochs, self._slots):
+            if epoch >= oldest:
+                for j, v in enumerate(slot):
+                    out[j] += v
+        return out
+
+
+class _Series:
+    def __init__(self, metric: "_Metric"):
+        self._metric = metric
+        self._lock = metric._lock
+
+
+class CounterSeries(_Series):
+    def __init__(self, metric: "Counter"):
+        super().__init__(metric)
+        self.value = 0.0
+        self._window = RollingWindow(1, metric.window_seconds, metric.slot_seconds)
+
+    def inc(self, amount: float = 1.0) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        with self._lock:
+            self.value += amount
+            self._window.add(self._metric.clock(), 0, amount)
+
+    def increase(self, seconds: Optional[float] = None) -> float:
+        with self._lock:
+            return self._window.totals(self._metric.clock(), seconds)[0]
+
+    def rate(self, seconds: Optional[float] = None) -> float:
+        """Average per-second increase over the window."""
+        seconds = seconds or self._metric.window_seconds
+        return self.increase(seconds) / seconds
+
+
+class GaugeSeries(_Series):
+    def __init__(self, metric: "Gauge"):
+        super().__init__(metric)
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        self.value = float(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value -= amount
+
+
+class HistogramSeries(_Series):
+    def __init__(self, metric: "Histogram"):
+        super().__init__(metric)
+        n = len(metric.buckets) + 1
+        self.counts = [0] * n
+        self.sum = 0.0
+        self.count = 0
+        self.max = 0.0
+        # Columns: one per bucket, then sum.
+        self._window = RollingWindow(n + 1, metric.window_seconds, metric.slot_seconds)
+
+    def observe(self, value: float) -> None:
+        i = bisect_left(self._metric.buckets, value)
+        with self._lock:
+            self.counts[i] += 1
+            self.count += 1
+            self.sum += value
+            if value > self.max:
+                self.max = value
+            now = self._metric.clock()
+            self._window.add(now, i, 1)
+            self._window.add(now, len(self.counts), value)
+
+    def observe_many(self, values: Iterable[float]) -> None:
+        """Observe a batch of values: one lock acquisition, one window update per bucket."""
+        buckets = self._metric.buckets
+        batch_counts: dict[int, int] = {}
+        batch_sum = 0.0
+        batch_max = 0.0
+        n = 0
+        for value in values:
+            i = bisect_left(buckets, value)
+            batch_counts[i] = batch_counts.get(i, 0) + 1
+            batch_sum += value
+            if value > batch_max:
+                batch_max = value
+            n += 1
+        if not n:
+            return
+        with self._lock:
+            now = self._metric.clock()
+            for i, c in batch_counts.items():
+                self.counts[i] += c
+                self._window.add(now, i, c)
+            self.count += n
+            self.sum += batch_sum
+            if batch_max > self.max:
+                self.max = batch_max
+            self._window.add(now, len(self.counts), batch_sum)
+
+    def window_counts(self, seconds: Optional[float] = None) -> list[float]:
+        """Bucket counts over the window, followed by the windowed sum."""
+        with self._lock:
+            return self._window.totals(self._metric.clock(), seconds)
+
+    def quantile(self, q: float, seconds: Optional[float] = None) -> float:
+        """Upper bucket bound containing the q-quantile of the window."""
+        return _bucket_quantile(self._metric.buckets, self.window_counts(seconds)[:-1], q, self.max)
+
+
+def _bucket_quantile(bounds: tuple[float, ...], counts: list[float], q: float, max_value: float) -> float:
+    total = sum(counts)
+    if not total:
+        return 0.0
+    target = q * total
+    seen = 0.0
+    for i, n in enumerate(counts):
+        seen += n
+        if seen >= target:
+            return bounds[i] if i < len(bounds) else max_value
+    return max_value
+
+
+class _Metric:
+    kind = ""
+    series_cls: type = _Series
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Iterable[str] = (),
+        window_seconds: float = DEFAULT_WINDOW_SECONDS,
+        slot_seconds: float = DEFAULT_SLOT_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self.window_seconds = window_seconds
+        self.slot_seconds = slot_seconds
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._series: dict[tuple[str, ...], Any] = {}
+
+    def labels(self, **labels: Any):
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        key = tuple(str(labels[n]) for n in self.labelnames)
+        series = self._series.get(key)
+        if series is None:
+            with self._lock:
+                series = self._series.get(key)
+                if series is None:
+                    series = self._series[key] = self.series_cls(self)
+        return series
+
+    def _unlabelled(self):
+        if self.labelnames:
+            raise ValueError(f"{self.name} requires labels {self.labelnames}")
+        return self.labels()
+
+    def series(self, match: Optional[dict[str, str]] = None) -> list[tuple[dict[str, str], Any]]:
+        """(labels, series) pairs whose labels include every `match` item."""
+        with self._lock:
+            items = list(self._series.items())
+        out = []
+        for key, s in items:
+            labels = dict(zip(self.labelnames, key))
+            if match and any(labels.get(k) != str(v) for k, v in match.items()):
+                continue
+            out.append((labels, s))
+        return out
+
+    def clear(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+
+class Counter(_Metric):
+    kind = "counter"
+    series_cls = CounterSeries
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._unlabelled().inc(amount)
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+    series_cls = GaugeSeries
+
+    def set(self, value: float) -> None:
+        self._unlabelled().set(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._unlabelled().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._unlabelled().dec(amount)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+    series_cls = HistogramSeries
+
+    def __init__(self, *args: Any, buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS_MS, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float) -> None:
+        self._unlabelled().observe(value)
+
+
+class MetricsRegistry:
+    """Named metrics plus the collectors that refresh mirrored gauges."""
+
+    def __init__(
+        self,
+        window_seconds: float = DEFAULT_WINDOW_SECONDS,
+        slot_seconds: float = DEFAULT_SLOT_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.window_seconds = window_seconds
+        self.slot_seconds = slot_seconds
+        self.clock = clock
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: dict[str, Callable[[], None]] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls: type, name: str, help_text: str, labelnames: Iterable[str], **kwargs: Any):
+        metric = self._metrics.get(name)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.get(name)
+                if metric is None:
+                    metric = self._metrics[name] = cls(
+                        name,
+                        help_text,
+                        labelnames,
+                        window_seconds=self.window_seconds,
+                        slot_seconds=self.slot_seconds,
+                        clock=self.clock,
+                        **kwargs,
+                    )
+        if not isinstance(metric, cls) or metric.labelnames != tuple(labelnames):
+            raise ValueError(f"Metric {name} already registered as {metric.kind}{metric.labelnames}")
+        return metric
+
+    def counter(self, name: str, help_text: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, help_text, labelnames)
+
+    def gauge(self, name: str, help_text: str, labelnames: Iterable[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, help_text, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS_MS,
+    ) -> Histogram:
+        return self._get_or_create(Histogram, name, help_text, labelnames, buckets=buckets)
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def metrics(self) -> list[_Metric]:
+        with self._lock:
+            return sorted(self._metrics.values(), key=lambda m: m.name)
+
+    def register_collector(self, name: str, collector: Callable[[], None]) -> None:
+        """Register (or replace) a callback that refreshes gauges before reads."""
+        self._collectors[name] = collector
+
+    def collect(self) -> None:
+        for name, collector in list(self._collectors.items()):
+            try:
+                collector()
+            except Exception as exc:  # a broken collector must not hide the rest
+                logger.warning(f"Metrics collector {name} failed: {exc}")
+
+    def snapshot(self) -> dict[str, Any]:
+        """JSON-friendly view: lifetime totals plus rolling-window rates and percentiles."""
+        self.collect()
+        out: dict[str, Any] = {"window_seconds": self.window_seconds, "metrics": {}}
+        for metric in self.metrics():
+            series = []
+            for labels, s in metric.series():
+                entry: dict[str, Any] = {"labels": labels}
+                if metric.kind == "counter":
+                    entry["value"] = s.value
+                    entry["rate_per_second"] = round(s.rate(), 6)
+                elif metric.kind == "gauge":
+                    entry["value"] = s.value
+                else:
+                    window = s.window_counts()
+                    window_count = sum(window[:-1])
+                    entry.update({
+                        "count": s.count,
+                        "window_count": int(window_count),
+                        "window_mean": round(window[-1] / window_count, 3) if window_count else 0.0,
+                        "p50": s.quantile(0.5),
+                        "p95": s.quantile(0.95),
+                        "p99": s.quantile(0.99),
+                        "max": round(s.max, 3),
+                    })
+                series.append(entry)
+            out["metrics"][metric.name] = {"type": metric.kind, "help": metric.help, "series": series}
+        return out
+
+    def prometheus_text(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        self.collect()
+        lines: list[str] = []
+        for metric in self.metrics():
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for labels, s in metric.series():
+                if metric.kind == "histogram":
+                    cumulative = 0
+                    for bound, n in zip(list(metric.buckets) + ["+Inf"], s.counts):
+                        cumulative += n
+                        lines.append(f"{metric.name}_bucket{_format_labels(labels, le=bound)} {cumulative}")
+                    lines.append(f"{metric.name}_sum{_format_labels(labels)} {s.sum:.3f}")
+                    lines.append(f"{metric.name}_count{_format_labels(labels)} {s.count}")
+                else:
+                    lines.append(f"{metric.name}{_format_labels(labels)} {s.value:g}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Drop every recorded series; metric definitions and collectors stay."""
+        for metric in self.metrics():
+            metric.clear()
+
+
+def _format_labels(labels: dict[str, str], **extra: Any) -> str:
+    items = list(labels.items()) + [(k, str(v)) for k, v in extra.items()]
+    if not items:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape_label(v)}"' for k, v in items) + "}"
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+@dataclass
+class AlertRule:
+    """
+    Declarative alert condition on one registry metric.
+
+    condition is one of:
+    - "value": sum of the current values of the matching series
+    - "increase": sum of counter increases (or histogram observations) in the window
+    - "rate": increase divided by the window, per second
+    - "quantile": `quantile` of the merged histogram window
+    The rule fires when `<condition> <op> threshold` holds. With affected_label
+    set, the alert lists that label's value for every contributing series.
+    """
+    id: str
+    metric: str
+    threshold: float
+    condition: str = "value"
+    op: str = ">"
+    labels: dict[str, str] = field(default_factory=dict)
+    window_seconds: Optional[float] = None
+    quantile: float = 0.95
+    severity: str = "warning"
+    message: str = "{metric} {condition} is {value:g}"
+    affected_label: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        if self.op not in _OPERATORS:
+            raise ValueError(f"Unsupported alert operator: {self.op}")
+        if self.condition not in ("value", "increase", "rate", "quantile"):
+            raise ValueError(f"Unsupported alert condition: {self.condition}")
+
+    def evaluate(self, registry: MetricsRegistry) -> Optional[dict[str, Any]]:
+        metric = registry.get(self.metric)
+        if metric is None:
+            return None
+        window = self.window_seconds or registry.window_seconds
+        matched = metric.series(self.labels)
+
+        per_series: list[tuple[dict[str, str], float]] = []
+        if self.condition == "quantile":
+            if metric.kind != "histogram":
+                raise ValueError(f"quantile rule {self.id} needs a histogram, {self.metric} is a {metric.kind}")
+            merged = [0.0] * (len(metric.buckets) + 1)
+            max_value = 0.0
+            for labels, s in matched:
+                counts = s.window_counts(window)[:-1]
+                merged = [a + b for a, b in zip(merged, counts)]
+                max_value = max(max_value, s.max)
+                per_series.append((labels, sum(counts)))
+            value = _bucket_quantile(metric.buckets, merged, self.quantile, max_value)
+        else:
+            for labels, s in matched:
+                per_series.append((labels, self._series_value(metric, s, window)))
+            value = sum(v for _, v in per_series)
+            if self.condition == "rate":
+                value /= window
+
+        if not _OPERATORS[self.op](value, self.threshold):
+            return None
+        alert: dict[str, Any] = {
+            "id": self.id,
+            "severity": self.severity,
+            "message": self.message.format(
+                metric=self.metric, condition=self.condition, value=value, threshold=self.threshold
+            ),
+            "value": value,
+            "threshold": self.threshold,
+            "timestamp": datetime.utcnow().isoformat(),
+        }
+        if self.affected_label:
+            alert["affected"] = sorted(
+                labels[self.affected_label]
+                for labels, v in per_series
+                if v and self.affected_label in labels
+            )
+        return alert
+
+    def _series_value(self, metric: _Metric, s: Any, window: float) -> float:
+        if self.condition == "value":
+            if metric.kind == "histogram":
+                return float(s.count)
+            return s.value
+        if metric.kind == "counter":
+            return s.increase(window)
+        if metric.kind == "histogram":
+            return sum(s.window_counts(window)[:-1])
+        raise ValueError(f"{self.condition} rule {self.id} needs a counter or histogram, {self.metric} is a gauge")
+
+
+def evaluate_alert_rules(registry: MetricsRegistry, rules: Iterable[AlertRule]) -> list[dict[str, Any]]:
+    """Run collectors once, then return an alert for every rule that holds."""
+    registry.collect()
+    alerts = []
+    for rule in rules:
+        alert = rule.evaluate(registry)
+        if alert is not None:
+            alerts.append(alert)
+    return alerts
+
+
+_registry: Optional[MetricsRegistry] = None
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Process-wide registry shared by every instrumented path."""
+    global _registry
+    if _registry is None:
+        _registry = MetricsRegistry()
+    return _registry
@@ -3,6 +3,9 @@ Monitoring and Metrics Aggregator Service
 Feature: 023-migration-observability
 
 Aggregates metrics from Discovery, Coordination, and Rollback services.
+Alerts are declarative rules evaluated against the in-process metrics
+registry; coordination and rollback state is mirrored into registry gauges by
+a collector before each evaluation.
 """
 
 import logging
@@ -12,6 +15,108 @@ from typing import Dict, List, Optional
 from api.services.discovery_service import get_discovery_service
 from api.services.coordination_service import get_coordination_service
 from api.services.rollback_service import get_rollback_service
+from api.services.cypher_telemetry import get_cypher_telemetry
+from api.services.metrics_registry import (
+    AlertRule,
+    MetricsRegistry,
+    evaluate_alert_rules,
+    get_metrics_registry,
+)
+
+
+DEFAULT_ALERT_RULES: List[AlertRule] = [
+    AlertRule(
+        id="queue_backlog",
+        metric="dionysus_coordination_queue_depth",
+        threshold=10,
+        severity="warning",
+        message="Task queue is backing up ({value:g} items)",
+    ),
+    AlertRule(
+        id="agents_degraded",
+        metric="dionysus_coordination_agent_degraded",
+        threshold=0,
+        severity="critical",
+        message="{value:g} agents are in DEGRADED state",
+        affected_label="agent_id",
+    ),
+    AlertRule(
+        id="rollback_failures",
+        metric="dionysus_rollback_recent_failures",
+        threshold=0,
+        severity="critical",
+        message="Detected {value:g} recent rollback failures",
+    ),
+    AlertRule(
+        id="http_error_rate",
+        metric="dionysus_http_requests_total",
+        condition="rate",
+        labels={"status_class": "5xx"},
+        threshold=0.05,
+        severity="warning",
+        message="HTTP 5xx rate is {value:.3f}/s",
+        affected_label="route",
+    ),
+    AlertRule(
+        id="http_latency_p95",
+        metric="dionysus_http_request_duration_ms",
+        condition="quantile",
+        quantile=0.95,
+        threshold=2500,
+        severity="warning",
+        message="HTTP p95 latency is {value:g}ms",
+    ),
+    AlertRule(
+        id="graph_errors",
+        metric="dionysus_graph_queries_total",
+        condition="increase",
+        labels={"outcome": "error"},
+        threshold=10,
+        severity="critical",
+        message="{value:g} graph queries failed in the last window",
+    ),
+    AlertRule(
+        id="llm_errors",
+        metric="dionysus_llm_requests_total",
+        condition="increase",
+        labels={"outcome": "error"},
+        threshold=5,
+        severity="warning",
+        message="{value:g} LLM completions failed in the last window",
+        affected_label="model",
+    ),
+    AlertRule(
+        id="embedding_errors",
+        metric="dionysus_embedding_requests_total",
+        condition="increase",
+        labels={"outcome": "error"},
+        threshold=5,
+        severity="warning",
+        message="{value:g} embedding requests failed in the last window",
+    ),
+]
+
+
+def collect_service_gauges(registry: MetricsRegistry) -> None:
+    """Mirror coordination and rollback state into registry gauges."""
+    coordination = get_coordination_service()
+    rollback = get_rollback_service()
+
+    registry.gauge(
+        "dionysus_coordination_queue_depth", "Tasks waiting in the coordination queue."
+    ).set(len(coordination.queue))
+
+    degraded = registry.gauge(
+        "dionysus_coordination_agent_degraded", "1 for each agent in DEGRADED state.", ("agent_id",)
+    )
+    degraded.clear()
+    for agent in coordination.list_agents():
+        if agent.status == "degraded":
+            degraded.labels(agent_id=agent.agent_id).set(1)
+
+    registry.gauge(
+        "dionysus_rollback_recent_failures", "Failed rollbacks among the last five."
+    ).set(len([r for r in rollback.history[-5:] if not r.success]))
 
 
 class MonitoringService:
@@ -19,6 +124,9 @@ class MonitoringService:
         self.logger = logging.getLogger(__name__)
         self.start_time = datetime.utcnow()
         self._current_trace_id: Optional[str] = None
+        self.registry = get_metrics_registry()
+        self.registry.register_collector("services", lambda: collect_service_gauges(self.registry))
+        self.alert_rules: List[AlertRule] = list(DEFAULT_ALERT_RULES)
 
     @property
     def trace_id(self) -> str:
@@ -72,48 +180,41 @@ class MonitoringService:
             }
         }
 
+    async def get_cypher_metrics(self) -> Dict:
+        """Per-call-site latency histograms for the Graphiti Cypher gateway."""
+        snapshot = get_cypher_telemetry().snapshot()
+        snapshot["timestamp"] = datetime.utcnow().isoformat()
+        return snapshot
+
+    async def get_slow_queries(self, limit: int = 50) -> List[Dict]:
+        """Most recent slow Cypher statements (parameters redacted)."""
+        return [q.to_dict() for q in get_cypher_telemetry().slow_queries(limit=limit)]
+
     def _calculate_agent_utilization(self, agents: List) -> float:
         if not agents: return 0.0
         busy = len([a for a in agents if a.status != "idle"])
         return (busy / len(agents)) * 100.0
 
-    async def get_alerts(self) -> List[Dict]:
-        alerts = []
-        coordination = get_coordination_service()
-        rollback = get_rollback_service()
-        
-        # 1. High queue alert
-        if len(coordination.queue) > 10:
-            alerts.append({
-                "id": "queue_backlog",
-                "severity": "warning",
-                "message": f"Task queue is backing up ({len(coordination.queue)} items)",
-                "timestamp": datetime.utcnow().isoformat()
-            })
-
-        # 2. Agent degradation alert
-        degraded = [a.agent_id for a in coordination.list_agents() if a.status == "degraded"]
-        if degraded:
-            alerts.append({
-                "id": "agents_degraded",
-                "severity": "critical",
-                "message": f"{len(degraded)} agents are in DEGRADED state",
-                "affected": degraded,
-                "timestamp": datetime.utcnow().isoformat()
-            })
-
-        # 3. Rollback failure alert
-        failed_rollbacks = [r for r in rollback.history[-5:] if not r.success]
-        if failed_rollbacks:
-            alerts.append({
-                "id": "rollback_failures",
-                "severity": "critical",
-                "message": f"Detected {len(failed_rollbacks)} recent rollback failures",
-                "timestamp": datetime.utcnow().isoformat()
-            })
+    def add_alert_rule(self, rule: AlertRule) -> None:
+        """Add a rule, replacing any existing rule with the same id."""
+        self.alert_rules = [r for r in self.alert_rules if r.id != rule.id] + [rule]
 
+    async def get_alerts(self) -> List[Dict]:
+        alerts = evaluate_alert_rules(self.registry, self.alert_rules)
+        if alerts:
+            self._log(logging.INFO, "alerts_firing", alert_ids=[a["id"] for a in alerts])
         return alerts
 
+    async def get_registry_metrics(self) -> Dict:
+        """Registry counters, gauges and histograms with rolling-window rates and percentiles."""
+        snapshot = self.registry.snapshot()
+        snapshot["timestamp"] = datetime.utcnow().isoformat()
+        return snapshot
+
+    def prometheus_text(self) -> str:
+        """Registry and Cypher gateway metrics in Prometheus text exposition format."""
+        return self.registry.prometheus_text() + get_cypher_telemetry().prometheus_text()
+
 
 _monitoring_service: Optional[MonitoringService] = None
 
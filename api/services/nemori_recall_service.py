@@ -6,12 +6,19 @@ Implements the k/m retrieval ratio from the Nemori framework:
 - m semantic memories (semantic memory)
 
 Features:
+- Episodic and semantic legs run concurrently under a shared deadline;
+  a leg that misses it is dropped and reported, not awaited
+- Semantic hits duplicating a recalled episode are dropped and backfilled,
+  so the k/m ratio holds across legs
 - Top-2 episodes include full narrative context
 - Remaining episodes include titles/summaries only
 - Benchmarks against standard retrieval
 """
 
+import asyncio
 import logging
+import os
+import re
 import time
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
@@ -22,14 +29,28 @@ from api.agents.consolidated_memory_stores import get_consolidated_memory_store
 
 logger = logging.getLogger("dionysus.nemori_recall")
 
+DEFAULT_DEADLINE_MS = float(os.getenv("NEMORI_RECALL_DEADLINE_MS", "1500"))
+
+
+def _content_key(text: Optional[str]) -> str:
+    """Whitespace/case-insensitive key for spotting the same memory across legs."""
+    return re.sub(r"\s+", " ", (text or "").strip().lower())
+
+
+def _consume_result(task: asyncio.Task) -> None:
+    if not task.cancelled():
+        task.exception()
+
+
 class NemoriRecallService:
     """
     Orchestrates hybrid retrieval using the k/m ratio.
     """
     
-    def __init__(self, k: int = 10, m: int = 20):
+    def __init__(self, k: int = 10, m: int = 20, deadline_ms: Optional[float] = None):
         self.k = k
         self.m = m
+        self.deadline_ms = DEFAULT_DEADLINE_MS if deadline_ms is None else deadline_ms
         self.store = get_consolidated_memory_store()
         self.vector_search = get_vector_search_service()
 
@@ -39,45 +60,130 @@ class NemoriRecallService:
         project_id: Optional[str] = None,
         session_id: Optional[str] = None,
         k_override: Optional[int] = None,
-        m_override: Optional[int] = None
+        m_override: Optional[int] = None,
+        deadline_ms: Optional[float] = None,
     ) -> Dict[str, Any]:
         """
         Perform hybrid recall with k episodic and m semantic results.
         
         T041-032: Implement k/m retrieval ratio.
+
+        Both legs start together and share one deadline. A leg that times out
+        or fails contributes nothing; the result is then marked partial and
+        "legs" says which leg and why.
         """
         start_time = time.time()
         k = k_override or self.k
         m = m_override or self.m
-        
+        deadline = (self.deadline_ms if deadline_ms is None else deadline_ms) / 1000.0
+
         # 1. Episodic Recall (k results)
-        episodes = await self.store.search_episodes(
+        episodic = asyncio.create_task(self.store.search_episodes(
             query=query,
             limit=k,
             group_ids=[project_id] if project_id else None
-        )
-        
-        # 2. Semantic Recall (m results)
+        ))
+
+        # 2. Semantic Recall (m results), over-fetched so duplicates of
+        # recalled episodes can be dropped without falling short of m
         filters = SearchFilters(project_id=project_id, session_id=session_id)
-        semantic_response = await self.vector_search.semantic_search(
+        semantic = asyncio.create_task(self.vector_search.semantic_search(
             query=query,
-            top_k=m,
+            top_k=m + k,
             filters=filters
-        )
+        ))
+
+        legs = await self._gather_legs({"episodic": episodic, "semantic": semantic}, deadline, start_time)
+        episodes = list(legs["episodic"].pop("value", None) or [])[:k]
+        semantic_response = legs["semantic"].pop("value", None)
+        candidates = list(semantic_response.results) if semantic_response is not None else []
+
+        # 3. Fuse: drop semantic hits that duplicate an episode or each other
+        semantic_results, deduplicated = self._fuse(episodes, candidates, m)
         
-        # 3. Format context (Top-2 full, rest abbreviated)
-        formatted_context = self._format_nemori_context(episodes, semantic_response.results)
+        # 4. Format context (Top-2 full, rest abbreviated)
+        formatted_context = self._format_nemori_context(episodes, semantic_results)
         
         total_time_ms = (time.time() - start_time) * 1000
+        timed_out = [name for name, leg in legs.items() if leg["status"] == "timeout"]
+        if timed_out:
+            logger.warning(f"Nemori recall returned partial results; timed out: {timed_out}")
         
         return {
             "formatted_context": formatted_context,
             "episodes_count": len(episodes),
-            "semantic_count": len(semantic_response.results),
+            "semantic_count": len(semantic_results),
             "total_time_ms": round(total_time_ms, 2),
-            "ratio": f"{len(episodes)}/{len(semantic_response.results)}"
+            "ratio": f"{len(episodes)}/{len(semantic_results)}",
+            "legs": legs,
+            "timed_out": timed_out,
+            "partial": any(leg["status"] != "ok" for leg in legs.values()),
+            "deduplicated": deduplicated,
         }
 
+    async def _gather_legs(
+        self,
+        tasks: Dict[str, asyncio.Task],
+        deadline: float,
+        start_time: float,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Wait for all legs until the deadline; cancel and report the stragglers."""
+        finished_at: Dict[str, float] = {}
+        for name, task in tasks.items():
+            task.add_done_callback(lambda _t, name=name: finished_at.setdefault(name, time.time()))
+
+        _, pending = await asyncio.wait(tasks.values(), timeout=max(deadline, 0.0))
+
+        legs: Dict[str, Dict[str, Any]] = {}
+        for name, task in tasks.items():
+            if task in pending:
+                task.add_done_callback(_consume_result)
+                task.cancel()
+                legs[name] = {"status": "timeout", "time_ms": round(deadline * 1000, 2)}
+                continue
+            elapsed_ms = round((finished_at.get(name, time.time()) - start_time) * 1000, 2)
+            if task.exception() is not None:
+                logger.warning(f"Nemori {name} recall failed: {task.exception()}")
+                legs[name] = {"status": "error", "error": str(task.exception()), "time_ms": elapsed_ms}
+            else:
+                legs[name] = {"status": "ok", "time_ms": elapsed_ms, "value": task.result()}
+        return legs
+
+    def _fuse(
+        self,
+        episodes: List[DevelopmentEpisode],
+        candidates: List[Any],
+        m: int,
+    ) -> Tuple[List[Any], int]:
+        """
+        Up to m semantic results, in rank order, that are not already covered.
+
+        A semantic hit duplicates an episode when it is the episode itself,
+        one of its events, or carries the same title/summary/narrative text.
+        """
+        seen_ids = set()
+        seen_content = set()
+        for ep in episodes:
+            seen_ids.add(ep.episode_id)
+            seen_ids.update(ep.events)
+            seen_content.update(_content_key(t) for t in (ep.title, ep.summary, ep.narrative))
+        seen_content.discard("")
+
+        kept, dropped = [], 0
+        for res in candidates:
+            res_id = getattr(res, "id", None)
+            key = _content_key(getattr(res, "content", None))
+            if (isinstance(res_id, str) and res_id in seen_ids) or (key and key in seen_content):
+                dropped += 1
+                continue
+            if len(kept) < m:
+                kept.append(res)
+            if isinstance(res_id, str):
+                seen_ids.add(res_id)
+            if key:
+                seen_content.add(key)
+        return kept, dropped
+
     def _format_nemori_context(
         self, 
         episodes: List[DevelopmentEpisode], 
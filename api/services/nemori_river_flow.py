@@ -1,8 +1,9 @@
 import logging
 import json
 import hashlib
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import List, Optional, Any, Dict, Tuple
+from typing import AsyncIterator, List, Optional, Any, Dict, Tuple
 from uuid import uuid4
 
 from api.models.autobiographical import (
@@ -16,6 +17,8 @@ from api.models.memevolve import TrajectoryData
 from api.models.beautiful_loop import ResonanceSignal, ResonanceMode
 from api.agents.consolidated_memory_stores import get_consolidated_memory_store
 from api.services.llm_service import chat_completion, GPT5_NANO
+from api.services.boundary_detector import BoundaryDetectorStats, BoundaryVerdict, EmbeddingBoundaryDetector
+from api.services.embedding import get_embedding_service
 from api.services.memory_basin_router import get_memory_basin_router
 from api.services.graphiti_service import get_graphiti_service
 from api.services.context_packaging import (
@@ -29,6 +32,14 @@ from api.models.memevolve import MemoryIngestRequest, TrajectoryData, Trajectory
 
 logger = logging.getLogger("dionysus.nemori_river_flow")
 
+# 50 tokens ~ 200ms processing time (heuristic)
+PACKET_SIZE = 50
+# Packets per bulk store_events write
+DEFAULT_PACKET_BATCH_SIZE = 32
+# Boundary detector windows kept per kind; least recently used streams are dropped
+MAX_BOUNDARY_STREAMS = 256
+DEFAULT_BOUNDARY_STREAM = "default"
+
 
 class NemoriRiverFlow:
     """
@@ -38,12 +49,57 @@ class NemoriRiverFlow:
     def __init__(self):
         self.store = get_consolidated_memory_store()
         self.token_budget = get_token_budget_manager()
+        # Local EST fast path; the LLM is only consulted in the ambiguous band.
+        # One rolling window per journey/device stream, counters shared per kind.
+        self._boundary_detectors: Dict[str, "OrderedDict[str, EmbeddingBoundaryDetector]"] = {
+            "events": OrderedDict(),
+            "trajectories": OrderedDict(),
+        }
+        self._boundary_stats: Dict[str, BoundaryDetectorStats] = {
+            kind: BoundaryDetectorStats() for kind in self._boundary_detectors
+        }
+
+    def _boundary_detector(self, kind: str, stream_id: str) -> EmbeddingBoundaryDetector:
+        """Rolling-window detector for one stream, created on first use."""
+        detectors = self._boundary_detectors[kind]
+        detector = detectors.get(stream_id)
+        if detector is None:
+            detector = EmbeddingBoundaryDetector()
+            detector.stats = self._boundary_stats[kind]
+            detectors[stream_id] = detector
+            if len(detectors) > MAX_BOUNDARY_STREAMS:
+                detectors.popitem(last=False)
+        else:
+            detectors.move_to_end(stream_id)
+        return detector
+
+    @staticmethod
+    def _event_stream_id(events: List[DevelopmentEvent]) -> str:
+        """Journey or device the latest event is anchored to."""
+        latest = events[-1]
+        state = latest.active_inference_state
+        if state and (state.journey_id or state.device_id):
+            return state.journey_id or state.device_id
+        return (
+            latest.metadata.get("journey_id")
+            or latest.metadata.get("device_id")
+            or DEFAULT_BOUNDARY_STREAM
+        )
+
+    @staticmethod
+    def _trajectory_stream_id(trajectories: List[TrajectoryData]) -> Optional[str]:
+        """Session, project or agent the latest trajectory belongs to, if any."""
+        metadata = trajectories[-1].metadata
+        if metadata:
+            return metadata.session_id or metadata.project_id or metadata.agent_id
+        return None
 
     async def create_packet_train(
         self, 
         content: str, 
         source_id: str = "user_input",
-        event_type: str = "cognitive_stream"
+        event_type: str = "cognitive_stream",
+        batch_size: int = DEFAULT_PACKET_BATCH_SIZE,
     ) -> List[DevelopmentEvent]:
         """
         QUANTIZATION LAYER (The Axon):
@@ -56,65 +112,132 @@ class NemoriRiverFlow:
         """
         # 1. Tokenize (Approximate)
         words = content.split()
-        total_tokens = len(words)
-        
         # 2. Determine Quantum Size (Packet Window)
-        # 50 tokens ~ 200ms processing time (heuristic)
-        PACKET_SIZE = 50 
-        
-        packets = []
-        chunks = [words[i:i + PACKET_SIZE] for i in range(0, len(words), PACKET_SIZE)]
-        
-        parent_packet_id = None
-        basin_router = get_memory_basin_router()
-        
-        for i, chunk in enumerate(chunks):
-            chunk_text = " ".join(chunk)
-            
-            # Calculate Dynamics
-            dynamics = self._calculate_packet_dynamics(chunk_text)
-            
-            # Determine Basin Context (Manifold Constraint)
-            # Only do full classification for the first packet to set the trajectory
-            linked_basin_id = None
-            basin_score = 0.0
-            if i == 0: 
-                try:
-                    mem_type = await basin_router.classify_memory_type(chunk_text)
-                    basin_config = basin_router.get_basin_for_type(mem_type)
-                    linked_basin_id = basin_config.get("basin_name")
-                    basin_score = basin_config.get("default_strength", 0.5)
-                    # Update dynamics with manifold position if possible (placeholder)
-                    dynamics.manifold_position = [0.1, 0.5] # Symbolic
-                except Exception:
-                    pass
+        total_packets = -(-len(words) // PACKET_SIZE)
 
-            event_id = f"pkt_{uuid4().hex[:8]}"
-            
-            packet = DevelopmentEvent(
-                event_id=event_id,
-                timestamp=datetime.now(timezone.utc),
+        async def _single(text: str) -> AsyncIterator[str]:
+            yield text
+
+        return [
+            packet
+            async for packet in self.stream_packet_train(
+                _single(content),
+                source_id=source_id,
                 event_type=event_type,
-                summary=chunk_text[:100] + "..." if len(chunk_text) > 100 else chunk_text,
-                rationale=chunk_text, # The full content is the rationale
-                impact="neuronal_flow",
-                packet_dynamics=dynamics,
-                linked_basin_id=linked_basin_id,
-                basin_r_score=basin_score,
-                metadata={
-                    "sequence_index": i,
-                    "total_packets": len(chunks),
-                    "source_id": source_id,
-                    "parent_packet_id": parent_packet_id 
-                }
+                batch_size=batch_size,
+                total_packets=total_packets,
             )
-            
-            # Store immediately (Fire the neuron)
-            await self.store.store_event(packet)
-            packets.append(packet)
-            parent_packet_id = event_id
-            
-        return packets
+        ]
+
+    async def stream_packet_train(
+        self,
+        stream: AsyncIterator[str],
+        source_id: str = "user_input",
+        event_type: str = "cognitive_stream",
+        batch_size: int = DEFAULT_PACKET_BATCH_SIZE,
+        total_packets: Optional[int] = None,
+    ) -> AsyncIterator[DevelopmentEvent]:
+        """
+        Streaming QUANTIZATION LAYER for long-form ingestion.
+
+        Consumes an async iterator of text, yields each packet as soon as its
+        window fills, and fires packets to the store in bulk batches of
+        `batch_size` (parent-chain links are written in the same batch).
+        Memory stays bounded by one packet window plus one pending batch.
+
+        `total_packets` is recorded in packet metadata when known up front;
+        for open-ended streams it stays None.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+
+        parent_packet_id = None
+        basin_router = get_memory_basin_router()
+        pending: List[DevelopmentEvent] = []
+
+        try:
+            index = 0
+            async for chunk_text in self._iter_packet_windows(stream):
+                # Calculate Dynamics
+                dynamics = self._calculate_packet_dynamics(chunk_text)
+
+                # Determine Basin Context (Manifold Constraint)
+                # Only do full classification for the first packet to set the trajectory
+                linked_basin_id = None
+                basin_score = 0.0
+                if index == 0:
+                    try:
+                        mem_type = await basin_router.classify_memory_type(chunk_text)
+                        basin_config = basin_router.get_basin_for_type(mem_type)
+                        linked_basin_id = basin_config.get("basin_name")
+                        basin_score = basin_config.get("default_strength", 0.5)
+                        # Update dynamics with manifold position if possible (placeholder)
+                        dynamics.manifold_position = [0.1, 0.5] # Symbolic
+                    except Exception:
+                        pass
+
+                event_id = f"pkt_{uuid4().hex[:8]}"
+
+                packet = DevelopmentEvent(
+                    event_id=event_id,
+                    timestamp=datetime.now(timezone.utc),
+                    event_type=event_type,
+                    summary=chunk_text[:100] + "..." if len(chunk_text) > 100 else chunk_text,
+                    rationale=chunk_text, # The full content is the rationale
+                    impact="neuronal_flow",
+                    packet_dynamics=dynamics,
+                    linked_basin_id=linked_basin_id,
+                    basin_r_score=basin_score,
+                    metadata={
+                        "sequence_index": index,
+                        "total_packets": total_packets,
+                        "source_id": source_id,
+                        "parent_packet_id": parent_packet_id 
+                    }
+                )
+
+                # Fire the neuron (batched)
+                pending.append(packet)
+                if len(pending) >= batch_size:
+                    await self._flush_packets(pending)
+                    pending = []
+
+                yield packet
+                parent_packet_id = event_id
+                index += 1
+        finally:
+            if pending:
+                await self._flush_packets(pending)
+
+    async def _flush_packets(self, packets: List[DevelopmentEvent]) -> None:
+        """Write a batch of packets through the bulk UNWIND path."""
+        stored = await self.store.store_events(packets)
+        if stored != len(packets):
+            logger.warning(f"Packet batch flush stored {stored}/{len(packets)} packets")
+
+    @staticmethod
+    async def _iter_packet_windows(stream: AsyncIterator[str]) -> AsyncIterator[str]:
+        """
+        Re-window an async text stream into PACKET_SIZE-word chunks.
+
+        A word split across two stream chunks is carried over and re-joined.
+        """
+        window: List[str] = []
+        carry = ""
+        async for piece in stream:
+            if not piece:
+                continue
+            text = carry + piece
+            words = text.split()
+            carry = words.pop() if words and not text[-1].isspace() else ""
+            window.extend(words)
+            while len(window) >= PACKET_SIZE:
+                yield " ".join(window[:PACKET_SIZE])
+                del window[:PACKET_SIZE]
+        if carry:
+            window.append(carry)
+        if window:
+            yield " ".join(window)
 
     def _calculate_packet_dynamics(self, text: str) -> "PacketDynamics":
         """
@@ -144,15 +267,24 @@ class NemoriRiverFlow:
             manifold_position=[] # populated by router if active
         )
 
-    async def check_boundary(self, events: List[DevelopmentEvent], resonance_signal: Optional[ResonanceSignal] = None) -> bool:
+    async def check_boundary(
+        self,
+        events: List[DevelopmentEvent],
+        resonance_signal: Optional[ResonanceSignal] = None,
+        stream_id: Optional[str] = None,
+    ) -> bool:
         """
         Reflective boundary detection using Predict-Calibrate logic.
         Detects if current events represent a phase shift (Attractor transition).
         Incorporates Richmond/Zacks Event Segmentation Theory (EST).
+
+        stream_id selects the embedding-drift window (a journey or device);
+        it defaults to the journey/device the latest event is anchored to.
         """
         logger.debug(f"Checking boundary for {len(events)} events...")
         if not events:
             return False
+        detector = self._boundary_detector("events", stream_id or self._event_stream_id(events))
 
         # Prepare context with surprisal/uncertainty if available
         context_lines = []
@@ -173,17 +305,28 @@ class NemoriRiverFlow:
         # Computational Trigger: High surprisal immediately triggers boundary
         if max_surprisal > 0.8: # Threshold could be dynamic
             logger.info(f"Computational EST Trigger: High surprisal detected ({max_surprisal:.2f})")
+            detector.reset(keep_last=False)
             return True
 
         # ULTRATHINK Trigger: Dissonance forces segmentation to protect Worldview
         if resonance_signal:
             if resonance_signal.mode == ResonanceMode.DISSONANT:
                 logger.info(f"ULTRATHINK Trigger: Dissonance detected (Score: {resonance_signal.resonance_score:.2f}). Forcing boundary.")
+                detector.reset(keep_last=False)
                 return True
             if resonance_signal.mode == ResonanceMode.TURBULENT and max_surprisal > 0.6:
                 logger.info("ULTRATHINK Trigger: Turbulence + High Surprisal. Forcing boundary.")
+                detector.reset(keep_last=False)
                 return True
 
+        # Embedding Drift Trigger: local centroid drift / change-point fast path
+        local = await self._local_boundary_verdict(
+            detector,
+            [(e.event_id, e.summary, e.metadata.get("embedding")) for e in events],
+        )
+        if local is not None:
+            return local
+
         context = "\n".join(context_lines)
         
         prompt = f"""
@@ -215,6 +358,8 @@ class NemoriRiverFlow:
             )
             result = json.loads(response.strip().strip("`").replace("json", "").strip())
             detected = result.get("boundary_detected", False)
+            if detected:
+                detector.reset(keep_last=True)
             
             # Record the surprisal estimate back into the event if detected
             # (In a real flow, this would be computed by the agent during prediction)
@@ -225,6 +370,67 @@ class NemoriRiverFlow:
             logger.error(f"Error in check_boundary: {e}")
             return False
 
+    async def _local_boundary_verdict(
+        self,
+        detector: EmbeddingBoundaryDetector,
+        items: List[Tuple[Any, str, Optional[List[float]]]],
+    ) -> Optional[bool]:
+        """
+        Run the embedding-drift detector over (key, text, embedding) items.
+
+        Items not yet in the detector window are embedded in one batch (reusing
+        any precomputed embedding); all but the latest are seeded, the latest is
+        scored. Returns True/False when the local detector is confident, or None
+        to escalate to the LLM.
+        """
+        latest_key = items[-1][0]
+        if latest_key in detector:
+            # Already scored in an earlier call; the LLM decides the re-check
+            detector.stats.checks += 1
+            detector.stats.llm_consultations += 1
+            return None
+
+        # Only the events after the newest one already in the window are new
+        missing = items[-detector.window_size:]
+        for idx in range(len(missing) - 1, -1, -1):
+            if missing[idx][0] in detector:
+                missing = missing[idx + 1:]
+                break
+        to_embed = [text for _, text, vector in missing if vector is None]
+        try:
+            if any(not text.strip() for text in to_embed):
+                raise ValueError("empty text")
+            embedded = iter(await get_embedding_service().generate_embeddings_batch(to_embed))
+            vectors = [vector if vector is not None else next(embedded) for _, _, vector in missing]
+        except Exception as e:
+            detector.stats.checks += 1
+            detector.stats.llm_consultations += 1
+            detector.stats.embedding_failures += 1
+            logger.debug(f"Embedding drift fast path unavailable: {e}")
+            return None
+
+        for (key, _, _), vector in zip(missing[:-1], vectors[:-1]):
+            detector.seed(key, vector)
+        decision = detector.observe(latest_key, vectors[-1])
+
+        if decision.verdict == BoundaryVerdict.BOUNDARY:
+            logger.info(
+                f"Embedding Drift Trigger: drift={decision.drift:.2f}, "
+                f"change={decision.change_score:.2f}"
+            )
+            detector.reset(keep_last=True)
+            return True
+        if decision.verdict == BoundaryVerdict.CONTINUE:
+            return False
+        return None
+
+    def get_boundary_stats(self) -> Dict[str, Dict[str, float]]:
+        """Report how often boundary detection fell through to the LLM."""
+        return {
+            kind: {**stats.to_dict(), "streams": len(self._boundary_detectors[kind])}
+            for kind, stats in self._boundary_stats.items()
+        }
+
     async def construct_episode(self, events: List[DevelopmentEvent], journey_id: str, parent_episode_id: Optional[str] = None) -> Optional[DevelopmentEpisode]:
         """
         Consolidates TRIBUTARY events into a coherent Episode (Stable Attractor).
@@ -547,13 +753,35 @@ class NemoriRiverFlow:
             logger.error(f"Error in predict-calibrate cycle: {e}")
             return [], {}
 
-    async def check_boundary_for_trajectories(self, trajectories: List[TrajectoryData]) -> bool:
+    async def check_boundary_for_trajectories(
+        self,
+        trajectories: List[TrajectoryData],
+        stream_id: Optional[str] = None,
+    ) -> bool:
         """
         Check for boundary condition in a stream of Trajectories (Protocol 060).
         """
         if not trajectories:
             return False
-            
+
+        # The detector window is keyed by trajectory id within a stream; without
+        # stable keys a window could be matched against another caller's items,
+        # so such checks go straight to the LLM
+        stream = stream_id or self._trajectory_stream_id(trajectories)
+        detector: Optional[EmbeddingBoundaryDetector] = None
+        if stream and all(t.id for t in trajectories):
+            detector = self._boundary_detector("trajectories", stream)
+            local = await self._local_boundary_verdict(
+                detector,
+                [(t.id, t.summary or t.query or "", None) for t in trajectories],
+            )
+            if local is not None:
+                return local
+        else:
+            stats = self._boundary_stats["trajectories"]
+            stats.checks += 1
+            stats.llm_consultations += 1
+
         context_lines = []
         for t in trajectories:
             line = f"- Trajectory {t.id or 'unknown'}: {t.summary or 'No summary'}"
@@ -584,7 +812,10 @@ class NemoriRiverFlow:
                 model=GPT5_NANO
             )
             result = json.loads(response.strip().strip("`").replace("json", "").strip())
-            return result.get("boundary_detected", False)
+            detected = result.get("boundary_detected", False)
+            if detected and detector is not None:
+                detector.reset(keep_last=True)
+            return detected
         except Exception as e:
             logger.error(f"Error in check_boundary_for_trajectories: {e}")
             return False
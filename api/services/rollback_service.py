@@ -4,16 +4,24 @@ Feature: 021-rollback-safety-net
 
 Handles checkpoint creation and fast rollback for agentic changes.
 Ported and enhanced from Dionysus 2.0.
+
+File contents go to a shared content-addressed chunk store, so repeated
+checkpoints of mostly unchanged files share storage. Checkpoint and rollback
+state is an append-only journal (state.journal, one JSON record per line)
+replayed on startup; it is rewritten compactly once dead records dominate.
+A legacy state.json is imported on first load.
 """
 
+import asyncio
 import hashlib
 import json
 import logging
+import os
 import shutil
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 from uuid import uuid4
 
 from api.models.rollback import (
@@ -23,90 +31,146 @@ from api.models.rollback import (
     RollbackRecord,
     CheckpointCreateRequest
 )
+from api.services.checkpoint_chunk_store import CheckpointChunkStore, ChunkIntegrityError
 
 logger = logging.getLogger(__name__)
 
+JOURNAL_FILE = "state.journal"
+LEGACY_STATE_FILE = "state.json"
+CHUNKS_DIR = "chunks"
+# Compact the journal once it holds this many more records than live state needs
+JOURNAL_COMPACT_SLACK = 256
+
 
 class RollbackService:
     def __init__(self, storage_path: str = ".checkpoints"):
         self.storage_path = Path(storage_path)
         self.storage_path.mkdir(parents=True, exist_ok=True)
+        self.chunks = CheckpointChunkStore(self.storage_path / CHUNKS_DIR)
         self.checkpoints: Dict[str, RollbackCheckpoint] = {}
         self.history: List[RollbackRecord] = []
+        self._journal_path = self.storage_path / JOURNAL_FILE
+        self._journal_records = 0
+        # Chunking and restores run in worker threads; chunk GC must not run
+        # while a checkpoint's chunks are written but not yet recorded
+        self._chunks_lock = asyncio.Lock()
         self._load_local_state()
 
+    # -------------------------------------------------------------------------
+    # State journal
+    # -------------------------------------------------------------------------
+
     def _load_local_state(self):
-        """Load existing checkpoints from disk if any."""
-        state_file = self.storage_path / "state.json"
-        if state_file.exists():
+        """Replay the state journal, importing a legacy state.json first."""
+        legacy = self.storage_path / LEGACY_STATE_FILE
+        if legacy.exists() and not self._journal_path.exists():
             try:
-                data = json.loads(state_file.read_text())
+                data = json.loads(legacy.read_text())
                 for cid, cdata in data.get("checkpoints", {}).items():
                     self.checkpoints[cid] = RollbackCheckpoint(**cdata)
                 for hdata in data.get("history", []):
                     self.history.append(RollbackRecord(**hdata))
+                self._compact_journal()
+                legacy.rename(legacy.with_suffix(".json.imported"))
             except Exception as e:
                 logger.error(f"failed_to_load_rollback_state: {e}")
+            return
+
+        if not self._journal_path.exists():
+            return
+        with open(self._journal_path, "rb") as f:
+            for line_no, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    self._apply(json.loads(line))
+                    self._journal_records += 1
+                except Exception as e:
+                    # A torn final write is expected after a crash; anything else is logged too
+                    logger.error(f"failed_to_replay_rollback_journal: line={line_no} error={e}")
 
-    def _save_local_state(self):
-        """Persist checkpoints and history to disk."""
-        state_file = self.storage_path / "state.json"
+    def _apply(self, entry: Dict[str, Any]) -> None:
+        op = entry["op"]
+        if op == "checkpoint":
+            checkpoint = RollbackCheckpoint(**entry["checkpoint"])
+            self.checkpoints[checkpoint.checkpoint_id] = checkpoint
+        elif op == "status":
+            checkpoint = self.checkpoints.get(entry["checkpoint_id"])
+            if checkpoint is not None:
+                checkpoint.status = CheckpointStatus(entry["status"])
+        elif op == "delete":
+            self.checkpoints.pop(entry["checkpoint_id"], None)
+        elif op == "rollback":
+            self.history.append(RollbackRecord(**entry["record"]))
+        else:
+            raise ValueError(f"unknown_journal_op: {op}")
+
+    def _append_journal(self, *entries: Dict[str, Any]) -> None:
+        """Append records to the journal and make them durable."""
         try:
-            data = {
-                "checkpoints": {cid: c.model_dump(mode='json') for cid, c in self.checkpoints.items()},
-                "history": [h.model_dump(mode='json') for h in self.history]
-            }
-            state_file.write_text(json.dumps(data, indent=2))
+            with open(self._journal_path, "ab") as f:
+                for entry in entries:
+                    f.write(json.dumps(entry, separators=(",", ":"), default=str).encode() + b"\n")
+                f.flush()
+                os.fsync(f.fileno())
         except Exception as e:
             logger.error(f"failed_to_save_rollback_state: {e}")
             raise
+        self._journal_records += len(entries)
+        if self._journal_records > len(self.checkpoints) + len(self.history) + JOURNAL_COMPACT_SLACK:
+            self._compact_journal()
+
+    def _compact_journal(self) -> None:
+        """Rewrite the journal as one record per live checkpoint and history entry."""
+        entries = [
+            {"op": "checkpoint", "checkpoint": c.model_dump(mode="json")}
+            for c in self.checkpoints.values()
+        ] + [
+            {"op": "rollback", "record": h.model_dump(mode="json")}
+            for h in self.history
+        ]
+        tmp = self._journal_path.with_name(f"{JOURNAL_FILE}.tmp")
+        with open(tmp, "wb") as f:
+            for entry in entries:
+                f.write(json.dumps(entry, separators=(",", ":")).encode() + b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+        tmp.replace(self._journal_path)
+        self._journal_records = len(entries)
+
+    # -------------------------------------------------------------------------
+    # Checkpoints
+    # -------------------------------------------------------------------------
 
     async def create_checkpoint(self, request: CheckpointCreateRequest) -> str:
         """Create a rollback checkpoint for a component."""
         checkpoint_id = str(uuid4())
-        checkpoint_dir = self.storage_path / checkpoint_id
-        checkpoint_dir.mkdir(parents=True, exist_ok=True)
-
         logger.info(f"creating_checkpoint: checkpoint_id={checkpoint_id} component_id={request.component_id}")
 
         try:
-            # 1. Backup files
-            file_backups = await self._backup_files(request, checkpoint_dir)
-
-            # 2. Backup metadata
-            metadata_path = checkpoint_dir / "metadata.json"
-            metadata = {
-                "component_id": request.component_id,
-                "migration_state": request.migration_state,
-                "created_at": datetime.utcnow().isoformat()
-            }
-            metadata_path.write_text(json.dumps(metadata, indent=2))
-
-            # 3. Create record
-            checkpoint = RollbackCheckpoint(
-                checkpoint_id=checkpoint_id,
-                component_id=request.component_id,
-                retention_until=datetime.utcnow() + timedelta(days=request.retention_days),
-                file_backups=file_backups,
-                metadata_backup=str(metadata_path),
-                migration_state=request.migration_state
-            )
+            async with self._chunks_lock:
+                # 1. Chunk files into the shared store (checksums come from the same read)
+                file_backups = await asyncio.to_thread(self._backup_files, request)
 
-            self.checkpoints[checkpoint_id] = checkpoint
-            self._save_local_state()
+                # 2. Record; component and migration state live in the journal entry
+                checkpoint = RollbackCheckpoint(
+                    checkpoint_id=checkpoint_id,
+                    component_id=request.component_id,
+                    retention_until=datetime.utcnow() + timedelta(days=request.retention_days),
+                    file_backups=file_backups,
+                    migration_state=request.migration_state
+                )
+                self._append_journal({"op": "checkpoint", "checkpoint": checkpoint.model_dump(mode="json")})
+                self.checkpoints[checkpoint_id] = checkpoint
             return checkpoint_id
 
         except Exception as e:
+            # Chunks written so far are shared or unreferenced; cleanup_expired collects the latter
             logger.error(f"checkpoint_failed: checkpoint_id={checkpoint_id} error={e}")
-            if checkpoint_dir.exists():
-                shutil.rmtree(checkpoint_dir)
             raise
 
-    async def _backup_files(self, request: CheckpointCreateRequest, checkpoint_dir: Path) -> Dict[str, FileBackup]:
+    def _backup_files(self, request: CheckpointCreateRequest) -> Dict[str, FileBackup]:
         backups = {}
-        files_dir = checkpoint_dir / "files"
-        files_dir.mkdir(exist_ok=True)
-
         all_files = [request.file_path] + request.related_files
         for fpath in all_files:
             source = Path(fpath)
@@ -114,28 +178,24 @@ class RollbackService:
                 logger.warning(f"file_not_found_for_backup: path={fpath}")
                 continue
 
-            dest = files_dir / source.name
-            if dest.exists(): # avoid collisions for related files with same name
-                dest = files_dir / f"{uuid4().hex[:8]}_{source.name}"
-            
-            shutil.copy2(source, dest)
-            checksum = await self._calculate_checksum(source)
-            
+            digests, checksum, size = self.chunks.put_file(source)
             backups[fpath] = FileBackup(
-                backup_path=str(dest),
+                backup_path=f"chunks:{checksum}",
                 original_path=fpath,
-                size_bytes=dest.stat().st_size,
+                size_bytes=size,
                 backup_time=datetime.utcnow(),
-                checksum=checksum
+                checksum=checksum,
+                chunks=digests,
             )
         return backups
 
-    async def _calculate_checksum(self, path: Path) -> str:
-        hasher = hashlib.sha256()
-        with open(path, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hasher.update(chunk)
-        return hasher.hexdigest()
+    def _referenced_chunks(self) -> set:
+        return {
+            digest
+            for checkpoint in self.checkpoints.values()
+            for backup in checkpoint.file_backups.values()
+            for digest in backup.chunks
+        }
 
     async def rollback(self, checkpoint_id: str, backup_current: bool = True) -> bool:
         """Rollback to a specific checkpoint."""
@@ -146,22 +206,20 @@ class RollbackService:
         start_time = time.time()
         success = False
         error = None
+        staged: List[tuple] = []
 
         try:
-            # 1. Verify integrity
-            for fpath, binfo in checkpoint.file_backups.items():
-                if not Path(binfo.backup_path).exists():
-                    raise ValueError(f"backup_file_missing: {binfo.backup_path}")
-                # Optional: verify checksum here too
-
-            # 2. Restore
-            for fpath, binfo in checkpoint.file_backups.items():
-                orig = Path(binfo.original_path)
+            # 1. Reassemble every file into a temporary sibling, verifying chunk and file checksums
+            async with self._chunks_lock:
+                for fpath, binfo in checkpoint.file_backups.items():
+                    staged.append((Path(binfo.original_path), await asyncio.to_thread(self._stage_restore, binfo)))
+
+            # 2. Restore: nothing is touched until every file verified
+            for orig, tmp in staged:
                 if orig.exists() and backup_current:
                     shutil.move(orig, orig.with_suffix(f"{orig.suffix}.pre_rollback_{checkpoint_id[:8]}"))
-                
-                orig.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(binfo.backup_path, orig)
+                os.replace(tmp, orig)
+            staged = []
 
             checkpoint.status = CheckpointStatus.RESTORED
             success = True
@@ -169,6 +227,8 @@ class RollbackService:
             error = str(e)
             logger.error(f"rollback_failed: checkpoint_id={checkpoint_id} error={error}")
         finally:
+            for _, tmp in staged:
+                tmp.unlink(missing_ok=True)
             duration = time.time() - start_time
             record = RollbackRecord(
                 rollback_id=str(uuid4()),
@@ -180,23 +240,49 @@ class RollbackService:
                 options={"backup_current": backup_current}
             )
             self.history.append(record)
-            self._save_local_state()
+            entries = [{"op": "rollback", "record": record.model_dump(mode="json")}]
+            if success:
+                entries.insert(0, {"op": "status", "checkpoint_id": checkpoint_id, "status": checkpoint.status.value})
+            self._append_journal(*entries)
 
         return success
 
+    def _stage_restore(self, binfo: FileBackup) -> Path:
+        """Verified temporary copy of a backed-up file, next to its original path."""
+        if binfo.chunks:
+            return self.chunks.restore_file(binfo.chunks, binfo.checksum, binfo.original_path)
+
+        # Legacy whole-file copy from before the chunk store
+        source = Path(binfo.backup_path)
+        if not source.exists():
+            raise ValueError(f"backup_file_missing: {binfo.backup_path}")
+        dest = Path(binfo.original_path)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        tmp = dest.with_name(f".{dest.name}.restore-{os.getpid()}")
+        shutil.copy2(source, tmp)
+        digest = hashlib.sha256()
+        with open(tmp, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        if digest.hexdigest() != binfo.checksum:
+            tmp.unlink(missing_ok=True)
+            raise ChunkIntegrityError(f"file_checksum_mismatch: {binfo.backup_path}")
+        return tmp
+
     async def cleanup_expired(self) -> int:
+        """Drop expired checkpoints, then garbage-collect chunks nothing references."""
         now = datetime.utcnow()
         to_delete = [cid for cid, c in self.checkpoints.items() if c.retention_until < now]
-        count = 0
         for cid in to_delete:
-            checkpoint_dir = self.storage_path / cid
-            if checkpoint_dir.exists():
-                shutil.rmtree(checkpoint_dir)
+            legacy_dir = self.storage_path / cid
+            if legacy_dir.exists():
+                shutil.rmtree(legacy_dir)
             del self.checkpoints[cid]
-            count += 1
-        if count > 0:
-            self._save_local_state()
-        return count
+        if to_delete:
+            self._append_journal(*({"op": "delete", "checkpoint_id": cid} for cid in to_delete))
+        async with self._chunks_lock:
+            await asyncio.to_thread(self.chunks.gc, self._referenced_chunks())
+        return len(to_delete)
 
     def metrics(self) -> Dict:
         """Expose rollback metrics for monitoring."""
@@ -207,6 +293,7 @@ class RollbackService:
             "failed_rollbacks": len(failed),
             "last_rollback_success": self.history[-1].success if self.history else None,
             "last_rollback_at": self.history[-1].rollback_id if self.history else None, # Using ID as proxy if no timestamp in record
+            "chunk_store": self.chunks.stats(),
         }
 
 
@@ -0,0 +1,130 @@
+"""
+Cypher Workload Index Advisor Package.
+
+Records the Cypher workload passing through GraphitiService.execute_cypher,
+groups it by statement shape, flags label scans (via EXPLAIN through the
+Graphiti gateway, or static analysis), and generates an idempotent
+index migration that the API ensures at startup.
+
+Usage:
+    from api.services.schema_advisor import get_schema_advisor
+
+    report = await get_schema_advisor().advise()
+    print(report.migration)
+"""
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+from api.services.cypher_telemetry import get_cypher_telemetry
+
+from .workload import (
+    CypherWorkloadRecorder,
+    StatementShape,
+    get_workload_recorder,
+    normalize_statement,
+)
+from .analyzer import (
+    CypherPlanAnalyzer,
+    PlanFinding,
+    PropertyLookup,
+    extract_property_lookups,
+    find_scan_operators,
+    gateway_plan_fetcher,
+)
+from .migration import (
+    BASELINE_INDEXES,
+    IndexSpec,
+    ensure_graph_schema,
+    ensure_schema,
+    generate_migration,
+    recommend_indexes,
+    render_migration,
+)
+
+
+@dataclass
+class SchemaAdvice:
+    """Advisor output: hot shapes, scan findings and the resulting migration."""
+    shapes: list[StatementShape] = field(default_factory=list)
+    findings: list[PlanFinding] = field(default_factory=list)
+    recommendations: list[IndexSpec] = field(default_factory=list)
+    migration: str = ""
+
+    def to_dict(self) -> dict:
+        return {
+            "shapes": [s.to_dict() for s in self.shapes],
+            "findings": [f.to_dict() for f in self.findings],
+            "unindexable": [f.to_dict() for f in self.findings if not f.indexable],
+            "recommendations": [spec.to_cypher() for spec in self.recommendations],
+            "migration": self.migration,
+        }
+
+
+class SchemaAdvisor:
+    """Ties the recorder, analyzer and migration generator together."""
+
+    def __init__(
+        self,
+        recorder: Optional[CypherWorkloadRecorder] = None,
+        analyzer: Optional[CypherPlanAnalyzer] = None,
+    ):
+        self.recorder = recorder or get_workload_recorder()
+        self.analyzer = analyzer or CypherPlanAnalyzer(
+            plan_fetcher=gateway_plan_fetcher(),
+            known_indexes=[(s.label, s.properties) for s in BASELINE_INDEXES if not s.fulltext],
+        )
+
+    async def advise(self, limit: Optional[int] = 50) -> SchemaAdvice:
+        get_cypher_telemetry().flush()  # gateway calls reach the recorder in batches
+        shapes = self.recorder.shapes(limit=limit)
+        findings = await self.analyzer.analyze(shapes)
+        findings.sort(key=lambda f: f.total_ms, reverse=True)
+        recommendations = [
+            spec for spec in recommend_indexes(findings)
+            if not any(base.covers(spec.label, spec.properties) for base in BASELINE_INDEXES)
+        ]
+        return SchemaAdvice(
+            shapes=shapes,
+            findings=findings,
+            recommendations=recommendations,
+            migration=render_migration(list(BASELINE_INDEXES) + recommendations),
+        )
+
+
+_advisor: Optional[SchemaAdvisor] = None
+
+
+def get_schema_advisor() -> SchemaAdvisor:
+    global _advisor
+    if _advisor is None:
+        _advisor = SchemaAdvisor()
+    return _advisor
+
+
+__all__ = [
+    # Workload
+    "CypherWorkloadRecorder",
+    "StatementShape",
+    "get_workload_recorder",
+    "normalize_statement",
+    # Analysis
+    "CypherPlanAnalyzer",
+    "PlanFinding",
+    "PropertyLookup",
+    "extract_property_lookups",
+    "find_scan_operators",
+    "gateway_plan_fetcher",
+    # Migration
+    "BASELINE_INDEXES",
+    "IndexSpec",
+    "ensure_graph_schema",
+    "ensure_schema",
+    "generate_migration",
+    "recommend_indexes",
+    "render_migration",
+    # Advisor
+    "SchemaAdvice",
+    "SchemaAdvisor",
+    "get_schema_advisor",
+]
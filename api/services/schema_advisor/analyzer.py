@@ -0,0 +1,229 @@
+"""
+Cypher Plan Analyzer
+
+Flags statement shapes whose node lookups fall back to label scans.
+
+Two modes:
+- Plan mode: fetches a plan for each shape (gateway_plan_fetcher runs EXPLAIN
+  through the Graphiti gateway) and walks it for AllNodesScan / NodeByLabelScan.
+- Static mode: when no plan fetcher is configured, property lookups extracted from
+  the statement text are checked against the known index set.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Iterable, Optional
+
+from .workload import StatementShape
+
+logger = logging.getLogger("dionysus.schema_advisor")
+
+PlanFetcher = Callable[[str], Awaitable[Optional[dict[str, Any]]]]
+
+LABEL_SCAN_OPERATORS = {"AllNodesScan", "NodeByLabelScan"}
+
+_NODE_PATTERN_RE = re.compile(r"\(\s*(\w+)\s*((?::\s*`?\w+`?\s*)*)(\{[^}]*\})?\s*\)")
+_MAP_KEY_RE = re.compile(r"(\w+)\s*:")
+_WHERE_PROP_RE = re.compile(
+    r"\b(\w+)\.(\w+)\s*(?:=|IN\b|STARTS\s+WITH\b|<|>|<=|>=)", re.IGNORECASE
+)
+_CLAUSE_RE = re.compile(r"\b(WHERE|MATCH|MERGE|WITH|RETURN|SET|CREATE|UNWIND|CALL|FOREACH)\b", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class PropertyLookup:
+    """A node lookup by property: (variable:Label {properties}) or WHERE var.prop = ..."""
+    variable: str
+    label: Optional[str]
+    properties: tuple[str, ...]
+
+
+@dataclass
+class PlanFinding:
+    """A lookup that is (or would be) served by a scan instead of an index."""
+    shape_id: str
+    operator: str
+    label: Optional[str]
+    properties: tuple[str, ...]
+    source: str  # "plan" or "static"
+    detail: str = ""
+    total_ms: float = 0.0
+    count: int = 0
+
+    @property
+    def indexable(self) -> bool:
+        return self.label is not None and bool(self.properties)
+
+    def to_dict(self) -> dict:
+        return {
+            "shape_id": self.shape_id,
+            "operator": self.operator,
+            "label": self.label,
+            "properties": list(self.properties),
+            "source": self.source,
+            "detail": self.detail,
+            "indexable": self.indexable,
+            "total_ms": round(self.total_ms, 3),
+            "count": self.count,
+        }
+
+
+def extract_property_lookups(statement: str) -> list[PropertyLookup]:
+    """Extract node property lookups from MATCH/MERGE patterns and WHERE clauses."""
+    labels: dict[str, Optional[str]] = {}
+    inline: dict[str, list[str]] = {}
+
+    for keyword, body in _split_clauses(statement):
+        for var, label_part, props in _NODE_PATTERN_RE.findall(body):
+            label = None
+            if label_part:
+                label = label_part.replace("`", "").split(":")[1].strip() or None
+            if label or var not in labels:
+                labels[var] = label or labels.get(var)
+            if props and keyword in ("MATCH", "MERGE"):
+                keys = _MAP_KEY_RE.findall(props)
+                if keys:
+                    inline.setdefault(var, []).extend(keys)
+
+    where_props: dict[str, list[str]] = {}
+    for keyword, body in _split_clauses(statement):
+        if keyword != "WHERE":
+            continue
+        for var, prop in _WHERE_PROP_RE.findall(body):
+            if var in labels:
+                where_props.setdefault(var, []).append(prop)
+
+    lookups = []
+    for var in dict.fromkeys(list(inline) + list(where_props)):
+        props = inline.get(var) or where_props.get(var) or []
+        lookups.append(PropertyLookup(var, labels.get(var), tuple(dict.fromkeys(props))))
+    return lookups
+
+
+def _split_clauses(statement: str) -> list[tuple[str, str]]:
+    clauses: list[tuple[str, str]] = []
+    matches = list(_CLAUSE_RE.finditer(statement))
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(statement)
+        clauses.append((match.group(1).upper(), statement[match.end():end]))
+    return clauses
+
+
+def find_scan_operators(plan: dict[str, Any]) -> list[tuple[str, str]]:
+    """Walk a Neo4j plan dict and return (operator, details) for every label scan."""
+    found: list[tuple[str, str]] = []
+    stack = [plan]
+    while stack:
+        node = stack.pop()
+        if not isinstance(node, dict):
+            continue
+        operator = str(node.get("operatorType", "")).split("@")[0]
+        if operator in LABEL_SCAN_OPERATORS:
+            args = node.get("arguments") or node.get("args") or {}
+            details = str(args.get("Details") or ",".join(node.get("identifiers", [])))
+            found.append((operator, details))
+        stack.extend(node.get("children", []) or [])
+    return found
+
+
+class CypherPlanAnalyzer:
+    """Analyze recorded statement shapes for label scans."""
+
+    def __init__(
+        self,
+        plan_fetcher: Optional[PlanFetcher] = None,
+        known_indexes: Iterable[tuple[str, tuple[str, ...]]] = (),
+        profile: bool = False,
+    ):
+        self.plan_fetcher = plan_fetcher
+        self.profile = profile
+        self._known = {(label, props[0]) for label, props in known_indexes if props}
+
+    def is_covered(self, label: Optional[str], properties: tuple[str, ...]) -> bool:
+        return label is not None and any((label, p) in self._known for p in properties)
+
+    async def analyze(self, shapes: Iterable[StatementShape]) -> list[PlanFinding]:
+        findings: list[PlanFinding] = []
+        for shape in shapes:
+            lookups = extract_property_lookups(shape.sample)
+            plan = await self._fetch_plan(shape.sample) if self.plan_fetcher else None
+            if plan is not None:
+                findings.extend(self._from_plan(shape, plan, lookups))
+            else:
+                findings.extend(self._from_static(shape, lookups))
+        return findings
+
+    async def _fetch_plan(self, statement: str) -> Optional[dict[str, Any]]:
+        prefix = "PROFILE" if self.profile else "EXPLAIN"
+        try:
+            return await self.plan_fetcher(f"{prefix} {statement}")
+        except Exception as e:
+            logger.debug(f"Plan fetch failed, falling back to static analysis: {e}")
+            return None
+
+    def _from_plan(
+        self, shape: StatementShape, plan: dict[str, Any], lookups: list[PropertyLookup]
+    ) -> list[PlanFinding]:
+        by_var = {lookup.variable: lookup for lookup in lookups}
+        findings = []
+        for operator, details in find_scan_operators(plan):
+            var = details.split(":")[0].strip()
+            lookup = by_var.get(var)
+            if lookup is None or not lookup.properties:
+                # Full scans with no property predicate (e.g. aggregates) are not index candidates
+                continue
+            findings.append(PlanFinding(
+                shape_id=shape.shape_id,
+                operator=operator,
+                label=lookup.label,
+                properties=lookup.properties,
+                source="plan",
+                detail=details,
+                total_ms=shape.total_ms,
+                count=shape.count,
+            ))
+        return findings
+
+    def _from_static(self, shape: StatementShape, lookups: list[PropertyLookup]) -> list[PlanFinding]:
+        findings = []
+        for lookup in lookups:
+            if not lookup.properties or self.is_covered(lookup.label, lookup.properties):
+                continue
+            findings.append(PlanFinding(
+                shape_id=shape.shape_id,
+                operator="AllNodesScan" if lookup.label is None else "NodeByLabelScan",
+                label=lookup.label,
+                properties=lookup.properties,
+                source="static",
+                detail=f"({lookup.variable}{':' + lookup.label if lookup.label else ''} "
+                       f"{{{', '.join(lookup.properties)}}})",
+                total_ms=shape.total_ms,
+                count=shape.count,
+            ))
+        return findings
+
+
+def gateway_plan_fetcher() -> Optional[PlanFetcher]:
+    """
+    Build a plan fetcher that runs EXPLAIN through the Graphiti gateway.
+
+    Enabled with SCHEMA_ADVISOR_EXPLAIN=true; returns None otherwise. EXPLAIN
+    never executes the statement, so PROFILE prefixes are downgraded.
+    """
+    if os.getenv("SCHEMA_ADVISOR_EXPLAIN", "false").lower() != "true":
+        return None
+
+    async def fetch(statement: str) -> Optional[dict[str, Any]]:
+        from api.services.graphiti_service import get_graphiti_service
+
+        prefix, _, body = statement.partition(" ")
+        if prefix.upper() not in ("EXPLAIN", "PROFILE"):
+            body = statement
+        service = await get_graphiti_service()
+        return await service.explain_plan(body)
+
+    return fetch
@@ -0,0 +1,166 @@
+"""
+Index Migration Generator
+
+Turns plan findings into an idempotent index migration and applies it through
+the Graphiti gateway. BASELINE_INDEXES covers the hot lookups found across the
+services; recommendations from the analyzer are merged on top.
+
+All statements use IF NOT EXISTS, so the migration can be re-run on every start.
+Range indexes are used rather than uniqueness constraints, since existing data
+is not guaranteed to be duplicate-free.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Iterable, Optional
+
+from .analyzer import PlanFinding
+
+logger = logging.getLogger("dionysus.schema_advisor")
+
+CypherExecutor = Callable[[str, Optional[dict[str, Any]]], Awaitable[list[dict[str, Any]]]]
+
+
+@dataclass(frozen=True)
+class IndexSpec:
+    """A range index, uniqueness constraint or full-text index on one label."""
+    label: str
+    properties: tuple[str, ...]
+    unique: bool = False
+    fulltext: bool = False
+
+    @property
+    def name(self) -> str:
+        base = "_".join([self.label] + list(self.properties))
+        base = re.sub(r"(?<!^)(?=[A-Z])", "_", base).lower()
+        if self.fulltext:
+            return f"{base}_fulltext"
+        return f"{base}_unique" if self.unique else f"{base}_idx"
+
+    def to_cypher(self) -> str:
+        if self.fulltext:
+            on = ", ".join(f"n.{p}" for p in self.properties)
+            return f"CREATE FULLTEXT INDEX {self.name} IF NOT EXISTS FOR (n:{self.label}) ON EACH [{on}]"
+        if self.unique:
+            (prop,) = self.properties
+            return (
+                f"CREATE CONSTRAINT {self.name} IF NOT EXISTS "
+                f"FOR (n:{self.label}) REQUIRE n.{prop} IS UNIQUE"
+            )
+        on = ", ".join(f"n.{p}" for p in self.properties)
+        return f"CREATE INDEX {self.name} IF NOT EXISTS FOR (n:{self.label}) ON ({on})"
+
+    def covers(self, label: Optional[str], properties: tuple[str, ...]) -> bool:
+        # Full-text indexes only serve db.index.fulltext queries, not property lookups
+        return not self.fulltext and label == self.label and bool(properties) and self.properties[0] in properties
+
+
+BASELINE_INDEXES: list[IndexSpec] = [
+    # Identity lookups
+    IndexSpec("Entity", ("name",)),
+    IndexSpec("Entity", ("id",)),
+    IndexSpec("ThoughtSeed", ("id",)),
+    IndexSpec("Goal", ("id",)),
+    IndexSpec("Agent", ("id",)),
+    IndexSpec("MentalModel", ("id",)),
+    IndexSpec("MemoryCluster", ("id",)),
+    IndexSpec("AttractorBasin", ("name",)),
+    IndexSpec("AttractorBasin", ("id",)),
+    IndexSpec("Journey", ("id",)),
+    IndexSpec("Journey", ("device_id",)),
+    IndexSpec("DevelopmentEvent", ("id",)),
+    IndexSpec("DevelopmentEpisode", ("id",)),
+    IndexSpec("Episode", ("id",)),
+    IndexSpec("Trajectory", ("id",)),
+    IndexSpec("Fact", ("id",)),
+    IndexSpec("MarkovBlanket", ("id",)),
+    IndexSpec("HeartbeatState", ("singleton_id",)),
+    IndexSpec("HeartbeatLog", ("id",)),
+    IndexSpec("AgentExecutionTrace", ("id",)),
+    IndexSpec("MetaToTTrace", ("id",)),
+    IndexSpec("PredictionRecord", ("id",)),
+    IndexSpec("NetworkState", ("id",)),
+    IndexSpec("SystemMetrics", ("id",)),
+    # Filter / ordering lookups
+    IndexSpec("ThoughtSeed", ("layer",)),
+    IndexSpec("NetworkState", ("agent_id", "timestamp")),
+    IndexSpec("HeartbeatLog", ("heartbeat_number",)),
+    IndexSpec("Memory", ("memory_type",)),
+    IndexSpec("Goal", ("priority",)),
+    IndexSpec("DevelopmentEvent", ("river_stage",)),
+    # Recent predictions per agent (SelfModelingService.get_predictions)
+    IndexSpec("PredictionRecord", ("agent_id", "timestamp")),
+    IndexSpec("CognitiveEpisode", ("timestamp",)),
+    # Rolling system moment window (SystemMetricsService.read)
+    IndexSpec("SystemMetricsBucket", ("hour",)),
+    # Prediction error rollups (SelfModelingService accuracy and trend)
+    IndexSpec("PredictionErrorBucket", ("agent_id", "hour")),
+    IndexSpec("PredictionErrorRollup", ("agent_id",)),
+    # Journey timeline keyset pagination (SessionManager.get_journey_timeline)
+    IndexSpec("Session", ("journey_id", "created_at")),
+    IndexSpec("JourneyDocument", ("journey_id", "created_at")),
+    # Journey history text search (SessionManager.query_journey_history)
+    IndexSpec("Session", ("summary",), fulltext=True),
+    IndexSpec("JourneyDocument", ("title", "content"), fulltext=True),
+]
+
+
+def recommend_indexes(findings: Iterable[PlanFinding]) -> list[IndexSpec]:
+    """One index per indexable finding, on the lookup's leading property."""
+    specs: dict[tuple[str, tuple[str, ...]], IndexSpec] = {}
+    for finding in findings:
+        if not finding.indexable:
+            continue
+        spec = IndexSpec(finding.label, (finding.properties[0],))
+        specs.setdefault((spec.label, spec.properties), spec)
+    return list(specs.values())
+
+
+def generate_migration(specs: Iterable[IndexSpec]) -> list[str]:
+    """Deduplicated, deterministically ordered, idempotent schema statements."""
+    unique: dict[str, IndexSpec] = {}
+    for spec in specs:
+        unique.setdefault(spec.name, spec)
+    ordered = sorted(unique.values(), key=lambda s: (not s.unique, s.label, s.properties))
+    return [spec.to_cypher() for spec in ordered]
+
+
+def render_migration(specs: Iterable[IndexSpec]) -> str:
+    """Render the migration as a .cypher script."""
+    statements = generate_migration(specs)
+    header = "// Generated by api.services.schema_advisor - safe to re-run\n"
+    return header + "".join(f"{stmt};\n" for stmt in statements)
+
+
+async def ensure_schema(
+    execute: CypherExecutor,
+    specs: Optional[Iterable[IndexSpec]] = None,
+) -> dict[str, Any]:
+    """Apply the migration statement by statement; failures are logged, not raised."""
+    statements = generate_migration(BASELINE_INDEXES if specs is None else specs)
+    applied, failed = 0, []
+    for statement in statements:
+        try:
+            await execute(statement, None)
+            applied += 1
+        except Exception as e:
+            failed.append({"statement": statement, "error": str(e)})
+            logger.warning(f"Schema statement failed: {statement} ({e})")
+    return {"applied": applied, "failed": failed, "total": len(statements)}
+
+
+async def ensure_graph_schema() -> dict[str, Any]:
+    """Startup hook: ensure the baseline migration through the Graphiti gateway."""
+    if os.getenv("DIONYSUS_ENSURE_SCHEMA", "true").lower() != "true":
+        return {"applied": 0, "failed": [], "total": 0, "skipped": True}
+
+    from api.services.graphiti_service import get_graphiti_service
+
+    graphiti = await get_graphiti_service()
+    result = await ensure_schema(graphiti.execute_cypher)
+    logger.info(f"Schema ensured: {result['applied']}/{result['total']} statements applied")
+    return result
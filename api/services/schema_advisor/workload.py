@@ -0,0 +1,157 @@
+"""
+Cypher Workload Recorder
+
+Records every statement passing through GraphitiService.execute_cypher with its
+timing, grouped by normalized statement shape (literals stripped, whitespace
+collapsed), so the index advisor can see which query shapes dominate.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+_COMMENT_RE = re.compile(r"//[^\n]*")
+_STRING_RE = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"")
+_NUMBER_RE = re.compile(r"(?<![\w$.])-?\d+(?:\.\d+)?\b")
+_WS_RE = re.compile(r"\s+")
+
+DEFAULT_MAX_SHAPES = 512
+
+
+def normalize_statement(statement: str) -> str:
+    """Reduce a Cypher statement to its shape: no comments, literals or extra whitespace."""
+    shape = _COMMENT_RE.sub(" ", statement)
+    shape = _STRING_RE.sub("?", shape)
+    shape = _NUMBER_RE.sub("?", shape)
+    return _WS_RE.sub(" ", shape).strip()
+
+
+def shape_id_for(shape: str) -> str:
+    return hashlib.sha1(shape.encode()).hexdigest()[:12]
+
+
+@dataclass
+class StatementShape:
+    """Aggregated timing for one normalized statement shape."""
+    shape_id: str
+    shape: str
+    sample: str
+    count: int = 0
+    errors: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    last_seen: float = field(default_factory=time.time)
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "shape_id": self.shape_id,
+            "shape": self.shape,
+            "count": self.count,
+            "errors": self.errors,
+            "total_ms": round(self.total_ms, 3),
+            "mean_ms": round(self.mean_ms, 3),
+            "max_ms": round(self.max_ms, 3),
+            "last_seen": self.last_seen,
+        }
+
+
+class CypherWorkloadRecorder:
+    """
+    Thread-safe, bounded aggregation of the gateway's Cypher workload.
+
+    When `max_shapes` distinct shapes are tracked, the shape with the least
+    total time is evicted to make room for a new one.
+    """
+
+    def __init__(self, max_shapes: int = DEFAULT_MAX_SHAPES, enabled: bool = True):
+        self.max_shapes = max_shapes
+        self.enabled = enabled
+        self._shapes: dict[str, StatementShape] = {}
+        self._shape_cache: dict[str, tuple[str, str]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, statement: str, duration_ms: float, error: bool = False) -> Optional[str]:
+        """Record one execution; returns the statement's shape id."""
+        if not self.enabled:
+            return None
+        return self._add(statement, 1, duration_ms, duration_ms, 1 if error else 0)
+
+    def record_batch(self, calls: Iterable[tuple[str, float, bool]]) -> None:
+        """Record many (statement, duration_ms, error) executions, one update per statement."""
+        if not self.enabled:
+            return
+        totals: dict[str, list] = {}
+        for statement, duration_ms, error in calls:
+            agg = totals.get(statement)
+            if agg is None:
+                totals[statement] = [1, duration_ms, duration_ms, 1 if error else 0]
+            else:
+                agg[0] += 1
+                agg[1] += duration_ms
+                if duration_ms > agg[2]:
+                    agg[2] = duration_ms
+                if error:
+                    agg[3] += 1
+        for statement, (count, total_ms, max_ms, errors) in totals.items():
+            self._add(statement, count, total_ms, max_ms, errors)
+
+    def _shape_of(self, statement: str) -> tuple[str, str]:
+        cached = self._shape_cache.get(statement)
+        if cached is None:
+            shape = normalize_statement(statement)
+            cached = (shape, shape_id_for(shape))
+            if len(self._shape_cache) < self.max_shapes * 4:
+                self._shape_cache[statement] = cached
+        return cached
+
+    def _add(self, statement: str, count: int, total_ms: float, max_ms: float, errors: int) -> str:
+        shape, sid = self._shape_of(statement)
+        with self._lock:
+            entry = self._shapes.get(sid)
+            if entry is None:
+                if len(self._shapes) >= self.max_shapes:
+                    coldest = min(self._shapes.values(), key=lambda s: s.total_ms)
+                    del self._shapes[coldest.shape_id]
+                entry = StatementShape(shape_id=sid, shape=shape, sample=statement)
+                self._shapes[sid] = entry
+            entry.count += count
+            entry.total_ms += total_ms
+            entry.max_ms = max(entry.max_ms, max_ms)
+            entry.last_seen = time.time()
+            entry.errors += errors
+        return sid
+
+    def shapes(self, limit: Optional[int] = None) -> list[StatementShape]:
+        """Tracked shapes, hottest (most total time) first."""
+        with self._lock:
+            ranked = sorted(self._shapes.values(), key=lambda s: s.total_ms, reverse=True)
+        return ranked[:limit] if limit else ranked
+
+    def reset(self) -> None:
+        with self._lock:
+            self._shapes.clear()
+            self._shape_cache.clear()
+
+
+_recorder: Optional[CypherWorkloadRecorder] = None
+
+
+def get_workload_recorder() -> CypherWorkloadRecorder:
+    """Process-wide recorder shared by every GraphitiService instance."""
+    global _recorder
+    if _recorder is None:
+        import os
+
+        _recorder = CypherWorkloadRecorder(
+            enabled=os.getenv("CYPHER_WORKLOAD_RECORDING", "true").lower() == "true",
+        )
+    return _recorder
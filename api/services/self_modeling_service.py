@@ -1,17 +1,116 @@
 """
 Self-Modeling Service - Predicts and resolves agent internal states.
+
+Prediction errors are rolled up as they are resolved: one
+(:PredictionErrorBucket {agent_id, hour}) per agent and hour of the
+prediction timestamp holds count, sum, sum of squares, min, max and a
+log-spaced histogram (quantile sketch). Accuracy for a window and the error
+trend combine buckets instead of scanning PredictionRecord nodes, so they are
+accurate to the hour. Rollups predating this are rebuilt once per agent
+(marked by a (:PredictionErrorRollup) node) on the first read; the rebuild
+only MERGEs and SETs buckets, zeroing hours it finds no predictions for.
 """
 
 import logging
-from typing import Dict, Optional
+import math
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
 from datetime import datetime, timedelta
 
 import numpy as np
-from api.models.prediction import PredictionRecord, PredictionAccuracy
+from api.models.prediction import PredictionRecord, PredictionAccuracy, PredictionErrorTrendPoint
+from api.services.cypher_statements import gate_blocked
 from api.services.webhook_neo4j_driver import get_neo4j_driver
 
 logger = logging.getLogger("dionysus.self_modeling")
 
+# Quantile sketch: bin 0 holds errors below SKETCH_MIN_ERROR, bin i >= 1 holds
+# [MIN * GAMMA^(i-1), MIN * GAMMA^i); the last bin absorbs everything above.
+# GAMMA = 1.2 keeps quantiles within ~10% of the true value.
+SKETCH_MIN_ERROR = 1e-4
+SKETCH_GAMMA = 1.2
+SKETCH_BINS = 80
+
+
+def error_bin(error: float) -> int:
+    if error < SKETCH_MIN_ERROR:
+        return 0
+    return min(SKETCH_BINS - 1, 1 + int(math.log(error / SKETCH_MIN_ERROR) / math.log(SKETCH_GAMMA)))
+
+
+def hour_key(timestamp: datetime) -> str:
+    """Bucket key: the ISO timestamp truncated to the hour ("YYYY-MM-DDTHH")."""
+    return timestamp.isoformat()[:13]
+
+
+@dataclass
+class ErrorRollup:
+    """Mergeable error summary for one or more buckets."""
+    count: int = 0
+    total: float = 0.0
+    total_sq: float = 0.0
+    min: float = math.inf
+    max: float = 0.0
+    bins: List[int] = field(default_factory=lambda: [0] * SKETCH_BINS)
+
+    def add(self, error: float) -> None:
+        self.count += 1
+        self.total += error
+        self.total_sq += error * error
+        self.min = min(self.min, error)
+        self.max = max(self.max, error)
+        self.bins[error_bin(error)] += 1
+
+    def merge(self, bucket: Dict[str, Any]) -> None:
+        """Fold in a bucket row (count, sum, sum_sq, min, max, bins)."""
+        count = int(bucket.get("count") or 0)
+        if not count:
+            return
+        self.count += count
+        self.total += float(bucket.get("sum") or 0.0)
+        self.total_sq += float(bucket.get("sum_sq") or 0.0)
+        self.min = min(self.min, float(bucket.get("min") or 0.0))
+        self.max = max(self.max, float(bucket.get("max") or 0.0))
+        for i, n in enumerate((bucket.get("bins") or [])[:SKETCH_BINS]):
+            self.bins[i] += int(n)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    @property
+    def variance(self) -> float:
+        if self.count < 2:
+            return 0.0
+        return max(0.0, (self.total_sq - self.total * self.total / self.count) / (self.count - 1))
+
+    def quantile(self, q: float) -> float:
+        """Approximate q-quantile: geometric midpoint of the bin holding it."""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for i, n in enumerate(self.bins):
+            seen += n
+            if n and seen >= target:
+                value = 0.0 if i == 0 else SKETCH_MIN_ERROR * SKETCH_GAMMA ** (i - 0.5)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+# Appended to the resolve write: adds the error to its (agent, hour) bucket
+_ROLLUP_FRAGMENT = """
+MERGE (b:PredictionErrorBucket {agent_id: $agent_id, hour: $hour})
+ON CREATE SET b.count = 0, b.sum = 0.0, b.sum_sq = 0.0, b.min = $error, b.max = $error,
+              b.bins = [i IN range(1, $sketch_bins) | 0]
+SET b.count = b.count + 1,
+    b.sum = b.sum + $error,
+    b.sum_sq = b.sum_sq + $error * $error,
+    b.min = CASE WHEN b.min IS NULL OR $error < b.min THEN $error ELSE b.min END,
+    b.max = CASE WHEN $error > b.max THEN $error ELSE b.max END,
+    b.bins = [i IN range(0, size(b.bins) - 1) | b.bins[i] + CASE WHEN i = $bin THEN 1 ELSE 0 END]
+"""
+
+
 class SelfModelingService:
     def __init__(self, driver=None):
         self.driver = driver or get_neo4j_driver()
@@ -41,19 +140,28 @@ class SelfModelingService:
             # Calculate L2 error (T031)
             error = self._calculate_l2_error(predicted, actual_state)
             
-            update_cypher = """
-            MATCH (p:PredictionRecord {id: $id})
+            # Resolve and roll the error into its hourly bucket in one write;
+            # re-resolving a prediction updates it without counting it twice
+            update_cypher = f"""
+            MATCH (p:PredictionRecord {{id: $id}})
+            WITH p, p.resolved_at IS NULL AS first_resolution
             SET p.actual_state = $actual,
                 p.prediction_error = $error,
                 p.resolved_at = datetime()
-            RETURN p
+            WITH p, first_resolution
+            WHERE first_resolution
+            {_ROLLUP_FRAGMENT}
             """
             await session.run(update_cypher, {
                 "id": prediction_id,
                 "actual": actual_state,
-                "error": error
+                "error": error,
+                "agent_id": p_data["agent_id"],
+                "hour": str(p_data["timestamp"])[:13],
+                "bin": error_bin(error),
+                "sketch_bins": SKETCH_BINS,
             })
-            
+
             return PredictionRecord(
                 id=prediction_id,
                 agent_id=p_data["agent_id"],
@@ -78,32 +186,135 @@ class SelfModelingService:
         window_hours: int = 24
     ) -> PredictionAccuracy:
         """Get time-windowed accuracy metrics for an agent (T032)."""
-        window_start = datetime.utcnow() - timedelta(hours=window_hours)
+        window_end = datetime.utcnow()
+        window_start = window_end - timedelta(hours=window_hours)
+
+        rollup = ErrorRollup()
+        for bucket in await self._read_buckets(agent_id, window_start):
+            rollup.merge(bucket)
+
+        return PredictionAccuracy(
+            agent_id=agent_id,
+            average_error=rollup.mean,
+            sample_count=rollup.count,
+            window_start=window_start,
+            window_end=window_end,
+            error_variance=rollup.variance,
+            min_error=rollup.min if rollup.count else 0.0,
+            max_error=rollup.max,
+            p50_error=rollup.quantile(0.5),
+            p90_error=rollup.quantile(0.9),
+            p99_error=rollup.quantile(0.99),
+        )
 
+    async def get_error_trend(
+        self,
+        agent_id: str,
+        window_hours: int = 24,
+        step_hours: int = 1
+    ) -> list[PredictionErrorTrendPoint]:
+        """Prediction error per step over the window, oldest first; empty steps have zero samples."""
+        now = datetime.utcnow()
+        first_step = (now - timedelta(hours=window_hours - 1)).replace(minute=0, second=0, microsecond=0)
+        steps = [
+            first_step + timedelta(hours=h)
+            for h in range(0, window_hours, step_hours)
+        ]
+        rollups = [ErrorRollup() for _ in steps]
+        for bucket in await self._read_buckets(agent_id, first_step):
+            try:
+                hour = datetime.fromisoformat(f"{bucket['hour']}:00")
+            except (KeyError, TypeError, ValueError):
+                continue
+            index = int((hour - first_step).total_seconds() // 3600) // step_hours
+            if 0 <= index < len(rollups):
+                rollups[index].merge(bucket)
+
+        return [
+            PredictionErrorTrendPoint(
+                bucket_start=start,
+                sample_count=rollup.count,
+                average_error=rollup.mean,
+                p90_error=rollup.quantile(0.9),
+            )
+            for start, rollup in zip(steps, rollups)
+        ]
+
+    async def _read_buckets(self, agent_id: str, since: datetime) -> list[Dict[str, Any]]:
+        """Error buckets for an agent from the hour containing `since` onward."""
         cypher = """
-        MATCH (p:PredictionRecord {agent_id: $agent_id})
-        WHERE p.resolved_at IS NOT NULL
-          AND datetime(p.timestamp) >= datetime($window_start)
-        RETURN avg(p.prediction_error) as avg_error,
-               count(p) as sample_count
+        OPTIONAL MATCH (r:PredictionErrorRollup {agent_id: $agent_id})
+        OPTIONAL MATCH (b:PredictionErrorBucket {agent_id: $agent_id})
+        WHERE b.hour >= $since_hour
+        RETURN r.rebuilt_at AS rebuilt_at,
+               collect(b {.hour, .count, .sum, .sum_sq, .min, .max, .bins}) AS buckets
         """
+        params = {"agent_id": agent_id, "since_hour": hour_key(since)}
         async with self.driver.session() as session:
-            result = await session.run(cypher, {
-                "agent_id": agent_id,
-                "window_start": window_start.isoformat()
-            })
+            result = await session.run(cypher, params)
             record = await result.single()
+            if record and not record["rebuilt_at"]:
+                await self.rebuild_error_rollups(agent_id)
+                result = await session.run(cypher, params)
+                record = await result.single()
+        return list(record["buckets"] or []) if record else []
+
+    async def rebuild_error_rollups(self, agent_id: str) -> int:
+        """
+        Recompute an agent's error buckets from its resolved predictions.
+
+        Returns the number of predictions rolled up.
+        """
+        async with self.driver.session() as session:
+            result = await session.run(
+                """
+                MATCH (p:PredictionRecord {agent_id: $agent_id})
+                WHERE p.prediction_error IS NOT NULL
+                RETURN p.timestamp AS timestamp, p.prediction_error AS error
+                """,
+                {"agent_id": agent_id},
+            )
+            rows = await result.data()
 
-            avg_error = record["avg_error"] if record and record["avg_error"] else 0.0
-            sample_count = record["sample_count"] if record else 0
+            rollups: Dict[str, ErrorRollup] = {}
+            for row in rows:
+                if not row.get("timestamp") or row.get("error") is None:
+                    continue
+                rollups.setdefault(str(row["timestamp"])[:13], ErrorRollup()).add(float(row["error"]))
 
-            return PredictionAccuracy(
-                agent_id=agent_id,
-                average_error=float(avg_error),
-                sample_count=int(sample_count),
-                window_start=window_start,
-                window_end=datetime.utcnow()
+            # MERGE/SET only (no DELETE, so the Destruction Gate lets it through):
+            # hours without resolved predictions are zeroed rather than removed
+            result = await session.run(
+                """
+                MERGE (r:PredictionErrorRollup {agent_id: $agent_id})
+                SET r.rebuilt_at = $now
+                WITH r
+                OPTIONAL MATCH (stale:PredictionErrorBucket {agent_id: $agent_id})
+                WHERE NOT stale.hour IN $hours
+                SET stale.count = 0, stale.sum = 0.0, stale.sum_sq = 0.0,
+                    stale.min = null, stale.max = 0.0, stale.bins = [i IN range(1, $sketch_bins) | 0]
+                WITH count(*) AS zeroed
+                UNWIND $buckets AS bucket
+                MERGE (b:PredictionErrorBucket {agent_id: $agent_id, hour: bucket.hour})
+                SET b.count = bucket.count, b.sum = bucket.sum, b.sum_sq = bucket.sum_sq,
+                    b.min = bucket.min, b.max = bucket.max, b.bins = bucket.bins
+                """,
+                {
+                    "agent_id": agent_id,
+                    "now": datetime.utcnow().isoformat(),
+                    "hours": sorted(rollups),
+                    "sketch_bins": SKETCH_BINS,
+                    "buckets": [
+                        {"hour": hour, "count": r.count, "sum": r.total, "sum_sq": r.total_sq,
+                         "min": r.min, "max": r.max, "bins": r.bins}
+                        for hour, r in rollups.items()
+                    ],
+                },
             )
+            if gate_blocked(await result.data()):
+                logger.error(f"Error rollup rebuild for {agent_id} was blocked by the Destruction Gate")
+                return 0
+        return sum(r.count for r in rollups.values())
 
     async def get_predictions(
         self,
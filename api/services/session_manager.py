@@ -9,8 +9,10 @@ Provides operations for creating/retrieving journeys, sessions, and documents.
 Database: Neo4j via Graphiti-backed driver
 """
 
+import base64
 import json
 import logging
+import re
 import time
 import asyncio
 from datetime import datetime
@@ -28,6 +30,9 @@ from api.models.journey import (
     JourneyHistoryResponse,
     TimelineEntry,
     JourneyTimelineResponse,
+    JourneyDocument,
+    JourneyDocumentCreate,
+    DocumentSummary,
 )
 from api.services.remote_sync import get_neo4j_driver
 
@@ -98,6 +103,90 @@ class JourneyNotFoundError(SessionManagerError):
     pass
 
 
+class InvalidCursorError(SessionManagerError):
+    """Raised when a timeline cursor cannot be decoded."""
+    pass
+
+
+# =============================================================================
+# Timeline Keyset Pagination
+# =============================================================================
+
+# Sessions and documents are merged in the database on the key
+# (created_at, entry_type, entry_id); a cursor is that key for one entry.
+# __CMP__ / __ORDER__ are filled in per paging direction.
+_TIMELINE_CYPHER = """
+CALL {
+    MATCH (s:Session {journey_id: $journey_id})
+    WHERE $cursor_at IS NULL
+       OR s.created_at __CMP__ datetime($cursor_at)
+       OR (s.created_at = datetime($cursor_at)
+           AND ('session' __CMP__ $cursor_type OR ('session' = $cursor_type AND s.id __CMP__ $cursor_id)))
+    RETURN 'session' AS entry_type, s.id AS entry_id, s.created_at AS created_at,
+           s.summary AS summary, s.diagnosis IS NOT NULL AS has_diagnosis,
+           null AS document_type, null AS title
+    ORDER BY created_at __ORDER__, entry_id __ORDER__
+    LIMIT $fetch
+    UNION ALL
+    MATCH (d:JourneyDocument {journey_id: $journey_id})
+    WHERE $include_documents
+      AND ($cursor_at IS NULL
+           OR d.created_at __CMP__ datetime($cursor_at)
+           OR (d.created_at = datetime($cursor_at)
+               AND ('document' __CMP__ $cursor_type OR ('document' = $cursor_type AND d.id __CMP__ $cursor_id))))
+    RETURN 'document' AS entry_type, d.id AS entry_id, d.created_at AS created_at,
+           null AS summary, false AS has_diagnosis,
+           d.document_type AS document_type, d.title AS title
+    ORDER BY created_at __ORDER__, entry_id __ORDER__
+    LIMIT $fetch
+}
+RETURN entry_type, entry_id, created_at, summary, has_diagnosis, document_type, title
+ORDER BY created_at __ORDER__, entry_type __ORDER__, entry_id __ORDER__
+LIMIT $fetch
+"""
+
+TIMELINE_CYPHER = {
+    "forward": _TIMELINE_CYPHER.replace("__CMP__", ">").replace("__ORDER__", "ASC"),
+    "backward": _TIMELINE_CYPHER.replace("__CMP__", "<").replace("__ORDER__", "DESC"),
+}
+
+
+def encode_timeline_cursor(created_at: Any, entry_type: str, entry_id: Any) -> str:
+    """Opaque cursor for a timeline entry's sort key."""
+    created = created_at if isinstance(created_at, str) else created_at.isoformat()
+    raw = json.dumps([created, entry_type, str(entry_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_timeline_cursor(cursor: str) -> tuple[str, str, str]:
+    """Inverse of encode_timeline_cursor: (created_at, entry_type, entry_id)."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, entry_type, entry_id = json.loads(raw)
+        if not all(isinstance(v, str) for v in (created_at, entry_type, entry_id)):
+            raise ValueError("cursor fields must be strings")
+    except Exception as e:
+        raise InvalidCursorError(f"Invalid timeline cursor: {e}") from e
+    return created_at, entry_type, entry_id
+
+
+_LUCENE_SPECIAL = re.compile(r'([+\-&|!(){}\[\]^"~*?:\\/])')
+
+
+def _fulltext_query(text: str) -> str:
+    """Escape free text for db.index.fulltext.queryNodes (terms are OR-ed)."""
+    return _LUCENE_SPECIAL.sub(r"\\\1", text.strip())
+
+
+def _to_datetime(value: Any) -> datetime:
+    """Neo4j DateTime, ISO string or datetime as a datetime."""
+    if hasattr(value, "to_native"):
+        return value.to_native()
+    if isinstance(value, str):
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    return value
+
+
 # =============================================================================
 # Session Manager Service (T009)
 # =============================================================================
@@ -322,71 +411,117 @@ class SessionManager:
         self,
         journey_id: UUID,
         limit: int = 50,
-        include_documents: bool = False
+        include_documents: bool = False,
+        cursor: Optional[str] = None,
+        direction: str = "forward",
     ) -> JourneyTimelineResponse:
         """
         Get sessions (and optionally documents) in chronological order.
+
+        Pages with keyset cursors rather than offsets: "forward" returns the
+        entries after `cursor` (from the start of the journey without one),
+        "backward" the entries before it (the most recent page without one).
+        Entries are oldest first either way; pass next_cursor / prev_cursor
+        from the response to continue. Sessions and documents are merged and
+        limited in the database, so each page is one bounded query.
+
+        Raises:
+            InvalidCursorError: If cursor cannot be decoded
+            ValueError: If direction is not "forward" or "backward"
         """
+        if direction not in TIMELINE_CYPHER:
+            raise ValueError(f"direction must be 'forward' or 'backward', got {direction!r}")
+        cursor_at, cursor_type, cursor_id = decode_timeline_cursor(cursor) if cursor else (None, None, None)
+        start_time = time.perf_counter()
+
+        try:
+            result = await self._driver.execute_query(TIMELINE_CYPHER[direction], {
+                "journey_id": str(journey_id),
+                "include_documents": include_documents,
+                "cursor_at": cursor_at,
+                "cursor_type": cursor_type,
+                "cursor_id": cursor_id,
+                # One extra row tells whether another page exists
+                "fetch": limit + 1,
+            })
+        except Exception as e:
+            logger.error(f"Error getting timeline: {e}")
+            return JourneyTimelineResponse(journey_id=journey_id, entries=[], total_entries=0)
+
+        rows = list(result or [])
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        if direction == "backward":
+            rows.reverse()
+
+        entries = [
+            TimelineEntry(
+                entry_type=row["entry_type"],
+                entry_id=UUID(row["entry_id"]),
+                created_at=_to_datetime(row["created_at"]),
+                summary=row.get("summary"),
+                has_diagnosis=bool(row.get("has_diagnosis")),
+                document_type=row.get("document_type"),
+                title=row.get("title"),
+            )
+            for row in rows
+        ]
+        log_journey_operation(
+            "timeline_queried", journey_id,
+            duration_ms=measure_duration(start_time),
+            entries=len(entries), direction=direction
+        )
+
+        def _cursor(row):
+            return encode_timeline_cursor(row["created_at"], row["entry_type"], row["entry_id"])
+
+        return JourneyTimelineResponse(
+            journey_id=journey_id,
+            entries=entries,
+            total_entries=len(entries),
+            next_cursor=_cursor(rows[-1]) if rows else cursor,
+            prev_cursor=_cursor(rows[0]) if rows else cursor,
+            has_more=has_more,
+        )
+
+    async def add_document_to_journey(self, document: JourneyDocumentCreate) -> JourneyDocument:
+        """Create a document linked to a journey."""
+        document_id = str(uuid4())
         cypher = """
         MATCH (j:Journey {id: $journey_id})
-        OPTIONAL MATCH (j)-[:HAS_SESSION]->(s:Session)
-        WITH j, s
-        ORDER BY s.created_at ASC
-        LIMIT $limit
-        
-        OPTIONAL MATCH (j)-[:HAS_DOCUMENT]->(d:JourneyDocument)
-        WITH j, collect(s) as sessions, collect(d) as docs
-        RETURN sessions, docs
+        CREATE (d:JourneyDocument {
+            id: $document_id,
+            journey_id: $journey_id,
+            document_type: $document_type,
+            title: $title,
+            content: $content,
+            metadata: $metadata,
+            created_at: datetime()
+        })
+        CREATE (j)-[:HAS_DOCUMENT]->(d)
+        RETURN d
         """
-        
         try:
             result = await self._driver.execute_query(cypher, {
-                "journey_id": str(journey_id),
-                "limit": limit
+                "journey_id": str(document.journey_id),
+                "document_id": document_id,
+                "document_type": document.document_type,
+                "title": document.title,
+                "content": document.content,
+                "metadata": json.dumps(document.metadata),
             })
-            
-            if not result:
-                return JourneyTimelineResponse(journey_id=journey_id, entries=[], total_entries=0)
-            
-            row = result[0]
-            sessions = row.get("sessions", [])
-            docs = row.get("docs", [])
-            
-            entries: list[TimelineEntry] = []
-            
-            for s in sessions:
-                if s:
-                    entries.append(TimelineEntry(
-                        entry_type="session",
-                        entry_id=UUID(s["id"]),
-                        created_at=datetime.fromisoformat(s["created_at"].replace('Z', '+00:00')) if isinstance(s["created_at"], str) else s["created_at"],
-                        summary=s["summary"],
-                        has_diagnosis=s.get("diagnosis") is not None
-                    ))
-            
-            if include_documents:
-                for d in docs:
-                    if d:
-                        entries.append(TimelineEntry(
-                            entry_type="document",
-                            entry_id=UUID(d["id"]),
-                            created_at=datetime.fromisoformat(d["created_at"].replace('Z', '+00:00')) if isinstance(d["created_at"], str) else d["created_at"],
-                            document_type=d["document_type"],
-                            title=d["title"]
-                        ))
-            
-            # Sort all entries by created_at
-            entries.sort(key=lambda e: e.created_at)
-            entries = entries[:limit]
-            
-            return JourneyTimelineResponse(
-                journey_id=journey_id,
-                entries=entries,
-                total_entries=len(entries)
-            )
         except Exception as e:
-            logger.error(f"Error getting timeline: {e}")
-            return JourneyTimelineResponse(journey_id=journey_id, entries=[], total_entries=0)
+            logger.error(f"Error adding document: {e}")
+            raise DatabaseUnavailableError(f"Database error: {e}")
+
+        if not result:
+            raise JourneyNotFoundError(f"Journey {document.journey_id} not found")
+        d_node = result[0]["d"]
+        return JourneyDocument(
+            **document.model_dump(),
+            id=UUID(d_node["id"]),
+            created_at=_to_datetime(d_node["created_at"]),
+        )
 
     # =========================================================================
     # Query Operations (T026, T027, T028)
@@ -397,44 +532,110 @@ class SessionManager:
         query: JourneyHistoryQuery
     ) -> JourneyHistoryResponse:
         """
-        Search journey history. In Neo4j, we use text search on properties.
-        """
-        cypher = """
-        MATCH (j:Journey {id: $journey_id})-[:HAS_SESSION]->(s:Session)
-        WHERE ($query IS NULL OR s.summary CONTAINS $query)
-        RETURN s
-        ORDER BY s.created_at DESC
-        LIMIT $limit
+        Search journey history.
+
+        Keyword queries go through the session_summary_fulltext index (and
+        journey_document_title_content_fulltext for documents), ranked by
+        relevance; without a query, the most recent sessions come from the
+        (journey_id, created_at) index. Falls back to a CONTAINS scan if the
+        full-text indexes are missing.
         """
-        
+        start_time = time.perf_counter()
+        params = {
+            "journey_id": str(query.journey_id),
+            "search": _fulltext_query(query.query) if query.query else None,
+            "query": query.query,
+            "from_date": query.from_date.isoformat() if query.from_date else None,
+            "to_date": query.to_date.isoformat() if query.to_date else None,
+            "limit": query.limit,
+        }
+
         try:
-            result = await self._driver.execute_query(cypher, {
-                "journey_id": str(query.journey_id),
-                "query": query.query,
-                "limit": query.limit
-            })
-            
-            sessions = [
-                SessionSummary(
-                    session_id=UUID(row["s"]["id"]),
-                    created_at=datetime.fromisoformat(row["s"]["created_at"].replace('Z', '+00:00')) if isinstance(row["s"]["created_at"], str) else row["s"]["created_at"],
-                    summary=row["s"]["summary"],
-                    has_diagnosis=row["s"].get("diagnosis") is not None,
-                    relevance_score=1.0 if query.query else None
-                )
-                for row in result
-            ]
-            
-            return JourneyHistoryResponse(
-                journey_id=query.journey_id,
-                sessions=sessions,
-                documents=[],
-                total_results=len(sessions)
-            )
+            session_rows = await self._search_history("Session", params)
+            document_rows = await self._search_history("JourneyDocument", params) if query.include_documents else []
         except Exception as e:
             logger.error(f"Error querying history: {e}")
             return JourneyHistoryResponse(journey_id=query.journey_id, sessions=[], documents=[], total_results=0)
 
+        top_score = max((row.get("score") or 0.0 for row in session_rows), default=0.0)
+        sessions = [
+            SessionSummary(
+                session_id=UUID(row["n"]["id"]),
+                created_at=_to_datetime(row["n"]["created_at"]),
+                summary=row["n"].get("summary"),
+                has_diagnosis=row["n"].get("diagnosis") is not None,
+                # Full-text scores are unbounded; report them relative to the best hit
+                relevance_score=(
+                    (row.get("score") or 0.0) / top_score if top_score else 1.0
+                ) if query.query else None
+            )
+            for row in session_rows
+        ]
+        documents = [
+            DocumentSummary(
+                document_id=UUID(row["n"]["id"]),
+                document_type=row["n"]["document_type"],
+                title=row["n"].get("title"),
+                created_at=_to_datetime(row["n"]["created_at"]),
+            )
+            for row in document_rows
+        ]
+        log_journey_operation(
+            "history_queried", query.journey_id,
+            duration_ms=measure_duration(start_time),
+            results=len(sessions) + len(documents)
+        )
+
+        return JourneyHistoryResponse(
+            journey_id=query.journey_id,
+            sessions=sessions,
+            documents=documents,
+            total_results=len(sessions) + len(documents)
+        )
+
+    async def _search_history(self, label: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Rows of (n, score) for one label, newest first or by relevance."""
+        date_filter = """
+        n.journey_id = $journey_id
+          AND ($from_date IS NULL OR n.created_at >= datetime($from_date))
+          AND ($to_date IS NULL OR n.created_at <= datetime($to_date))
+        """
+        if params["search"] is None:
+            cypher = f"""
+            MATCH (n:{label})
+            WHERE {date_filter}
+            RETURN n, null AS score
+            ORDER BY n.created_at DESC
+            LIMIT $limit
+            """
+            return list(await self._driver.execute_query(cypher, params) or [])
+
+        index = "session_summary_fulltext" if label == "Session" else "journey_document_title_content_fulltext"
+        cypher = f"""
+        CALL db.index.fulltext.queryNodes('{index}', $search) YIELD node AS n, score
+        WHERE {date_filter}
+        RETURN n, score
+        ORDER BY score DESC, n.created_at DESC
+        LIMIT $limit
+        """
+        try:
+            return list(await self._driver.execute_query(cypher, params) or [])
+        except Exception as e:
+            logger.warning(f"Full-text search on {label} failed, falling back to CONTAINS: {e}")
+
+        text_match = (
+            "toLower(n.summary) CONTAINS toLower($query)" if label == "Session"
+            else "(toLower(n.title) CONTAINS toLower($query) OR toLower(n.content) CONTAINS toLower($query))"
+        )
+        cypher = f"""
+        MATCH (n:{label})
+        WHERE {date_filter} AND {text_match}
+        RETURN n, 1.0 AS score
+        ORDER BY n.created_at DESC
+        LIMIT $limit
+        """
+        return list(await self._driver.execute_query(cypher, params) or [])
+
     # =========================================================================
     # Summary Generation (T026)
     # =========================================================================
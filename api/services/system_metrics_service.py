@@ -0,0 +1,305 @@
+"""
+System Metrics Service
+
+Incrementally maintained aggregates behind MetaEvolutionService system moments.
+
+Writers of Memory, CognitiveEpisode and Goal nodes bump a single
+(:SystemMetrics) counter node and hourly (:SystemMetricsBucket) nodes, so a
+capture reads precomputed values instead of counting and scanning the graph.
+Memory and episode writers append count_created_memory() /
+count_recorded_episode() to their own write; goal writers call
+record_goal_touched().
+
+    memory_count     total Memory nodes
+    buckets          per-hour episode count, surprise sum and success count;
+                     the rolling 24-hour window sums the buckets after the
+                     cutoff hour, so it is accurate to the hour
+    focus_*          the current focus goal (most recently touched active goal,
+                     else queued); marked stale when that goal leaves the
+                     active/queued set, and recomputed on the next read
+
+Basin strengths are read live in the same round trip; the named attractor
+basins are a small fixed set.
+
+Recording is best-effort; reconcile() recounts everything from the graph and
+reports the drift it corrected. The background worker runs it periodically,
+and read() callers run it when the counters were never seeded.
+"""
+
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from api.services.cypher_statements import gate_blocked
+from api.services.webhook_neo4j_driver import get_neo4j_driver
+
+logger = logging.getLogger("dionysus.system_metrics")
+
+METRICS_ID = "system"
+WINDOW_HOURS = 24
+
+def count_created_memory(alias: str) -> str:
+    """
+    Cypher appended to a write of one Memory node (bound to `alias`) that
+    bumps the memory count in the same round trip.
+    """
+    return f"""
+WITH {alias}
+MERGE (metrics:SystemMetrics {{id: '{METRICS_ID}'}})
+ON CREATE SET metrics.memory_count = 0
+SET metrics.memory_count = metrics.memory_count + 1
+"""
+
+
+def count_recorded_episode(alias: str) -> str:
+    """
+    Cypher appended to a write of one CognitiveEpisode (bound to `alias`)
+    that adds it to its hourly bucket in the same round trip.
+    """
+    return f"""
+WITH {alias} AS episode
+MERGE (bucket:SystemMetricsBucket {{hour: substring(episode.timestamp, 0, 13)}})
+ON CREATE SET bucket.episodes = 0, bucket.surprise_sum = 0.0, bucket.success_sum = 0
+SET bucket.episodes = bucket.episodes + 1,
+    bucket.surprise_sum = bucket.surprise_sum + coalesce(episode.surprise_score, 0.0),
+    bucket.success_sum = bucket.success_sum + CASE WHEN episode.success THEN 1 ELSE 0 END
+"""
+
+
+_FOCUS_QUERY = """
+MATCH (g:Goal)
+WHERE g.priority IN ['active', 'queued']
+RETURN g.id as goal_id, g.title as title, g.priority as priority
+ORDER BY CASE g.priority WHEN 'active' THEN 0 ELSE 1 END, g.last_touched DESC
+LIMIT 1
+"""
+
+
+def hour_key(timestamp: datetime) -> str:
+    """Bucket key: the ISO timestamp truncated to the hour ("YYYY-MM-DDTHH")."""
+    return timestamp.isoformat()[:13]
+
+
+class SystemMetricsService:
+    """Maintains and reads the precomputed system moment aggregates."""
+
+    def __init__(self, driver=None):
+        self._driver = driver
+
+    def _get_driver(self):
+        return self._driver or get_neo4j_driver()
+
+    # =========================================================================
+    # Write-side hooks
+    # =========================================================================
+
+    async def record_goal_touched(self, goal_id: str) -> None:
+        """
+        Update the focus after a goal write (including deletion).
+
+        Every goal write moves last_touched to now, so a touched active goal
+        always becomes the focus, and a touched queued goal does unless an
+        active goal holds it. When the focus goal itself drops in priority
+        or disappears, the focus is marked stale for the next read.
+        """
+        await self._execute(
+            """
+            MERGE (s:SystemMetrics {id: $metrics_id})
+            WITH s
+            OPTIONAL MATCH (g:Goal {id: $goal_id})
+            WITH s, g,
+                 coalesce(g.priority IN ['active', 'queued'], false) AS eligible,
+                 CASE g.priority WHEN 'active' THEN 0 ELSE 1 END AS goal_rank,
+                 CASE s.focus_priority WHEN 'active' THEN 0 WHEN 'queued' THEN 1 ELSE 2 END AS focus_rank,
+                 coalesce(s.focus_goal_id = $goal_id, false) AS is_focus
+            WITH s, g, eligible, goal_rank, focus_rank,
+                 is_focus AND (NOT eligible OR goal_rank > focus_rank) AS loses_focus
+            WITH s, g, loses_focus,
+                 eligible AND NOT loses_focus AND goal_rank <= focus_rank AS takes_focus
+            SET s.focus_goal_id = CASE WHEN takes_focus THEN g.id ELSE s.focus_goal_id END,
+                s.focus_title = CASE WHEN takes_focus THEN g.title ELSE s.focus_title END,
+                s.focus_priority = CASE WHEN takes_focus THEN g.priority ELSE s.focus_priority END,
+                s.focus_stale = CASE
+                    WHEN takes_focus THEN coalesce(s.focus_stale, false) AND NOT (g.priority = 'active')
+                    WHEN loses_focus THEN true
+                    ELSE coalesce(s.focus_stale, false)
+                END
+            """,
+            {"metrics_id": METRICS_ID, "goal_id": str(goal_id)},
+        )
+
+    async def _execute(self, cypher: str, params: Dict[str, Any]) -> None:
+        try:
+            await self._get_driver().execute_query(cypher, params)
+        except Exception as e:
+            logger.warning(f"Failed to update system metrics: {e}")
+
+    # =========================================================================
+    # Read side
+    # =========================================================================
+
+    async def read(self, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Read the precomputed aggregates in one round trip.
+
+        Reconciles first if the counters were never seeded, and recomputes
+        the focus if a goal write marked it stale.
+        """
+        now = now or datetime.utcnow()
+        row = await self._read_row(now)
+        if not (row.get("metrics") or {}).get("reconciled_at"):
+            await self.reconcile(now)
+            row = await self._read_row(now)
+        metrics = row.get("metrics") or {}
+
+        focus = metrics.get("focus_title")
+        if metrics.get("focus_stale"):
+            focus = await self._refresh_focus()
+
+        episodes = int(row.get("episodes") or 0)
+        return {
+            "memory_count": int(metrics.get("memory_count") or 0),
+            "episode_count": episodes,
+            "avg_surprise": (row.get("surprise_sum") or 0.0) / episodes if episodes else 0.0,
+            "avg_success": (row.get("success_sum") or 0) / episodes if episodes else 0.0,
+            "current_focus": focus,
+            "basin_strengths": [float(s) for s in row.get("basin_strengths") or [] if s is not None],
+        }
+
+    async def _read_row(self, now: datetime) -> Dict[str, Any]:
+        rows = await self._get_driver().execute_query(
+            """
+            OPTIONAL MATCH (s:SystemMetrics {id: $metrics_id})
+            OPTIONAL MATCH (b:SystemMetricsBucket) WHERE b.hour > $cutoff_hour
+            WITH s, sum(b.episodes) AS episodes, sum(b.surprise_sum) AS surprise_sum,
+                 sum(b.success_sum) AS success_sum
+            OPTIONAL MATCH (a:AttractorBasin)
+            RETURN s {.*} AS metrics, episodes, surprise_sum, success_sum,
+                   collect(a.strength) AS basin_strengths
+            """,
+            {
+                "metrics_id": METRICS_ID,
+                "cutoff_hour": hour_key(now - timedelta(hours=WINDOW_HOURS)),
+            },
+        )
+        return dict(rows[0]) if rows else {}
+
+    async def _refresh_focus(self) -> Optional[str]:
+        driver = self._get_driver()
+        rows = await driver.execute_query(_FOCUS_QUERY)
+        focus = rows[0] if rows else {}
+        await driver.execute_query(
+            """
+            MERGE (s:SystemMetrics {id: $metrics_id})
+            SET s.focus_goal_id = $goal_id, s.focus_title = $title,
+                s.focus_priority = $priority, s.focus_stale = false
+            """,
+            {
+                "metrics_id": METRICS_ID,
+                "goal_id": focus.get("goal_id"),
+                "title": focus.get("title"),
+                "priority": focus.get("priority"),
+            },
+        )
+        return focus.get("title")
+
+    # =========================================================================
+    # Reconciliation
+    # =========================================================================
+
+    async def reconcile(self, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Recount every aggregate from the graph and overwrite the counters.
+
+        Returns the drift corrected: the memory count delta, the episode
+        count delta over the window, and whether the focus changed.
+        """
+        now = now or datetime.utcnow()
+        driver = self._get_driver()
+        since_hour = hour_key(now - timedelta(hours=WINDOW_HOURS))
+
+        before_rows = await driver.execute_query(
+            """
+            OPTIONAL MATCH (s:SystemMetrics {id: $metrics_id})
+            OPTIONAL MATCH (b:SystemMetricsBucket) WHERE b.hour > $since_hour
+            RETURN s.memory_count AS memory_count, s.focus_title AS focus, sum(b.episodes) AS episodes
+            """,
+            {"metrics_id": METRICS_ID, "since_hour": since_hour},
+        )
+        before = before_rows[0] if before_rows else {}
+
+        memory_rows = await driver.execute_query("MATCH (m:Memory) RETURN count(m) as count")
+        memory_count = int(memory_rows[0]["count"]) if memory_rows else 0
+
+        focus_rows = await driver.execute_query(_FOCUS_QUERY)
+        focus = focus_rows[0] if focus_rows else {}
+
+        # One statement recounts the window and overwrites every bucket in it,
+        # zeroing hours with no episodes, so there is no gap for a concurrent
+        # count_recorded_episode() to fall into and nothing for the Destruction
+        # Gate to refuse. ISO timestamps sort as strings, so the window is an
+        # index range scan on CognitiveEpisode.timestamp.
+        rows = await driver.execute_query(
+            """
+            MERGE (s:SystemMetrics {id: $metrics_id})
+            SET s.memory_count = $memory_count,
+                s.focus_goal_id = $goal_id,
+                s.focus_title = $title,
+                s.focus_priority = $priority,
+                s.focus_stale = false,
+                s.reconciled_at = $now
+            WITH s
+            OPTIONAL MATCH (e:CognitiveEpisode)
+            WHERE e.timestamp > $since_hour
+            WITH substring(e.timestamp, 0, 13) AS hour, e
+            WITH hour,
+                 count(e) AS episodes,
+                 sum(coalesce(e.surprise_score, 0.0)) AS surprise_sum,
+                 sum(CASE WHEN e.success THEN 1 ELSE 0 END) AS success_sum
+            WITH collect(CASE WHEN hour > $since_hour THEN
+                {hour: hour, episodes: episodes, surprise_sum: surprise_sum, success_sum: success_sum}
+            END) AS counted
+            OPTIONAL MATCH (stale:SystemMetricsBucket)
+            WHERE stale.hour > $since_hour AND NOT stale.hour IN [c IN counted | c.hour]
+            SET stale.episodes = 0, stale.surprise_sum = 0.0, stale.success_sum = 0
+            WITH counted, count(stale) AS zeroed
+            FOREACH (bucket IN counted |
+                MERGE (b:SystemMetricsBucket {hour: bucket.hour})
+                SET b.episodes = bucket.episodes,
+                    b.surprise_sum = bucket.surprise_sum,
+                    b.success_sum = bucket.success_sum)
+            RETURN reduce(total = 0, c IN counted | total + c.episodes) AS episodes
+            """,
+            {
+                "metrics_id": METRICS_ID,
+                "memory_count": memory_count,
+                "goal_id": focus.get("goal_id"),
+                "title": focus.get("title"),
+                "priority": focus.get("priority"),
+                "now": now.isoformat(),
+                "since_hour": since_hour,
+            },
+        )
+        if gate_blocked(rows):
+            logger.error("System metrics reconcile was blocked by the Destruction Gate")
+            return {"memory_count": 0, "episode_count": 0, "focus_changed": False}
+
+        episodes = int(rows[0]["episodes"] or 0) if rows else 0
+        drift = {
+            "memory_count": memory_count - int(before.get("memory_count") or 0),
+            "episode_count": episodes - int(before.get("episodes") or 0),
+            "focus_changed": before.get("focus") != focus.get("title"),
+        }
+        if drift["memory_count"] or drift["episode_count"] or drift["focus_changed"]:
+            logger.info(f"Reconciled system metrics; corrected drift {drift}")
+        return drift
+
+
+_metrics_instance: Optional[SystemMetricsService] = None
+
+
+def get_system_metrics_service() -> SystemMetricsService:
+    global _metrics_instance
+    if _metrics_instance is None:
+        _metrics_instance = SystemMetricsService()
+    return _metrics_instance
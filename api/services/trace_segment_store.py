@@ -0,0 +1,291 @@
+"""
+Append-Only Trace Segment Store (Feature 039)
+
+Completed execution traces are appended, one JSON line each, to rotating
+segment files under EXECUTION_TRACE_SEGMENT_DIR (default data/execution_traces):
+
+    segment-00000001.jsonl   sealed, compacted into Neo4j (kept for reads)
+    segment-00000002.jsonl   sealed, waiting for compaction
+    segment-00000003.jsonl   active (appends go here)
+    manifest.json            which segments have been compacted
+
+A segment is sealed when it reaches max_segment_bytes or max_segment_age_seconds;
+the age limit is checked on append and by seal_if_expired, which the trace
+service's periodic compactor calls so idle segments are sealed too. Segments
+left over from a previous process are sealed on startup. Every method does
+blocking file I/O; async callers run them via asyncio.to_thread. An in-memory
+index (trace id -> segment, offset, length) serves reads by id without touching
+Neo4j. Compacted segments beyond `retain_compacted` are deleted oldest-first.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+logger = logging.getLogger("dionysus.trace_segment_store")
+
+SEGMENT_PREFIX = "segment-"
+SEGMENT_SUFFIX = ".jsonl"
+MANIFEST_FILE = "manifest.json"
+
+# Fields kept in memory per trace for list views
+SUMMARY_FIELDS = (
+    "id", "agent_name", "run_id", "started_at", "completed_at",
+    "step_count", "planning_count", "success",
+)
+
+
+@dataclass(frozen=True)
+class TraceLocation:
+    """Where a trace record lives on disk."""
+    segment: str
+    offset: int
+    length: int
+
+
+class TraceSegmentStore:
+    """Rotating append-only JSONL segments with an in-memory id index."""
+
+    def __init__(
+        self,
+        directory: str | Path,
+        max_segment_bytes: int = 4 * 1024 * 1024,
+        max_segment_age_seconds: float = 300.0,
+        retain_compacted: int = 16,
+    ):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_segment_bytes = max_segment_bytes
+        self.max_segment_age_seconds = max_segment_age_seconds
+        self.retain_compacted = retain_compacted
+
+        self._lock = threading.Lock()
+        self._index: dict[str, TraceLocation] = {}
+        self._summaries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._segment_traces: dict[str, list[str]] = {}
+        self._compacted: list[str] = []
+        self._sealed: list[str] = []
+        self._active: Optional[str] = None
+        self._active_file = None
+        self._active_opened_at = 0.0
+        self._next_seq = 1
+        self._load()
+
+    @classmethod
+    def from_env(cls) -> "TraceSegmentStore":
+        return cls(
+            directory=os.getenv("EXECUTION_TRACE_SEGMENT_DIR", "data/execution_traces"),
+            max_segment_bytes=int(os.getenv("EXECUTION_TRACE_SEGMENT_BYTES", str(4 * 1024 * 1024))),
+            max_segment_age_seconds=float(os.getenv("EXECUTION_TRACE_SEGMENT_AGE_SECONDS", "300")),
+            retain_compacted=int(os.getenv("EXECUTION_TRACE_RETAIN_SEGMENTS", "16")),
+        )
+
+    # -------------------------------------------------------------------------
+    # Startup
+    # -------------------------------------------------------------------------
+
+    def _load(self) -> None:
+        manifest = self.directory / MANIFEST_FILE
+        compacted: set[str] = set()
+        if manifest.exists():
+            try:
+                compacted = set(json.loads(manifest.read_text()).get("compacted", []))
+            except (OSError, ValueError) as e:
+                logger.error(f"Unreadable trace segment manifest, recompacting all segments: {e}")
+
+        for path in sorted(self.directory.glob(f"{SEGMENT_PREFIX}*{SEGMENT_SUFFIX}")):
+            name = path.name
+            try:
+                seq = int(name[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)])
+            except ValueError:
+                continue
+            self._next_seq = max(self._next_seq, seq + 1)
+            self._index_segment(name)
+            # Leftover segments are sealed; nothing appends to them again
+            (self._compacted if name in compacted else self._sealed).append(name)
+
+    def _index_segment(self, name: str) -> None:
+        offset = 0
+        with open(self.directory / name, "rb") as f:
+            for line in f:
+                length = len(line)
+                if line.endswith(b"\n"):
+                    try:
+                        self._index_record(name, offset, length, json.loads(line))
+                    except ValueError:
+                        logger.warning(f"Skipping corrupt trace record in {name} at offset {offset}")
+                # A torn final line (crash mid-append) is ignored
+                offset += length
+
+    def _index_record(self, segment: str, offset: int, length: int, record: dict[str, Any]) -> None:
+        trace_id = record["id"]
+        self._index[trace_id] = TraceLocation(segment, offset, length)
+        self._summaries[trace_id] = {k: record.get(k) for k in SUMMARY_FIELDS}
+        self._summaries.move_to_end(trace_id)
+        self._segment_traces.setdefault(segment, []).append(trace_id)
+
+    # -------------------------------------------------------------------------
+    # Writes
+    # -------------------------------------------------------------------------
+
+    def append(self, record: dict[str, Any]) -> bool:
+        """
+        Append one trace record. Returns True when the append sealed the
+        active segment, i.e. there is new work for the compactor.
+        """
+        line = (json.dumps(record, separators=(",", ":"), default=str) + "\n").encode()
+        with self._lock:
+            if self._active_file is None:
+                self._open_segment()
+            offset = self._active_file.tell()
+            self._active_file.write(line)
+            self._active_file.flush()
+            self._index_record(self._active, offset, len(line), record)
+
+            if (
+                offset + len(line) >= self.max_segment_bytes
+                or time.monotonic() - self._active_opened_at >= self.max_segment_age_seconds
+            ):
+                self._seal_locked()
+                return True
+        return False
+
+    def seal(self) -> Optional[str]:
+        """Seal the active segment (if any) so it can be compacted."""
+        with self._lock:
+            return self._seal_locked()
+
+    def seal_if_expired(self) -> Optional[str]:
+        """Seal the active segment once it is older than max_segment_age_seconds."""
+        with self._lock:
+            if (
+                self._active_file is not None
+                and time.monotonic() - self._active_opened_at >= self.max_segment_age_seconds
+            ):
+                return self._seal_locked()
+        return None
+
+    def _open_segment(self) -> None:
+        self._active = f"{SEGMENT_PREFIX}{self._next_seq:08d}{SEGMENT_SUFFIX}"
+        self._next_seq += 1
+        self._active_file = open(self.directory / self._active, "ab")
+        self._active_opened_at = time.monotonic()
+
+    def _seal_locked(self) -> Optional[str]:
+        if self._active_file is None:
+            return None
+        self._active_file.close()
+        sealed = self._active
+        self._sealed.append(sealed)
+        self._active = None
+        self._active_file = None
+        return sealed
+
+    # -------------------------------------------------------------------------
+    # Reads
+    # -------------------------------------------------------------------------
+
+    def get(self, trace_id: str) -> Optional[dict[str, Any]]:
+        """Read one trace record by id, or None if it is not held locally."""
+        location = self._index.get(trace_id)
+        if location is None:
+            return None
+        try:
+            with open(self.directory / location.segment, "rb") as f:
+                f.seek(location.offset)
+                return json.loads(f.read(location.length))
+        except (OSError, ValueError) as e:
+            logger.error(f"Failed to read trace {trace_id} from {location.segment}: {e}")
+            return None
+
+    def __contains__(self, trace_id: str) -> bool:
+        return trace_id in self._index
+
+    def summaries(
+        self,
+        agent_name: Optional[str] = None,
+        success_only: bool = False,
+        limit: int = 20,
+    ) -> list[dict[str, Any]]:
+        """Trace summaries, newest first."""
+        found = []
+        for summary in reversed(list(self._summaries.values())):
+            if agent_name and summary.get("agent_name") != agent_name:
+                continue
+            if success_only and summary.get("success") is not True:
+                continue
+            found.append(dict(summary))
+            if len(found) >= limit:
+                break
+        return found
+
+    def read_segment(self, name: str) -> Iterator[dict[str, Any]]:
+        """Yield every intact record of a segment in append order."""
+        with open(self.directory / name, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+
+    # -------------------------------------------------------------------------
+    # Compaction bookkeeping
+    # -------------------------------------------------------------------------
+
+    def pending_segments(self) -> list[str]:
+        """Sealed segments not yet compacted into the graph, oldest first."""
+        with self._lock:
+            return list(self._sealed)
+
+    def mark_compacted(self, name: str) -> None:
+        """Record a segment as compacted, then apply retention."""
+        with self._lock:
+            if name in self._sealed:
+                self._sealed.remove(name)
+            if name not in self._compacted:
+                self._compacted.append(name)
+            expired = self._compacted[:-self.retain_compacted] if self.retain_compacted else list(self._compacted)
+            for old in expired:
+                self._drop_segment_locked(old)
+            self._write_manifest_locked()
+
+    def _drop_segment_locked(self, name: str) -> None:
+        self._compacted.remove(name)
+        for trace_id in self._segment_traces.pop(name, []):
+            location = self._index.get(trace_id)
+            if location is not None and location.segment == name:
+                del self._index[trace_id]
+                self._summaries.pop(trace_id, None)
+        try:
+            (self.directory / name).unlink()
+        except FileNotFoundError:
+            pass
+
+    def _write_manifest_locked(self) -> None:
+        tmp = self.directory / f"{MANIFEST_FILE}.tmp"
+        tmp.write_text(json.dumps({"compacted": self._compacted}))
+        tmp.replace(self.directory / MANIFEST_FILE)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "directory": str(self.directory),
+                "traces": len(self._index),
+                "active_segment": self._active,
+                "pending_segments": len(self._sealed),
+                "compacted_segments": len(self._compacted),
+            }
+
+    def close(self) -> None:
+        """Seal the active segment; the next append starts a new one."""
+        self.seal()
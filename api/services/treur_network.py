@@ -0,0 +1,279 @@
+"""
+Whole-network simulator for Treur Self-Modeling Networks (SMN).
+
+DynamicsService provides the scalar primitives (alogistic, hebbian,
+state_update). TreurNetwork holds a whole network as arrays and advances every
+state, and every adaptive (Hebbian) connection weight, in one vectorized step:
+
+    impact_Y   = sum_X  W[X, Y] * X                      (weights[src, dst])
+    dY/dt      = eta_Y * (c_Y(impact_Y) - Y)
+    dW/dt      = eta_W * (hebbian(mu, X, Y, W) - W)      (adaptive connections only)
+
+c_Y is alogistic(sigm_Y, tau_Y) or scaled sum (impact / scale_Y). States with
+speed 0 are constant inputs.
+
+Integration is fixed-step Euler (identical to chaining DynamicsService.state_update)
+or adaptive Heun-Euler with step-size control. Trajectories can be saved to a
+compressed .npz and reloaded.
+
+References:
+- Treur (2020): Network-Oriented Modeling for Adaptive Networks, Ch. 2-3.
+- Anderson (2014): Chapter 3 (Numerical Integration).
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger("dionysus.treur_network")
+
+ALOGISTIC = "alogistic"
+SCALED_SUM = "ssum"
+COMBINATION_FUNCTIONS = (ALOGISTIC, SCALED_SUM)
+
+
+@dataclass
+class Trajectory:
+    """Recorded simulation output; row k of `states` is the network at `times[k]`."""
+
+    state_names: List[str]
+    times: np.ndarray
+    states: np.ndarray
+    weights: Optional[np.ndarray] = None  # (steps, n, n) when weights were recorded
+
+    def state(self, name: str) -> np.ndarray:
+        return self.states[:, self.state_names.index(name)]
+
+    def save(self, path: str | Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        arrays: Dict[str, Any] = {
+            "state_names": np.array(self.state_names),
+            "times": self.times,
+            "states": self.states,
+        }
+        if self.weights is not None:
+            arrays["weights"] = self.weights
+        with open(path, "wb") as f:
+            np.savez_compressed(f, **arrays)
+        return path
+
+    @classmethod
+    def load(cls, path: str | Path) -> "Trajectory":
+        with np.load(path) as data:
+            return cls(
+                state_names=[str(n) for n in data["state_names"]],
+                times=data["times"],
+                states=data["states"],
+                weights=data["weights"] if "weights" in data else None,
+            )
+
+
+@dataclass
+class TreurNetwork:
+    """
+    Array form of a self-modeling network.
+
+    All per-state arrays have shape (n,); connection arrays have shape (n, n)
+    indexed [source, target].
+    """
+
+    state_names: List[str]
+    values: np.ndarray
+    weights: np.ndarray
+    speed: np.ndarray
+    sigm: np.ndarray
+    tau: np.ndarray
+    scale: np.ndarray
+    alogistic_mask: np.ndarray
+    adaptive_mask: np.ndarray
+    mu: np.ndarray
+    weight_speed: np.ndarray
+    time: float = 0.0
+    _index: Dict[str, int] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self):
+        self._index = {name: i for i, name in enumerate(self.state_names)}
+
+    @classmethod
+    def from_spec(
+        cls,
+        states: List[Dict[str, Any]],
+        connections: List[Dict[str, Any]],
+    ) -> "TreurNetwork":
+        """
+        Build a network from plain dicts.
+
+        states:      {"name", "initial"=0.0, "speed"=0.5, "combination"="alogistic",
+                      "sigm"=5.0, "tau"=0.5, "scale"=1.0}
+        connections: {"source", "target", "weight", "adaptive"=False, "mu"=0.1, "speed"=0.1}
+        """
+        n = len(states)
+        names = [s["name"] for s in states]
+        if len(set(names)) != n:
+            raise ValueError("State names must be unique")
+        index = {name: i for i, name in enumerate(names)}
+
+        combination = [s.get("combination", ALOGISTIC) for s in states]
+        unknown = set(combination) - set(COMBINATION_FUNCTIONS)
+        if unknown:
+            raise ValueError(f"Unknown combination function(s): {sorted(unknown)}")
+
+        weights = np.zeros((n, n))
+        adaptive = np.zeros((n, n), dtype=bool)
+        mu = np.zeros((n, n))
+        weight_speed = np.zeros((n, n))
+        for conn in connections:
+            try:
+                src, dst = index[conn["source"]], index[conn["target"]]
+            except KeyError as e:
+                raise ValueError(f"Connection references unknown state {e}") from None
+            weights[src, dst] = conn["weight"]
+            if conn.get("adaptive", False):
+                adaptive[src, dst] = True
+                mu[src, dst] = conn.get("mu", 0.1)
+                weight_speed[src, dst] = conn.get("speed", 0.1)
+
+        return cls(
+            state_names=names,
+            values=np.array([s.get("initial", 0.0) for s in states], dtype=float),
+            weights=weights,
+            speed=np.array([s.get("speed", 0.5) for s in states], dtype=float),
+            sigm=np.array([s.get("sigm", 5.0) for s in states], dtype=float),
+            tau=np.array([s.get("tau", 0.5) for s in states], dtype=float),
+            scale=np.array([s.get("scale", 1.0) for s in states], dtype=float),
+            alogistic_mask=np.array([c == ALOGISTIC for c in combination]),
+            adaptive_mask=adaptive,
+            mu=mu,
+            weight_speed=weight_speed,
+        )
+
+    def __getitem__(self, name: str) -> float:
+        return float(self.values[self._index[name]])
+
+    def weight(self, source: str, target: str) -> float:
+        return float(self.weights[self._index[source], self._index[target]])
+
+    # -------------------------------------------------------------------------
+    # Dynamics
+    # -------------------------------------------------------------------------
+
+    def aggregate(self, values: np.ndarray, weights: np.ndarray) -> np.ndarray:
+        """Combination function output c_Y(impact_Y) for every state."""
+        impact = values @ weights
+        shift = 1.0 / (1.0 + np.exp(self.sigm * self.tau))
+        logistic = (1.0 / (1.0 + np.exp(-self.sigm * (impact - self.tau))) - shift) / (1.0 - shift)
+        return np.where(self.alogistic_mask, logistic, impact / self.scale)
+
+    def derivatives(self, values: np.ndarray, weights: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """(dY/dt, dW/dt) at the given point."""
+        d_values = self.speed * (self.aggregate(values, weights) - values)
+        if not self.adaptive_mask.any():
+            return d_values, np.zeros_like(weights)
+        # hebbian(mu, x, y, w) = mu*x*y + (1 - mu*x)*w for x = source, y = target
+        x = values[:, None]
+        hebbian = self.mu * x * values[None, :] + (1.0 - self.mu * x) * weights
+        d_weights = np.where(self.adaptive_mask, self.weight_speed * (hebbian - weights), 0.0)
+        return d_values, d_weights
+
+    # -------------------------------------------------------------------------
+    # Integration
+    # -------------------------------------------------------------------------
+
+    def run(
+        self,
+        duration: float,
+        dt: float = 0.1,
+        record_every: int = 1,
+        record_weights: bool = False,
+        path: Optional[str | Path] = None,
+    ) -> Trajectory:
+        """Fixed-step Euler integration for `duration` time units."""
+        if dt <= 0:
+            raise ValueError("dt must be positive")
+        steps = int(round(duration / dt))
+        recorder = _Recorder(self, record_weights)
+        for step in range(1, steps + 1):
+            d_values, d_weights = self.derivatives(self.values, self.weights)
+            self.values = self.values + d_values * dt
+            self.weights = self.weights + d_weights * dt
+            self.time += dt
+            if step % record_every == 0 or step == steps:
+                recorder.record(self)
+        return recorder.finish(path)
+
+    def run_adaptive(
+        self,
+        duration: float,
+        tolerance: float = 1e-4,
+        initial_dt: float = 0.1,
+        min_dt: float = 1e-4,
+        max_dt: float = 1.0,
+        record_weights: bool = False,
+        path: Optional[str | Path] = None,
+    ) -> Trajectory:
+        """
+        Adaptive Heun-Euler integration: the gap between the Euler and Heun
+        estimates drives the step size. Every accepted step is recorded.
+        """
+        end = self.time + duration
+        dt = min(initial_dt, max_dt)
+        recorder = _Recorder(self, record_weights)
+        rejected = 0
+        while self.time < end - 1e-12:
+            dt = min(dt, end - self.time)
+            k1_values, k1_weights = self.derivatives(self.values, self.weights)
+            euler_values = self.values + dt * k1_values
+            euler_weights = self.weights + dt * k1_weights
+            k2_values, k2_weights = self.derivatives(euler_values, euler_weights)
+            heun_values = self.values + 0.5 * dt * (k1_values + k2_values)
+            heun_weights = self.weights + 0.5 * dt * (k1_weights + k2_weights)
+
+            error = max(
+                float(np.max(np.abs(heun_values - euler_values), initial=0.0)),
+                float(np.max(np.abs(heun_weights - euler_weights), initial=0.0)),
+            )
+            if error <= tolerance or dt <= min_dt:
+                self.values, self.weights = heun_values, heun_weights
+                self.time += dt
+                recorder.record(self)
+            else:
+                rejected += 1
+            factor = 5.0 if error == 0 else min(5.0, max(0.2, 0.9 * (tolerance / error) ** 0.5))
+            dt = min(max_dt, max(min_dt, dt * factor))
+
+        logger.debug(f"Adaptive run: {len(recorder.times) - 1} steps accepted, {rejected} rejected")
+        return recorder.finish(path)
+
+
+class _Recorder:
+    def __init__(self, network: TreurNetwork, record_weights: bool):
+        self.state_names = list(network.state_names)
+        self.record_weights = record_weights
+        self.times: List[float] = []
+        self.states: List[np.ndarray] = []
+        self.weights: List[np.ndarray] = []
+        self.record(network)
+
+    def record(self, network: TreurNetwork) -> None:
+        self.times.append(network.time)
+        self.states.append(network.values.copy())
+        if self.record_weights:
+            self.weights.append(network.weights.copy())
+
+    def finish(self, path: Optional[str | Path]) -> Trajectory:
+        trajectory = Trajectory(
+            state_names=self.state_names,
+            times=np.array(self.times),
+            states=np.vstack(self.states),
+            weights=np.stack(self.weights) if self.record_weights else None,
+        )
+        if path is not None:
+            trajectory.save(path)
+            logger.info(f"Trajectory saved: {path} ({len(self.times)} points)")
+        return trajectory
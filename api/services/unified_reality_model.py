@@ -49,7 +49,14 @@ class UnifiedRealityModelService:
         try:
             from api.utils.event_bus import get_event_bus
             bus = get_event_bus()
-            bus.subscribe("cognitive_event", self._handle_cognitive_event)
+            # Only the latest state per source matters; superseded events are coalesced
+            bus.subscribe(
+                "cognitive_event",
+                self._handle_cognitive_event,
+                name="urm_active_inference",
+                policy="coalesce",
+                coalesce_key=lambda data: data.get("source"),
+            )
             logger.info("URM Service: Subscribed to cognitive events.")
         except Exception as e:
             logger.warning(f"URM Service: Failed to subscribe to EventBus: {e}")
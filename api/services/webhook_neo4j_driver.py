@@ -13,15 +13,17 @@ from typing import Any, Optional
 
 logger = logging.getLogger("dionysus.webhook_driver")
 
-class WebhookNeo4jResult:
-    def __init__(self, records: list[dict[str, Any]]):
-        self._records = records
+class WebhookNeo4jResult(list):
+    """
+    Records from a proxied query. Callers of execute_query index and iterate
+    it like a list; session-style callers use the async data()/single().
+    """
 
     async def data(self) -> list[dict[str, Any]]:
-        return self._records
+        return list(self)
 
     async def single(self) -> Optional[dict[str, Any]]:
-        return self._records[0] if self._records else None
+        return self[0] if self else None
 
 
 class WebhookNeo4jSession:
@@ -48,6 +50,19 @@ class WebhookNeo4jSession:
         records = await adapter.execute_cypher(statement, combined_params)
         return WebhookNeo4jResult(records)
 
+    async def run_statement(self, name: str, parameters: Optional[dict[str, Any]] = None, **kwargs):
+        """
+        Proxies a statement registered via cypher_statements.register_statement.
+        """
+        from api.services.memevolve_adapter import get_memevolve_adapter
+        adapter = get_memevolve_adapter()
+
+        combined_params = (parameters or {}).copy()
+        combined_params.update(kwargs)
+
+        records = await adapter.execute_statement(name, combined_params)
+        return WebhookNeo4jResult(records)
+
 class WebhookNeo4jDriver:
     """
     Compatibility shim that enforces Graphiti-only access.
@@ -4,9 +4,27 @@ Centralized bus for cognitive and system events.
 
 Ensures that events from any source (OODA, background workers, API) 
 can trigger the Consciousness Integration Pipeline.
+
+Every subscriber (the integration pipeline included) gets its own bounded
+queue drained by its own worker task, so subscribers run concurrently and a
+slow one cannot stall publishers or its peers. Each subscription has a
+policy:
+- block:       when the queue is full, the publisher waits for space
+               (backpressure)
+- drop_oldest: when the queue is full, the oldest pending event is discarded
+- coalesce:    a new event always replaces a still-pending event with the same
+               key in place (latest wins, queue position kept), whether or not
+               the queue is full; a new key arriving at a full queue discards
+               the oldest pending event
+Per-subscriber depth, lag, delivery, drop and failure counts are exposed by
+EventBus.stats().
 """
 
+import asyncio
 import logging
+import time
+from collections import deque
+from enum import Enum
 from typing import Any, Dict, Optional, List, Callable
 from datetime import datetime
 
@@ -15,20 +33,193 @@ from api.models.meta_tot import ActiveInferenceState
 
 logger = logging.getLogger("dionysus.event_bus")
 
+DEFAULT_MAX_QUEUE = 256
+
+
+class OverflowPolicy(str, Enum):
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    COALESCE = "coalesce"
+
+
+class _Subscription:
+    """One subscriber: bounded queue, overflow policy, worker task and counters."""
+
+    def __init__(
+        self,
+        event_type: str,
+        callback: Callable,
+        name: str,
+        max_queue: int,
+        policy: OverflowPolicy,
+        coalesce_key: Optional[Callable[[Dict[str, Any]], Any]],
+    ):
+        if policy == OverflowPolicy.COALESCE and coalesce_key is None:
+            raise ValueError("coalesce policy requires a coalesce_key")
+        self.event_type = event_type
+        self.callback = callback
+        self.name = name
+        self.max_queue = max(1, max_queue)
+        self.policy = policy
+        self.coalesce_key = coalesce_key
+        self.is_coroutine = asyncio.iscoroutinefunction(callback)
+
+        # Entries are [key, enqueued_at, data]; coalescing mutates data in place
+        self._queue: deque = deque()
+        self._keyed: Dict[Any, list] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._not_empty: Optional[asyncio.Event] = None
+        self._not_full: Optional[asyncio.Event] = None
+        self._idle: Optional[asyncio.Event] = None
+
+        self.delivered = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.failed = 0
+        self.max_lag_ms = 0.0
+        self.last_lag_ms = 0.0
+
+    def _ensure_worker(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._worker is not None and not self._worker.done():
+            return
+        if self._loop is not loop:
+            # Events are bound to a loop; start fresh (e.g. a new test loop)
+            self._not_empty = asyncio.Event()
+            self._not_full = asyncio.Event()
+            self._idle = asyncio.Event()
+            self._loop = loop
+        if self._queue:
+            self._not_empty.set()
+        if len(self._queue) < self.max_queue:
+            self._not_full.set()
+        if not self._queue:
+            self._idle.set()
+        self._worker = loop.create_task(self._run(), name=f"event_bus:{self.name}")
+
+    async def put(self, data: Dict[str, Any]) -> None:
+        self._ensure_worker()
+        key = self.coalesce_key(data) if self.coalesce_key else None
+
+        if self.policy == OverflowPolicy.COALESCE and key in self._keyed:
+            self._keyed[key][2] = data
+            self.coalesced += 1
+            return
+
+        while len(self._queue) >= self.max_queue:
+            if self.policy == OverflowPolicy.BLOCK:
+                self._not_full.clear()
+                await self._not_full.wait()
+            else:
+                self._pop()
+                self.dropped += 1
+
+        entry = [key, time.monotonic(), data]
+        self._queue.append(entry)
+        if self.policy == OverflowPolicy.COALESCE:
+            self._keyed[key] = entry
+        self._idle.clear()
+        self._not_empty.set()
+
+    def _pop(self) -> list:
+        entry = self._queue.popleft()
+        if self.policy == OverflowPolicy.COALESCE:
+            self._keyed.pop(entry[0], None)
+        if len(self._queue) < self.max_queue:
+            self._not_full.set()
+        return entry
+
+    async def _run(self) -> None:
+        while True:
+            if not self._queue:
+                self._idle.set()
+                self._not_empty.clear()
+                await self._not_empty.wait()
+                continue
+            _, enqueued_at, data = self._pop()
+            self.last_lag_ms = (time.monotonic() - enqueued_at) * 1000
+            self.max_lag_ms = max(self.max_lag_ms, self.last_lag_ms)
+            try:
+                if self.is_coroutine:
+                    await self.callback(data)
+                else:
+                    self.callback(data)
+                self.delivered += 1
+            except Exception as e:
+                self.failed += 1
+                logger.warning(f"EventBus: Subscriber {self.name} for {self.event_type} failed: {e}")
+
+    async def drain(self) -> None:
+        if self._loop is asyncio.get_running_loop() and self._worker is not None and not self._worker.done():
+            await self._idle.wait()
+
+    def stats(self) -> Dict[str, Any]:
+        oldest = self._queue[0][1] if self._queue else None
+        return {
+            "event_type": self.event_type,
+            "subscriber": self.name,
+            "policy": self.policy.value,
+            "max_queue": self.max_queue,
+            "depth": len(self._queue),
+            "lag_ms": round((time.monotonic() - oldest) * 1000, 3) if oldest is not None else 0.0,
+            "last_lag_ms": round(self.last_lag_ms, 3),
+            "max_lag_ms": round(self.max_lag_ms, 3),
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "failed": self.failed,
+        }
+
+
 class EventBus:
-    def __init__(self):
+    def __init__(self, default_max_queue: int = DEFAULT_MAX_QUEUE):
         self.pipeline = get_consciousness_pipeline()
-        self._subscribers: Dict[str, List[Callable]] = {
+        self.default_max_queue = default_max_queue
+        self._subscribers: Dict[str, List[_Subscription]] = {
             "cognitive_event": [],
             "system_event": [],
             "precision_update": []
         }
+        # The integration pipeline is a subscriber like any other; it must
+        # not lose events, so publishers wait when its queue is full.
+        self.subscribe(
+            "cognitive_event",
+            self._run_pipeline,
+            name="consciousness_pipeline",
+            policy=OverflowPolicy.BLOCK,
+        )
+
+    def subscribe(
+        self,
+        event_type: str,
+        callback: Callable,
+        name: Optional[str] = None,
+        max_queue: Optional[int] = None,
+        policy: OverflowPolicy | str = OverflowPolicy.BLOCK,
+        coalesce_key: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    ) -> None:
+        """
+        Register a subscriber for an event type.
 
-    def subscribe(self, event_type: str, callback: Callable) -> None:
-        """Register a subscriber for an event type."""
+        Args:
+            name: Label used in stats (defaults to the callback's qualified name)
+            max_queue: Pending events held for this subscriber
+            policy: block | drop_oldest (applied when the queue is full) or
+                coalesce (same-key replacement on every publish; drops the
+                oldest event when a new key meets a full queue)
+            coalesce_key: For coalesce, maps event data to the key that supersedes
+        """
         if event_type not in self._subscribers:
             self._subscribers[event_type] = []
-        self._subscribers[event_type].append(callback)
+        self._subscribers[event_type].append(_Subscription(
+            event_type=event_type,
+            callback=callback,
+            name=name or getattr(callback, "__qualname__", repr(callback)),
+            max_queue=max_queue or self.default_max_queue,
+            policy=OverflowPolicy(policy),
+            coalesce_key=coalesce_key,
+        ))
         logger.debug(f"EventBus: Subscribed to {event_type}")
 
     async def emit_cognitive_event(
@@ -52,18 +243,7 @@ class EventBus:
                 precision=0.9
             )
             
-        # 1. Integration Pipeline (Synchronous processing)
-        try:
-            await self.pipeline.process_cognitive_event(
-                problem=problem,
-                reasoning_trace=reasoning,
-                active_inference_state=state,
-                context=context
-            )
-        except Exception as e:
-            logger.error(f"EventBus: Pipeline processing failed for {source}: {e}")
-
-        # 2. Notify Subscribers (Asynchronous notifications)
+        # Integration pipeline and subscribers are queued, not awaited
         event_data = {
             "source": source,
             "problem": problem,
@@ -73,18 +253,31 @@ class EventBus:
         }
         await self._notify_subscribers("cognitive_event", event_data)
 
+    async def _run_pipeline(self, data: Dict[str, Any]) -> None:
+        try:
+            await self.pipeline.process_cognitive_event(
+                problem=data["problem"],
+                reasoning_trace=data["reasoning"],
+                active_inference_state=data["state"],
+                context=data["context"]
+            )
+        except Exception as e:
+            logger.error(f"EventBus: Pipeline processing failed for {data['source']}: {e}")
+
     async def _notify_subscribers(self, event_type: str, data: Dict[str, Any]) -> None:
-        """Helper to run all subscriber callbacks for an event."""
-        subscribers = self._subscribers.get(event_type, [])
-        for callback in subscribers:
-            try:
-                import asyncio
-                if asyncio.iscoroutinefunction(callback):
-                    await callback(data)
-                else:
-                    callback(data)
-            except Exception as e:
-                logger.warning(f"EventBus: Subscriber for {event_type} failed: {e}")
+        """Enqueue an event for every subscriber of its type."""
+        for subscription in self._subscribers.get(event_type, []):
+            await subscription.put(data)
+
+    async def drain(self) -> None:
+        """Wait until every subscriber queue on the current loop is empty."""
+        await asyncio.gather(*(
+            sub.drain() for subs in self._subscribers.values() for sub in subs
+        ))
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Per-subscriber queue depth, lag and delivery/drop/failure counts."""
+        return [sub.stats() for subs in self._subscribers.values() for sub in subs]
 
     async def emit_system_event(self, source: str, event_type: str, summary: str, metadata: Optional[Dict[str, Any]] = None):
         """
@@ -29,13 +29,23 @@ from dotenv import load_dotenv
 # Load environment variables from .env
 load_dotenv()
 
-import httpx
 from mcp.server.fastmcp import FastMCP
 from api.services.remote_sync import get_neo4j_driver, close_neo4j_driver
+from dionysus_mcp.tools import memory as memory_tools
+
+
+@asynccontextmanager
+async def server_lifespan(server: FastMCP):
+    """Close the pooled webhook client and graph driver when the server stops."""
+    try:
+        yield {}
+    finally:
+        await memory_tools.close_http_client()
+        await close_neo4j_driver()
 
 
 # Create MCP server using FastMCP (provides @app.tool() decorator)
-app = FastMCP("dionysus-core")
+app = FastMCP("dionysus-core", lifespan=server_lifespan)
 
 
 
@@ -66,47 +76,7 @@ async def create_memory(
     Returns:
         Created memory record with ID
     """
-    import uuid
-    from datetime import datetime
-
-    memory_id = str(uuid.uuid4())
-    created_at = datetime.utcnow().isoformat()
-
-    payload = {
-        "memory_id": memory_id,
-        "content": content,
-        "memory_type": memory_type,
-        "importance": importance,
-        "metadata": metadata or {},
-        "created_at": created_at,
-        "operation": "create",
-    }
-
-    payload_bytes = json.dumps(payload, default=str).encode("utf-8")
-    signature = _generate_webhook_signature(payload_bytes)
-
-    async with httpx.AsyncClient(timeout=WEBHOOK_TIMEOUT_SECONDS) as client:
-        response = await client.post(
-            N8N_WEBHOOK_URL,
-            content=payload_bytes,
-            headers={
-                "Content-Type": "application/json",
-                "X-Webhook-Signature": signature,
-            },
-        )
-
-        if response.status_code == 200:
-            result = response.json() if response.text else {}
-            return {
-                "id": result.get("memory_id", memory_id),
-                "created_at": result.get("created_at", created_at),
-                "type": memory_type,
-                "importance": importance,
-            }
-        else:
-            raise Exception(
-                f"Webhook returned {response.status_code}: {response.text}"
-            )
+    return await memory_tools.create_memory(content, memory_type, importance, metadata)
 
 
 @app.tool()
@@ -131,50 +101,23 @@ async def search_memories(
     Returns:
         List of matching memories with similarity scores
     """
-    payload: dict[str, Any] = {
-        "operation": "vector_search",
-        "query": query,
-        "k": limit,
-        "threshold": threshold,
-    }
-
-    if memory_type:
-        payload["filters"] = {"memory_types": [memory_type]}
+    return await memory_tools.search_memories(query, limit, threshold, memory_type)
 
-    payload_bytes = json.dumps(payload, default=str).encode("utf-8")
-    signature = _generate_webhook_signature(payload_bytes)
 
-    async with httpx.AsyncClient(timeout=WEBHOOK_TIMEOUT_SECONDS) as client:
-        response = await client.post(
-            N8N_RECALL_URL,
-            content=payload_bytes,
-            headers={
-                "Content-Type": "application/json",
-                "X-Webhook-Signature": signature,
-            },
-        )
+@app.tool()
+async def batch_memory_operations(operations: list[dict]) -> list[dict]:
+    """
+    Run many memory operations in one call.
 
-        if response.status_code == 200:
-            result = response.json() if response.text else {}
-            items = result.get("results") or result.get("memories") or []
+    Args:
+        operations: Up to 100 items, each {"op": "create", "content": ..., ...}
+            or {"op": "search", "query": ..., ...} with the same arguments as
+            create_memory / search_memories
 
-            return [
-                {
-                    "id": str(item.get("id") or item.get("memory_id") or ""),
-                    "content": str(item.get("content", ""))[:200],
-                    "type": item.get("memory_type") or item.get("type") or "unknown",
-                    "importance": float(item.get("importance", 0.5)),
-                    "similarity": float(
-                        item.get("similarity_score") or item.get("score") or item.get("similarity") or 0.0
-                    ),
-                }
-                for item in items
-                if isinstance(item, dict)
-            ]
-        else:
-            raise Exception(
-                f"Webhook returned {response.status_code}: {response.text}"
-            )
+    Returns:
+        One result per operation, in order: {"index", "op", "ok", "result" | "error"}
+    """
+    return await memory_tools.batch_memory_operations(operations)
 
 
 @app.tool()
@@ -641,77 +584,15 @@ async def create_thoughtseed(
 
 
 
+from dionysus_mcp.tools.thoughtseeds import run_thoughtseed_competition_tool
+
+
 @app.tool()
 async def run_thoughtseed_competition(layer: str) -> dict:
     """
     Run winner selection among thoughtseeds at a given layer via n8n webhook.
     """
-    driver = get_neo4j_driver()
-    # This logic is complex and better handled by a single n8n workflow/Cypher query
-    # if it were more than just selection. Here, we can do it in parts.
-    
-    get_competitors_cypher = """
-        MATCH (t:ThoughtSeed)
-        WHERE t.layer = $layer
-          AND t.competition_status IN ['pending', 'competing']
-        RETURN t.id as id, t.activation_level as activation_level
-        ORDER BY t.activation_level DESC
-    """
-    
-    async with driver.session() as session:
-        result = await session.run(get_competitors_cypher, {"layer": layer})
-        competitors = await result.data()
-
-        if not competitors:
-            return {"message": "No competitors at this layer", "winner": None}
-
-        winner = competitors[0]
-        loser_ids = [c["id"] for c in competitors[1:]]
-
-        # Update winner
-        await session.run(
-            "MATCH (t:ThoughtSeed {id: $id}) SET t.competition_status = 'won'",
-            {"id": winner["id"]}
-        )
-
-        # Update losers
-        if loser_ids:
-            await session.run(
-                "MATCH (t:ThoughtSeed) WHERE t.id IN $ids SET t.competition_status = 'lost'",
-                {"ids": loser_ids}
-            )
-
-        # Record competition
-        competition_result = await session.run(
-            """
-            CREATE (c:ThoughtSeedCompetition {
-                id: randomUUID(),
-                competitor_ids: $competitor_ids,
-                winner_id: $winner_id,
-                layer: $layer,
-                competition_energy: $energy,
-                created_at: datetime()
-            })
-            RETURN c.id as id
-            """,
-            {
-                "competitor_ids": [c["id"] for c in competitors],
-                "winner_id": winner["id"],
-                "layer": layer,
-                "energy": sum(c["activation_level"] for c in competitors)
-            }
-        )
-        competition_record = await competition_result.single()
-
-    return {
-        "competition_id": str(competition_record["id"]),
-        "layer": layer,
-        "competitors": len(competitors),
-        "winner": {
-            "id": str(winner["id"]),
-            "activation_level": float(winner["activation_level"])
-        }
-    }
+    return await run_thoughtseed_competition_tool(layer)
 
 
 
@@ -1,13 +1,179 @@
 # Copyright 2025 Mani Saint Victor
 # SPDX-License-Identifier: Apache-2.0
 
-"""Memory operations for MCP server."""
+"""
+Memory operations for MCP server.
+
+All memory operations are proxied through n8n webhooks, which handle Neo4j
+persistence. Every call goes through one server-lifetime httpx client so
+connections to n8n are pooled and kept alive instead of being opened per
+tool call; server.py closes it on shutdown.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import uuid
+from datetime import datetime
+from typing import Any, Optional
+
+import httpx
+
+from api.services.hmac_utils import generate_signature
+
+logger = logging.getLogger("dionysus.mcp.memory")
+
+N8N_WEBHOOK_URL = os.getenv("N8N_WEBHOOK_URL", "http://n8n:5678/webhook/memory/v1/ingest/message")
+N8N_RECALL_URL = os.getenv("N8N_RECALL_URL", "http://n8n:5678/webhook/memory/v1/recall")
+WEBHOOK_TIMEOUT_SECONDS = float(os.getenv("MCP_WEBHOOK_TIMEOUT_SECONDS", "30"))
+HTTP_MAX_CONNECTIONS = int(os.getenv("MCP_HTTP_MAX_CONNECTIONS", "20"))
+# Operations of one batch call in flight at once
+BATCH_CONCURRENCY = int(os.getenv("MCP_BATCH_CONCURRENCY", "8"))
+MAX_BATCH_OPERATIONS = 100
+
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Shared pooled client, created on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=WEBHOOK_TIMEOUT_SECONDS,
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_CONNECTIONS,
+            ),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def _generate_webhook_signature(payload_bytes: bytes) -> str:
+    return generate_signature(payload_bytes, os.getenv("MEMORY_WEBHOOK_TOKEN", ""))
+
+
+async def _post_webhook(url: str, payload: dict[str, Any]) -> dict[str, Any]:
+    payload_bytes = json.dumps(payload, default=str).encode("utf-8")
+    response = await get_http_client().post(
+        url,
+        content=payload_bytes,
+        headers={
+            "Content-Type": "application/json",
+            "X-Webhook-Signature": _generate_webhook_signature(payload_bytes),
+        },
+    )
+    if response.status_code != 200:
+        raise Exception(f"Webhook returned {response.status_code}: {response.text}")
+    return response.json() if response.text else {}
+
+
+async def create_memory(
+    content: str,
+    memory_type: str = "semantic",
+    importance: float = 0.5,
+    metadata: Optional[dict] = None,
+) -> dict:
+    """Create a memory via the n8n ingest webhook."""
+    memory_id = str(uuid.uuid4())
+    created_at = datetime.utcnow().isoformat()
+
+    result = await _post_webhook(N8N_WEBHOOK_URL, {
+        "memory_id": memory_id,
+        "content": content,
+        "memory_type": memory_type,
+        "importance": importance,
+        "metadata": metadata or {},
+        "created_at": created_at,
+        "operation": "create",
+    })
+    return {
+        "id": result.get("memory_id", memory_id),
+        "created_at": result.get("created_at", created_at),
+        "type": memory_type,
+        "importance": importance,
+    }
+
+
+async def search_memories(
+    query: str,
+    limit: int = 10,
+    threshold: float = 0.5,
+    memory_type: Optional[str] = None,
+) -> list[dict]:
+    """Vector search via the n8n recall webhook."""
+    payload: dict[str, Any] = {
+        "operation": "vector_search",
+        "query": query,
+        "k": limit,
+        "threshold": threshold,
+    }
+    if memory_type:
+        payload["filters"] = {"memory_types": [memory_type]}
+
+    result = await _post_webhook(N8N_RECALL_URL, payload)
+    items = result.get("results") or result.get("memories") or []
+    return [
+        {
+            "id": str(item.get("id") or item.get("memory_id") or ""),
+            "content": str(item.get("content", ""))[:200],
+            "type": item.get("memory_type") or item.get("type") or "unknown",
+            "importance": float(item.get("importance", 0.5)),
+            "similarity": float(
+                item.get("similarity_score") or item.get("score") or item.get("similarity") or 0.0
+            ),
+        }
+        for item in items
+        if isinstance(item, dict)
+    ]
+
+
+_BATCH_OPERATIONS = {
+    "create": create_memory,
+    "search": search_memories,
+}
+
+
+async def batch_memory_operations(operations: list[dict]) -> list[dict]:
+    """
+    Run many create/search operations in one call over the pooled client.
+
+    Each operation is {"op": "create" | "search", **arguments}. Results come
+    back in input order as {"index", "op", "ok", "result" | "error"}; one
+    failing operation does not fail the batch.
+    """
+    if len(operations) > MAX_BATCH_OPERATIONS:
+        raise ValueError(f"At most {MAX_BATCH_OPERATIONS} operations per batch")
+
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+    async def _run(index: int, operation: dict) -> dict:
+        arguments = dict(operation)
+        op = arguments.pop("op", None)
+        handler = _BATCH_OPERATIONS.get(op)
+        if handler is None:
+            return {"index": index, "op": op, "ok": False, "error": f"Unknown operation: {op}"}
+        async with semaphore:
+            try:
+                return {"index": index, "op": op, "ok": True, "result": await handler(**arguments)}
+            except Exception as e:
+                logger.warning(f"Batch memory operation {index} ({op}) failed: {e}")
+                return {"index": index, "op": op, "ok": False, "error": str(e)}
+
+    return list(await asyncio.gather(*(_run(i, op) for i, op in enumerate(operations))))
 
-# Memory tools are implemented in server.py
-# This module provides type hints and documentation
 
 __all__ = [
     "create_memory",
     "search_memories",
-    "get_memory",
+    "batch_memory_operations",
+    "get_http_client",
+    "close_http_client",
 ]
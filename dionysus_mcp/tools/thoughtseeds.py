@@ -0,0 +1,56 @@
+# Copyright 2025 Mani Saint Victor
+# SPDX-License-Identifier: Apache-2.0
+
+"""ThoughtSeed competition for MCP server."""
+
+from api.services.remote_sync import get_neo4j_driver
+
+# Select competitors, mark winner/losers and record the competition in one
+# statement: one round trip, and no window for another competition to claim
+# the same seeds between the read and the writes.
+THOUGHTSEED_COMPETITION_CYPHER = """
+MATCH (t:ThoughtSeed)
+WHERE t.layer = $layer
+  AND t.competition_status IN ['pending', 'competing']
+WITH t ORDER BY t.activation_level DESC
+WITH collect(t) AS competitors
+WHERE size(competitors) > 0
+WITH competitors, competitors[0] AS winner
+FOREACH (c IN competitors |
+    SET c.competition_status = CASE WHEN c = winner THEN 'won' ELSE 'lost' END
+)
+CREATE (comp:ThoughtSeedCompetition {
+    id: randomUUID(),
+    competitor_ids: [c IN competitors | c.id],
+    winner_id: winner.id,
+    layer: $layer,
+    competition_energy: reduce(e = 0.0, c IN competitors | e + coalesce(c.activation_level, 0.0)),
+    created_at: datetime()
+})
+RETURN comp.id AS id,
+       size(competitors) AS competitors,
+       winner.id AS winner_id,
+       winner.activation_level AS winner_activation
+"""
+
+
+async def run_thoughtseed_competition_tool(layer: str) -> dict:
+    """Run winner selection among pending thoughtseeds at a layer."""
+    driver = get_neo4j_driver()
+    async with driver.session() as session:
+        result = await session.run(THOUGHTSEED_COMPETITION_CYPHER, {"layer": layer})
+        rows = await result.data()
+
+    if not rows:
+        return {"message": "No competitors at this layer", "winner": None}
+
+    row = rows[0]
+    return {
+        "competition_id": str(row["id"]),
+        "layer": layer,
+        "competitors": row["competitors"],
+        "winner": {
+            "id": str(row["winner_id"]),
+            "activation_level": float(row["winner_activation"] or 0.0),
+        },
+    }
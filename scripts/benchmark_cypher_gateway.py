@@ -0,0 +1,99 @@
+"""
+Micro-benchmark: per-call overhead of the Cypher gateway.
+
+Runs GraphitiService.execute_cypher (ad-hoc text) and execute_statement
+(registered name) against a no-op in-memory driver, so the numbers are pure
+gateway cost: classification, Destruction Gate, routing, the per-call
+timeout, and buffered telemetry/workload/metrics recording (including the
+amortized batch flushes). driver_with_timeout_us isolates the asyncio.timeout
+guard, which every gateway call keeps.
+
+Usage:
+    python scripts/benchmark_cypher_gateway.py [--calls 20000] [--no-telemetry]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api.services import graphiti_service
+from api.services.cypher_statements import register_statement
+from api.services.cypher_telemetry import get_cypher_telemetry
+from api.services.graphiti_service import GraphitiService
+from api.services.schema_advisor.workload import get_workload_recorder
+
+STATEMENT = "MATCH (m:Memory {id: $memory_id}) RETURN m.id AS id, m.content AS content"
+STATEMENT_NAME = "benchmark.memory_by_id"
+
+
+class _NoopDriver:
+    async def execute_query(self, statement, params=None, **kwargs):
+        return SimpleNamespace(records=[])
+
+
+def _service() -> GraphitiService:
+    graphiti_service._global_graphiti = SimpleNamespace(driver=_NoopDriver())
+    service = GraphitiService.__new__(GraphitiService)
+    service.config = SimpleNamespace(cypher_timeout_seconds=5)
+    return service
+
+
+async def _time_calls(call, calls: int) -> float:
+    """Mean microseconds per call."""
+    for _ in range(min(calls, 500)):  # warm caches
+        await call()
+    started = time.perf_counter()
+    for _ in range(calls):
+        await call()
+    return (time.perf_counter() - started) / calls * 1e6
+
+
+async def run(calls: int) -> dict[str, float]:
+    service = _service()
+    register_statement(STATEMENT_NAME, STATEMENT)
+    params = {"memory_id": "m-1"}
+    driver = service._get_graphiti().driver
+
+    async def guarded():
+        async with asyncio.timeout(service.config.cypher_timeout_seconds):
+            return await driver.execute_query(STATEMENT, params=params)
+
+    baseline = await _time_calls(lambda: driver.execute_query(STATEMENT, params=params), calls)
+    guarded_baseline = await _time_calls(guarded, calls)
+    adhoc = await _time_calls(lambda: service.execute_cypher(STATEMENT, params), calls)
+    named = await _time_calls(lambda: service.execute_statement(STATEMENT_NAME, params), calls)
+    return {
+        "driver_only_us": baseline,
+        "driver_with_timeout_us": guarded_baseline,
+        "execute_cypher_us": adhoc,
+        "execute_statement_us": named,
+        "execute_cypher_overhead_us": adhoc - baseline,
+        "execute_statement_overhead_us": named - baseline,
+        "recording_overhead_us": named - guarded_baseline,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=20000)
+    parser.add_argument("--no-telemetry", action="store_true", help="disable telemetry and workload recording")
+    args = parser.parse_args()
+
+    if args.no_telemetry:
+        get_cypher_telemetry().enabled = False
+        get_workload_recorder().enabled = False
+
+    results = asyncio.run(run(args.calls))
+    print(f"Cypher gateway overhead over {args.calls} calls (mean per call):")
+    for key, value in results.items():
+        print(f"  {key:<32} {value:8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Recall-vs-exact evaluation for the in-process memory ANN index.
+
+Builds an index from a snapshot (MEMORY_ANN_SNAPSHOT) or from synthetic
+clustered embeddings, then reports recall@k of the IVF search against an
+exact scan and the mean per-query latency of both, for each n_probe given.
+
+Usage:
+    python scripts/benchmark_memory_ann.py [--snapshot data/memory_ann/index.npz]
+        [--vectors 20000] [--dim 768] [--queries 200] [--k 10] [--nprobe 1 4 8 16]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api.services.memory_ann_index import MemoryANNIndex
+
+
+def _synthetic(vectors: int, dim: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    clusters = max(1, vectors // 200)
+    centers = rng.normal(size=(clusters, dim))
+    labels = rng.integers(0, clusters, size=vectors)
+    return centers[labels] + 0.5 * rng.normal(size=(vectors, dim))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--snapshot", help="evaluate a saved index instead of synthetic data")
+    parser.add_argument("--vectors", type=int, default=20000)
+    parser.add_argument("--dim", type=int, default=768)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[1, 4, 8, 16])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed + 1)
+    if args.snapshot:
+        index = MemoryANNIndex.load(args.snapshot, capacity=10**9)
+        sample = index._vectors[rng.choice(len(index), size=min(args.queries, len(index)), replace=False)]
+    else:
+        data = _synthetic(args.vectors, args.dim, args.seed)
+        index = MemoryANNIndex(capacity=len(data), seed=args.seed)
+        started = time.perf_counter()
+        index.add_batch((f"m-{i}", vector, None) for i, vector in enumerate(data))
+        print(f"Inserted {len(data)} vectors in {time.perf_counter() - started:.2f}s")
+        sample = data[rng.choice(len(data), size=args.queries, replace=False)]
+    queries = sample + 0.1 * rng.normal(size=sample.shape)
+
+    stats = index.stats()
+    print(f"Index: {stats['vectors']} vectors, dim {stats['dim']}, {stats['lists']} lists")
+    print(f"{'n_probe':>8} {'recall@' + str(args.k):>10} {'ann ms':>9} {'exact ms':>9}")
+    for n_probe in args.nprobe:
+        index.n_probe = n_probe
+        result = index.evaluate_recall(queries, k=args.k)
+        print(
+            f"{n_probe:>8} {result['recall_at_k']:>10.3f} "
+            f"{result['ann_ms_per_query']:>9.3f} {result['exact_ms_per_query']:>9.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
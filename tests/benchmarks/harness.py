@@ -0,0 +1,392 @@
+"""
+Offline benchmark harness.
+
+Runs real code paths against deterministic in-memory stand-ins for the three
+external dependencies, each with configurable injected latency:
+
+    graph      Graphiti client behind GraphitiService (driver.execute_query,
+               search, add_episode) - every Cypher call goes through the real
+               gateway, WebhookNeo4jDriver included
+    llm        litellm (acompletion/completion) and the smolagents orchestrator
+               run (run_agent_with_timeout)
+    embedding  EmbeddingService.generate_embedding(s_batch)
+
+Every stand-in call is a round trip, attributed to the phase active at the
+time (a contextvar, so concurrent phases are counted separately). Work done
+by long-lived background tasks, such as EventBus subscriber workers, lands in
+"unattributed". Scenarios report per-phase latency distributions and mean
+round-trip counts; compare() checks a run against a stored baseline.
+
+Service singletons keep their state across iterations, so some round trips
+(e.g. a boundary check that depends on accumulated context) vary between
+iterations. The sequence is deterministic, so compare runs made with the same
+iteration and warmup counts as the baseline.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import contextvars
+import functools
+import hashlib
+import json
+import os
+import statistics
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Awaitable, Callable, Iterator, Optional
+from unittest.mock import patch
+
+import numpy as np
+
+BACKENDS = ("graph", "llm", "embedding")
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+
+_current_phase: contextvars.ContextVar[str] = contextvars.ContextVar("benchmark_phase", default="unattributed")
+
+DEFAULT_LLM_RESPONSE = json.dumps({
+    "reasoning": "Benchmark stand-in response.",
+    "actions": [{"action": "rest", "params": {}, "reason": "benchmark"}],
+    "confidence": 0.7,
+    "emotional_state": 0.0,
+    "force_execution": False,
+    "insights": [],
+    "entities": [],
+    "relationships": [],
+})
+
+
+@dataclass
+class LatencyProfile:
+    """Injected latency per round trip, in milliseconds."""
+
+    graph_ms: float = 2.0
+    llm_ms: float = 20.0
+    embedding_ms: float = 5.0
+
+    @classmethod
+    def parse(cls, spec: str) -> "LatencyProfile":
+        """Parse "graph=2,llm=20,embedding=5" (missing keys keep defaults)."""
+        profile = cls()
+        for part in filter(None, (p.strip() for p in spec.split(","))):
+            key, _, value = part.partition("=")
+            setattr(profile, f"{key.strip()}_ms", float(value))
+        return profile
+
+    def seconds(self, backend: str) -> float:
+        return getattr(self, f"{backend}_ms") / 1000.0
+
+
+class RoundTripCounter:
+    """Round trips per (phase, backend)."""
+
+    def __init__(self):
+        self.counts: dict[str, dict[str, int]] = {}
+
+    def record(self, backend: str) -> None:
+        phase = self.counts.setdefault(_current_phase.get(), {})
+        phase[backend] = phase.get(backend, 0) + 1
+
+    def total(self) -> dict[str, int]:
+        totals = {backend: 0 for backend in BACKENDS}
+        for phase in self.counts.values():
+            for backend, count in phase.items():
+                totals[backend] += count
+        return totals
+
+
+@contextlib.contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Attribute round trips made inside the block to `name`."""
+    token = _current_phase.set(name)
+    try:
+        yield
+    finally:
+        _current_phase.reset(token)
+
+
+# =============================================================================
+# Stand-ins
+# =============================================================================
+
+
+class _Record:
+    def __init__(self, row: dict[str, Any]):
+        self._row = row
+
+    def data(self) -> dict[str, Any]:
+        return dict(self._row)
+
+
+class FakeGraphDriver:
+    """Neo4j driver stand-in: every statement returns the responder's rows."""
+
+    def __init__(self, env: "BenchmarkEnvironment"):
+        self._env = env
+        self.statements: list[str] = []
+
+    async def execute_query(self, statement: str, params: Optional[dict] = None, **kwargs):
+        await self._env.round_trip("graph")
+        self.statements.append(statement)
+        rows = self._env.graph_responder(statement, params or {})
+        return SimpleNamespace(records=[_Record(row) for row in rows])
+
+
+class FakeGraphiti:
+    """Graphiti client stand-in used behind the real GraphitiService."""
+
+    def __init__(self, env: "BenchmarkEnvironment"):
+        self._env = env
+        self.driver = FakeGraphDriver(env)
+
+    async def search(self, query: str, group_ids=None, num_results: int = 10, **kwargs):
+        await self._env.round_trip("graph")
+        return [
+            SimpleNamespace(
+                uuid=f"edge-{_digest(query, i)}",
+                name=f"fact-{i}",
+                fact=f"Deterministic fact {i} about {query[:40]}",
+                valid_at=None,
+                invalid_at=None,
+            )
+            for i in range(min(num_results, self._env.search_results))
+        ]
+
+    async def add_episode(self, **kwargs):
+        await self._env.round_trip("graph")
+        return SimpleNamespace(episode=SimpleNamespace(uuid=_digest(str(kwargs.get("name")), 0)), nodes=[], edges=[])
+
+    async def build_indices_and_constraints(self, delete_existing: bool = False):
+        return None
+
+
+def _digest(text: str, salt: int) -> str:
+    return hashlib.sha256(f"{salt}:{text}".encode()).hexdigest()[:12]
+
+
+def _deterministic_vector(text: str, dim: int) -> list[float]:
+    seed = int.from_bytes(hashlib.sha256(text.encode()).digest()[:8], "little")
+    vector = np.random.default_rng(seed).normal(size=dim)
+    return (vector / np.linalg.norm(vector)).tolist()
+
+
+def _llm_response(content: str) -> SimpleNamespace:
+    message = SimpleNamespace(content=content, role="assistant", tool_calls=None)
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=None)
+
+
+# =============================================================================
+# Environment
+# =============================================================================
+
+
+@dataclass
+class BenchmarkEnvironment:
+    """Installs the stand-ins and counts round trips while active."""
+
+    latency: LatencyProfile = field(default_factory=LatencyProfile)
+    search_results: int = 5
+    graph_responder: Callable[[str, dict], list[dict]] = lambda statement, params: []
+    llm_responder: Callable[[list[dict]], str] = lambda messages: DEFAULT_LLM_RESPONSE
+    counter: RoundTripCounter = field(default_factory=RoundTripCounter)
+
+    async def round_trip(self, backend: str) -> None:
+        self.counter.record(backend)
+        delay = self.latency.seconds(backend)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def reset(self) -> None:
+        self.counter = RoundTripCounter()
+
+    @contextlib.contextmanager
+    def install(self) -> Iterator["BenchmarkEnvironment"]:
+        from api.services import graphiti_service, llm_service, memevolve_adapter, remote_sync, webhook_neo4j_driver
+        from api.services.embedding import EMBEDDING_DIMENSIONS, EmbeddingService
+        from api.services.llm_response_cache import LLMResponseCache
+
+        env = self
+        real_driver = webhook_neo4j_driver.WebhookNeo4jDriver()
+
+        async def acompletion(**kwargs):
+            await env.round_trip("llm")
+            return _llm_response(env.llm_responder(kwargs.get("messages", [])))
+
+        async def run_agent_with_timeout(agent, prompt, *args, **kwargs):
+            await env.round_trip("llm")
+            return env.llm_responder([{"role": "user", "content": prompt}])
+
+        async def generate_embedding(service, text: str) -> list[float]:
+            await env.round_trip("embedding")
+            return _deterministic_vector(text, EMBEDDING_DIMENSIONS)
+
+        async def generate_embeddings_batch(service, texts: list[str]) -> list[list[float]]:
+            if not texts:
+                return []
+            await env.round_trip("embedding")
+            return [_deterministic_vector(t, EMBEDDING_DIMENSIONS) for t in texts]
+
+        with contextlib.ExitStack() as stack:
+            # GraphitiConfig refuses to build without credentials; nothing connects anywhere
+            stack.enter_context(patch.dict(os.environ, {
+                "NEO4J_PASSWORD": os.getenv("NEO4J_PASSWORD") or "benchmark",
+                "OPENAI_API_KEY": os.getenv("OPENAI_API_KEY") or "benchmark",
+                "GRAPHITI_SKIP_INDEX_BUILD": "true",
+            }))
+            stack.enter_context(patch.object(graphiti_service, "_global_graphiti", FakeGraphiti(env)))
+            # Route driver lookups to the real webhook driver (pytest's conftest mocks them)
+            stack.enter_context(patch.object(remote_sync, "get_neo4j_driver", lambda: real_driver))
+            stack.enter_context(patch.object(webhook_neo4j_driver, "get_neo4j_driver", lambda: real_driver))
+            stack.enter_context(patch.object(llm_service, "acompletion", acompletion))
+            stack.enter_context(patch("litellm.completion", acompletion))
+            stack.enter_context(patch("litellm.acompletion", acompletion))
+            stack.enter_context(patch("api.agents.resource_gate.run_agent_with_timeout", run_agent_with_timeout))
+            stack.enter_context(patch("api.agents.consciousness_manager.run_agent_with_timeout", run_agent_with_timeout))
+            stack.enter_context(patch.object(EmbeddingService, "generate_embedding", generate_embedding))
+            stack.enter_context(patch.object(EmbeddingService, "generate_embeddings_batch", generate_embeddings_batch))
+            # Caches would hide repeated work across iterations
+            stack.enter_context(patch.object(llm_service, "get_llm_response_cache", lambda: LLMResponseCache(enabled=False)))
+            stack.enter_context(patch.object(memevolve_adapter, "get_memory_ann_index", lambda: None))
+            yield self
+
+
+# =============================================================================
+# Scenarios and results
+# =============================================================================
+
+
+def instrument(target: Any, attribute: str, name: str, timings: dict[str, list[float]]) -> contextlib.AbstractContextManager:
+    """Patch an async method so its calls are timed and attributed to phase `name`."""
+    original = getattr(target, attribute)
+
+    @functools.wraps(original)
+    async def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        with phase(name):
+            try:
+                return await original(*args, **kwargs)
+            finally:
+                timings.setdefault(name, []).append((time.perf_counter() - started) * 1000)
+
+    return patch.object(target, attribute, wrapper)
+
+
+@dataclass
+class Sample:
+    """One scenario iteration: phase wall times (ms) and round trips."""
+
+    phases_ms: dict[str, float]
+    round_trips: dict[str, dict[str, int]]
+
+
+Scenario = Callable[[BenchmarkEnvironment], Awaitable[Sample]]
+
+
+def _distribution(values: list[float]) -> dict[str, float]:
+    ordered = sorted(values)
+    return {
+        "p50": round(statistics.median(ordered), 3),
+        "p95": round(ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))], 3),
+        "mean": round(statistics.fmean(ordered), 3),
+        "max": round(ordered[-1], 3),
+    }
+
+
+def summarize(samples: list[Sample]) -> dict[str, Any]:
+    """Latency distribution per phase and mean round trips per phase/backend."""
+    phase_names = sorted({name for s in samples for name in s.phases_ms})
+    round_trip_phases = sorted({name for s in samples for name in s.round_trips})
+    return {
+        "iterations": len(samples),
+        "latency_ms": {
+            name: _distribution([s.phases_ms.get(name, 0.0) for s in samples]) for name in phase_names
+        },
+        "round_trips": {
+            name: {
+                backend: round(statistics.fmean(s.round_trips.get(name, {}).get(backend, 0) for s in samples), 2)
+                for backend in BACKENDS
+                if any(s.round_trips.get(name, {}).get(backend) for s in samples)
+            }
+            for name in round_trip_phases
+        },
+    }
+
+
+async def run_scenario(
+    scenario: Scenario,
+    iterations: int,
+    latency: Optional[LatencyProfile] = None,
+    warmup: int = 1,
+) -> dict[str, Any]:
+    env = BenchmarkEnvironment(latency=latency or LatencyProfile())
+    samples = []
+    with env.install():
+        for i in range(warmup + iterations):
+            env.reset()
+            sample = await scenario(env)
+            if i >= warmup:
+                samples.append(sample)
+    result = summarize(samples)
+    result["latency_profile"] = asdict(env.latency)
+    return result
+
+
+@dataclass
+class Regression:
+    scenario: str
+    metric: str
+    baseline: float
+    current: float
+
+    def __str__(self) -> str:
+        return f"{self.scenario}: {self.metric} {self.baseline:g} -> {self.current:g}"
+
+
+def compare(
+    current: dict[str, Any],
+    baseline: dict[str, Any],
+    tolerance: float = 0.25,
+    slack_ms: float = 5.0,
+    check_latency: bool = True,
+) -> list[Regression]:
+    """
+    Regressions of `current` against `baseline` (both {scenario: summary}).
+
+    Round trips are deterministic and must not grow at all. A phase's p50 may
+    exceed the baseline by `tolerance` (relative) plus `slack_ms` before it
+    counts, so scheduler noise on small phases does not trip the check.
+    Pass `check_latency=False` to compare round trips only.
+    """
+    regressions = []
+    for scenario, result in current.items():
+        expected = baseline.get(scenario)
+        if expected is None:
+            continue
+        for name, backends in result["round_trips"].items():
+            for backend, count in backends.items():
+                before = expected["round_trips"].get(name, {}).get(backend, 0)
+                if count > before:
+                    regressions.append(Regression(scenario, f"round_trips.{name}.{backend}", before, count))
+        if not check_latency:
+            continue
+        for name, dist in result["latency_ms"].items():
+            before = expected["latency_ms"].get(name)
+            if before is None:
+                continue
+            if dist["p50"] > before["p50"] * (1 + tolerance) + slack_ms:
+                regressions.append(Regression(scenario, f"latency_ms.{name}.p50", before["p50"], dist["p50"]))
+    return regressions
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> dict[str, Any]:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def save_baseline(results: dict[str, Any], path: Path = BASELINE_PATH) -> Path:
+    path.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+    return path
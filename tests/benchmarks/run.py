@@ -0,0 +1,80 @@
+"""
+Run the offline benchmarks and compare against the stored baseline.
+
+Usage:
+    python -m tests.benchmarks.run [--scenario ooda_cycle ...] [--iterations 5]
+        [--latency graph=2,llm=20,embedding=5] [--tolerance 0.25]
+        [--update-baseline] [--json]
+
+Exit status is 1 when any scenario regressed against the baseline.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from tests.benchmarks.harness import LatencyProfile, compare, load_baseline, run_scenario, save_baseline
+from tests.benchmarks.scenarios import SCENARIOS
+
+DEFAULT_ITERATIONS = 5
+
+
+async def run(names: list[str], iterations: int, latency: LatencyProfile) -> dict:
+    return {name: await run_scenario(SCENARIOS[name], iterations, latency) for name in names}
+
+
+def _print_report(results: dict) -> None:
+    for name, result in results.items():
+        print(f"\n{name} ({result['iterations']} iterations)")
+        print(f"  {'phase':<22} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9}   round trips")
+        phases = sorted(set(result["latency_ms"]) | set(result["round_trips"]))
+        for phase in phases:
+            dist = result["latency_ms"].get(phase)
+            trips = ", ".join(f"{k}={v:g}" for k, v in result["round_trips"].get(phase, {}).items())
+            if dist:
+                print(f"  {phase:<22} {dist['p50']:>9.2f} {dist['p95']:>9.2f} {dist['max']:>9.2f}   {trips}")
+            else:
+                print(f"  {phase:<22} {'':>9} {'':>9} {'':>9}   {trips}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scenario", nargs="+", choices=sorted(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+    parser.add_argument("--latency", default="", help="injected latency, e.g. graph=2,llm=20,embedding=5")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative p50 increase")
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--json", action="store_true", help="print raw results as JSON")
+    args = parser.parse_args()
+
+    # The code under test logs every stand-in failure path; keep the report readable
+    logging.basicConfig(level=logging.CRITICAL)
+
+    results = asyncio.run(run(args.scenario, args.iterations, LatencyProfile.parse(args.latency)))
+    if args.json:
+        print(json.dumps(results, indent=2, sort_keys=True))
+    else:
+        _print_report(results)
+
+    if args.update_baseline:
+        baseline = {**load_baseline(), **results}
+        print(f"\nBaseline written: {save_baseline(baseline)}")
+        return
+
+    regressions = compare(results, load_baseline(), tolerance=args.tolerance)
+    if regressions:
+        print("\nRegressions against baseline:")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+    print("\nNo regressions against baseline.")
+
+
+if __name__ == "__main__":
+    main()
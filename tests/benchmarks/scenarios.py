@@ -0,0 +1,153 @@
+"""
+Benchmark scenarios: one iteration each, returning a Sample.
+
+    ooda_cycle   ConsciousnessManager._run_ooda_cycle, timed per OODA phase
+                 (the orchestrator run is a single LLM round trip)
+    heartbeat    HeartbeatService.heartbeat, using its own phase timings
+    recall       MemEvolveAdapter.recall_memories (query expansion + search)
+    ingestion    MemEvolveAdapter.ingest_message (summary, extraction, writes)
+"""
+
+from __future__ import annotations
+
+import contextlib
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from tests.benchmarks.harness import BenchmarkEnvironment, Sample, instrument, phase
+
+TASK = "Review recent progress on the memory consolidation goal and plan next steps."
+
+
+def _sample(env: BenchmarkEnvironment, phases_ms: dict[str, float]) -> Sample:
+    return Sample(phases_ms=phases_ms, round_trips={k: dict(v) for k, v in env.counter.counts.items()})
+
+
+async def ooda_cycle(env: BenchmarkEnvironment) -> Sample:
+    from api.agents.consciousness_manager import ConsciousnessManager
+    from api.services.cognitive_meta_coordinator import get_meta_coordinator
+    from api.services.worldview_integration import get_worldview_integration_service
+    from api.utils.event_bus import get_event_bus
+
+    manager = ConsciousnessManager(model_id="dionysus-benchmark")
+    # The orchestrator run itself is an LLM stand-in; only its memory is read afterwards
+    manager.orchestrator = SimpleNamespace(memory=SimpleNamespace(steps=[]))
+    worldview = get_worldview_integration_service()
+
+    timings: dict[str, list[float]] = {}
+    targets = [
+        (manager, "_check_prior_constraints", "priors"),
+        (manager, "_check_sovereignty_resistance", "sovereignty"),
+        (manager.bootstrap_svc, "recall_context", "bootstrap_recall"),
+        (manager.meta_learner, "retrieve_relevant_episodes", "episode_recall"),
+        (manager.meta_learner, "synthesize_lessons", "episode_recall"),
+        (manager, "_fetch_biographical_context", "biography"),
+        (get_meta_coordinator(), "coordinate", "coordination"),
+        (worldview, "filter_prediction_by_worldview", "worldview"),
+        (worldview, "record_prediction_error", "worldview"),
+        (manager.particle_store, "add_particle", "particle"),
+        (manager.meta_learner, "record_episode", "episode_record"),
+    ]
+    with contextlib.ExitStack() as stack:
+        for target, attribute, name in targets:
+            stack.enter_context(instrument(target, attribute, name, timings))
+        stack.enter_context(instrument(
+            __import__("api.agents.consciousness_manager", fromlist=["_"]),
+            "run_agent_with_timeout", "orchestrator", timings,
+        ))
+        started = time.perf_counter()
+        await manager._run_ooda_cycle({"task": TASK, "project_id": "benchmark"})
+        total = (time.perf_counter() - started) * 1000
+        with phase("event_bus"):
+            await get_event_bus().drain()
+
+    phases_ms = {name: sum(values) for name, values in timings.items()}
+    phases_ms["total"] = total
+    return _sample(env, phases_ms)
+
+
+class _HeartbeatGraph:
+    """Graph responder holding the HeartbeatState singleton the energy service reads."""
+
+    def __init__(self):
+        self.state = {"current_energy": 20.0, "heartbeat_count": 0, "paused": False}
+
+    def __call__(self, statement: str, params: dict) -> list[dict]:
+        if "HeartbeatState" not in statement:
+            return []
+        if "current_energy = $energy" in statement:
+            self.state["current_energy"] = params.get("energy", self.state["current_energy"])
+        if "s.heartbeat_count + 1" in statement:
+            self.state["heartbeat_count"] += 1
+            return [{"count": self.state["heartbeat_count"]}]
+        if "RETURN s" in statement:
+            return [{"s": dict(self.state)}]
+        return []
+
+
+async def heartbeat(env: BenchmarkEnvironment) -> Sample:
+    from api.services import heartbeat_service
+    from api.services.energy_service import EnergyService
+    from api.services.heartbeat_service import HeartbeatService
+    from api.utils.event_bus import get_event_bus
+
+    original_phase = heartbeat_service._PhaseTimer.phase
+
+    @contextlib.contextmanager
+    def attributed_phase(self, name):
+        with phase(name), original_phase(self, name):
+            yield
+
+    service = HeartbeatService(energy_service=EnergyService())
+    # The record and settle phases gather coroutines created before the phase
+    # starts, so attribute their round trips at the coroutine instead
+    untimed: dict[str, list[float]] = {}
+    with contextlib.ExitStack() as stack:
+        stack.enter_context(patch.object(heartbeat_service._PhaseTimer, "phase", attributed_phase))
+        stack.enter_context(patch.object(env, "graph_responder", _HeartbeatGraph()))
+        for attribute, name in [
+            ("_record_heartbeat", "record"),
+            ("_route_heartbeat_memory", "record"),
+            ("_consume_trajectories", "settle"),
+            ("_record_execution_gap", "settle"),
+        ]:
+            stack.enter_context(instrument(service, attribute, name, untimed))
+        summary = await service.heartbeat()
+        with phase("event_bus"):
+            await get_event_bus().drain()
+    return _sample(env, dict(summary.phase_timings_ms))
+
+
+async def recall(env: BenchmarkEnvironment) -> Sample:
+    from api.models.memevolve import MemoryRecallRequest
+    from api.services.memevolve_adapter import MemEvolveAdapter
+
+    adapter = MemEvolveAdapter()
+    started = time.perf_counter()
+    with phase("recall"):
+        await adapter.recall_memories(MemoryRecallRequest(query=TASK, limit=10, project_id="benchmark"))
+    return _sample(env, {"total": (time.perf_counter() - started) * 1000})
+
+
+async def ingestion(env: BenchmarkEnvironment) -> Sample:
+    from api.services.memevolve_adapter import MemEvolveAdapter
+
+    adapter = MemEvolveAdapter()
+    started = time.perf_counter()
+    with phase("ingestion"):
+        await adapter.ingest_message(
+            "Consolidated three episodic memories about the onboarding journey into one semantic summary.",
+            source_id="benchmark",
+            session_id="benchmark-session",
+            project_id="benchmark",
+        )
+    return _sample(env, {"total": (time.perf_counter() - started) * 1000})
+
+
+SCENARIOS = {
+    "ooda_cycle": ooda_cycle,
+    "heartbeat": heartbeat,
+    "recall": recall,
+    "ingestion": ingestion,
+}
@@ -0,0 +1,46 @@
+"""
+Benchmark regression gate: round trips per phase must not exceed the baseline.
+
+Round trips are deterministic, so they gate every run. Wall-clock latency is
+too noisy on shared machines to gate by default; set BENCHMARK_CHECK_LATENCY=1
+to include it, or use `python -m tests.benchmarks.run` for the full comparison.
+"""
+
+import os
+
+import pytest
+
+from tests.benchmarks.harness import LatencyProfile, compare, load_baseline, run_scenario
+from tests.benchmarks.scenarios import SCENARIOS
+
+CHECK_LATENCY = os.getenv("BENCHMARK_CHECK_LATENCY", "").lower() in ("1", "true", "yes")
+
+
+async def _run_against_baseline(name):
+    baseline = load_baseline()
+    if name not in baseline:
+        pytest.skip(f"no baseline for {name}; run python -m tests.benchmarks.run --update-baseline")
+
+    expected = baseline[name]
+    result = await run_scenario(SCENARIOS[name], expected["iterations"], LatencyProfile(**expected["latency_profile"]))
+    assert result["round_trips"], "scenario made no round trips"
+    return result, baseline
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("name", sorted(SCENARIOS))
+async def test_scenario_has_no_regressions(name):
+    result, baseline = await _run_against_baseline(name)
+
+    regressions = compare({name: result}, baseline, check_latency=False)
+    assert not regressions, "\n".join(str(r) for r in regressions)
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(not CHECK_LATENCY, reason="set BENCHMARK_CHECK_LATENCY=1 to gate on latency")
+@pytest.mark.parametrize("name", sorted(SCENARIOS))
+async def test_scenario_latency_within_tolerance(name):
+    result, baseline = await _run_against_baseline(name)
+
+    regressions = compare({name: result}, baseline, tolerance=1.0, slack_ms=25.0)
+    assert not regressions, "\n".join(str(r) for r in regressions)
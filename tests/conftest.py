@@ -51,6 +51,36 @@ def mock_graphiti_service():
         yield mock_service
 
 
+@pytest.fixture
+def gated_gateway(monkeypatch):
+    """
+    A real GraphitiService, Destruction Gate included, over a fake Neo4j driver.
+
+    Assign `gateway.respond = fn(statement, params) -> rows` to script results;
+    statements that get past the gate are recorded in `gateway.executed`.
+    """
+    from types import SimpleNamespace
+
+    from api.services import graphiti_service
+    from api.services.cypher_telemetry import CypherTelemetry
+
+    async def execute_query(statement, params=None, **_kwargs):
+        gateway.executed.append((statement, params))
+        rows = gateway.respond(statement, params) or []
+        return SimpleNamespace(records=[SimpleNamespace(data=lambda row=row: row) for row in rows])
+
+    monkeypatch.setattr(
+        graphiti_service, "_global_graphiti", SimpleNamespace(driver=SimpleNamespace(execute_query=execute_query))
+    )
+    monkeypatch.setattr(graphiti_service, "get_cypher_telemetry", lambda: CypherTelemetry())
+
+    gateway = graphiti_service.GraphitiService.__new__(graphiti_service.GraphitiService)
+    gateway.config = SimpleNamespace(cypher_timeout_seconds=5)
+    gateway.executed = []
+    gateway.respond = lambda statement, params: []
+    return gateway
+
+
 @pytest.fixture(autouse=True)
 def reset_belief_tracking_singleton():
     """
@@ -164,12 +164,12 @@ def mock_session_manager_driver():
         if "MATCH (s:Session {id:" in cypher:
             return []  # No sessions in mock by default
 
-        # Handle timeline query
-        if "HAS_SESSION" in cypher and "HAS_DOCUMENT" in cypher:
-            return [{"sessions": [], "docs": []}]
+        # Handle timeline query (no sessions in mock by default)
+        if "entry_type" in cypher and "fetch" in params:
+            return []
 
         # Handle history query
-        if "HAS_SESSION" in cypher and "summary CONTAINS" in cypher:
+        if "db.index.fulltext.queryNodes" in cypher or "ORDER BY n.created_at DESC" in cypher:
             return []
 
         # Default: return empty
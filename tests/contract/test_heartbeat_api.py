@@ -51,6 +51,7 @@ def mock_heartbeat_services():
         energy_end=90.0,
         actions_completed=1,
         narrative="Test narrative",
+        phase_timings_ms={"observe": 12.5, "decide": 840.0, "total": 910.0},
     )
     mock_heartbeat = MagicMock()
     mock_heartbeat.trigger_manual_heartbeat = AsyncMock(return_value=mock_heartbeat_summary)
@@ -142,6 +143,7 @@ class TestTriggerHeartbeatEndpoint:
         assert isinstance(data["success"], bool)
         assert isinstance(data["heartbeat_number"], int)
         assert isinstance(data["actions_completed"], int)
+        assert data["phase_timings_ms"]["total"] == 910.0
 
 
 class TestPauseHeartbeatEndpoint:
@@ -95,3 +95,52 @@ def test_tracing_correlation_contract():
     response = client.get("/api/monitoring/cognitive", headers={"x-trace-id": trace_id})
     assert response.status_code == 200
     assert response.json()["trace_id"] == trace_id
+
+def test_cypher_metrics_contract():
+    """Cypher gateway telemetry is exposed as JSON and Prometheus text."""
+    from api.services.cypher_telemetry import get_cypher_telemetry
+
+    def contract_caller():
+        get_cypher_telemetry().record_call("MATCH (n) RETURN n", {"id": "x"}, 12.0, rows=3)
+
+    contract_caller()
+
+    response = client.get("/api/monitoring/cypher")
+    assert response.status_code == 200
+    data = response.json()
+    assert "call_sites" in data
+    assert any(s["call_site"] == f"{__name__}:contract_caller" for s in data["call_sites"])
+
+    response = client.get("/api/monitoring/cypher/slow")
+    assert response.status_code == 200
+    assert isinstance(response.json(), list)
+
+    response = client.get("/api/monitoring/cypher/prometheus")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert f'call_site="{__name__}:contract_caller"' in response.text
+
+def test_registry_metrics_and_prometheus_contract():
+    """Request metrics land in the registry and the combined exposition endpoint."""
+    client.get("/api/monitoring/alerts")
+
+    response = client.get("/api/monitoring/registry")
+    assert response.status_code == 200
+    data = response.json()
+    assert "dionysus_http_requests_total" in data["metrics"]
+    assert "dionysus_coordination_queue_depth" in data["metrics"]
+
+    response = client.get("/api/monitoring/prometheus")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "# TYPE dionysus_http_request_duration_ms histogram" in response.text
+    assert 'route="/api/monitoring/alerts"' in response.text
+    assert "dionysus_cypher_latency_ms" in response.text
+
+def test_boundary_detection_stats_contract():
+    """Nemori boundary detection reports local vs. LLM decisions per kind."""
+    response = client.get("/api/monitoring/boundary-detection")
+    assert response.status_code == 200
+    data = response.json()
+    assert set(data) == {"events", "trajectories"}
+    assert {"checks", "llm_consultations", "llm_rate", "streams"} <= set(data["events"])
@@ -175,6 +175,50 @@ class TestTrajectoryAgency:
         assert result_long.confidence >= result_short.confidence - 0.1
 
 
+class TestBatchedAgency:
+    """Test the vectorized pairwise estimator and the sliding window."""
+
+    @staticmethod
+    def _per_pair(detector, mu, a):
+        return np.array([
+            [detector._compute_2d_kl_divergence(mu[:, i], a[:, j]) for j in range(a.shape[1])]
+            for i in range(mu.shape[1])
+        ])
+
+    def test_pairwise_matches_per_pair_reference(self, detector):
+        """Batched scores should equal the per-pair histogram computation."""
+        rng = np.random.default_rng(7)
+        mu = rng.normal(size=(300, 4))
+        mu[:, 2] = 1.5  # constant dimension
+        mu[:, 3] = rng.integers(0, 5, size=300)  # values on bin edges
+        a = np.column_stack([mu[:, 0] * 2 + rng.normal(size=300) * 0.1, rng.uniform(size=300), mu[:, 3]])
+
+        pairwise = detector.pairwise_agency_scores(mu, a)
+
+        assert pairwise.shape == (4, 3)
+        np.testing.assert_allclose(pairwise, self._per_pair(detector, mu, a), rtol=1e-9, atol=1e-12)
+        assert detector.calculate_agency_score(mu, a) == pytest.approx(pairwise.mean())
+
+    def test_sliding_window_tracks_batch_score(self, detector):
+        """Streaming score should equal the batch score of the current window."""
+        rng = np.random.default_rng(3)
+        mu = np.cumsum(rng.normal(size=(120, 3)), axis=0)  # drifting ranges force re-binning
+        a = np.column_stack([mu[:, 0] + rng.normal(size=120) * 0.2, rng.normal(size=(120, 2))])
+        window = detector.sliding_window(40)
+
+        assert window.score() == 0.0
+        for t in range(len(mu)):
+            window.push(mu[t], a[t])
+            if t % 7 == 0 or t == len(mu) - 1:
+                start = max(0, t + 1 - 40)
+                expected = self._per_pair(detector, mu[start:t + 1], a[start:t + 1]) if t else np.zeros((3, 3))
+                np.testing.assert_allclose(window.pairwise_scores(), expected, rtol=1e-9, atol=1e-12)
+
+        assert len(window) == 40
+        with pytest.raises(ValueError):
+            window.push(mu[0][:2], a[0])
+
+
 class TestAgencyThresholds:
     """Test threshold configuration."""
 
@@ -0,0 +1,175 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from api.models.biological_agency import AgencyTier, ReconciliationEvent
+from api.services.cypher_statements import get_statement_registry
+from api.services.biological_agency_service import BiologicalAgencyService, StatePersistencePolicy
+
+
+class StateGraph:
+    """Applies the state/ledger/compaction statements to in-memory nodes."""
+
+    def __init__(self):
+        self.heads, self.history, self.ledger, self.calls = {}, {}, {}, []
+
+    async def execute_cypher(self, cypher, params=None):
+        self.calls.append(cypher)
+        agent_id = params["agent_id"]
+        if "BiologicalStateHead {agent_id" in cypher:
+            head = self.heads.setdefault(agent_id, {})
+            head.update(params["changed"])
+            head.update(version=params["version"], keyframe_version=params["keyframe_version"])
+            # History slots are overwritten in place, oldest version first out
+            history = [r for r in self.history.get(agent_id, []) if r["slot"] != params["slot"]]
+            self.history[agent_id] = history + [params["record"]]
+        elif "UNWIND $events" in cypher:
+            self.ledger.setdefault(agent_id, {}).update({e["id"]: e for e in params["events"]})
+        elif "LATEST_STATE" in cypher and agent_id in self.heads:
+            return [{"h": dict(self.heads[agent_id]), "ledger": list(self.ledger.get(agent_id, {}).values())}]
+        return []
+
+    async def execute_statement(self, name, params=None):
+        return await self.execute_cypher(get_statement_registry().get(name).text, params)
+
+
+def _service(graph, **policy):
+    service = BiologicalAgencyService(persistence=StatePersistencePolicy(write_behind_delay=0.0, **policy))
+    service._graphiti = graph
+    return service
+
+
+def _event(action):
+    return ReconciliationEvent(
+        original_event_id="decision-1", refused_action=action, real_outcome_impact=0.1,
+        counterfactual_outcome_impact=0.3, sorrow_index=-0.2, validation_index=0.2,
+    )
+
+
+@pytest.mark.asyncio
+async def test_writes_only_changed_substates_and_new_ledger_events():
+    graph = StateGraph()
+    service = _service(graph)
+    agent = await service.create_agent("agent-1")
+
+    # Unchanged state costs nothing
+    await service.persist_agent_state("agent-1")
+    assert len(graph.calls) == 1
+
+    agent.current_tier = AgencyTier.INTENTIONAL
+    agent.reconciliation_ledger.append(_event("comply"))
+    await service.persist_agent_state("agent-1")
+    agent.reconciliation_ledger.append(_event("obey"))
+    await service.persist_agent_state("agent-1")
+
+    keyframe, delta, ledger_only = graph.history["agent-1"]
+    assert keyframe["kind"] == "keyframe" and "perception_state" in keyframe
+    assert delta["kind"] == "delta" and delta["changed"] == ["current_tier"]
+    assert "perception_state" not in delta
+    assert ledger_only["changed"] == []
+    # Each flush appends only the events it has not written yet
+    assert sum("UNWIND $events" in c for c in graph.calls) == 2
+    assert len(graph.ledger["agent-1"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_write_behind_coalesces_and_flushes():
+    graph = StateGraph()
+    service = _service(graph)
+    agent = await service.create_agent("agent-1")
+
+    for stage in range(2, 6):
+        agent.developmental_stage = stage
+        await service.persist_agent_state("agent-1", wait=False)
+    await service.flush()
+
+    assert len(graph.history["agent-1"]) == 2
+    assert graph.heads["agent-1"]["developmental_stage"] == 5
+
+
+@pytest.mark.asyncio
+async def test_failed_write_stays_dirty_until_next_flush():
+    graph = StateGraph()
+    service = _service(graph)
+    agent = await service.create_agent("agent-1")
+
+    agent.developmental_stage = 3
+    with patch.object(graph, "execute_statement", side_effect=RuntimeError("neo4j down")):
+        await service.persist_agent_state("agent-1")
+    assert service._dirty == {"agent-1"}
+    assert len(graph.history["agent-1"]) == 1
+
+    await service.flush()
+    assert not service._dirty
+    assert graph.heads["agent-1"]["developmental_stage"] == 3
+
+
+@pytest.mark.asyncio
+async def test_keyframes_and_retention_compaction():
+    graph = StateGraph()
+    service = _service(graph, keyframe_interval=2, retain_keyframes=2)
+    agent = await service.create_agent("agent-1")
+
+    for stage in range(2, 12):
+        agent.developmental_stage = stage
+        await service.persist_agent_state("agent-1")
+
+    kinds = [r["kind"] for r in graph.history["agent-1"]]
+    versions = [r["version"] for r in graph.history["agent-1"]]
+    # Keyframes at v1, v4, v7, v10; a ring of two keyframe spans (six slots)
+    assert versions == [6, 7, 8, 9, 10, 11]
+    assert [v for v, k in zip(versions, kinds) if k == "keyframe"] == [7, 10]
+    assert sorted(r["slot"] for r in graph.history["agent-1"]) == list(range(6))
+    assert not any("DELETE" in c for c in graph.calls)
+
+
+@pytest.mark.asyncio
+async def test_state_writes_pass_the_destruction_gate(gated_gateway):
+    service = _service(gated_gateway, keyframe_interval=1, retain_keyframes=1)
+    agent = await service.create_agent("agent-1")
+
+    for stage in range(2, 6):
+        agent.developmental_stage = stage
+        agent.reconciliation_ledger.append(_event(f"act-{stage}"))
+        await service.persist_agent_state("agent-1")
+
+    assert not service._dirty
+    # Initial write plus a state write and a ledger append per persist, none refused
+    assert len(gated_gateway.executed) == 1 + 2 * 4
+
+
+@pytest.mark.asyncio
+async def test_gate_refusal_keeps_agent_dirty():
+    graph = StateGraph()
+    service = _service(graph)
+    agent = await service.create_agent("agent-1")
+
+    agent.developmental_stage = 3
+    refusal = [{"error": "DESTRUCTION_GATE_TRIGGERED"}]
+    with patch.object(graph, "execute_statement", AsyncMock(return_value=refusal)):
+        await service.persist_agent_state("agent-1")
+    assert service._dirty == {"agent-1"}
+
+
+@pytest.mark.asyncio
+async def test_hydrates_from_latest_state_pointer():
+    graph = StateGraph()
+    service = _service(graph)
+    agent = await service.create_agent("agent-1")
+    agent.current_tier = AgencyTier.METACOGNITIVE
+    agent.developmental_stage = 3
+    agent.reconciliation_ledger.append(_event("comply"))
+    await service.persist_agent_state("agent-1")
+
+    revived = _service(graph)
+    with patch.object(revived, "_get_graph_service", return_value=graph):
+        restored = await revived.get_agent("agent-1")
+    calls_before = len(graph.calls)
+    await revived.persist_agent_state("agent-1")
+
+    assert restored.current_tier == AgencyTier.METACOGNITIVE
+    assert restored.developmental_stage == 3
+    assert [e.refused_action for e in restored.reconciliation_ledger] == ["comply"]
+    # The revived service knows what is persisted: no rewrite, and versions continue
+    assert len(graph.calls) == calls_before
+    assert revived._persisted["agent-1"].version == 2
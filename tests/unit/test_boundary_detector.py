@@ -0,0 +1,213 @@
+import pytest
+import numpy as np
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from api.services.boundary_detector import (
+    BoundaryVerdict,
+    EmbeddingBoundaryDetector,
+    replay_boundary_log,
+)
+
+
+def _topic_vector(topic: int, dims: int = 16, noise: float = 0.05, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    base = np.zeros(dims)
+    base[topic] = 1.0
+    return base + rng.normal(0, noise, dims)
+
+
+def _event_log(segments, per_segment=10):
+    embeddings, boundaries = [], set()
+    for s, topic in enumerate(segments):
+        if s > 0:
+            boundaries.add(len(embeddings))
+        for i in range(per_segment):
+            embeddings.append(_topic_vector(topic, seed=s * 100 + i))
+    return embeddings, boundaries
+
+
+def test_warmup_is_ambiguous():
+    detector = EmbeddingBoundaryDetector(min_window=2)
+    decision = detector.observe("a", _topic_vector(0))
+    assert decision.verdict == BoundaryVerdict.AMBIGUOUS
+    assert detector.stats.llm_consultations == 1
+
+
+def test_same_topic_continues_and_topic_shift_is_boundary():
+    detector = EmbeddingBoundaryDetector()
+    for i in range(5):
+        detector.observe(i, _topic_vector(0, seed=i))
+
+    assert detector.score(_topic_vector(0, seed=99)).verdict == BoundaryVerdict.CONTINUE
+    shift = detector.score(_topic_vector(3, seed=98))
+    assert shift.verdict == BoundaryVerdict.BOUNDARY
+    assert shift.drift > 0.45
+
+
+def test_reset_keeps_latest_as_seed():
+    detector = EmbeddingBoundaryDetector()
+    detector.seed("a", _topic_vector(0))
+    detector.seed("b", _topic_vector(1))
+    detector.reset(keep_last=True)
+    assert len(detector) == 1
+    assert "b" in detector and "a" not in detector
+
+
+def test_replay_reports_quality_and_llm_rate():
+    embeddings, boundaries = _event_log([0, 4, 7, 2])
+    report = replay_boundary_log(embeddings, boundaries)
+
+    assert report.f1 == pytest.approx(1.0)
+    assert report.predicted == sorted(boundaries)
+    # Only the warm-up after each boundary reaches the LLM
+    assert report.llm_rate <= 0.15
+
+
+@pytest.mark.asyncio
+async def test_check_boundary_skips_llm_when_confident():
+    from api.models.autobiographical import DevelopmentEvent, DevelopmentEventType
+    from api.services.nemori_river_flow import NemoriRiverFlow
+
+    vectors = {f"e{i}": _topic_vector(0, seed=i).tolist() for i in range(4)}
+    vectors["shift"] = _topic_vector(5, seed=50).tolist()
+
+    def _event(event_id):
+        return DevelopmentEvent(
+            event_id=event_id,
+            timestamp=datetime.now(timezone.utc),
+            event_type=DevelopmentEventType.IMPLEMENTATION_MILESTONE,
+            summary=event_id,
+            rationale="r",
+            impact="i",
+        )
+
+    embedder = MagicMock()
+    embedder.generate_embeddings_batch = AsyncMock(
+        side_effect=lambda texts: [vectors[t] for t in texts]
+    )
+    llm = AsyncMock(return_value='{"boundary_detected": false}')
+
+    with patch("api.services.nemori_river_flow.get_embedding_service", return_value=embedder), \
+         patch("api.services.nemori_river_flow.chat_completion", llm), \
+         patch("api.services.nemori_river_flow.get_consolidated_memory_store"):
+        flow = NemoriRiverFlow()
+        events = [_event(f"e{i}") for i in range(4)]
+
+        assert await flow.check_boundary(events) is False
+        assert await flow.check_boundary(events + [_event("shift")]) is True
+
+    llm.assert_not_awaited()
+    stats = flow.get_boundary_stats()["events"]
+    assert stats["checks"] == 2
+    assert stats["llm_consultations"] == 0
+    assert stats["local_boundaries"] == 1
+
+
+@pytest.mark.asyncio
+async def test_check_boundary_escalates_when_embeddings_unavailable():
+    from api.models.autobiographical import DevelopmentEvent, DevelopmentEventType
+    from api.services.nemori_river_flow import NemoriRiverFlow
+
+    event = DevelopmentEvent(
+        event_id="only",
+        timestamp=datetime.now(timezone.utc),
+        event_type=DevelopmentEventType.IMPLEMENTATION_MILESTONE,
+        summary="only",
+        rationale="r",
+        impact="i",
+    )
+    embedder = MagicMock()
+    embedder.generate_embeddings_batch = AsyncMock(side_effect=RuntimeError("offline"))
+    llm = AsyncMock(return_value='{"boundary_detected": true}')
+
+    with patch("api.services.nemori_river_flow.get_embedding_service", return_value=embedder), \
+         patch("api.services.nemori_river_flow.chat_completion", llm), \
+         patch("api.services.nemori_river_flow.get_consolidated_memory_store"):
+        flow = NemoriRiverFlow()
+        assert await flow.check_boundary([event]) is True
+
+    llm.assert_awaited_once()
+    assert flow.get_boundary_stats()["events"]["embedding_failures"] == 1
+
+
+@pytest.mark.asyncio
+async def test_check_boundary_keeps_one_window_per_journey():
+    from api.models.autobiographical import DevelopmentEvent, DevelopmentEventType
+    from api.services.nemori_river_flow import NemoriRiverFlow
+
+    vectors = {f"a{i}": _topic_vector(0, seed=i).tolist() for i in range(4)}
+    vectors.update({f"b{i}": _topic_vector(5, seed=20 + i).tolist() for i in range(4)})
+
+    def _event(event_id):
+        return DevelopmentEvent(
+            event_id=event_id,
+            timestamp=datetime.now(timezone.utc),
+            event_type=DevelopmentEventType.IMPLEMENTATION_MILESTONE,
+            summary=event_id,
+            rationale="r",
+            impact="i",
+        )
+
+    embedder = MagicMock()
+    embedder.generate_embeddings_batch = AsyncMock(
+        side_effect=lambda texts: [vectors[t] for t in texts]
+    )
+    llm = AsyncMock(return_value='{"boundary_detected": false}')
+
+    with patch("api.services.nemori_river_flow.get_embedding_service", return_value=embedder), \
+         patch("api.services.nemori_river_flow.chat_completion", llm), \
+         patch("api.services.nemori_river_flow.get_consolidated_memory_store"):
+        flow = NemoriRiverFlow()
+        journey_a = [_event(f"a{i}") for i in range(4)]
+        journey_b = [_event(f"b{i}") for i in range(4)]
+
+        # Interleaved journeys on different topics do not read as drift
+        assert await flow.check_boundary(journey_a[:3], stream_id="journey-a") is False
+        assert await flow.check_boundary(journey_b[:3], stream_id="journey-b") is False
+        assert await flow.check_boundary(journey_a, stream_id="journey-a") is False
+        assert await flow.check_boundary(journey_b, stream_id="journey-b") is False
+
+        # Re-checking an already scored event escalates and is counted
+        assert await flow.check_boundary(journey_b, stream_id="journey-b") is False
+
+    stats = flow.get_boundary_stats()["events"]
+    assert stats["streams"] == 2
+    assert stats["local_boundaries"] == 0
+    assert stats["checks"] == 5
+    assert stats["llm_consultations"] == 1
+    llm.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_trajectory_fast_path_requires_stable_keys():
+    from api.models.memevolve import TrajectoryData
+    from api.services.nemori_river_flow import NemoriRiverFlow
+
+    vectors = {f"t{i}": _topic_vector(0, seed=i).tolist() for i in range(4)}
+    embedder = MagicMock()
+    embedder.generate_embeddings_batch = AsyncMock(
+        side_effect=lambda texts: [vectors[t] for t in texts]
+    )
+    llm = AsyncMock(return_value='{"boundary_detected": true}')
+
+    with patch("api.services.nemori_river_flow.get_embedding_service", return_value=embedder), \
+         patch("api.services.nemori_river_flow.chat_completion", llm), \
+         patch("api.services.nemori_river_flow.get_consolidated_memory_store"):
+        flow = NemoriRiverFlow()
+        id_less = [TrajectoryData(summary=f"t{i}") for i in range(4)]
+        keyed = [TrajectoryData(id=f"id-{i}", summary=f"t{i}") for i in range(4)]
+
+        # No trajectory ids, or no stream to scope them to: straight to the LLM
+        assert await flow.check_boundary_for_trajectories(id_less, stream_id="session-1") is True
+        assert await flow.check_boundary_for_trajectories(keyed) is True
+        embedder.generate_embeddings_batch.assert_not_awaited()
+
+        # Same-topic trajectories with ids in a stream are settled locally
+        assert await flow.check_boundary_for_trajectories(keyed, stream_id="session-1") is False
+
+    assert llm.await_count == 2
+    stats = flow.get_boundary_stats()["trajectories"]
+    assert stats["streams"] == 1
+    assert stats["checks"] == 3
+    assert stats["llm_consultations"] == 2
@@ -0,0 +1,109 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from api.services.cypher_statements import StatementRegistry, classify_statement
+
+
+def _gateway(monkeypatch, registry):
+    from api.services import graphiti_service
+    from api.services.cypher_telemetry import CypherTelemetry
+    from api.services.graphiti_service import GraphitiService
+
+    driver = MagicMock()
+    driver.execute_query = AsyncMock(return_value=SimpleNamespace(
+        records=[SimpleNamespace(data=lambda: {"id": "m-1"})]
+    ))
+    monkeypatch.setattr(graphiti_service, "_global_graphiti", SimpleNamespace(driver=driver))
+    monkeypatch.setattr(graphiti_service, "get_statement_registry", lambda: registry)
+    monkeypatch.setattr(graphiti_service, "get_cypher_telemetry", lambda: CypherTelemetry())
+
+    service = GraphitiService.__new__(GraphitiService)
+    service.config = SimpleNamespace(cypher_timeout_seconds=5)
+    return service, driver
+
+
+def test_classification():
+    assert classify_statement("MATCH (n:Memory {id: $id}) RETURN n") == (False, True)
+    assert classify_statement("MERGE (n:Memory {id: $id}) SET n.x = 1") == (False, False)
+    assert classify_statement("MATCH (n) DETACH DELETE n") == (True, False)
+    # Procedures may mutate, so they are never routed as reads
+    assert classify_statement("CALL db.index.fulltext.queryNodes('x', $q)") == (False, False)
+    assert classify_statement("CALL { MATCH (n) RETURN count(n) AS c } RETURN c") == (False, True)
+    assert classify_statement("CALL { CREATE (n:Memory) } RETURN 1") == (False, False)
+
+
+def test_register_is_idempotent_and_rejects_conflicts():
+    registry = StatementRegistry()
+    first = registry.register("memory.by_id", "MATCH (m:Memory {id: $id}) RETURN m")
+    assert registry.register("memory.by_id", "MATCH (m:Memory {id: $id}) RETURN m") is first
+    assert first.parameters == frozenset({"id"})
+    assert "memory.by_id" in registry
+
+    with pytest.raises(ValueError):
+        registry.register("memory.by_id", "MATCH (m:Memory) RETURN m")
+    with pytest.raises(KeyError):
+        registry.get("memory.missing")
+
+
+def test_adhoc_classification_is_memoized_and_bounded():
+    registry = StatementRegistry(max_adhoc=1)
+    assert registry.classify("MATCH (n) RETURN n") is registry.classify("MATCH (n) RETURN n")
+    registry.classify("MATCH (m) RETURN m")
+    assert len(registry._adhoc) == 1
+
+
+@pytest.mark.asyncio
+async def test_execute_statement_routes_reads_and_writes(monkeypatch):
+    registry = StatementRegistry()
+    registry.register("memory.by_id", "MATCH (m:Memory {id: $id}) RETURN m.id AS id")
+    registry.register("memory.touch", "MATCH (m:Memory {id: $id}) SET m.touched = true")
+    service, driver = _gateway(monkeypatch, registry)
+
+    rows = await service.execute_statement("memory.by_id", {"id": "m-1"})
+    assert rows == [{"id": "m-1"}]
+    assert driver.execute_query.call_args.kwargs["routing_"] == "r"
+
+    await service.execute_statement("memory.touch", {"id": "m-1"})
+    assert "routing_" not in driver.execute_query.call_args.kwargs
+
+
+@pytest.mark.asyncio
+async def test_destruction_gate_uses_registered_classification(monkeypatch):
+    registry = StatementRegistry()
+    registry.register("memory.purge", "MATCH (m:Memory {id: $id}) DETACH DELETE m")
+    service, driver = _gateway(monkeypatch, registry)
+
+    blocked = await service.execute_statement("memory.purge", {"id": "m-1"})
+    assert blocked[0]["error"] == "DESTRUCTION_GATE_TRIGGERED"
+    driver.execute_query.assert_not_called()
+
+    await service.execute_statement(
+        "memory.purge", {"id": "m-1", "fingerprint_authorized": True, "user_confirmed": True}
+    )
+    driver.execute_query.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_ingest_relationships_batches_per_type(monkeypatch):
+    service, driver = _gateway(monkeypatch, StatementRegistry())
+    relationships = [
+        {"source": "A", "target": "B", "relation_type": "extends", "status": "approved"},
+        {"source": "B", "target": "C", "relation_type": "EXTENDS", "status": "approved"},
+        {"source": "C", "target": "D", "relation_type": "bad-type!", "status": "approved"},
+        {"source": "D", "target": "E", "relation_type": "EXTENDS", "status": "pending_review"},
+    ]
+
+    result = await service.ingest_extracted_relationships(relationships, source_id="memevolve:t-1")
+
+    assert result == {"ingested": 3, "skipped": 1, "errors": []}
+    assert driver.execute_query.await_count == 2
+    statements = [call.args[0] for call in driver.execute_query.call_args_list]
+    assert any("[r:EXTENDS]" in s for s in statements)
+    assert any("[r:RELATED_TO]" in s for s in statements)
+    # The source lookup is labelled so it can use the Trajectory id index
+    assert all("MATCH (source:Trajectory {id: $source_id})" in s for s in statements)
+    params = driver.execute_query.call_args_list[0].kwargs["params"]
+    assert params["source_id"] == "t-1"
+    assert len(params["rows"]) == 2
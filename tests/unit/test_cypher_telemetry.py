@@ -0,0 +1,150 @@
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from api.services.cypher_telemetry import (
+    CypherTelemetry,
+    approximate_payload_bytes,
+    redact_params,
+)
+
+
+def _gateway(monkeypatch, records=None, error=None):
+    from api.services import graphiti_service
+    from api.services.graphiti_service import GraphitiService
+
+    driver = MagicMock()
+    if error:
+        driver.execute_query = AsyncMock(side_effect=error)
+    else:
+        driver.execute_query = AsyncMock(return_value=SimpleNamespace(
+            records=[SimpleNamespace(data=lambda r=r: r) for r in (records or [])]
+        ))
+    monkeypatch.setattr(graphiti_service, "_global_graphiti", SimpleNamespace(driver=driver))
+    telemetry = CypherTelemetry(slow_query_ms=0.0)
+    monkeypatch.setattr(graphiti_service, "get_cypher_telemetry", lambda: telemetry)
+
+    service = GraphitiService.__new__(GraphitiService)
+    service.config = SimpleNamespace(cypher_timeout_seconds=5)
+    return service, telemetry
+
+
+def test_histogram_quantiles_and_counters():
+    telemetry = CypherTelemetry(slow_query_ms=1000)
+
+    def svc_fn(ms):
+        telemetry.record_call("MATCH (n) RETURN n", {"id": "x"}, ms, rows=2)
+
+    for ms in (0.5, 3, 3, 40, 2000):
+        svc_fn(ms)
+
+    (stats,) = telemetry.call_sites()
+    assert stats.call_site == f"{__name__}:svc_fn"
+    assert stats.count == 5
+    assert stats.rows == 10
+    assert stats.quantile(0.5) == 5
+    assert stats.quantile(0.99) == 2500
+    assert len(telemetry.slow_queries()) == 1
+
+
+def test_redaction_keeps_shape_only():
+    redacted = redact_params({
+        "name": "Alice Secret",
+        "embedding": [0.1] * 768,
+        "api_key": "sk-123",
+        "limit": 10,
+        "props": {"a": 1, "b": 2},
+    })
+    assert redacted == {
+        "name": "<str len=12>",
+        "embedding": "<list len=768>",
+        "api_key": "<redacted>",
+        "limit": 10,
+        "props": "<map keys=2>",
+    }
+    assert approximate_payload_bytes({"embedding": [0.1] * 768}) == len("embedding") + 768 * 8
+
+
+def test_prometheus_text_exposition():
+    telemetry = CypherTelemetry()
+
+    def fn():
+        telemetry.record_call("RETURN 1", None, 7.0, rows=1)
+
+    fn()
+    site = f"{__name__}:fn"
+    text = telemetry.prometheus_text()
+    assert '# TYPE dionysus_cypher_latency_ms histogram' in text
+    assert f'dionysus_cypher_latency_ms_bucket{{call_site="{site}",le="5"}} 0' in text
+    assert f'dionysus_cypher_latency_ms_bucket{{call_site="{site}",le="10"}} 1' in text
+    assert f'dionysus_cypher_latency_ms_bucket{{call_site="{site}",le="+Inf"}} 1' in text
+    assert f'dionysus_cypher_rows_total{{call_site="{site}"}} 1' in text
+
+
+@pytest.mark.asyncio
+async def test_gateway_records_caller_rows_and_slow_log(monkeypatch):
+    service, telemetry = _gateway(monkeypatch, records=[{"a": 1}, {"a": 2}])
+
+    async def hot_caller():
+        return await service.execute_cypher("MATCH (n:Goal {id: $id}) RETURN n", {"id": "g1", "password": "pw"})
+
+    rows = await hot_caller()
+
+    assert len(rows) == 2
+    (stats,) = telemetry.call_sites()
+    assert stats.call_site == f"{__name__}:hot_caller"
+    assert stats.rows == 2
+    slow = telemetry.slow_queries()[0]
+    assert slow.params == {"id": "<str len=2>", "password": "<redacted>"}
+
+
+@pytest.mark.asyncio
+async def test_gateway_records_errors(monkeypatch):
+    service, telemetry = _gateway(monkeypatch, error=RuntimeError("down"))
+    with pytest.raises(RuntimeError):
+        await service.execute_cypher("MATCH (n) RETURN n")
+    assert telemetry.call_sites()[0].errors == 1
+
+
+def test_record_overhead_is_low():
+    telemetry = CypherTelemetry(slow_query_ms=10_000)
+    params = {"id": "abc", "embedding": [0.0] * 768}
+    n = 5000
+    start = time.perf_counter()
+    for _ in range(n):
+        telemetry.record_call("MATCH (n:Memory {id: $id}) RETURN n", params, 3.0, rows=1)
+    telemetry.flush()
+    per_call_us = (time.perf_counter() - start) / n * 1e6
+    assert per_call_us < 200
+
+
+def test_record_call_buffers_until_batch_or_read():
+    telemetry = CypherTelemetry(slow_query_ms=5.0, batch_size=3, flush_seconds=60)
+    batches = []
+    telemetry.add_sink("test", batches.append)
+
+    telemetry.record_call("RETURN 1", None, 1.0, rows=1, read_only=True)
+    telemetry.record_call("RETURN 1", None, 9.0, rows=1, read_only=True)
+    assert batches == []
+    assert len(telemetry.slow_queries()) == 1  # slow statements are logged immediately
+
+    telemetry.record_call("RETURN 1", None, 2.0, error=True)
+    assert [len(b) for b in batches] == [3]
+
+    telemetry.record_call("RETURN 2", None, 1.0)
+    (stats,) = telemetry.call_sites()  # reads flush the pending batch
+    assert stats.call_site == f"{__name__}:test_record_call_buffers_until_batch_or_read"
+    assert stats.count == 4
+    assert stats.errors == 1
+    assert [len(b) for b in batches] == [3, 1]
+
+
+def test_failing_sink_does_not_drop_others():
+    telemetry = CypherTelemetry(batch_size=1)
+    seen = []
+    telemetry.add_sink("broken", lambda batch: 1 / 0)
+    telemetry.add_sink("ok", seen.extend)
+    telemetry.record_call("RETURN 1", None, 1.0)
+    assert len(seen) == 1
@@ -326,4 +326,69 @@ class TestEFEEngineCoverage:
         assert result.dominant_seed_id is not None
         assert len(result.scores) == 2
         # Certain candidate should win (lower EFE)
-        assert result.dominant_seed_id == "certain"
\ No newline at end of file
+        assert result.dominant_seed_id == "certain"
+
+class TestBatchScoring:
+    """The matrix path must agree with the per-candidate scalar path."""
+
+    @staticmethod
+    def _pool(n=300, dim=16, seed=7):
+        rng = np.random.default_rng(seed)
+        pool = []
+        for i in range(n):
+            candidate = {"id": f"seed-{i}", "vector": rng.normal(size=dim).tolist()}
+            k = int(rng.integers(1, 6))
+            candidate["probabilities"] = rng.dirichlet(np.ones(k)).tolist()
+            pool.append(candidate)
+        pool[0]["vector"] = [0.0] * dim  # zero vector -> divergence 1.0
+        pool[1]["probabilities"] = []  # empty distribution -> entropy 1.0
+        pool[2]["probabilities"] = [0.0, 1.0, 0.0]
+        del pool[3]["vector"]
+        return pool, rng.normal(size=dim).tolist()
+
+    @pytest.mark.parametrize("modality", ["neurotypical", "adhd_exploratory", "siege_locked"])
+    def test_batch_matches_scalar(self, efe_engine, modality):
+        pool, goal = self._pool()
+        precisions = np.linspace(0.2, 3.0, len(pool))
+        scores = efe_engine.score_candidates_batch(pool, goal, precisions, modality=modality)
+
+        for i, candidate in enumerate(pool):
+            probs = candidate["probabilities"]
+            vector = np.array(candidate.get("vector", [0.0] * len(goal)))
+            assert scores.uncertainty[i] == pytest.approx(efe_engine.calculate_entropy(probs), abs=1e-9)
+            assert scores.goal_divergence[i] == pytest.approx(
+                efe_engine.calculate_goal_divergence(vector, np.array(goal)), abs=1e-9
+            )
+            assert scores.efe[i] == pytest.approx(
+                efe_engine.calculate_efe(probs, vector, np.array(goal), precisions[i], modality), abs=1e-9
+            )
+
+    def test_select_dominant_thought_matches_scalar_argmin(self, efe_engine):
+        pool, goal = self._pool(n=1000)
+        response = efe_engine.select_dominant_thought(pool, goal, precision=1.3)
+
+        scalar = [
+            efe_engine.calculate_efe(
+                c["probabilities"], np.array(c.get("vector", [0.0] * len(goal))), np.array(goal), 1.3
+            )
+            for c in pool
+        ]
+        assert response.dominant_seed_id == pool[int(np.argmin(scalar))]["id"]
+        assert len(response.scores) == 1000
+
+    def test_mismatched_vector_dimension_raises(self, efe_engine):
+        with pytest.raises(ValueError):
+            efe_engine.score_candidates_batch([{"id": "a", "vector": [1.0, 0.0, 0.0]}], [1.0, 0.0])
+
+    def test_alogistic_batch_matches_scalar(self, efe_engine):
+        from api.services.dynamics_service import DynamicsService
+
+        candidates = [{"id": str(i), "efe_score": e} for i, e in enumerate([0.3, 1.2, 0.3, 2.0, 0.9])]
+        ranked = efe_engine.select_top_candidates_alogistic(candidates)
+
+        efe_scores = [0.3, 1.2, 0.3, 2.0, 0.9]
+        low, high = min(efe_scores), max(efe_scores)
+        for candidate in ranked:
+            x = 1.0 - (candidate["efe_score"] - low) / (high - low)
+            assert candidate["activation"] == pytest.approx(DynamicsService.alogistic(5.0, 0.5, [x], [1.0]))
+        assert [c["id"] for c in ranked][:2] == ["0", "2"]
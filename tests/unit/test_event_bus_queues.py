@@ -0,0 +1,106 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from api.utils.event_bus import EventBus
+
+
+@pytest.fixture
+def bus():
+    with patch("api.utils.event_bus.get_consciousness_pipeline") as pipeline:
+        pipeline.return_value.process_cognitive_event = AsyncMock()
+        yield EventBus(default_max_queue=4)
+
+
+def _stats(bus, name):
+    return next(s for s in bus.stats() if s["subscriber"] == name)
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_does_not_stall_publisher_or_peers(bus):
+    release = asyncio.Event()
+    fast_seen = []
+
+    async def slow(data):
+        await release.wait()
+
+    bus.subscribe("system_event", slow, name="slow", policy="drop_oldest")
+    bus.subscribe("system_event", fast_seen.append, name="fast")
+
+    for i in range(10):
+        await asyncio.wait_for(bus._notify_subscribers("system_event", {"i": i}), timeout=1)
+    await asyncio.sleep(0.01)
+
+    assert [d["i"] for d in fast_seen] == list(range(10))
+    slow_stats = _stats(bus, "slow")
+    # One event in flight, four queued, the rest dropped oldest-first
+    assert slow_stats["depth"] == 4
+    assert slow_stats["dropped"] == 5
+    assert slow_stats["lag_ms"] > 0
+
+    release.set()
+    await bus.drain()
+    assert _stats(bus, "slow")["delivered"] == 5
+
+
+@pytest.mark.asyncio
+async def test_block_policy_applies_backpressure(bus):
+    release = asyncio.Event()
+
+    async def slow(data):
+        await release.wait()
+
+    bus.subscribe("system_event", slow, name="slow", max_queue=1, policy="block")
+    await bus._notify_subscribers("system_event", {"i": 0})
+    await asyncio.sleep(0)  # worker takes event 0
+    await bus._notify_subscribers("system_event", {"i": 1})  # fills the queue
+
+    publisher = asyncio.create_task(bus._notify_subscribers("system_event", {"i": 2}))
+    await asyncio.sleep(0.01)
+    assert not publisher.done()
+
+    release.set()
+    await asyncio.wait_for(publisher, timeout=1)
+    await bus.drain()
+    assert _stats(bus, "slow")["delivered"] == 3
+    assert _stats(bus, "slow")["dropped"] == 0
+
+
+@pytest.mark.asyncio
+async def test_coalesce_replaces_pending_event_with_same_key(bus):
+    release = asyncio.Event()
+    seen = []
+
+    async def handler(data):
+        await release.wait()
+        seen.append((data["key"], data["v"]))
+
+    bus.subscribe("system_event", handler, name="latest", policy="coalesce", coalesce_key=lambda d: d["key"])
+    await bus._notify_subscribers("system_event", {"key": "a", "v": 0})
+    await asyncio.sleep(0)
+    for v in range(1, 4):
+        await bus._notify_subscribers("system_event", {"key": "a", "v": v})
+        await bus._notify_subscribers("system_event", {"key": "b", "v": v})
+
+    release.set()
+    await bus.drain()
+    assert seen == [("a", 0), ("a", 3), ("b", 3)]
+    assert _stats(bus, "latest")["coalesced"] == 4
+
+
+@pytest.mark.asyncio
+async def test_cognitive_event_reaches_pipeline_and_counts_failures(bus):
+    def broken(data):
+        raise RuntimeError("boom")
+
+    bus.subscribe("cognitive_event", broken, name="broken")
+    await bus.emit_cognitive_event(source="test", problem="p", reasoning="r")
+    await bus.drain()
+
+    bus.pipeline.process_cognitive_event.assert_awaited_once()
+    assert _stats(bus, "broken")["failed"] == 1
+    assert _stats(bus, "consciousness_pipeline")["delivered"] == 1
+
+    with pytest.raises(ValueError):
+        bus.subscribe("system_event", broken, policy="coalesce")
@@ -0,0 +1,122 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from api.models.action import (
+    ActionPlan,
+    ActionRequest,
+    ActionResult,
+    ActionStatus,
+    ActionType,
+    EnvironmentSnapshot,
+    GoalsSnapshot,
+    HeartbeatDecision,
+)
+from api.models.goal import GoalAssessment
+from api.services.heartbeat_service import WORLD_SNAPSHOT_CYPHER, ContextBuilder, HeartbeatService
+
+
+class SnapshotSession:
+    def __init__(self, record):
+        self.record = record
+        self.run_calls = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return None
+
+    async def run(self, query, **kwargs):
+        self.run_calls.append(query)
+        return SimpleNamespace(data=AsyncMock(return_value=[self.record]))
+
+
+def _assessment():
+    return GoalAssessment(
+        active_goals=[], queued_goals=[], blocked_goals=[], stale_goals=[],
+        issues=[], snapshot=GoalsSnapshot(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_build_context_reads_world_in_one_round_trip():
+    session = SnapshotSession({
+        "recent_memories": [{"id": "m1", "content": "hello", "type": "episodic"}],
+        "recent_trajectories": [{"id": "t1", "summary": "ran", "metadata": None}],
+        "identity": ["I value clarity."],
+        "last_narrative": "I rested.",
+    })
+    builder = ContextBuilder(driver=SimpleNamespace(session=lambda: session))
+    subconscious = MagicMock(modality="neurotypical", active_loops=[], is_finality_predicted=False)
+
+    with patch("api.services.hexis_service.get_hexis_service") as hexis, \
+            patch("api.services.aspect_service.get_aspect_service") as aspects:
+        hexis.return_value.get_subconscious_state = AsyncMock(return_value=subconscious)
+        aspects.return_value.get_all_aspects = AsyncMock(return_value=[{"name": "Critic"}])
+        context = await builder.build_context(EnvironmentSnapshot(), _assessment())
+
+    assert session.run_calls == [WORLD_SNAPSHOT_CYPHER]
+    assert context.recent_memories[0]["id"] == "m1"
+    assert context.recent_trajectories[0]["id"] == "t1"
+    assert context.identity_context == "I value clarity."
+    assert context.last_heartbeat_summary == "I rested."
+    assert context.boardroom_aspects == [{"name": "Critic"}]
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_runs_independent_phases_concurrently_and_reports_timings():
+    energy = MagicMock()
+    energy.get_state = AsyncMock(return_value=SimpleNamespace(paused=False, current_energy=8.0))
+    energy.regenerate_energy = AsyncMock(return_value=SimpleNamespace(current_energy=10.0))
+    energy.increment_heartbeat_count = AsyncMock(return_value=7)
+    executor = MagicMock()
+    executor.execute_plan = AsyncMock(return_value=[
+        ActionResult(action_type=ActionType.REST, status=ActionStatus.COMPLETED, energy_cost=0.0)
+    ])
+
+    service = HeartbeatService(energy_service=energy, action_executor=executor, driver=MagicMock())
+
+    running: set[str] = set()
+    seen_running: list[set[str]] = []
+
+    async def phase(name, value):
+        running.add(name)
+        seen_running.append(set(running))
+        await asyncio.sleep(0.02)
+        running.discard(name)
+        return value
+
+    service._observe = lambda n, e: phase("observe", EnvironmentSnapshot(heartbeat_number=n))
+    service._review_goals = lambda: phase("goal_review", _assessment())
+    service._fetch_unresolved_predictions = lambda: phase("prediction_fetch", [])
+    service._generate_model_predictions = AsyncMock(return_value=[])
+    service._resolve_pending_predictions = AsyncMock(return_value=[])
+    service._context_builder.build_context = AsyncMock(return_value=MagicMock(recent_trajectories=[]))
+    service._detect_trajectory_patterns = AsyncMock(return_value=[])
+    service._make_decision = AsyncMock(return_value=HeartbeatDecision(
+        action_plan=ActionPlan(actions=[ActionRequest(action_type=ActionType.REST)]),
+        reasoning="rest",
+    ))
+    service._consume_trajectories = AsyncMock()
+    service._record_execution_gap = AsyncMock()
+    service._generate_narrative = AsyncMock(return_value="I rested.")
+    service._record_heartbeat = AsyncMock()
+    service._route_heartbeat_memory = AsyncMock()
+
+    with patch("api.services.multi_tier_lifecycle_service.get_multi_tier_lifecycle_service") as lifecycle:
+        lifecycle.return_value.run_lifecycle_management = AsyncMock(return_value={})
+        summary = await service.heartbeat()
+
+    assert {"observe", "goal_review", "prediction_fetch"} in seen_running
+    service._resolve_pending_predictions.assert_awaited_once()
+    assert service._resolve_pending_predictions.call_args.kwargs["unresolved"] == []
+
+    timings = summary.phase_timings_ms
+    for name in ("initialize", "observe", "goal_review", "context", "decide", "act", "record", "total"):
+        assert name in timings
+    assert timings["observe"] >= 15
+    assert timings["total"] < timings["observe"] + timings["goal_review"] + timings["prediction_fetch"]
+    assert summary.to_dict()["phase_timings_ms"] is timings
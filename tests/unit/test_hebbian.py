@@ -249,3 +249,26 @@ class TestHebbianService:
 
         # Should have called session.run twice (fetch + update)
         assert mock_session.run.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_record_coactivations_batches_fetch_and_update(self):
+        """Test a batch of co-activations costs one fetch and one update."""
+        mock_driver = MagicMock()
+        mock_session = AsyncMock()
+        mock_result = AsyncMock()
+        mock_result.data = AsyncMock(return_value=[{"source": "a", "target": "b", "weight": 0.5}])
+
+        mock_session.run = AsyncMock(return_value=mock_result)
+        mock_driver.session.return_value.__aenter__ = AsyncMock(return_value=mock_session)
+        mock_driver.session.return_value.__aexit__ = AsyncMock()
+
+        service = HebbianService(driver=mock_driver)
+        updated = await service.record_coactivations([("a", "b", 1.0, 1.0), ("b", "c", 0.8, 0.8), ("a", "b", 1.0, 1.0)])
+
+        assert updated == 2
+        assert mock_session.run.call_count == 2
+        updates = {(u["src"], u["tgt"]): u["weight"] for u in mock_session.run.call_args_list[1].args[1]["updates"]}
+        # Repeated pair applied twice in order; unknown pair starts from 0.5
+        once = hebbian_update(1.0, 1.0, 0.5)
+        assert updates[("a", "b")] == pytest.approx(hebbian_update(1.0, 1.0, once))
+        assert updates[("b", "c")] == pytest.approx(hebbian_update(0.8, 0.8, 0.5))
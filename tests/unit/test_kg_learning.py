@@ -73,3 +73,37 @@ async def test_basin_strengthening():
     args = service._driver.execute_query.call_args
     assert "MERGE (b:AttractorBasin" in args[0][0]
     assert args[0][1]["main"] == "Alpha"
+
+
+@pytest.mark.asyncio
+async def test_learning_phase_uses_constant_number_of_writes(mock_model):
+    """Proposals, basins, strategy boosts and co-activation are one write each, however many relationships."""
+    relationships = [
+        {"source": f"C{i}", "target": f"C{i + 1}", "relation_type": "EXTENDS" if i % 2 else "CONTRADICTS",
+         "confidence": 0.9, "evidence": "quote", "status": "approved"}
+        for i in range(12)
+    ]
+    adapter = AsyncMock()
+    adapter.extract_with_context = AsyncMock(return_value={
+        "entities": ["C0", "C1"], "relationships": relationships, "model_used": "mock-model",
+    })
+    adapter.execute_cypher = AsyncMock(return_value=[])
+    hebbian = MagicMock()
+    hebbian.record_coactivations = AsyncMock(return_value=12)
+    service = KGLearningService(adapter=adapter)
+
+    with patch.object(service, "_get_relevant_basins", return_value="basin context"), \
+         patch.object(service, "_get_active_strategies", return_value="strategy context"), \
+         patch.object(service, "evaluate_extraction", return_value={"precision_score": 0.9}), \
+         patch("api.services.kg_learning_service.get_network_state_config",
+               return_value=MagicMock(hebbian_learning_enabled=True)), \
+         patch("api.services.hebbian_service.get_hebbian_service", return_value=hebbian):
+        result = await service.extract_and_learn("Sample content", "source-1")
+
+    assert result.write_counts == {"proposals": 1, "basins": 1, "strategies": 1, "coactivation": 1}
+    assert adapter.execute_cypher.await_count == 3
+    proposals = adapter.execute_cypher.await_args_list[0].args[1]["proposals"]
+    assert len(proposals) == 12
+    boosts = adapter.execute_cypher.await_args_list[2].args[1]["boosts"]
+    assert sorted((b["name"], b["count"]) for b in boosts) == [("CONTRADICTS", 6), ("EXTENDS", 6)]
+    assert len(hebbian.record_coactivations.await_args.args[0]) == 12
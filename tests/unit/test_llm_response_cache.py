@@ -0,0 +1,89 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from api.services import llm_service
+from api.services.llm_response_cache import LLMResponseCache, make_cache_key
+
+
+def _response(content):
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+def test_key_normalizes_whitespace_and_separates_params():
+    base = make_cache_key("openai/gpt-5-nano", [{"role": "user", "content": "hi"}], max_tokens=100)
+
+    assert make_cache_key("openai/gpt-5-nano", [{"role": "user", "content": " hi \n", "name": None}], max_tokens=100) == base
+    assert make_cache_key("openai/gpt-5-nano", [{"role": "user", "content": "hi"}], max_tokens=200) != base
+    assert make_cache_key("ollama/llama3.2", [{"role": "user", "content": "hi"}], max_tokens=100) != base
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_calls_share_one_upstream_request():
+    cache = LLMResponseCache()
+    release = asyncio.Event()
+
+    async def slow_completion(**kwargs):
+        await release.wait()
+        return _response("answer")
+
+    upstream = AsyncMock(side_effect=slow_completion)
+    with patch.object(llm_service, "acompletion", upstream), \
+         patch.object(llm_service, "get_llm_response_cache", return_value=cache):
+        calls = [
+            asyncio.create_task(llm_service.chat_completion([{"role": "user", "content": "q"}], "sys"))
+            for _ in range(5)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*calls)
+
+        # Served from the cache afterwards
+        assert await llm_service.chat_completion([{"role": "user", "content": "q"}], "sys") == "answer"
+
+    assert results == ["answer"] * 5
+    assert upstream.await_count == 1
+    stats = cache.stats()
+    assert (stats["misses"], stats["coalesced"], stats["hits"]) == (1, 4, 1)
+    assert stats["hit_rate"] == pytest.approx(5 / 6)
+
+
+@pytest.mark.asyncio
+async def test_opt_out_errors_and_ttl_expiry_reach_upstream():
+    cache = LLMResponseCache()
+    upstream = AsyncMock(side_effect=[RuntimeError("rate limited"), _response("ok"), _response("fresh"), _response("again"), _response("once more")])
+    messages = [{"role": "user", "content": "q"}]
+
+    with patch.object(llm_service, "acompletion", upstream), \
+         patch.object(llm_service, "get_llm_response_cache", return_value=cache):
+        # Upstream failures return "" and are not cached
+        assert await llm_service.chat_completion(messages, "sys") == ""
+        assert await llm_service.chat_completion(messages, "sys") == "ok"
+        assert await llm_service.chat_completion(messages, "sys", use_cache=False) == "fresh"
+        # A zero TTL stores nothing, so the next identical call goes upstream
+        other = [{"role": "user", "content": "other"}]
+        assert await llm_service.chat_completion(other, "sys", cache_ttl=0) == "again"
+        assert await llm_service.chat_completion(other, "sys") == "once more"
+
+    assert upstream.await_count == 5
+    assert cache.stats()["bypassed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction_and_expiry():
+    cache = LLMResponseCache(max_entries=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    cache.get("a")
+    cache.set("c", "3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.stats()["evictions"] == 1
+
+    cache.set("d", "4", ttl=-1)
+    assert cache.get("d") is None
+    with patch("api.services.llm_response_cache.time.monotonic", return_value=10**12):
+        assert cache.get("a") is None
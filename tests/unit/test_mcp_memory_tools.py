@@ -0,0 +1,110 @@
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from dionysus_mcp.tools import memory as memory_tools
+from dionysus_mcp.tools.thoughtseeds import (
+    THOUGHTSEED_COMPETITION_CYPHER,
+    run_thoughtseed_competition_tool,
+)
+
+
+@pytest.fixture
+def webhook(monkeypatch):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        requests.append((str(request.url), body))
+        assert request.headers["X-Webhook-Signature"].startswith("sha256=")
+        if body.get("content") == "fail":
+            return httpx.Response(500, text="boom")
+        if body["operation"] == "vector_search":
+            return httpx.Response(200, json={"results": [{"id": "m-1", "content": body["query"], "score": 0.9}]})
+        return httpx.Response(200, json={"memory_id": body["memory_id"]})
+
+    created = []
+    real_client = httpx.AsyncClient
+
+    def client_factory(**kwargs):
+        client = real_client(transport=httpx.MockTransport(handler))
+        created.append(client)
+        return client
+
+    monkeypatch.setattr(memory_tools, "_http_client", None)
+    monkeypatch.setattr(memory_tools.httpx, "AsyncClient", client_factory)
+    yield SimpleNamespace(requests=requests, created=created)
+
+
+@pytest.mark.asyncio
+async def test_tool_calls_share_one_pooled_client(webhook):
+    await memory_tools.create_memory("hello")
+    results = await memory_tools.search_memories("hello", memory_type="episodic")
+
+    assert len(webhook.created) == 1
+    assert results[0]["similarity"] == 0.9
+    assert webhook.requests[1][1]["filters"] == {"memory_types": ["episodic"]}
+
+    await memory_tools.close_http_client()
+    await memory_tools.create_memory("again")
+    assert len(webhook.created) == 2
+    await memory_tools.close_http_client()
+
+
+@pytest.mark.asyncio
+async def test_batch_runs_operations_in_order_and_isolates_failures(webhook):
+    results = await memory_tools.batch_memory_operations([
+        {"op": "create", "content": "a", "importance": 0.9},
+        {"op": "search", "query": "a", "limit": 3},
+        {"op": "create", "content": "fail"},
+        {"op": "delete", "id": "x"},
+    ])
+
+    assert [r["index"] for r in results] == [0, 1, 2, 3]
+    assert results[0]["ok"] and results[0]["result"]["importance"] == 0.9
+    assert results[1]["result"][0]["id"] == "m-1"
+    assert not results[2]["ok"] and "500" in results[2]["error"]
+    assert results[3] == {"index": 3, "op": "delete", "ok": False, "error": "Unknown operation: delete"}
+    assert len(webhook.created) == 1
+
+    with pytest.raises(ValueError):
+        await memory_tools.batch_memory_operations([{"op": "search", "query": "q"}] * 101)
+    await memory_tools.close_http_client()
+
+
+class _Session:
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return None
+
+    async def run(self, query, params):
+        self.calls.append((query, params))
+        return SimpleNamespace(data=AsyncMock(return_value=self.rows))
+
+
+@pytest.mark.asyncio
+async def test_thoughtseed_competition_is_one_round_trip():
+    session = _Session([{"id": "c-1", "competitors": 3, "winner_id": "t-1", "winner_activation": 0.8}])
+    with patch("dionysus_mcp.tools.thoughtseeds.get_neo4j_driver", return_value=SimpleNamespace(session=lambda: session)):
+        result = await run_thoughtseed_competition_tool("concept")
+
+    assert session.calls == [(THOUGHTSEED_COMPETITION_CYPHER, {"layer": "concept"})]
+    assert result == {
+        "competition_id": "c-1",
+        "layer": "concept",
+        "competitors": 3,
+        "winner": {"id": "t-1", "activation_level": 0.8},
+    }
+
+    empty = _Session([])
+    with patch("dionysus_mcp.tools.thoughtseeds.get_neo4j_driver", return_value=SimpleNamespace(session=lambda: empty)):
+        assert (await run_thoughtseed_competition_tool("concept"))["winner"] is None
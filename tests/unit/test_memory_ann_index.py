@@ -0,0 +1,220 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pytest
+
+from api.models.memevolve import MemoryRecallRequest
+from api.services import memevolve_adapter
+from api.services.memevolve_adapter import MemEvolveAdapter
+from api.services.memory_ann_index import MemoryANNIndex
+
+
+def _clustered(n=2000, dim=32, seed=0):
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(20, dim))
+    return centers[rng.integers(0, 20, size=n)] + 0.3 * rng.normal(size=(n, dim))
+
+
+def test_ivf_search_matches_exact_and_reports_recall():
+    data = _clustered()
+    index = MemoryANNIndex(train_min=256, n_probe=4)
+    index.add_batch((f"m-{i}", v, {"i": i}) for i, v in enumerate(data))
+
+    assert index.stats()["lists"] > 1
+    hits = index.search(data[7], k=5)
+    assert hits[0].id == "m-7"
+    assert hits[0].score == pytest.approx(1.0, abs=1e-5)
+    assert hits[0].metadata == {"i": 7}
+
+    report = index.evaluate_recall(data[:50] + 0.05, k=10)
+    assert report["recall_at_k"] >= 0.95
+    assert report["queries"] == 50
+
+
+def test_filter_threshold_delete_and_row_reuse():
+    index = MemoryANNIndex()
+    index.add("a", [1.0, 0.0], {"project_id": "p1"})
+    index.add("b", [0.9, 0.1], {"project_id": "p2"})
+    index.add("c", [0.0, 1.0], {"project_id": "p1"})
+
+    assert [h.id for h in index.search([1.0, 0.0], k=3, where=lambda m: m["project_id"] == "p1")] == ["a", "c"]
+    assert [h.id for h in index.search([1.0, 0.0], k=3, min_similarity=0.9)] == ["a", "b"]
+
+    assert index.remove("a") is True
+    assert index.remove("a") is False
+    assert [h.id for h in index.search([1.0, 0.0], k=1)] == ["b"]
+    index.add("d", [1.0, 0.0])
+    assert len(index) == 3
+    assert index.stats()["deletes"] == 1
+
+    with pytest.raises(ValueError):
+        index.add("e", [1.0, 0.0, 0.0])
+
+
+def test_capacity_evicts_least_recently_used():
+    index = MemoryANNIndex(capacity=2)
+    index.add("old", [1.0, 0.0])
+    index.add("hot", [0.0, 1.0])
+    index.search([1.0, 0.0], k=1)  # touches "old"
+    index.add("new", [0.7, 0.7])
+
+    assert "old" in index and "new" in index
+    assert "hot" not in index
+    assert index.stats()["evictions"] == 1
+
+
+def test_snapshot_round_trip(tmp_path):
+    data = _clustered(n=600)
+    index = MemoryANNIndex(train_min=256)
+    index.add_batch((f"m-{i}", v, {"project_id": "p"}) for i, v in enumerate(data))
+    index.remove("m-3")
+    path = index.save(tmp_path / "index.npz")
+
+    restored = MemoryANNIndex.load(path)
+    assert len(restored) == len(index)
+    assert "m-3" not in restored
+    assert restored.stats()["lists"] == index.stats()["lists"]
+    assert [h.id for h in restored.search(data[10], k=3)] == [h.id for h in index.search(data[10], k=3)]
+    assert restored.search(data[10], k=1)[0].metadata == {"project_id": "p"}
+
+
+@pytest.mark.asyncio
+async def test_recall_serves_from_ann_tier_then_falls_back_to_graph():
+    index = MemoryANNIndex()
+    index.add("m-1", [1.0, 0.0], {"content": "alpha", "type": "semantic", "project_id": "p1"})
+    index.add("m-2", [0.95, 0.05], {"content": "beta", "type": "semantic", "project_id": "p1"})
+
+    embeddings = MagicMock()
+    embeddings.generate_embedding = AsyncMock(return_value=[1.0, 0.0])
+    embeddings.generate_embeddings_batch = AsyncMock(return_value=[[0.0, 1.0]])
+    active_inference = MagicMock()
+    active_inference.expand_query = AsyncMock(return_value=[])
+    graphiti = AsyncMock()
+    graphiti.search = AsyncMock(return_value={"edges": [{"uuid": "g-1", "fact": "gamma"}]})
+
+    adapter = MemEvolveAdapter(sync_service=MagicMock())
+    with patch.object(memevolve_adapter, "get_memory_ann_index", return_value=index), \
+         patch("api.services.embedding.get_embedding_service", return_value=embeddings), \
+         patch("api.services.active_inference_service.get_active_inference_service", return_value=active_inference), \
+         patch.object(adapter, "_get_graphiti_service", AsyncMock(return_value=graphiti)):
+        hot = await adapter.recall_memories(MemoryRecallRequest(query="alpha", limit=2, project_id="p1"))
+        # Not enough confident hits for another project: go to the graph
+        cold = await adapter.recall_memories(MemoryRecallRequest(query="alpha", limit=2, project_id="p2"))
+        await asyncio.gather(*adapter._background_tasks)
+
+    assert hot["tier"] == "ann"
+    assert [m["id"] for m in hot["memories"]] == ["m-1", "m-2"]
+    assert hot["memories"][0]["content"] == "alpha"
+    assert hot["memories"][0]["similarity"] == pytest.approx(1.0)
+    graphiti.search.assert_awaited_once()
+    assert "tier" not in cold
+    # The graph result was embedded into the local tier
+    assert index.search([0.0, 1.0], k=1)[0].id == "g-1"
+
+
+def test_ttl_skips_stale_vectors_and_has_candidates():
+    index = MemoryANNIndex()
+    index.add("old", [1.0, 0.0], {"project_id": "p1"})
+    index.add("new", [0.9, 0.1], {"project_id": "p1"})
+    index._added_at[index._rows["old"]] -= 3600
+
+    assert [h.id for h in index.search([1.0, 0.0], k=2, max_age_seconds=60)] == ["new"]
+    assert index.age_seconds("old") >= 3600
+    assert index.has_candidates(1, max_age_seconds=60)
+    assert not index.has_candidates(2, max_age_seconds=60)
+    assert not index.has_candidates(1, where=lambda m: m["project_id"] == "p2")
+
+
+def _recall_patches(adapter, index, embeddings, graphiti):
+    active_inference = MagicMock()
+    active_inference.expand_query = AsyncMock(return_value=[])
+    return (
+        patch.object(memevolve_adapter, "get_memory_ann_index", return_value=index),
+        patch("api.services.embedding.get_embedding_service", return_value=embeddings),
+        patch("api.services.active_inference_service.get_active_inference_service", return_value=active_inference),
+        patch.object(adapter, "_get_graphiti_service", AsyncMock(return_value=graphiti)),
+    )
+
+
+@pytest.mark.asyncio
+async def test_recall_revalidates_stale_hits_and_drops_invalidated(monkeypatch):
+    monkeypatch.setenv("MEMORY_ANN_TTL_SECONDS", "60")
+    index = MemoryANNIndex()
+    index.add("m-1", [1.0, 0.0], {"content": "alpha", "type": "semantic"})
+    index.add("m-2", [0.95, 0.05], {"content": "beta", "type": "semantic"})
+    index._added_at[:] -= 3600  # both entries outlived the TTL
+
+    embeddings = MagicMock()
+    embeddings.generate_embedding = AsyncMock(return_value=[1.0, 0.0])
+    embeddings.generate_embeddings_batch = AsyncMock(return_value=[[1.0, 0.0]])
+    graphiti = AsyncMock()
+    graphiti.search = AsyncMock(return_value={"edges": [
+        {"uuid": "m-1", "fact": "alpha"},
+        {"uuid": "m-2", "fact": "beta", "invalid_at": "2026-01-01T00:00:00"},
+    ]})
+
+    adapter = MemEvolveAdapter(sync_service=MagicMock())
+    patches = _recall_patches(adapter, index, embeddings, graphiti)
+    with patches[0], patches[1], patches[2], patches[3]:
+        result = await adapter.recall_memories(MemoryRecallRequest(query="alpha", limit=2))
+        await asyncio.gather(*adapter._background_tasks)
+
+    assert "tier" not in result
+    # No candidates were fresh, so the query was not embedded for the ANN tier
+    embeddings.generate_embedding.assert_not_awaited()
+    # Invalidated without include_temporal_metadata, and m-1 re-confirmed
+    assert "m-2" not in index
+    assert index.age_seconds("m-1") < 60
+
+
+@pytest.mark.asyncio
+async def test_recall_applies_dict_context_filters():
+    index = MemoryANNIndex()
+    index.add("m-1", [1.0, 0.0], {"content": "alpha", "domain": "math"})
+
+    embeddings = MagicMock()
+    embeddings.generate_embedding = AsyncMock(return_value=[1.0, 0.0])
+    embeddings.generate_embeddings_batch = AsyncMock(return_value=[])
+    graphiti = AsyncMock()
+    graphiti.search = AsyncMock(return_value={"edges": []})
+
+    adapter = MemEvolveAdapter(sync_service=MagicMock())
+    patches = _recall_patches(adapter, index, embeddings, graphiti)
+    with patches[0], patches[1], patches[2], patches[3]:
+        hot = await adapter.recall_memories(MemoryRecallRequest(query="alpha", limit=1, context={"domain": "math"}))
+        cold = await adapter.recall_memories(MemoryRecallRequest(query="alpha", limit=1, context={"domain": "art"}))
+
+    assert hot["tier"] == "ann"
+    assert "tier" not in cold
+    graphiti.search.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_graph_invalidation_forgets_ann_entries():
+    from types import SimpleNamespace
+
+    from api.services import graphiti_service
+    from api.services.graphiti_service import GraphitiService
+
+    index = MemoryANNIndex()
+    index.add("edge-old", [1.0, 0.0])
+    index.add("edge-kept", [0.0, 1.0])
+    edges = [
+        SimpleNamespace(uuid="edge-old", name="n", fact="f", source_node_uuid="a", target_node_uuid="b",
+                        invalid_at="2026-01-01", expired_at=None),
+        SimpleNamespace(uuid="edge-new", name="n", fact="f", source_node_uuid="a", target_node_uuid="b",
+                        invalid_at=None, expired_at=None),
+    ]
+    graphiti = MagicMock()
+    graphiti.add_episode = AsyncMock(return_value=SimpleNamespace(episode=None, nodes=[], edges=edges))
+    service = GraphitiService.__new__(GraphitiService)
+    service.config = SimpleNamespace(group_id="g")
+
+    with patch.object(service, "_get_graphiti", return_value=graphiti), \
+         patch("api.services.memory_ann_index.get_memory_ann_index", return_value=index), \
+         patch.object(graphiti_service, "_get_episode_type_message", return_value="message"):
+        await service.ingest_message("the sky is green")
+
+    assert "edge-old" not in index
+    assert "edge-kept" in index
@@ -65,6 +65,10 @@ async def test_record_episode():
         # Verify params
         args, kwargs = mock_session.run.call_args
         assert args[1]["task_query"] == "Test recording"
+        # Only the first write of an episode id bumps the metrics bucket
+        query = args[0]
+        assert "c.timestamp IS NULL AS is_new" in query
+        assert query.index("WHERE is_new") < query.index("SystemMetricsBucket")
 
 @pytest.mark.asyncio
 async def test_retrieve_relevant_episodes_fallback():
@@ -16,12 +16,28 @@ from api.services.meta_evolution_service import MetaEvolutionService, get_meta_e
 from api.models.evolution import SystemMoment
 
 
+def _metrics_row(basin_stats, memory_count=0, avg_surprise=0.0, avg_success=0.0, episodes=0, focus=None):
+    """Row returned by SystemMetricsService's precomputed read."""
+    return {
+        "metrics": {
+            "memory_count": memory_count,
+            "focus_title": focus,
+            "focus_stale": False,
+            "reconciled_at": datetime.utcnow().isoformat(),
+        },
+        "episodes": episodes,
+        "surprise_sum": avg_surprise * episodes,
+        "success_sum": avg_success * episodes,
+        "basin_strengths": [b["strength"] for b in basin_stats["basins"]],
+    }
+
+
 class TestCaptureSystemMomentRealMetrics:
     """
     Tests for capture_system_moment() with REAL metric computation.
 
     Replaces placeholder values (energy_level=100.0, active_basins_count=5)
-    with actual computation from basin service.
+    with actual computation from basin strengths.
     """
 
     @pytest.mark.asyncio
@@ -37,7 +53,7 @@ class TestCaptureSystemMomentRealMetrics:
         """
         service = MetaEvolutionService()
 
-        # Mock basin service to return basins with known strengths
+        # Basins with known strengths
         mock_basin_stats = {
             "basins": [
                 {"name": "cognitive_science", "strength": 0.85, "stability": 0.7, "activation_count": 10},
@@ -51,24 +67,17 @@ class TestCaptureSystemMomentRealMetrics:
         # cognitive_science (0.85) + consciousness (0.65) + systems_theory (0.50) = 2.00
         expected_energy = 2.00
 
-        with patch('api.services.meta_evolution_service.get_memory_basin_router') as mock_router:
-            mock_router_instance = AsyncMock()
-            mock_router_instance.get_basin_stats = AsyncMock(return_value=mock_basin_stats)
-            mock_router.return_value = mock_router_instance
-
-            # Also mock Neo4j driver for total_memories_count
-            with patch('api.services.meta_evolution_service.get_neo4j_driver') as mock_driver:
-                mock_driver_instance = AsyncMock()
-                mock_driver_instance.execute_query = AsyncMock(side_effect=[
-                    [{"count": 150}],  # Memory count
-                    [{"avg_surprise": 0.0, "avg_success": 0.0, "episode_count": 0}],  # Episodes
-                    [],  # Focus (empty - no active goals)
-                    [],  # Logs (empty - no recent errors)
-                    [],  # Persist (CREATE confirmation)
-                ])
-                mock_driver.return_value = mock_driver_instance
+        # Also mock Neo4j driver for total_memories_count
+        with patch('api.services.meta_evolution_service.get_neo4j_driver') as mock_driver:
+            mock_driver_instance = AsyncMock()
+            mock_driver_instance.execute_query = AsyncMock(side_effect=[
+                [_metrics_row(mock_basin_stats, memory_count=150, avg_surprise=0.0, avg_success=0.0, episodes=0, focus=None)],
+                [],  # Logs (empty - no recent errors)
+                [],  # Persist (CREATE confirmation)
+            ])
+            mock_driver.return_value = mock_driver_instance
 
-                moment = await service.capture_system_moment()
+            moment = await service.capture_system_moment()
 
         # Verify energy_level is computed (not placeholder)
         assert moment.energy_level != 100.0, "energy_level must NOT be placeholder value 100.0"
@@ -97,23 +106,16 @@ class TestCaptureSystemMomentRealMetrics:
         # Expected: only strong_basin (0.90) contributes
         expected_energy = 0.90
 
-        with patch('api.services.meta_evolution_service.get_memory_basin_router') as mock_router:
-            mock_router_instance = AsyncMock()
-            mock_router_instance.get_basin_stats = AsyncMock(return_value=mock_basin_stats)
-            mock_router.return_value = mock_router_instance
-
-            with patch('api.services.meta_evolution_service.get_neo4j_driver') as mock_driver:
-                mock_driver_instance = AsyncMock()
-                mock_driver_instance.execute_query = AsyncMock(side_effect=[
-                    [{"count": 50}],  # Memory count
-                    [{"avg_surprise": 0.0, "avg_success": 0.0, "episode_count": 0}],  # Episodes
-                    [],  # Focus
-                    [],  # Logs
-                    [],  # Persist
-                ])
-                mock_driver.return_value = mock_driver_instance
+        with patch('api.services.meta_evolution_service.get_neo4j_driver') as mock_driver:
+            mock_driver_instance = AsyncMock()
+            mock_driver_instance.execute_query = AsyncMock(side_effect=[
+                [_metrics_row(mock_basin_stats, memory_count=50, avg_surprise=0.0, avg_success=0.0, episodes=0, focus=None)],
+                [],  # Logs
+                [],  # Persist
+            ])
+            mock_driver.return_value = mock_driver_instance
 
-                moment = await service.capture_system_moment()
+            moment = await service.capture_system_moment()
 
         assert moment.energy_level == pytest.approx(expected_energy, rel=0.01), \
             "energy_level should exclude basins below threshold"
@@ -142,23 +144,16 @@ class TestCaptureSystemMomentRealMetrics:
 
         expected_count = 3  # Three basins above 0.3 threshold
 
-        with patch('api.services.meta_evolution_service.get_memory_basin_router') as mock_router:
-            mock_router_instance = AsyncMock()
-            mock_router_instance.get_basin_stats = AsyncMock(return_value=mock_basin_stats)
-            mock_router.return_value = mock_router_instance
-
-            with patch('api.services.meta_evolution_service.get_neo4j_driver') as mock_driver:
-                mock_driver_instance = AsyncMock()
-                mock_driver_instance.execute_query = AsyncMock(side_effect=[
-                    [{"count": 75}],  # Memory count
-                    [{"avg_surprise": 0.0, "avg_success": 0.0, "episode_count": 0}],  # Episodes
-                    [],  # Focus
-                    [],  # Logs
-                    [],  # Persist
-                ])
-                mock_driver.return_value = mock_driver_instance
+        with patch('api.services.meta_evolution_service.get_neo4j_driver') as mock_driver:
+            mock_driver_instance = AsyncMock()
+            mock_driver_instance.execute_query = AsyncMock(side_effect=[
+                [_metrics_row(mock_basin_stats, memory_count=75, avg_surprise=0.0, avg_success=0.0, episodes=0, focus=None)],
+                [],  # Logs
+                [],  # Persist
+            ])
+            mock_driver.return_value = mock_driver_instance
 
-                moment = await service.capture_system_moment()
+            moment = await service.capture_system_moment()
 
         assert moment.active_basins_count != 5, "active_basins_count must NOT be placeholder value 5"
         assert moment.active_basins_count == expected_count, \
@@ -178,23 +173,16 @@ class TestCaptureSystemMomentRealMetrics:
         # No basins returned
         mock_basin_stats = {"basins": []}
 
-        with patch('api.services.meta_evolution_service.get_memory_basin_router') as mock_router:
-            mock_router_instance = AsyncMock()
-            mock_router_instance.get_basin_stats = AsyncMock(return_value=mock_basin_stats)
-            mock_router.return_value = mock_router_instance
-
-            with patch('api.services.meta_evolution_service.get_neo4j_driver') as mock_driver:
-                mock_driver_instance = AsyncMock()
-                mock_driver_instance.execute_query = AsyncMock(side_effect=[
-                    [{"count": 0}],  # Memory count
-                    [{"avg_surprise": 0.0, "avg_success": 0.0, "episode_count": 0}],  # Episodes
-                    [],  # Focus
-                    [],  # Logs
-                    [],  # Persist
-                ])
-                mock_driver.return_value = mock_driver_instance
+        with patch('api.services.meta_evolution_service.get_neo4j_driver') as mock_driver:
+            mock_driver_instance = AsyncMock()
+            mock_driver_instance.execute_query = AsyncMock(side_effect=[
+                [_metrics_row(mock_basin_stats, memory_count=0, avg_surprise=0.0, avg_success=0.0, episodes=0, focus=None)],
+                [],  # Logs
+                [],  # Persist
+            ])
+            mock_driver.return_value = mock_driver_instance
 
-                moment = await service.capture_system_moment()
+            moment = await service.capture_system_moment()
 
         assert moment.active_basins_count == 0, "Should handle zero active basins"
         assert moment.energy_level == 0.0, "Energy level should be 0 when no basins active"
@@ -217,28 +205,21 @@ class TestCaptureSystemMomentRealMetrics:
             ]
         }
 
-        with patch('api.services.meta_evolution_service.get_memory_basin_router') as mock_router:
-            mock_router_instance = AsyncMock()
-            mock_router_instance.get_basin_stats = AsyncMock(return_value=mock_basin_stats)
-            mock_router.return_value = mock_router_instance
-
-            with patch('api.services.meta_evolution_service.get_neo4j_driver') as mock_driver:
-                mock_driver_instance = AsyncMock()
-                mock_driver_instance.execute_query = AsyncMock(side_effect=[
-                    [{"count": 50}],  # Memory count
-                    [{"avg_surprise": 0.0, "avg_success": 0.0, "episode_count": 0}],  # Episodes
-                    [],  # Focus
-                    [],  # Logs
-                    [],  # Persist
-                ])
-                mock_driver.return_value = mock_driver_instance
-
-                with patch('api.services.meta_evolution_service.logger') as mock_logger:
-                    moment = await service.capture_system_moment()
-
-                    # Should log warning for out-of-range value
-                    assert any("out of expected range" in str(call) for call in mock_logger.warning.call_args_list), \
-                        "Should warn when energy_level outside [0, 10] range"
+        with patch('api.services.meta_evolution_service.get_neo4j_driver') as mock_driver:
+            mock_driver_instance = AsyncMock()
+            mock_driver_instance.execute_query = AsyncMock(side_effect=[
+                [_metrics_row(mock_basin_stats, memory_count=50, avg_surprise=0.0, avg_success=0.0, episodes=0, focus=None)],
+                [],  # Logs
+                [],  # Persist
+            ])
+            mock_driver.return_value = mock_driver_instance
+
+            with patch('api.services.meta_evolution_service.logger') as mock_logger:
+                moment = await service.capture_system_moment()
+
+                # Should log warning for out-of-range value
+                assert any("out of expected range" in str(call) for call in mock_logger.warning.call_args_list), \
+                    "Should warn when energy_level outside [0, 10] range"
 
         # Value should be clamped to valid range
         assert 0.0 <= moment.energy_level <= 10.0, "energy_level must be clamped to [0, 10] range"
@@ -255,23 +236,16 @@ class TestCaptureSystemMomentRealMetrics:
             ]
         }
 
-        with patch('api.services.meta_evolution_service.get_memory_basin_router') as mock_router:
-            mock_router_instance = AsyncMock()
-            mock_router_instance.get_basin_stats = AsyncMock(return_value=mock_basin_stats)
-            mock_router.return_value = mock_router_instance
-
-            with patch('api.services.meta_evolution_service.get_neo4j_driver') as mock_driver:
-                mock_driver_instance = AsyncMock()
-                mock_driver_instance.execute_query = AsyncMock(side_effect=[
-                    [{"count": 7}],  # Memory count
-                    [{"avg_surprise": 0.2, "avg_success": 0.75, "episode_count": 4}],  # Episodes
-                    [{"title": "Primary Goal", "priority": "active", "last_touched": datetime.utcnow()}],  # Focus
-                    [{"actions": '[{"error": "boom"}, {"error": null}]'}],  # Logs
-                    [],  # Persist
-                ])
-                mock_driver.return_value = mock_driver_instance
+        with patch('api.services.meta_evolution_service.get_neo4j_driver') as mock_driver:
+            mock_driver_instance = AsyncMock()
+            mock_driver_instance.execute_query = AsyncMock(side_effect=[
+                [_metrics_row(mock_basin_stats, memory_count=7, avg_surprise=0.2, avg_success=0.75, episodes=4, focus="Primary Goal")],
+                [{"actions": '[{"error": "boom"}, {"error": null}]'}],  # Logs
+                [],  # Persist
+            ])
+            mock_driver.return_value = mock_driver_instance
 
-                moment = await service.capture_system_moment()
+            moment = await service.capture_system_moment()
 
         assert moment.total_memories_count == 7
         assert moment.avg_surprise_score == pytest.approx(0.2, rel=0.01)
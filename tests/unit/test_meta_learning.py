@@ -20,6 +20,7 @@ from api.models.meta_learning import (
     PatternLibrary,
 )
 from api.services.meta_learning_enhancer import (
+    KeywordScanner,
     MetaLearningEnhancer,
     get_meta_learning_enhancer,
     enhance_document,
@@ -534,6 +535,133 @@ class TestClassificationAccuracy:
         assert result.extraction.paper_type == MetaLearningPaperType.CONTINUAL_LEARNING
 
 
+class TestKeywordScanner:
+    """Tests for the single-pass keyword scanner."""
+
+    def test_matches_str_count_and_index(self):
+        """Counts and first positions should match per-keyword scans."""
+        keywords = [
+            "inference", "active inference", "nas", "ssl", "step",
+            "attention", "self-attention", "aa",
+        ]
+        text = (
+            "Active Inference uses self-attention; dynasty steps stepstep "
+            "aaaa SSL inference. ACTIVE INFERENCE"
+        )
+        hits = KeywordScanner(keywords).scan(text)
+        lower = text.lower()
+
+        for keyword in keywords:
+            assert hits.count(keyword) == lower.count(keyword)
+            if keyword in lower:
+                assert keyword in hits
+                assert hits.index(keyword) == lower.index(keyword)
+            else:
+                assert keyword not in hits
+
+    def test_finditer_reports_overlapping_hits(self):
+        """Every occurrence should be reported with its position."""
+        scanner = KeywordScanner(["free energy", "energy", "free"])
+        assert sorted(scanner.finditer("free energy")) == [
+            (0, "free"), (0, "free energy"), (5, "energy"),
+        ]
+
+    def test_empty_keyword_set(self):
+        """A scanner without keywords should find nothing."""
+        hits = KeywordScanner([]).scan("anything")
+        assert hits.counts == {}
+
+
+class TestBatchProcessing:
+    """Tests for process_documents batch entry point."""
+
+    @pytest.fixture
+    def documents(self):
+        return [
+            {
+                "document_id": f"batch_{i}",
+                "content": (
+                    "Our method uses active inference. First, then, next, "
+                    "finally each step is compared to a baseline. "
+                    f"Results for run {i}."
+                ),
+            }
+            for i in range(6)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_inline_batch_matches_single_processing(self, documents):
+        """Small batches should match per-document processing."""
+        batch_enhancer = MetaLearningEnhancer()
+        single_enhancer = MetaLearningEnhancer()
+
+        results = await batch_enhancer.process_documents(documents)
+        for doc, result in zip(documents, results):
+            single = await single_enhancer.process_document(**doc)
+            assert result.extraction.document_id == doc["document_id"]
+            assert result.extraction.paper_type == single.extraction.paper_type
+            assert result.extraction.key_concepts == single.extraction.key_concepts
+            assert len(result.extraction.patterns) == len(single.extraction.patterns)
+
+    @pytest.mark.asyncio
+    async def test_process_pool_merges_pattern_library(self, documents):
+        """Worker results should come back in order and merge into the library."""
+        enhancer = MetaLearningEnhancer()
+        results = await enhancer.process_documents(
+            documents, max_workers=2, min_documents_for_processes=2
+        )
+
+        assert [r.extraction.document_id for r in results] == [
+            d["document_id"] for d in documents
+        ]
+        assert all(r.success for r in results)
+        extracted = sum(len(r.extraction.patterns) for r in results)
+        assert extracted > 0
+        assert sum(r.patterns_learned + r.patterns_reinforced for r in results) == extracted
+        library = enhancer.pattern_library.patterns.values()
+        assert sum(p.occurrence_count for p in library) == extracted
+        sources = {s for p in library for s in p.source_documents}
+        assert sources == {d["document_id"] for d in documents}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_batch_does_not_wait_for_workers(self, documents, monkeypatch):
+        """Workers are spawned, and cancellation drops queued chunks without joining."""
+        import asyncio
+
+        from api.services import meta_learning_enhancer
+
+        pools = []
+
+        class RecordingPool(meta_learning_enhancer.ProcessPoolExecutor):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.start_method = kwargs["mp_context"].get_start_method()
+                self.shutdown_kwargs = None
+                pools.append(self)
+
+            def shutdown(self, **kwargs):
+                self.shutdown_kwargs = kwargs
+                super().shutdown(**kwargs)
+
+        monkeypatch.setattr(meta_learning_enhancer, "ProcessPoolExecutor", RecordingPool)
+        task = asyncio.create_task(MetaLearningEnhancer().process_documents(
+            documents * 20, max_workers=2, min_documents_for_processes=2
+        ))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        (pool,) = pools
+        assert pool.start_method == "spawn"
+        assert pool.shutdown_kwargs == {"wait": False, "cancel_futures": True}
+
+    @pytest.mark.asyncio
+    async def test_empty_batch(self):
+        """An empty batch should return no results."""
+        assert await MetaLearningEnhancer().process_documents([]) == []
+
+
 class TestServiceSingleton:
     """Tests for singleton service pattern."""
 
@@ -12,6 +12,35 @@ from api.services.meta_tot_trace_service import (
     get_meta_tot_trace_service,
 )
 from api.models.meta_tot import MetaToTTracePayload, MetaToTNodeTrace, MetaToTDecision
+from api.services.meta_tot_blob_store import MetaToTBlobStore
+
+
+@pytest.fixture(autouse=True)
+def blob_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("META_TOT_BLOB_DIR", str(tmp_path / "blobs"))
+    return tmp_path / "blobs"
+
+
+def _node(node_id, parent_id=None, depth=0, thought="t"):
+    return MetaToTNodeTrace(
+        node_id=node_id, parent_id=parent_id, depth=depth, node_type="exploration",
+        cpa_domain="explore", thought=thought, score=0.5, prediction_error=0.1, free_energy=0.2,
+    )
+
+
+def _tree_payload(trace_id="tree-1", created_at="2026-01-26T12:00:00"):
+    return MetaToTTracePayload(
+        trace_id=trace_id,
+        session_id="session-tree",
+        created_at=created_at,
+        confidence=0.7,
+        nodes=[
+            _node("root"),
+            _node("a", "root", 1), _node("b", "root", 1),
+            _node("a1", "a", 2), _node("a2", "a", 2, thought="same"),
+            _node("b1", "b", 2),
+        ],
+    )
 
 
 class TestMetaToTTraceService:
@@ -32,6 +61,42 @@ class TestMetaToTTraceService:
         mock_graphiti.execute_cypher.assert_called_once()
         call_args = mock_graphiti.execute_cypher.call_args
         assert "MERGE (t:MetaToTTrace" in call_args[0][0]
+        # Only a summary and the blob pointer go to the graph
+        params = call_args[0][1]
+        assert "payload" not in params
+        assert len(params["blob_hash"]) == 64
+
+    @pytest.mark.asyncio
+    async def test_stored_trace_round_trips_without_graph_read(self):
+        mock_graphiti = AsyncMock()
+        mock_graphiti.execute_cypher = AsyncMock(return_value=[{"id": "tree-1"}])
+        service = MetaToTTraceService(graphiti_service=mock_graphiti)
+        payload = _tree_payload()
+
+        await service.store_trace(payload)
+        mock_graphiti.execute_cypher.reset_mock()
+
+        assert await service.get_trace("tree-1") == payload
+        mock_graphiti.execute_cypher.assert_not_called()
+
+        lazy = await service.get_trace("tree-1", include_branches=False)
+        assert [n.node_id for n in lazy.nodes] == ["root"]
+        branch = await service.get_branch("tree-1", "a")
+        assert [n.node_id for n in branch] == ["a", "a1", "a2"]
+        assert await service.get_branch("tree-1", "missing") is None
+        assert (await service.list_traces())[0]["node_count"] == 6
+
+    @pytest.mark.asyncio
+    async def test_get_trace_follows_graph_pointer(self, blob_dir):
+        ref = MetaToTBlobStore(blob_dir / "elsewhere").put_trace(_tree_payload().model_dump())
+        store = MetaToTBlobStore(blob_dir / "elsewhere")
+        store._refs.clear()  # trace known only through the graph
+        mock_graphiti = AsyncMock()
+        mock_graphiti.execute_cypher = AsyncMock(return_value=[{"blob_hash": ref["hash"], "payload": None}])
+        service = MetaToTTraceService(graphiti_service=mock_graphiti, blob_store=store)
+
+        result = await service.get_trace("tree-1")
+        assert len(result.nodes) == 6
 
     @pytest.mark.asyncio
     async def test_store_trace_with_fallback_graphiti(self):
@@ -85,6 +150,107 @@ class TestMetaToTTraceService:
         assert result is None
 
 
+class TestMetaToTBlobStore:
+    def test_identical_branches_are_stored_once(self, blob_dir):
+        store = MetaToTBlobStore(blob_dir)
+        first = store.put_trace(_tree_payload("t-1").model_dump())
+        second = store.put_trace(_tree_payload("t-2").model_dump())
+
+        assert first["hash"] != second["hash"]
+        # 2 branch blobs shared + 2 manifests
+        assert len(list((blob_dir / "objects").glob("*/*"))) == 4
+        assert second["stored_bytes"] > 0
+
+    def test_gc_expires_by_age_and_count_and_sweeps_objects(self, blob_dir):
+        store = MetaToTBlobStore(blob_dir, retention_days=30, max_traces=1)
+        store.put_trace(_tree_payload("old", created_at="2025-01-01T00:00:00").model_dump())
+        store.put_trace(_tree_payload("mid", created_at="2026-01-20T00:00:00").model_dump())
+        keep = _tree_payload("new", created_at="2026-01-25T00:00:00")
+        keep.nodes[-1].thought = "changed"
+        store.put_trace(keep.model_dump())
+
+        from datetime import datetime
+        result = store.gc(now=datetime(2026, 1, 26))
+
+        assert result == {
+            "expired_traces": 2, "deleted_objects": 3, "traces": 1, "expired_trace_ids": ["mid", "old"],
+        }
+        assert store.get_manifest("old") is None
+        assert store.assemble(store.get_manifest("new"))["nodes"][-1]["thought"] == "changed"
+        assert [r["trace_id"] for r in MetaToTBlobStore(blob_dir).list_traces()] == ["new"]
+
+    def test_refs_are_journaled_not_rewritten(self, blob_dir, monkeypatch):
+        from api.services import meta_tot_blob_store
+
+        monkeypatch.setattr(meta_tot_blob_store, "REFS_JOURNAL_COMPACT_SLACK", 2)
+        store = MetaToTBlobStore(blob_dir)
+        for i in range(3):
+            store.put_trace(_tree_payload(f"t-{i}").model_dump())
+        journal = blob_dir / meta_tot_blob_store.REFS_JOURNAL_FILE
+        assert len(journal.read_text().splitlines()) == 3
+
+        # Re-puts only append; the 6th record exceeds 3 live refs + 2 slack
+        for i in (1, 2):
+            store.put_trace(_tree_payload(f"t-{i}").model_dump())
+        assert len(journal.read_text().splitlines()) == 5
+        store.put_trace(_tree_payload("t-0").model_dump())
+        assert len(journal.read_text().splitlines()) == 3
+        assert sorted(r["trace_id"] for r in MetaToTBlobStore(blob_dir).list_traces()) == ["t-0", "t-1", "t-2"]
+
+    def test_legacy_refs_file_is_imported(self, blob_dir):
+        ref = MetaToTBlobStore(blob_dir).put_trace(_tree_payload("legacy").model_dump())
+        (blob_dir / "refs.journal").unlink()
+        (blob_dir / "refs.json").write_text(json.dumps({"legacy": ref}))
+
+        assert MetaToTBlobStore(blob_dir).get_ref("legacy") == ref
+        assert not (blob_dir / "refs.json").exists()
+        assert MetaToTBlobStore(blob_dir).get_ref("legacy") == ref
+
+    @pytest.mark.asyncio
+    async def test_gc_clears_graph_pointers_to_expired_blobs(self, blob_dir):
+        store = MetaToTBlobStore(blob_dir, max_traces=1)
+        mock_graphiti = AsyncMock()
+        mock_graphiti.execute_cypher = AsyncMock(return_value=[])
+        service = MetaToTTraceService(graphiti_service=mock_graphiti, blob_store=store, gc_every=2)
+
+        await service.store_trace(_tree_payload("old", created_at="2099-01-01T00:00:00"))
+        await service.store_trace(_tree_payload("new", created_at="2099-01-02T00:00:00"))
+
+        cypher, params = mock_graphiti.execute_cypher.call_args.args
+        assert "t.blob_hash = null" in cypher
+        assert params["ids"] == ["old"]
+
+
+    @pytest.mark.asyncio
+    async def test_blob_io_runs_off_the_event_loop(self, blob_dir):
+        import asyncio
+        import threading
+
+        store = MetaToTBlobStore(blob_dir)
+        threads = {}
+        for name in ("put_trace", "gc", "get_manifest", "assemble"):
+            original = getattr(store, name)
+
+            def record(*args, _name=name, _original=original, **kwargs):
+                threads[_name] = threading.get_ident()
+                return _original(*args, **kwargs)
+
+            setattr(store, name, record)
+        mock_graphiti = AsyncMock()
+        mock_graphiti.execute_cypher = AsyncMock(return_value=[])
+        service = MetaToTTraceService(graphiti_service=mock_graphiti, blob_store=store, gc_every=3)
+
+        ids = await asyncio.gather(*(
+            service.store_trace(_tree_payload(f"t-{i}", created_at="2099-01-01T00:00:00")) for i in range(6)
+        ))
+        loaded = await service.get_trace("t-5")
+
+        assert loaded is not None and loaded.trace_id == "t-5"
+        assert sorted(ids) == [f"t-{i}" for i in range(6)]
+        assert set(threads) == {"put_trace", "gc", "get_manifest", "assemble"}
+        assert threading.get_ident() not in threads.values()
+
+
 class TestTracePayloadSerialization:
     def test_payload_with_nodes(self):
         node_trace = MetaToTNodeTrace(
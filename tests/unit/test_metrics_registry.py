@@ -0,0 +1,111 @@
+import pytest
+
+from api.services.metrics_registry import AlertRule, MetricsRegistry, evaluate_alert_rules
+
+
+class _Clock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _registry(clock=None):
+    return MetricsRegistry(window_seconds=60, slot_seconds=10, clock=clock or _Clock())
+
+
+def test_counter_rate_rolls_off_after_window():
+    clock = _Clock()
+    registry = _registry(clock)
+    requests = registry.counter("reqs_total", "Requests.", ("outcome",))
+
+    for _ in range(30):
+        requests.labels(outcome="ok").inc()
+    series = requests.labels(outcome="ok")
+    assert series.value == 30
+    assert series.rate() == pytest.approx(0.5)
+
+    clock.now += 120
+    assert series.increase() == 0
+    assert series.value == 30
+
+
+def test_histogram_window_quantiles():
+    clock = _Clock()
+    registry = _registry(clock)
+    latency = registry.histogram("latency_ms", "Latency.", buckets=(10, 100, 1000))
+
+    for ms in (3, 3, 3, 50, 5000):
+        latency.observe(ms)
+    series = latency.labels()
+    assert series.quantile(0.5) == 10
+    assert series.quantile(0.99) == 5000
+
+    clock.now += 120
+    latency.observe(500)
+    assert series.quantile(0.5) == 1000
+    assert series.count == 6
+
+
+def test_registry_rejects_conflicting_definitions():
+    registry = _registry()
+    registry.counter("x_total", "X.")
+    with pytest.raises(ValueError):
+        registry.gauge("x_total", "X.")
+    with pytest.raises(ValueError):
+        registry.counter("x_total", "X.", ("label",))
+
+
+def test_prometheus_text_renders_cumulative_buckets():
+    registry = _registry()
+    registry.histogram("lat_ms", "Latency.", ("route",), buckets=(10, 100)).labels(route="/a").observe(50)
+    registry.counter("hits_total", "Hits.").inc(2)
+
+    text = registry.prometheus_text()
+    assert "# TYPE lat_ms histogram" in text
+    assert 'lat_ms_bucket{route="/a",le="10"} 0' in text
+    assert 'lat_ms_bucket{route="/a",le="+Inf"} 1' in text
+    assert "hits_total 2" in text
+
+
+def test_alert_rules_threshold_rate_and_quantile():
+    registry = _registry()
+    depth = registry.gauge("queue_depth", "Queue depth.")
+    degraded = registry.gauge("agent_degraded", "Degraded agents.", ("agent_id",))
+    errors = registry.counter("errors_total", "Errors.", ("outcome",))
+    latency = registry.histogram("latency_ms", "Latency.", buckets=(10, 100, 1000))
+
+    collected = []
+    registry.register_collector("test", lambda: (collected.append(1), depth.set(15)))
+    degraded.labels(agent_id="a1").set(1)
+    degraded.labels(agent_id="a2").set(0)
+    for _ in range(12):
+        errors.labels(outcome="error").inc()
+    errors.labels(outcome="ok").inc(100)
+    for _ in range(10):
+        latency.observe(800)
+
+    rules = [
+        AlertRule(id="backlog", metric="queue_depth", threshold=10, message="{value:g} queued"),
+        AlertRule(id="degraded", metric="agent_degraded", threshold=0, severity="critical", affected_label="agent_id"),
+        AlertRule(id="error_rate", metric="errors_total", condition="rate", labels={"outcome": "error"}, threshold=0.1),
+        AlertRule(id="quiet", metric="errors_total", condition="increase", labels={"outcome": "error"}, threshold=50),
+        AlertRule(id="p95", metric="latency_ms", condition="quantile", threshold=500),
+        AlertRule(id="missing", metric="not_registered", threshold=0),
+    ]
+    alerts = {a["id"]: a for a in evaluate_alert_rules(registry, rules)}
+
+    assert collected
+    assert set(alerts) == {"backlog", "degraded", "error_rate", "p95"}
+    assert alerts["backlog"]["message"] == "15 queued"
+    assert alerts["degraded"]["affected"] == ["a1"]
+    assert alerts["error_rate"]["value"] == pytest.approx(0.2)
+    assert alerts["p95"]["value"] == 1000
+
+
+def test_alert_rule_validates_operator_and_condition():
+    with pytest.raises(ValueError):
+        AlertRule(id="bad", metric="m", threshold=1, op="~")
+    with pytest.raises(ValueError):
+        AlertRule(id="bad", metric="m", threshold=1, condition="median")
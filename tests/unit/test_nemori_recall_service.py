@@ -0,0 +1,117 @@
+import asyncio
+import time
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from api.models.autobiographical import DevelopmentEpisode
+from api.services.nemori_recall_service import NemoriRecallService
+
+
+def _episode(episode_id, title, summary="summary", events=()):
+    return DevelopmentEpisode(
+        episode_id=episode_id,
+        journey_id="j1",
+        title=title,
+        summary=summary,
+        narrative=f"narrative of {title}",
+        start_time=datetime(2026, 1, 1),
+        end_time=datetime(2026, 1, 2),
+        events=list(events),
+    )
+
+
+def _hit(id, content):
+    return SimpleNamespace(id=id, content=content)
+
+
+def _service(episodes, hits, episodic_delay=0.0, semantic_delay=0.0, deadline_ms=1000):
+    async def search_episodes(**kwargs):
+        await asyncio.sleep(episodic_delay)
+        return episodes
+
+    async def semantic_search(**kwargs):
+        await asyncio.sleep(semantic_delay)
+        return SimpleNamespace(results=hits[: kwargs["top_k"]])
+
+    store = MagicMock()
+    store.search_episodes = AsyncMock(side_effect=search_episodes)
+    vector = MagicMock()
+    vector.semantic_search = AsyncMock(side_effect=semantic_search)
+    with patch("api.services.nemori_recall_service.get_consolidated_memory_store", return_value=store), \
+         patch("api.services.nemori_recall_service.get_vector_search_service", return_value=vector):
+        return NemoriRecallService(k=2, m=2, deadline_ms=deadline_ms), vector
+
+
+@pytest.mark.asyncio
+async def test_legs_run_concurrently():
+    service, _ = _service([_episode("e1", "Alpha")], [_hit("s1", "fact")], episodic_delay=0.1, semantic_delay=0.1)
+
+    started = time.perf_counter()
+    result = await service.recall_with_nemori_ratio("q")
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.18
+    assert result["ratio"] == "1/1"
+    assert result["partial"] is False
+    assert result["timed_out"] == []
+    assert {leg["status"] for leg in result["legs"].values()} == {"ok"}
+
+
+@pytest.mark.asyncio
+async def test_slow_leg_is_dropped_at_deadline():
+    service, _ = _service([_episode("e1", "Alpha")], [_hit("s1", "fact")], semantic_delay=5.0, deadline_ms=50)
+
+    started = time.perf_counter()
+    result = await service.recall_with_nemori_ratio("q")
+
+    assert time.perf_counter() - started < 1.0
+    assert result["partial"] is True
+    assert result["timed_out"] == ["semantic"]
+    assert result["legs"]["episodic"]["status"] == "ok"
+    assert (result["episodes_count"], result["semantic_count"]) == (1, 0)
+    assert "Alpha" in result["formatted_context"]
+
+
+@pytest.mark.asyncio
+async def test_failed_leg_is_reported_not_raised():
+    service, vector = _service([_episode("e1", "Alpha")], [])
+    vector.semantic_search.side_effect = RuntimeError("index offline")
+
+    result = await service.recall_with_nemori_ratio("q")
+
+    assert result["partial"] is True
+    assert result["timed_out"] == []
+    assert result["legs"]["semantic"]["status"] == "error"
+    assert result["legs"]["semantic"]["error"] == "index offline"
+    assert result["ratio"] == "1/0"
+
+
+@pytest.mark.asyncio
+async def test_cross_leg_duplicates_are_dropped_and_backfilled():
+    episodes = [_episode("e1", "Alpha", summary="Shipped the recall refactor", events=["ev-9"])]
+    hits = [
+        _hit("e1", "episode itself"),
+        _hit("s1", "  shipped the RECALL refactor "),
+        _hit("ev-9", "an event of the episode"),
+        _hit("s2", "first fact"),
+        _hit("s3", "first fact"),
+        _hit("s4", "second fact"),
+        _hit("s5", "third fact"),
+    ]
+    service, vector = _service(episodes, hits)
+    vector.semantic_search.side_effect = None
+    vector.semantic_search.return_value = SimpleNamespace(results=hits)
+
+    result = await service.recall_with_nemori_ratio("q")
+
+    # Over-fetched so the m budget survives deduplication
+    assert vector.semantic_search.await_args.kwargs["top_k"] == 4
+    assert result["ratio"] == "1/2"
+    assert result["deduplicated"] == 4
+    assert "first fact" in result["formatted_context"]
+    assert "second fact" in result["formatted_context"]
+    assert "third fact" not in result["formatted_context"]
+    assert "episode itself" not in result["formatted_context"]
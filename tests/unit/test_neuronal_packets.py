@@ -41,6 +41,49 @@ async def test_packet_chaining(river_flow):
     assert len(packets) == 1
     assert packets[0].metadata["parent_packet_id"] is None
 
+@pytest.mark.asyncio
+async def test_stream_packet_train_batches_writes(river_flow):
+    """Verify streamed packets are flushed through store_events in batches."""
+    from unittest.mock import AsyncMock
+
+    river_flow.store = AsyncMock()
+    river_flow.store.store_events = AsyncMock(side_effect=lambda batch: len(batch))
+
+    async def stream():
+        # 230 words split mid-word across chunk boundaries
+        text = " ".join(f"w{i}" for i in range(230))
+        for start in range(0, len(text), 37):
+            yield text[start:start + 37]
+
+    packets = [p async for p in river_flow.stream_packet_train(stream(), batch_size=2)]
+
+    assert len(packets) == 5
+    words = " ".join(p.rationale for p in packets).split()
+    assert words == [f"w{i}" for i in range(230)]
+    assert packets[0].metadata["parent_packet_id"] is None
+    for i in range(1, len(packets)):
+        assert packets[i].metadata["parent_packet_id"] == packets[i - 1].event_id
+        assert packets[i].metadata["total_packets"] is None
+
+    batches = [call.args[0] for call in river_flow.store.store_events.await_args_list]
+    assert [len(b) for b in batches] == [2, 2, 1]
+    river_flow.store.store_event.assert_not_awaited()
+
+@pytest.mark.asyncio
+async def test_create_packet_train_uses_bulk_store(river_flow):
+    """Verify create_packet_train no longer writes one packet at a time."""
+    from unittest.mock import AsyncMock
+
+    river_flow.store = AsyncMock()
+    river_flow.store.store_events = AsyncMock(side_effect=lambda batch: len(batch))
+
+    packets = await river_flow.create_packet_train("word " * 120, batch_size=32)
+
+    assert len(packets) == 3
+    assert all(p.metadata["total_packets"] == 3 for p in packets)
+    river_flow.store.store_events.assert_awaited_once()
+    river_flow.store.store_event.assert_not_awaited()
+
 @pytest.mark.asyncio
 async def test_active_inference_metrics():
     """Verify entropy and surprisal calculations."""
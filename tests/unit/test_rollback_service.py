@@ -61,3 +61,175 @@ async def test_cleanup_expired():
         count = await service.cleanup_expired()
         assert count == 1
         assert cid not in service.checkpoints
+
+
+@pytest.mark.asyncio
+async def test_repeated_checkpoints_share_chunks(tmp_path):
+    import random
+
+    service = RollbackService(storage_path=str(tmp_path / "store"))
+    file_path = tmp_path / "big.bin"
+    original = random.Random(7).randbytes(256 * 1024)
+    data = bytearray(original)
+    file_path.write_bytes(original)
+
+    first = await service.create_checkpoint(CheckpointCreateRequest(component_id="c", file_path=str(file_path)))
+    stored_after_first = service.chunks.stats()["chunks"]
+
+    data[100_000:100_010] = b"0123456789"
+    file_path.write_bytes(bytes(data))
+    second = await service.create_checkpoint(CheckpointCreateRequest(component_id="c", file_path=str(file_path)))
+
+    first_chunks = service.checkpoints[first].file_backups[str(file_path)].chunks
+    second_chunks = service.checkpoints[second].file_backups[str(file_path)].chunks
+    shared = set(first_chunks) & set(second_chunks)
+    assert len(shared) >= len(first_chunks) - 2
+    assert service.chunks.stats()["chunks"] <= stored_after_first + 2
+
+    file_path.write_bytes(b"clobbered")
+    assert await service.rollback(first, backup_current=False) is True
+    assert file_path.read_bytes() == original
+
+
+@pytest.mark.asyncio
+async def test_journal_replays_state(tmp_path):
+    storage = str(tmp_path / "store")
+    file_path = tmp_path / "logic.py"
+    file_path.write_text("v1")
+
+    service = RollbackService(storage_path=storage)
+    cid = await service.create_checkpoint(CheckpointCreateRequest(component_id="c", file_path=str(file_path)))
+    file_path.write_text("v2")
+    assert await service.rollback(cid, backup_current=False)
+    assert not (Path(storage) / "state.json").exists()
+
+    reloaded = RollbackService(storage_path=storage)
+    assert reloaded.checkpoints[cid].status == "restored"
+    assert reloaded.checkpoints[cid].file_backups[str(file_path)].chunks
+    assert len(reloaded.history) == 1 and reloaded.history[0].success
+
+
+@pytest.mark.asyncio
+async def test_legacy_state_json_is_imported(tmp_path):
+    from datetime import datetime, timedelta
+
+    storage = tmp_path / "store"
+    storage.mkdir()
+    (storage / "state.json").write_text(json.dumps({
+        "checkpoints": {"old": {
+            "checkpoint_id": "old",
+            "component_id": "c",
+            "retention_until": (datetime.utcnow() + timedelta(days=1)).isoformat(),
+        }},
+        "history": [],
+    }))
+
+    service = RollbackService(storage_path=str(storage))
+    assert "old" in service.checkpoints
+    assert RollbackService(storage_path=str(storage)).checkpoints.keys() == {"old"}
+
+
+@pytest.mark.asyncio
+async def test_rollback_fails_on_corrupt_chunk_without_touching_file(tmp_path):
+    service = RollbackService(storage_path=str(tmp_path / "store"))
+    file_path = tmp_path / "logic.py"
+    file_path.write_text("v1_content")
+    cid = await service.create_checkpoint(CheckpointCreateRequest(component_id="c", file_path=str(file_path)))
+    file_path.write_text("v2_content")
+
+    (digest,) = service.checkpoints[cid].file_backups[str(file_path)].chunks
+    import zlib
+    service.chunks._object_path(digest).write_bytes(zlib.compress(b"tampered"))
+
+    assert await service.rollback(cid) is False
+    assert file_path.read_text() == "v2_content"
+    assert "checksum" in service.history[-1].error
+    assert list(tmp_path.glob(".logic.py.restore-*")) == []
+
+
+@pytest.mark.asyncio
+async def test_cleanup_expired_collects_unreferenced_chunks(tmp_path):
+    from datetime import datetime, timedelta
+
+    service = RollbackService(storage_path=str(tmp_path / "store"))
+    shared = tmp_path / "shared.py"
+    shared.write_text("shared content")
+    only_old = tmp_path / "old.py"
+    only_old.write_text("only in the expired checkpoint")
+
+    old = await service.create_checkpoint(CheckpointCreateRequest(
+        component_id="c", file_path=str(shared), related_files=[str(only_old)]
+    ))
+    keep = await service.create_checkpoint(CheckpointCreateRequest(component_id="c", file_path=str(shared)))
+    assert service.chunks.stats()["chunks"] == 2
+
+    service.checkpoints[old].retention_until = datetime.utcnow() - timedelta(hours=1)
+    assert await service.cleanup_expired() == 1
+    assert service.chunks.stats()["chunks"] == 1
+
+    shared.write_text("changed")
+    assert await service.rollback(keep, backup_current=False)
+    assert shared.read_text() == "shared content"
+    assert old not in RollbackService(storage_path=str(tmp_path / "store")).checkpoints
+
+
+def test_vectorized_cut_points_match_rolling_gear_hash():
+    import io
+    import random
+
+    from api.services import checkpoint_chunk_store as store
+
+    def reference_cut(data, start, end):
+        if end - start <= store.MIN_CHUNK_BYTES:
+            return end
+        stop = min(end, start + store.MAX_CHUNK_BYTES)
+        h = 0
+        for i in range(start + store.MIN_CHUNK_BYTES, stop):
+            h = ((h << 1) + store._GEAR[data[i]]) & ((1 << 64) - 1)
+            if not h & store._CUT_MASK:
+                return i + 1
+        return stop
+
+    rng = random.Random(11)
+    data = rng.randbytes(400 * 1024) + b"\0" * 150_000 + bytes(rng.choice(b"ab \n") for _ in range(60_000))
+    expected, pos = [], 0
+    while pos < len(data):
+        cut = reference_cut(data, pos, len(data))
+        expected.append(data[pos:cut])
+        pos = cut
+
+    assert list(store.iter_chunks(io.BytesIO(data))) == expected
+
+
+@pytest.mark.asyncio
+async def test_cleanup_waits_for_in_flight_checkpoint(tmp_path, monkeypatch):
+    import asyncio
+    import threading
+
+    service = RollbackService(storage_path=str(tmp_path / "store"))
+    file_path = tmp_path / "logic.py"
+    file_path.write_text("v1_content")
+
+    chunked, release = threading.Event(), threading.Event()
+    put_file = service.chunks.put_file
+
+    def slow_put_file(path):
+        result = put_file(path)
+        chunked.set()
+        release.wait(5)
+        return result
+
+    monkeypatch.setattr(service.chunks, "put_file", slow_put_file)
+    create = asyncio.create_task(service.create_checkpoint(CheckpointCreateRequest(component_id="c", file_path=str(file_path))))
+    await asyncio.to_thread(chunked.wait, 5)
+    # The loop stays free while chunking; GC waits until the checkpoint is recorded
+    cleanup = asyncio.create_task(service.cleanup_expired())
+    await asyncio.sleep(0.01)
+    assert not cleanup.done()
+    release.set()
+    cid = await create
+    assert await cleanup == 0
+
+    file_path.write_text("v2_content")
+    assert await service.rollback(cid, backup_current=False)
+    assert file_path.read_text() == "v1_content"
@@ -0,0 +1,171 @@
+import pytest
+
+from api.services.schema_advisor import (
+    BASELINE_INDEXES,
+    CypherPlanAnalyzer,
+    CypherWorkloadRecorder,
+    IndexSpec,
+    SchemaAdvisor,
+    ensure_schema,
+    extract_property_lookups,
+    gateway_plan_fetcher,
+    generate_migration,
+    normalize_statement,
+)
+
+
+def test_normalize_statement_groups_literals_and_whitespace():
+    a = "MATCH (n:Memory {id: 'abc'})\n  // comment\n  RETURN n LIMIT 10"
+    b = "MATCH (n:Memory {id: 'xyz'}) RETURN n   LIMIT 25"
+    assert normalize_statement(a) == normalize_statement(b)
+    assert "$src" in normalize_statement("MATCH (n {uuid: $src}) RETURN n")
+
+
+def test_recorder_aggregates_by_shape():
+    recorder = CypherWorkloadRecorder()
+    recorder.record("MATCH (n:Goal {id: 'a'}) RETURN n", 2.0)
+    recorder.record("MATCH (n:Goal {id: 'b'}) RETURN n", 4.0, error=True)
+    recorder.record("MATCH (n:Memory) RETURN count(n)", 1.0)
+
+    hottest = recorder.shapes()[0]
+    assert hottest.count == 2
+    assert hottest.errors == 1
+    assert hottest.mean_ms == pytest.approx(3.0)
+    assert len(recorder.shapes()) == 2
+
+
+def test_record_batch_matches_per_call_recording():
+    calls = [
+        ("MATCH (n:Goal {id: 'a'}) RETURN n", 2.0, False),
+        ("MATCH (n:Goal {id: 'b'}) RETURN n", 4.0, True),
+        ("MATCH (n:Goal {id: 'a'}) RETURN n", 6.0, False),
+    ]
+    batched, single = CypherWorkloadRecorder(), CypherWorkloadRecorder()
+    batched.record_batch(calls)
+    for statement, ms, error in calls:
+        single.record(statement, ms, error=error)
+
+    (b,), (s,) = batched.shapes(), single.shapes()
+    assert (b.count, b.errors, b.total_ms, b.max_ms) == (s.count, s.errors, s.total_ms, s.max_ms) == (3, 1, 12.0, 6.0)
+
+
+def test_recorder_evicts_coldest_shape_when_full():
+    recorder = CypherWorkloadRecorder(max_shapes=2)
+    recorder.record("MATCH (a:A) RETURN a", 10.0)
+    recorder.record("MATCH (b:B) RETURN b", 1.0)
+    recorder.record("MATCH (c:C) RETURN c", 5.0)
+    shapes = {s.shape for s in recorder.shapes()}
+    assert shapes == {"MATCH (a:A) RETURN a", "MATCH (c:C) RETURN c"}
+
+
+def test_extract_property_lookups_inline_where_and_labelless():
+    lookups = extract_property_lookups("""
+        MATCH (source {id: $source_id})
+        MATCH (t:ThoughtSeed) WHERE t.layer = $layer
+        MERGE (s:Entity {name: $name})
+    """)
+    by_var = {l.variable: l for l in lookups}
+    assert by_var["source"].label is None
+    assert by_var["t"].label == "ThoughtSeed" and by_var["t"].properties == ("layer",)
+    assert by_var["s"].properties == ("name",)
+
+
+@pytest.mark.asyncio
+async def test_static_analysis_flags_uncovered_lookups():
+    recorder = CypherWorkloadRecorder()
+    recorder.record("MATCH (n:Widget {serial: $serial}) RETURN n", 9.0)
+    recorder.record("MATCH (n {uuid: $src}) RETURN n", 3.0)
+    recorder.record("MATCH (m:Memory {memory_type: $t}) RETURN m", 1.0)
+
+    advisor = SchemaAdvisor(
+        recorder=recorder,
+        analyzer=CypherPlanAnalyzer(
+            known_indexes=[(s.label, s.properties) for s in BASELINE_INDEXES]
+        ),
+    )
+    advice = await advisor.advise()
+
+    assert [(f.label, f.properties) for f in advice.findings] == [
+        ("Widget", ("serial",)),
+        (None, ("uuid",)),
+    ]
+    assert [spec.label for spec in advice.recommendations] == ["Widget"]
+    assert "widget_serial_idx" in advice.migration
+    assert advice.to_dict()["unindexable"][0]["properties"] == ["uuid"]
+
+
+@pytest.mark.asyncio
+async def test_plan_analysis_flags_label_scans():
+    plan = {
+        "operatorType": "ProduceResults@neo4j",
+        "children": [{
+            "operatorType": "Filter@neo4j",
+            "children": [{
+                "operatorType": "NodeByLabelScan@neo4j",
+                "arguments": {"Details": "n:HeartbeatLog"},
+                "children": [],
+            }],
+        }],
+    }
+    fetched = []
+
+    async def fetch(statement):
+        fetched.append(statement)
+        return plan
+
+    recorder = CypherWorkloadRecorder()
+    recorder.record("MATCH (n:HeartbeatLog) WHERE n.heartbeat_number = $n RETURN n", 5.0)
+    advice = await SchemaAdvisor(recorder, CypherPlanAnalyzer(plan_fetcher=fetch)).advise()
+
+    assert fetched[0].startswith("EXPLAIN ")
+    assert advice.findings[0].source == "plan"
+    assert advice.findings[0].label == "HeartbeatLog"
+    assert advice.findings[0].properties == ("heartbeat_number",)
+
+
+@pytest.mark.asyncio
+async def test_gateway_plan_fetcher_is_opt_in_and_explain_only(monkeypatch):
+    from api.services import graphiti_service
+
+    monkeypatch.delenv("SCHEMA_ADVISOR_EXPLAIN", raising=False)
+    assert gateway_plan_fetcher() is None
+
+    explained = []
+
+    class _Gateway:
+        async def explain_plan(self, statement):
+            explained.append(statement)
+            return {"operatorType": "ProduceResults@neo4j", "children": []}
+
+    async def _service():
+        return _Gateway()
+
+    monkeypatch.setenv("SCHEMA_ADVISOR_EXPLAIN", "true")
+    monkeypatch.setattr(graphiti_service, "get_graphiti_service", _service)
+    fetch = gateway_plan_fetcher()
+    assert await fetch("PROFILE MATCH (n:Memory) RETURN n")
+    assert explained == ["MATCH (n:Memory) RETURN n"]
+
+
+@pytest.mark.asyncio
+async def test_migration_is_idempotent_and_tolerates_failures():
+    specs = [IndexSpec("NetworkState", ("agent_id", "timestamp")), IndexSpec("NetworkState", ("agent_id", "timestamp"))]
+    statements = generate_migration(specs)
+    assert statements == [
+        "CREATE INDEX network_state_agent_id_timestamp_idx IF NOT EXISTS "
+        "FOR (n:NetworkState) ON (n.agent_id, n.timestamp)"
+    ]
+
+    calls = []
+
+    async def execute(statement, params):
+        calls.append(statement)
+        if "Entity" in statement:
+            raise RuntimeError("boom")
+        return []
+
+    result = await ensure_schema(execute)
+    assert result["total"] == len(calls) == len(generate_migration(BASELINE_INDEXES))
+    assert all("IF NOT EXISTS" in c for c in calls)
+    assert result["applied"] == result["total"] - len(result["failed"])
+    assert result["failed"]
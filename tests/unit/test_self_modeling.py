@@ -11,7 +11,14 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 from api.models.prediction import PredictionRecord, PredictionAccuracy
 from api.models.network_state import PredictionStatus
-from api.services.self_modeling_service import SelfModelingService
+import numpy as np
+
+from api.services.self_modeling_service import (
+    SKETCH_BINS,
+    ErrorRollup,
+    SelfModelingService,
+    error_bin,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -187,7 +194,7 @@ class TestSelfModelingService:
         mock_driver = MagicMock()
         mock_session = AsyncMock()
         mock_result = AsyncMock()
-        mock_result.single = AsyncMock(return_value={"avg_error": None, "sample_count": 0})
+        mock_result.single = AsyncMock(return_value={"rebuilt_at": "2026-01-01T00:00:00", "buckets": []})
 
         mock_session.run = AsyncMock(return_value=mock_result)
         mock_driver.session.return_value.__aenter__ = AsyncMock(return_value=mock_session)
@@ -199,3 +206,153 @@ class TestSelfModelingService:
         assert metrics.agent_id == "agent-001"
         assert metrics.average_error == 0.0
         assert metrics.sample_count == 0
+        assert metrics.p90_error == 0.0
+
+    @pytest.mark.asyncio
+    async def test_get_accuracy_metrics_combines_buckets(self):
+        """Accuracy merges bucket rollups: mean, variance and sketch quantiles."""
+        errors_a = [0.1, 0.2, 0.3]
+        errors_b = [0.4, 2.0]
+        buckets = []
+        for hour, errors in (("2026-01-01T10", errors_a), ("2026-01-01T11", errors_b)):
+            rollup = ErrorRollup()
+            for e in errors:
+                rollup.add(e)
+            buckets.append({"hour": hour, "count": rollup.count, "sum": rollup.total,
+                            "sum_sq": rollup.total_sq, "min": rollup.min, "max": rollup.max,
+                            "bins": rollup.bins})
+
+        mock_driver = MagicMock()
+        mock_session = AsyncMock()
+        mock_result = AsyncMock()
+        mock_result.single = AsyncMock(return_value={"rebuilt_at": "2026-01-01T00:00:00", "buckets": buckets})
+        mock_session.run = AsyncMock(return_value=mock_result)
+        mock_driver.session.return_value.__aenter__ = AsyncMock(return_value=mock_session)
+        mock_driver.session.return_value.__aexit__ = AsyncMock()
+
+        metrics = await SelfModelingService(driver=mock_driver).get_accuracy_metrics("agent-001")
+
+        all_errors = errors_a + errors_b
+        assert metrics.sample_count == 5
+        assert metrics.average_error == pytest.approx(sum(all_errors) / 5)
+        assert metrics.error_variance == pytest.approx(float(np.var(all_errors, ddof=1)))
+        assert metrics.min_error == pytest.approx(0.1)
+        assert metrics.max_error == pytest.approx(2.0)
+        assert metrics.p50_error == pytest.approx(0.3, rel=0.1)
+        assert metrics.p99_error == pytest.approx(2.0, rel=0.1)
+        mock_session.run.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_accuracy_rebuilds_rollups_once_when_unseeded(self):
+        """An agent without a rollup marker is rebuilt from its predictions, then re-read."""
+        mock_driver = MagicMock()
+        mock_session = AsyncMock()
+        unseeded = AsyncMock()
+        unseeded.single = AsyncMock(return_value={"rebuilt_at": None, "buckets": []})
+        predictions = AsyncMock()
+        predictions.data = AsyncMock(return_value=[
+            {"timestamp": "2026-01-01T10:15:00", "error": 0.5},
+            {"timestamp": "2026-01-01T10:45:00", "error": 0.25},
+        ])
+        seeded = AsyncMock()
+        seeded.single = AsyncMock(return_value={"rebuilt_at": "now", "buckets": []})
+        mock_session.run = AsyncMock(side_effect=[unseeded, predictions, AsyncMock(), seeded])
+        mock_driver.session.return_value.__aenter__ = AsyncMock(return_value=mock_session)
+        mock_driver.session.return_value.__aexit__ = AsyncMock()
+
+        await SelfModelingService(driver=mock_driver).get_accuracy_metrics("agent-001")
+
+        write_params = mock_session.run.call_args_list[2].args[1]
+        (bucket,) = write_params["buckets"]
+        assert bucket["hour"] == "2026-01-01T10"
+        assert bucket["count"] == 2
+        assert bucket["sum"] == pytest.approx(0.75)
+        assert mock_session.run.call_count == 4
+
+    @pytest.mark.asyncio
+    async def test_rollup_rebuild_passes_the_destruction_gate(self, gated_gateway):
+        """The rebuild reaches Neo4j through the real gateway, so later reads do not redo it."""
+        from types import SimpleNamespace
+
+        from api.services.webhook_neo4j_driver import WebhookNeo4jDriver
+
+        state = {"rebuilt_at": None}
+
+        def respond(statement, params):
+            if "RETURN r.rebuilt_at" in statement:
+                return [{"rebuilt_at": state["rebuilt_at"], "buckets": []}]
+            if "MATCH (p:PredictionRecord" in statement:
+                return [{"timestamp": "2026-01-01T10:15:00", "error": 0.5}]
+            if "SET r.rebuilt_at" in statement:
+                state["rebuilt_at"] = params["now"]
+            return []
+
+        gated_gateway.respond = respond
+        adapter = SimpleNamespace(execute_cypher=gated_gateway.execute_cypher)
+        with patch("api.services.memevolve_adapter.get_memevolve_adapter", return_value=adapter):
+            service = SelfModelingService(driver=WebhookNeo4jDriver())
+            await service.get_accuracy_metrics("agent-001")
+            await service.get_accuracy_metrics("agent-001")
+
+        assert state["rebuilt_at"] is not None
+        statements = [statement for statement, _ in gated_gateway.executed]
+        assert sum("SET r.rebuilt_at" in st for st in statements) == 1
+        assert sum("MATCH (p:PredictionRecord" in st for st in statements) == 1
+
+    @pytest.mark.asyncio
+    async def test_resolve_prediction_rolls_error_into_bucket(self):
+        """Resolution updates the prediction and its hourly bucket in one write."""
+        mock_driver = MagicMock()
+        mock_session = AsyncMock()
+        read = AsyncMock()
+        read.single = AsyncMock(return_value={"p": {
+            "agent_id": "agent-001",
+            "timestamp": "2026-01-01T10:15:00",
+            "predicted_state": {"w_a": 0.5},
+        }})
+        mock_session.run = AsyncMock(side_effect=[read, AsyncMock()])
+        mock_driver.session.return_value.__aenter__ = AsyncMock(return_value=mock_session)
+        mock_driver.session.return_value.__aexit__ = AsyncMock()
+
+        record = await SelfModelingService(driver=mock_driver).resolve_prediction("p-1", {"w_a": 0.6})
+
+        cypher, params = mock_session.run.call_args_list[1].args
+        assert "first_resolution" in cypher
+        assert "PredictionErrorBucket" in cypher
+        assert params["hour"] == "2026-01-01T10"
+        assert params["bin"] == error_bin(record.prediction_error)
+
+    @pytest.mark.asyncio
+    async def test_error_trend_fills_empty_steps(self):
+        """The trend has one point per step, oldest first, with gaps at zero."""
+        current_hour = datetime.utcnow().strftime("%Y-%m-%dT%H")
+        rollup = ErrorRollup()
+        rollup.add(0.4)
+        mock_driver = MagicMock()
+        mock_session = AsyncMock()
+        mock_result = AsyncMock()
+        mock_result.single = AsyncMock(return_value={"rebuilt_at": "now", "buckets": [
+            {"hour": current_hour, "count": 1, "sum": 0.4, "sum_sq": 0.16, "min": 0.4, "max": 0.4, "bins": rollup.bins},
+        ]})
+        mock_session.run = AsyncMock(return_value=mock_result)
+        mock_driver.session.return_value.__aenter__ = AsyncMock(return_value=mock_session)
+        mock_driver.session.return_value.__aexit__ = AsyncMock()
+
+        trend = await SelfModelingService(driver=mock_driver).get_error_trend("agent-001", window_hours=6)
+
+        assert len(trend) == 6
+        assert [p.sample_count for p in trend] == [0, 0, 0, 0, 0, 1]
+        assert trend[-1].average_error == pytest.approx(0.4)
+        assert trend[0].bucket_start < trend[-1].bucket_start
+
+
+def test_error_sketch_quantiles_stay_within_bin_accuracy():
+    rng = np.random.default_rng(3)
+    errors = rng.lognormal(mean=-2.0, sigma=1.0, size=2000)
+    rollup = ErrorRollup()
+    for e in errors:
+        rollup.add(float(e))
+    for q in (0.5, 0.9, 0.99):
+        assert rollup.quantile(q) == pytest.approx(float(np.quantile(errors, q)), rel=0.15)
+    assert error_bin(0.0) == 0
+    assert error_bin(1e9) == SKETCH_BINS - 1
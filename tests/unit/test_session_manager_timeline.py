@@ -0,0 +1,115 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock
+from uuid import UUID, uuid4
+
+import pytest
+
+from api.models.journey import JourneyHistoryQuery
+from api.services.session_manager import (
+    TIMELINE_CYPHER,
+    InvalidCursorError,
+    SessionManager,
+    decode_timeline_cursor,
+)
+
+JOURNEY_ID = uuid4()
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+class KeysetGraph:
+    """Evaluates the timeline statement's keyset filter and ordering over in-memory rows."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = []
+
+    async def execute_query(self, cypher, params):
+        self.calls.append((cypher, params))
+        backward = cypher == TIMELINE_CYPHER["backward"]
+        key = lambda r: (r["created_at"], r["entry_type"], r["entry_id"])
+        rows = [r for r in self.rows if params["include_documents"] or r["entry_type"] == "session"]
+        if params["cursor_at"] is not None:
+            cursor = (params["cursor_at"], params["cursor_type"], params["cursor_id"])
+            rows = [r for r in rows if (key(r) < cursor if backward else key(r) > cursor)]
+        return sorted(rows, key=key, reverse=backward)[:params["fetch"]]
+
+
+def _timeline_rows(sessions=5, documents=3):
+    rows = []
+    for i in range(sessions):
+        rows.append({
+            "entry_type": "session", "entry_id": str(UUID(int=i + 1)),
+            "created_at": (START + timedelta(hours=2 * i)).isoformat(),
+            "summary": f"session {i}", "has_diagnosis": False, "document_type": None, "title": None,
+        })
+    for i in range(documents):
+        rows.append({
+            "entry_type": "document", "entry_id": str(UUID(int=100 + i)),
+            # Document 0 shares a timestamp with session 1 to exercise the tie-break
+            "created_at": (START + timedelta(hours=2 + 3 * i)).isoformat(),
+            "summary": None, "has_diagnosis": False, "document_type": "note", "title": f"doc {i}",
+        })
+    return rows
+
+
+@pytest.mark.asyncio
+async def test_timeline_pages_forward_and_backward_without_gaps():
+    graph = KeysetGraph(_timeline_rows())
+    manager = SessionManager(driver=graph)
+
+    seen, cursor, has_more = [], None, True
+    while has_more:
+        page = await manager.get_journey_timeline(JOURNEY_ID, limit=3, include_documents=True, cursor=cursor)
+        seen.extend(page.entries)
+        cursor, has_more = page.next_cursor, page.has_more
+
+    assert len(seen) == 8
+    assert [e.created_at for e in seen] == sorted(e.created_at for e in seen)
+    tie = [e.entry_type for e in seen if e.created_at == START + timedelta(hours=2)]
+    assert tie == ["document", "session"]
+
+    # Latest page first, then back towards the start; each page is oldest first
+    latest = await manager.get_journey_timeline(JOURNEY_ID, limit=3, include_documents=True, direction="backward")
+    older = await manager.get_journey_timeline(
+        JOURNEY_ID, limit=3, include_documents=True, cursor=latest.prev_cursor, direction="backward"
+    )
+    assert latest.entries == seen[-3:] and latest.has_more
+    assert older.entries == seen[-6:-3]
+    # Every page is a single bounded query merged in the database
+    assert all(params["fetch"] == 4 for _, params in graph.calls)
+
+
+@pytest.mark.asyncio
+async def test_timeline_excludes_documents_and_rejects_bad_cursor():
+    manager = SessionManager(driver=KeysetGraph(_timeline_rows()))
+
+    page = await manager.get_journey_timeline(JOURNEY_ID, limit=10)
+
+    assert [e.entry_type for e in page.entries] == ["session"] * 5
+    assert not page.has_more
+    assert decode_timeline_cursor(page.next_cursor)[1:] == ("session", str(UUID(int=5)))
+    with pytest.raises(InvalidCursorError):
+        await manager.get_journey_timeline(JOURNEY_ID, cursor="not-a-cursor")
+    with pytest.raises(ValueError):
+        await manager.get_journey_timeline(JOURNEY_ID, direction="sideways")
+
+
+@pytest.mark.asyncio
+async def test_history_uses_fulltext_index_and_falls_back_to_contains():
+    session = {"id": str(uuid4()), "created_at": START.isoformat(), "summary": "career change plan"}
+    driver = AsyncMock()
+    driver.execute_query = AsyncMock(return_value=[{"n": session, "score": 2.5}])
+    manager = SessionManager(driver=driver)
+
+    result = await manager.query_journey_history(JourneyHistoryQuery(journey_id=JOURNEY_ID, query="career: change"))
+
+    cypher, params = driver.execute_query.await_args.args
+    assert "db.index.fulltext.queryNodes('session_summary_fulltext'" in cypher
+    assert params["search"] == "career\\: change"
+    assert result.sessions[0].relevance_score == pytest.approx(1.0)
+
+    driver.execute_query = AsyncMock(side_effect=[RuntimeError("no such index"), [{"n": session, "score": 1.0}]])
+    fallback = await manager.query_journey_history(JourneyHistoryQuery(journey_id=JOURNEY_ID, query="career"))
+
+    assert "CONTAINS" in driver.execute_query.await_args.args[0]
+    assert fallback.total_results == 1
@@ -0,0 +1,162 @@
+from datetime import datetime
+
+import pytest
+
+from api.services.system_metrics_service import SystemMetricsService, count_recorded_episode
+
+
+class _Graph:
+    """Answers SystemMetricsService queries from canned rows, recording each call."""
+
+    def __init__(self, metrics=None, buckets=None, focus=None, memory_count=0, strengths=()):
+        self.metrics = metrics
+        self.buckets = buckets or []
+        self.focus = focus
+        self.memory_count = memory_count
+        self.strengths = list(strengths)
+        self.calls = []
+
+    async def execute_query(self, statement, params=None):
+        params = params or {}
+        self.calls.append((statement, params))
+        if "RETURN s {.*} AS metrics" in statement:
+            in_window = [b for b in self.buckets if b["hour"] > params["cutoff_hour"]]
+            return [{
+                "metrics": dict(self.metrics) if self.metrics else None,
+                "episodes": sum(b["episodes"] for b in in_window),
+                "surprise_sum": sum(b["surprise_sum"] for b in in_window),
+                "success_sum": sum(b["success_sum"] for b in in_window),
+                "basin_strengths": self.strengths,
+            }]
+        if "s.memory_count AS memory_count" in statement:
+            metrics = self.metrics or {}
+            return [{"memory_count": metrics.get("memory_count"), "focus": metrics.get("focus_title"),
+                     "episodes": sum(b["episodes"] for b in self.buckets)}]
+        if "MATCH (m:Memory) RETURN count(m)" in statement:
+            return [{"count": self.memory_count}]
+        if "ORDER BY CASE g.priority" in statement:
+            return [self.focus] if self.focus else []
+        if "s.reconciled_at = $now" in statement:
+            # Buckets double as the episodes they were counted from
+            self.metrics = {"memory_count": params["memory_count"], "focus_title": params["title"],
+                            "focus_stale": False, "reconciled_at": params["now"]}
+            self.buckets = [b for b in self.buckets if b["hour"] > params["since_hour"]]
+            return [{"episodes": sum(b["episodes"] for b in self.buckets)}]
+        if "s.focus_stale = false" in statement and self.metrics:
+            self.metrics.update(focus_title=params["title"], focus_stale=False)
+        return []
+
+
+NOW = datetime(2026, 3, 2, 12, 30)
+
+
+def _bucket(hour, episodes, surprise_sum, success_sum):
+    return {"hour": hour, "episodes": episodes, "surprise_sum": surprise_sum, "success_sum": success_sum}
+
+
+@pytest.mark.asyncio
+async def test_read_uses_precomputed_window_without_scanning():
+    graph = _Graph(
+        metrics={"memory_count": 42, "focus_title": "Ship it", "focus_stale": False, "reconciled_at": "x"},
+        buckets=[
+            _bucket("2026-03-01T11", 5, 5.0, 5),  # outside the 24h window
+            _bucket("2026-03-01T13", 2, 0.6, 1),
+            _bucket("2026-03-02T12", 2, 0.2, 2),
+        ],
+        strengths=[0.9, 0.2, None],
+    )
+
+    metrics = await SystemMetricsService(graph).read(NOW)
+
+    assert metrics == {
+        "memory_count": 42,
+        "episode_count": 4,
+        "avg_surprise": pytest.approx(0.2),
+        "avg_success": pytest.approx(0.75),
+        "current_focus": "Ship it",
+        "basin_strengths": [0.9, 0.2],
+    }
+    assert len(graph.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_unseeded_counters_are_reconciled_then_read():
+    graph = _Graph(
+        metrics={"memory_count": 3},  # bumped by writers before any reconcile
+        buckets=[_bucket("2026-03-02T09", 3, 1.5, 3)],
+        focus={"goal_id": "g1", "title": "Queued goal", "priority": "queued"},
+        memory_count=10,
+    )
+
+    metrics = await SystemMetricsService(graph).read(NOW)
+
+    assert metrics["memory_count"] == 10
+    assert metrics["episode_count"] == 3
+    assert metrics["current_focus"] == "Queued goal"
+    assert not any("DELETE" in statement for statement, _ in graph.calls)
+
+
+@pytest.mark.asyncio
+async def test_reconcile_reports_drift():
+    graph = _Graph(
+        metrics={"memory_count": 8, "focus_title": "Old", "reconciled_at": "x"},
+        buckets=[_bucket("2026-03-02T09", 1, 0.1, 1)],
+        focus={"goal_id": "g2", "title": "New", "priority": "active"},
+        memory_count=10,
+    )
+    graph.buckets.append(_bucket("2026-03-02T10", 2, 0.4, 0))
+
+    drift = await SystemMetricsService(graph).reconcile(NOW)
+
+    assert drift == {"memory_count": 2, "episode_count": 0, "focus_changed": True}
+    assert graph.metrics["focus_title"] == "New"
+
+
+@pytest.mark.asyncio
+async def test_reconcile_passes_the_destruction_gate(gated_gateway):
+    from types import SimpleNamespace
+
+    def respond(statement, params):
+        if "s.memory_count AS memory_count" in statement:
+            return [{"memory_count": 1, "focus": None, "episodes": 5}]
+        if "MATCH (m:Memory) RETURN count(m)" in statement:
+            return [{"count": 1}]
+        if "s.reconciled_at = $now" in statement:
+            return [{"episodes": 3}]
+        return []
+
+    sent = []
+
+    async def execute_query(statement, params=None):
+        sent.append(statement)
+        return await gated_gateway.execute_cypher(statement, params)
+
+    gated_gateway.respond = respond
+    drift = await SystemMetricsService(SimpleNamespace(execute_query=execute_query)).reconcile(NOW)
+
+    assert drift["episode_count"] == -2
+    # Nothing was refused: every statement reached the driver, and the recount
+    # and bucket overwrite are one of them
+    assert [statement for statement, _ in gated_gateway.executed] == sent
+    assert sum("SystemMetricsBucket {hour: bucket.hour}" in st for st in sent) == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_focus_is_recomputed_once():
+    graph = _Graph(
+        metrics={"memory_count": 1, "focus_title": "Completed goal", "focus_stale": True, "reconciled_at": "x"},
+        focus={"goal_id": "g3", "title": "Next goal", "priority": "active"},
+    )
+    service = SystemMetricsService(graph)
+
+    assert (await service.read(NOW))["current_focus"] == "Next goal"
+    calls = len(graph.calls)
+    assert (await service.read(NOW))["current_focus"] == "Next goal"
+    assert len(graph.calls) == calls + 1
+
+
+def test_episode_fragment_buckets_by_hour():
+    fragment = count_recorded_episode("c")
+
+    assert fragment.lstrip().startswith("WITH c AS episode")
+    assert "substring(episode.timestamp, 0, 13)" in fragment
@@ -0,0 +1,146 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from api.services.execution_trace_service import (
+    COMPACT_BASIN_LINKS_CYPHER,
+    COMPACT_TRACES_CYPHER,
+    ExecutionTraceService,
+)
+from api.services.trace_segment_store import MANIFEST_FILE, TraceSegmentStore
+
+
+def _record(trace_id, steps=0, agent="perception", success=True):
+    return {
+        "id": trace_id,
+        "agent_name": agent,
+        "run_id": "run-1",
+        "started_at": "2026-01-26T12:00:00",
+        "completed_at": "2026-01-26T12:01:00",
+        "step_count": steps,
+        "planning_count": 0,
+        "success": success,
+        "steps": [{"id": f"{trace_id}-s{i}", "step_number": i, "step_type": "ActionStep"} for i in range(steps)],
+        "basin_links": [],
+    }
+
+
+def test_append_rotates_and_reads_by_id_after_restart(tmp_path):
+    store = TraceSegmentStore(tmp_path, max_segment_bytes=400)
+    sealed = [store.append(_record(f"t-{i}", steps=2)) for i in range(4)]
+
+    assert any(sealed)
+    assert store.pending_segments()
+    assert store.get("t-2")["steps"][1]["id"] == "t-2-s1"
+    store.close()
+
+    reopened = TraceSegmentStore(tmp_path, max_segment_bytes=400)
+    assert reopened.get("t-0")["id"] == "t-0"
+    assert [s["id"] for s in reopened.summaries(limit=2)] == ["t-3", "t-2"]
+    # Segments from the previous process are all pending compaction
+    assert len(reopened.pending_segments()) == len(list(tmp_path.glob("segment-*.jsonl")))
+
+
+def test_torn_final_line_is_ignored(tmp_path):
+    store = TraceSegmentStore(tmp_path)
+    store.append(_record("t-ok"))
+    store.close()
+    segment = next(tmp_path.glob("segment-*.jsonl"))
+    with open(segment, "ab") as f:
+        f.write(b'{"id": "t-torn", "agent')
+
+    reopened = TraceSegmentStore(tmp_path)
+    assert "t-ok" in reopened
+    assert "t-torn" not in reopened
+    assert [r["id"] for r in reopened.read_segment(segment.name)] == ["t-ok"]
+
+
+def test_retention_drops_oldest_compacted_segments(tmp_path):
+    store = TraceSegmentStore(tmp_path, max_segment_bytes=1, retain_compacted=1)
+    store.append(_record("t-old"))
+    store.append(_record("t-new"))
+    for name in store.pending_segments():
+        store.mark_compacted(name)
+
+    assert "t-old" not in store
+    assert store.get("t-new")["id"] == "t-new"
+    assert len(list(tmp_path.glob("segment-*.jsonl"))) == 1
+    assert len(json.loads((tmp_path / MANIFEST_FILE).read_text())["compacted"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_completed_trace_is_served_from_segments_without_neo4j(tmp_path):
+    service = ExecutionTraceService(store=TraceSegmentStore(tmp_path))
+    driver = MagicMock()
+    driver.execute_query = AsyncMock(return_value=[])
+
+    with patch("api.services.remote_sync.get_neo4j_driver", return_value=driver):
+        trace_id = await service.create_trace("perception", "run-1")
+        await service.add_step(trace_id, {"step_number": 1, "step_type": "ActionStep", "tool_name": "search"})
+        await service.link_basin(trace_id, "basin-1", 0.8)
+        await service.complete_trace(trace_id, success=True)
+
+        trace = await service.get_trace(trace_id)
+        listed = await service.list_traces(limit=1)
+
+    driver.execute_query.assert_not_called()
+    assert trace.steps[0].tool_name == "search"
+    assert trace.activated_basins[0]["basin_id"] == "basin-1"
+    assert listed[0]["id"] == trace_id
+
+
+@pytest.mark.asyncio
+async def test_compaction_writes_bulk_batches(tmp_path):
+    store = TraceSegmentStore(tmp_path)
+    service = ExecutionTraceService(store=store, compaction_batch_steps=5)
+    for i in range(6):
+        record = _record(f"t-{i}", steps=2)
+        record["basin_links"] = [{"basin_id": "basin-1", "strength": 0.5, "at_step": 1}]
+        store.append(record)
+
+    driver = MagicMock()
+    driver.execute_query = AsyncMock(return_value=[])
+    with patch("api.services.remote_sync.get_neo4j_driver", return_value=driver):
+        result = await service.compact(seal_active=True)
+
+    assert result["segments"] == 1
+    assert (result["traces"], result["steps"], result["basin_links"]) == (6, 12, 6)
+    statements = [c.args[0] for c in driver.execute_query.call_args_list]
+    # 12 steps at <= 5 per batch -> 3 trace batches; 6 links -> 2 link batches
+    assert statements.count(COMPACT_TRACES_CYPHER) == 3
+    assert statements.count(COMPACT_BASIN_LINKS_CYPHER) == 2
+    assert store.pending_segments() == []
+    # Compacted traces stay readable locally
+    assert store.get("t-5")["id"] == "t-5"
+
+
+@pytest.mark.asyncio
+async def test_compaction_loop_seals_idle_segments_and_startup_leftovers(tmp_path):
+    leftover = TraceSegmentStore(tmp_path)
+    leftover.append(_record("t-previous-process"))
+    leftover.close()
+
+    store = TraceSegmentStore(tmp_path, max_segment_age_seconds=0.0)
+    store.append(_record("t-idle"))  # sealed by age on append
+    store.max_segment_age_seconds = 3600
+    store.append(_record("t-active"))
+    assert store.stats()["active_segment"] is not None
+
+    service = ExecutionTraceService(store=store)
+    driver = MagicMock()
+    driver.execute_query = AsyncMock(return_value=[])
+    with patch("api.services.remote_sync.get_neo4j_driver", return_value=driver):
+        service.start_compaction_loop(interval_seconds=0.01)
+        await asyncio.sleep(0.05)
+        assert store.pending_segments() == []
+        assert store.stats()["compacted_segments"] == 2
+
+        # The idle active segment is sealed once it outlives its age limit
+        store.max_segment_age_seconds = 0.0
+        await asyncio.sleep(0.05)
+        await service.stop_compaction_loop()
+
+    assert store.stats()["active_segment"] is None
+    assert store.stats()["compacted_segments"] == 3
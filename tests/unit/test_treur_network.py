@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from api.services.dynamics_service import DynamicsService
+from api.services.treur_network import Trajectory, TreurNetwork
+
+STATES = [
+    {"name": "stimulus", "initial": 1.0, "speed": 0.0},
+    {"name": "belief", "speed": 0.4, "sigm": 6.0, "tau": 0.4},
+    {"name": "action", "speed": 0.3, "combination": "ssum", "scale": 2.0},
+]
+CONNECTIONS = [
+    {"source": "stimulus", "target": "belief", "weight": 0.8},
+    {"source": "belief", "target": "action", "weight": 0.5, "adaptive": True, "mu": 0.2, "speed": 0.3},
+    {"source": "stimulus", "target": "action", "weight": 0.6},
+    {"source": "action", "target": "belief", "weight": 0.3},
+]
+
+
+def _scalar_reference(steps, dt):
+    """Chained DynamicsService primitives, one call per state per step."""
+    s, b, a, w = 1.0, 0.0, 0.0, 0.5
+    for _ in range(steps):
+        agg_b = DynamicsService.alogistic(6.0, 0.4, [s, a], [0.8, 0.3])
+        agg_a = (b * w + s * 0.6) / 2.0
+        hebb = DynamicsService.hebbian(0.2, b, a, w)
+        b, a, w = (
+            DynamicsService.state_update(b, agg_b, 0.4, dt),
+            DynamicsService.state_update(a, agg_a, 0.3, dt),
+            DynamicsService.state_update(w, hebb, 0.3, dt),
+        )
+    return b, a, w
+
+
+def test_fixed_step_matches_scalar_primitives():
+    network = DynamicsService.network(STATES, CONNECTIONS)
+    trajectory = network.run(duration=5.0, dt=0.1)
+
+    b, a, w = _scalar_reference(50, 0.1)
+    assert network["belief"] == pytest.approx(b, abs=1e-12)
+    assert network["action"] == pytest.approx(a, abs=1e-12)
+    assert network.weight("belief", "action") == pytest.approx(w, abs=1e-12)
+    assert network["stimulus"] == 1.0
+    assert trajectory.states.shape == (51, 3)
+    assert trajectory.times[-1] == pytest.approx(5.0)
+
+
+def test_adaptive_step_tracks_fine_fixed_step():
+    reference = TreurNetwork.from_spec(STATES, CONNECTIONS)
+    reference.run(duration=20.0, dt=0.001, record_every=1000)
+    adaptive = TreurNetwork.from_spec(STATES, CONNECTIONS)
+    trajectory = adaptive.run_adaptive(duration=20.0, tolerance=1e-5)
+
+    assert adaptive.time == pytest.approx(20.0)
+    np.testing.assert_allclose(adaptive.values, reference.values, atol=2e-3)
+    # Far fewer steps than the fine fixed-step run
+    assert len(trajectory.times) < 2000
+
+
+def test_trajectory_round_trips_to_disk(tmp_path):
+    network = TreurNetwork.from_spec(STATES, CONNECTIONS)
+    path = tmp_path / "runs" / "trajectory.npz"
+    trajectory = network.run(duration=1.0, dt=0.1, record_every=2, record_weights=True, path=path)
+
+    loaded = Trajectory.load(path)
+    assert loaded.state_names == ["stimulus", "belief", "action"]
+    np.testing.assert_array_equal(loaded.states, trajectory.states)
+    assert loaded.weights.shape == (len(loaded.times), 3, 3)
+    assert loaded.state("belief")[-1] == network["belief"]
+
+
+def test_invalid_spec_rejected():
+    with pytest.raises(ValueError):
+        TreurNetwork.from_spec(STATES, [{"source": "stimulus", "target": "missing", "weight": 1.0}])
+    with pytest.raises(ValueError):
+        TreurNetwork.from_spec([{"name": "x", "combination": "max"}], [])
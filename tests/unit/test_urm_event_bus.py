@@ -25,6 +25,9 @@ async def test_urm_event_bus_integration():
         state=test_state
     )
     
+    # Delivery is queued per subscriber
+    await bus.drain()
+
     # 3. Verify URM updated
     model = service.get_model()
     assert len(model.active_inference_states) > 0